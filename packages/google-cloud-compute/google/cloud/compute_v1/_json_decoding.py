@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Fast decoding of compute REST responses.
+
+:func:`google.protobuf.json_format.Parse` walks the descriptor of every field
+of every message in pure Python. :func:`parse` instead decodes the JSON text
+(with ``orjson`` when it is installed), converts the result to constructor
+keyword arguments using a plan compiled once per message type, and builds
+the message with a single call to its native constructor.
+
+Anything the fast path does not handle (well-known types, ``bytes`` fields,
+unknown enum names, malformed input) falls back to
+:func:`~google.protobuf.json_format.Parse`, so the result and the errors
+raised are the same as before.
+"""
+
+import json
+from typing import Any, Callable, Dict, Tuple, Union
+
+from google.protobuf import descriptor, json_format, message, message_factory
+
+try:
+    import orjson
+except ImportError:  # pragma: NO COVER
+    orjson = None
+
+from google.cloud.compute_v1 import _query_params
+
+_FieldDescriptor = descriptor.FieldDescriptor
+
+_INTEGER_TYPES = frozenset(
+    [
+        _FieldDescriptor.TYPE_INT32,
+        _FieldDescriptor.TYPE_SINT32,
+        _FieldDescriptor.TYPE_SFIXED32,
+        _FieldDescriptor.TYPE_UINT32,
+        _FieldDescriptor.TYPE_FIXED32,
+        _FieldDescriptor.TYPE_INT64,
+        _FieldDescriptor.TYPE_SINT64,
+        _FieldDescriptor.TYPE_SFIXED64,
+        _FieldDescriptor.TYPE_UINT64,
+        _FieldDescriptor.TYPE_FIXED64,
+    ]
+)
+
+_FLOAT_TYPES = frozenset([_FieldDescriptor.TYPE_FLOAT, _FieldDescriptor.TYPE_DOUBLE])
+
+# Values which need no conversion before being passed to a constructor.
+_IDENTITY_TYPES = frozenset(
+    [
+        _FieldDescriptor.TYPE_STRING,
+        _FieldDescriptor.TYPE_BOOL,
+        _FieldDescriptor.TYPE_ENUM,
+    ]
+)
+
+# Well-known types have special JSON representations.
+_WELL_KNOWN_TYPES_PREFIX = "google.protobuf."
+
+# Plans keyed by message descriptor. Each plan maps the JSON name and the
+# original name of every field to the field name and a value converter.
+_plans: Dict[descriptor.Descriptor, Dict[str, Tuple[str, Callable]]] = {}
+
+
+class _Unsupported(Exception):
+    """Raised for input which the fast path does not handle."""
+
+
+def _loads(content: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _unsupported(value):
+    raise _Unsupported()
+
+
+def _integer(value):
+    # json_format rejects booleans and non-integral numbers for integers.
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise _Unsupported()
+    return int(value)
+
+
+def _repeated(convert: Callable) -> Callable:
+    return lambda values: [convert(value) for value in values]
+
+
+def _message_kwargs(message_descriptor: descriptor.Descriptor) -> Callable:
+    def convert(values):
+        plan = _plans.get(message_descriptor)
+        if plan is None:
+            plan = _compile(message_descriptor)
+        kwargs = {}
+        for key, value in values.items():
+            entry = plan.get(key)
+            # Unknown fields are ignored, and null means the default value.
+            if entry is None or value is None:
+                continue
+            name, convert_value = entry
+            kwargs[name] = convert_value(value)
+        return kwargs
+
+    return convert
+
+
+def _message_class(message_descriptor: descriptor.Descriptor) -> type:
+    get_message_class = getattr(message_factory, "GetMessageClass", None)
+    if get_message_class is not None:
+        return get_message_class(message_descriptor)
+    return message_factory.MessageFactory().GetPrototype(  # pragma: NO COVER
+        message_descriptor
+    )
+
+
+def _map_converter(field: _FieldDescriptor) -> Callable:
+    key_field = field.message_type.fields_by_name["key"]
+    value_field = field.message_type.fields_by_name["value"]
+    if key_field.type == _FieldDescriptor.TYPE_BOOL:
+        convert_key = {"true": True, "false": False}.__getitem__
+    elif key_field.type in _INTEGER_TYPES:
+        convert_key = int
+    else:
+        convert_key = str
+
+    convert_value = _value_converter(value_field)
+    if value_field.type == _FieldDescriptor.TYPE_MESSAGE:
+        # Map values must be message instances rather than dictionaries.
+        value_class = _message_class(value_field.message_type)
+        convert_kwargs = convert_value
+
+        def convert_value(value):
+            return value_class(**convert_kwargs(value))
+
+    return lambda values: {
+        convert_key(key): convert_value(value) for key, value in values.items()
+    }
+
+
+def _value_converter(field: _FieldDescriptor) -> Callable:
+    if field.type in _IDENTITY_TYPES:
+        return lambda value: value
+    if field.type in _INTEGER_TYPES:
+        return _integer
+    if field.type in _FLOAT_TYPES:
+        return float
+    if field.type == _FieldDescriptor.TYPE_MESSAGE:
+        if field.message_type.full_name.startswith(_WELL_KNOWN_TYPES_PREFIX):
+            return _unsupported
+        return _message_kwargs(field.message_type)
+    return _unsupported
+
+
+def _field_converter(field: _FieldDescriptor) -> Callable:
+    if (
+        field.type == _FieldDescriptor.TYPE_MESSAGE
+        and field.message_type.GetOptions().map_entry
+    ):
+        return _map_converter(field)
+    convert = _value_converter(field)
+    if _query_params._is_repeated(field):
+        return _repeated(convert)
+    return convert
+
+
+def _compile(
+    message_descriptor: descriptor.Descriptor,
+) -> Dict[str, Tuple[str, Callable]]:
+    plan: Dict[str, Tuple[str, Callable]] = {}
+    # Register the plan before compiling fields, for recursive messages, and
+    # drop it if compiling fails, so that a partial plan is never used.
+    _plans[message_descriptor] = plan
+    try:
+        for field in message_descriptor.fields:
+            entry = (field.name, _field_converter(field))
+            plan[field.json_name] = entry
+            plan[field.name] = entry
+    except BaseException:
+        del _plans[message_descriptor]
+        raise
+    return plan
+
+
+def parse(
+    text: Union[bytes, str],
+    message: message.Message,
+    ignore_unknown_fields: bool = False,
+) -> message.Message:
+    """Parse a JSON representation of a protocol buffer message.
+
+    A drop-in replacement for :func:`google.protobuf.json_format.Parse`.
+
+    Args:
+        text (Union[bytes, str]): The JSON representation of the message.
+        message (google.protobuf.message.Message): The message to merge the
+            parsed fields into.
+        ignore_unknown_fields (bool): Whether to ignore fields which are not
+            part of the message. The fast path is only taken when this is
+            ``True``, as it is for REST responses.
+
+    Returns:
+        google.protobuf.message.Message: ``message``.
+
+    Raises:
+        google.protobuf.json_format.ParseError: On a failure to parse.
+    """
+    full_name = message.DESCRIPTOR.full_name
+    if ignore_unknown_fields and not full_name.startswith(_WELL_KNOWN_TYPES_PREFIX):
+        try:
+            values = _loads(text)
+            if isinstance(values, dict):
+                convert = _message_kwargs(message.DESCRIPTOR)
+                message.MergeFrom(type(message)(**convert(values)))
+                return message
+        except (_Unsupported, ValueError, TypeError, KeyError, AttributeError):
+            pass
+    return json_format.Parse(text, message, ignore_unknown_fields=ignore_unknown_fields)
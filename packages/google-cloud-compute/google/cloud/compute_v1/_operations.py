@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Extended operation wrappers shared by the compute service clients.
+
+Every mutating compute method returns an
+:class:`~google.api_core.extended_operation.ExtendedOperation` that polls one
+of the zone, region, global or global organization operation services. The
+wrapper classes are defined once here, rather than on every call, so that
+issuing many operations does not repeatedly create classes.
+"""
+
+import abc
+import functools
+from typing import Any, Dict, Optional
+
+from google.api_core import extended_operation
+
+from google.cloud.compute_v1.types import compute
+
+
+def _cancel_operation():
+    # Cancel is not part of extended operations yet.
+    return None
+
+
+class _ComputeOperation(extended_operation.ExtendedOperation):
+    """Base class for compute extended operations.
+
+    Provides a uniform set of names for certain fields in the
+    :class:`~google.cloud.compute_v1.types.Operation` message. See
+    :class:`google.api_core.extended_operation.ExtendedOperation` for details
+    on these properties and the expected interface.
+
+    Subclasses name the transport property holding their operation service
+    client, the request types used to poll it, and the request fields that
+    identify the operation.
+    """
+
+    _operation_service_name: str
+    _get_request_type: type
+    _wait_request_type: Optional[type] = None
+
+    @property
+    def error_message(self):
+        return self._extended_operation.http_error_message
+
+    @property
+    def error_code(self):
+        return self._extended_operation.http_error_status_code
+
+    @classmethod
+    @abc.abstractmethod
+    def _operation_fields(cls, request, response) -> Dict[str, Any]:
+        """Return the fields identifying the operation in a poll request."""
+
+    @classmethod
+    def from_response(cls, transport, request, response):
+        """Wrap the operation returned by a compute method.
+
+        Args:
+            transport: The transport of the client that sent ``request``.
+            request (proto.Message): The request that started the operation.
+            response (google.cloud.compute_v1.types.Operation): The
+                operation returned for ``request``.
+
+        Returns:
+            google.api_core.extended_operation.ExtendedOperation:
+                A future polling the operation.
+        """
+        operation_service = getattr(transport, cls._operation_service_name)
+        fields = cls._operation_fields(request, response)
+        get_operation = functools.partial(
+            operation_service.get, cls._get_request_type(**fields)
+        )
+        operation = cls.make(get_operation, _cancel_operation, response)
+        operation._get_operation = get_operation
+        operation._wait_operation = None
+        if cls._wait_request_type is not None:
+            operation._wait_operation = functools.partial(
+                operation_service.wait, cls._wait_request_type(**fields)
+            )
+        return operation
+
+    def use_server_wait(self, enabled: bool = True):
+        """Poll the operation with the service's ``wait`` method.
+
+        By default the operation is polled with the operation service's
+        ``get`` method, sleeping between polls. ``wait`` instead blocks on
+        the server until the operation is done or about two minutes have
+        passed, which detects completion sooner and with fewer requests.
+        A single poll may therefore block for up to two minutes, regardless
+        of the timeout given to :meth:`result`.
+
+        Example::
+
+            operation = client.insert(request=request).use_server_wait()
+            operation.result(timeout=600)
+
+        Args:
+            enabled (bool): Whether to poll with ``wait`` rather than ``get``.
+
+        Returns:
+            This operation, for chaining.
+
+        Raises:
+            ValueError: If the operation service has no ``wait`` method.
+        """
+        if not enabled:
+            self._refresh = self._get_operation
+        elif self._wait_operation is None:
+            raise ValueError(
+                "{} does not support server-side waiting.".format(type(self).__name__)
+            )
+        else:
+            self._refresh = self._wait_operation
+        return self
+
+
+def _project_fields(request, response):
+    return {"project": request.project, "operation": response.name}
+
+
+class ZoneOperation(_ComputeOperation):
+    """An extended operation polled through the zone operations service."""
+
+    _operation_service_name = "_zone_operations_client"
+    _get_request_type = compute.GetZoneOperationRequest
+    _wait_request_type = compute.WaitZoneOperationRequest
+
+    @classmethod
+    def _operation_fields(cls, request, response):
+        fields = _project_fields(request, response)
+        fields["zone"] = request.zone
+        return fields
+
+
+class RegionOperation(_ComputeOperation):
+    """An extended operation polled through the region operations service."""
+
+    _operation_service_name = "_region_operations_client"
+    _get_request_type = compute.GetRegionOperationRequest
+    _wait_request_type = compute.WaitRegionOperationRequest
+
+    @classmethod
+    def _operation_fields(cls, request, response):
+        fields = _project_fields(request, response)
+        fields["region"] = request.region
+        return fields
+
+
+class GlobalOperation(_ComputeOperation):
+    """An extended operation polled through the global operations service."""
+
+    _operation_service_name = "_global_operations_client"
+    _get_request_type = compute.GetGlobalOperationRequest
+    _wait_request_type = compute.WaitGlobalOperationRequest
+
+    @classmethod
+    def _operation_fields(cls, request, response):
+        return _project_fields(request, response)
+
+
+class GlobalOrganizationOperation(_ComputeOperation):
+    """An extended operation polled through the global organization
+    operations service, which has no ``wait`` method."""
+
+    _operation_service_name = "_global_organization_operations_client"
+    _get_request_type = compute.GetGlobalOrganizationOperationRequest
+
+    @classmethod
+    def _operation_fields(cls, request, response):
+        fields = {"operation": response.name}
+        if "parent_id" in type(request).meta.fields:
+            fields["parent_id"] = request.parent_id
+        return fields
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Background page prefetching shared by the compute pagers."""
+
+import queue
+import threading
+from typing import Any, Callable, Iterator, Sequence, Tuple
+
+# How often (in seconds) a blocked producer re-checks whether the consumer
+# has gone away.
+_POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+class _PageError(object):
+    """Carries an exception raised on the producer thread to the consumer."""
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def prefetch_pages(
+    method: Callable[..., Any],
+    request: Any,
+    response: Any,
+    *,
+    metadata: Sequence[Tuple[str, str]] = (),
+    depth: int = 1,
+) -> Iterator[Any]:
+    """Yield ``response`` and every following page, fetching ahead.
+
+    Subsequent pages are requested on a background thread while the caller
+    consumes the current one. At most ``depth`` pages are buffered ahead of
+    the caller, which bounds memory use regardless of the result size.
+
+    Args:
+        method (Callable): The wrapped RPC used to fetch subsequent pages.
+        request (proto.Message): The list request. Its ``page_token`` field
+            is updated in place as pages are fetched.
+        response (proto.Message): The page already in hand.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+        depth (int): The maximum number of pages fetched ahead of the
+            caller. Must be positive.
+
+    Returns:
+        Iterator[proto.Message]: The pages, in order.
+
+    Raises:
+        ValueError: If ``depth`` is not positive.
+    """
+    if depth < 1:
+        raise ValueError("Prefetch depth must be positive, got {}.".format(depth))
+    return _iter_prefetched(method, request, response, metadata, depth)
+
+
+def _iter_prefetched(method, request, response, metadata, depth):
+    yield response
+    if not response.next_page_token:
+        return
+
+    buffered: queue.Queue = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(item):
+        # Block while the buffer is full, but give up if the consumer stops.
+        while not stopped.is_set():
+            try:
+                buffered.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(page):
+        try:
+            while page.next_page_token and not stopped.is_set():
+                request.page_token = page.next_page_token
+                page = method(request, metadata=metadata)
+                if not put(page):
+                    return
+        except BaseException as exc:  # Re-raised on the consumer thread.
+            put(_PageError(exc))
+            return
+        put(_DONE)
+
+    producer = threading.Thread(
+        target=produce,
+        args=(response,),
+        name="compute-page-prefetch",
+        daemon=True,
+    )
+    producer.start()
+    try:
+        while True:
+            item = buffered.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _PageError):
+                raise item.exc
+            yield item
+    finally:
+        stopped.set()
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Encode the query parameters of compute REST requests.
+
+The REST transports previously serialized the transcoded query parameter
+message to a JSON string with :func:`google.protobuf.json_format.MessageToJson`
+only to parse it straight back into a dictionary. :func:`to_dict` builds the
+same dictionary directly from the set fields of the message.
+
+Query parameters are almost always strings, integers, booleans and enums.
+Fields of any other type are rare in query parameters; if one is set, the
+whole message falls back to the JSON round trip, so the result is always
+identical to it. So does any error while converting a message.
+
+The generated REST transports are pointed at :func:`to_dict` by
+``scripts/client-post-processing/compute-query-params-encoding.yaml``,
+which reapplies the change whenever the transports are regenerated.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from google.protobuf import descriptor, json_format, message
+
+_LOGGER = logging.getLogger(__name__)
+
+_FieldDescriptor = descriptor.FieldDescriptor
+
+_IDENTITY_TYPES = frozenset(
+    [
+        _FieldDescriptor.TYPE_STRING,
+        _FieldDescriptor.TYPE_BOOL,
+        _FieldDescriptor.TYPE_INT32,
+        _FieldDescriptor.TYPE_SINT32,
+        _FieldDescriptor.TYPE_SFIXED32,
+        _FieldDescriptor.TYPE_UINT32,
+        _FieldDescriptor.TYPE_FIXED32,
+    ]
+)
+
+# The proto3 JSON mapping encodes 64-bit integers as strings.
+_STRING_TYPES = frozenset(
+    [
+        _FieldDescriptor.TYPE_INT64,
+        _FieldDescriptor.TYPE_SINT64,
+        _FieldDescriptor.TYPE_SFIXED64,
+        _FieldDescriptor.TYPE_UINT64,
+        _FieldDescriptor.TYPE_FIXED64,
+    ]
+)
+
+# Converters for each field, keyed by whether enums are encoded as integers
+# and the field descriptor. ``None`` marks fields which need the JSON round
+# trip.
+_converters: Dict[bool, Dict[_FieldDescriptor, Optional[Callable]]] = {
+    False: {},
+    True: {},
+}
+
+
+def _identity(value):
+    return value
+
+
+def _is_repeated(field: _FieldDescriptor) -> bool:
+    # Newer protobuf runtimes have ``is_repeated`` and no longer have
+    # ``label``.
+    is_repeated = getattr(field, "is_repeated", None)
+    if is_repeated is not None:
+        return is_repeated
+    return field.label == _FieldDescriptor.LABEL_REPEATED  # pragma: NO COVER
+
+
+def _enum_converter(field: _FieldDescriptor) -> Callable:
+    values_by_number = field.enum_type.values_by_number
+
+    def convert(value):
+        enum_value = values_by_number.get(value)
+        # Unknown values are encoded as numbers, as json_format does.
+        return value if enum_value is None else enum_value.name
+
+    return convert
+
+
+def _make_converter(
+    field: _FieldDescriptor, use_integers_for_enums: bool
+) -> Optional[Callable]:
+    if field.type in _IDENTITY_TYPES:
+        convert = _identity
+    elif field.type in _STRING_TYPES:
+        convert = str
+    elif field.type == _FieldDescriptor.TYPE_ENUM:
+        convert = _identity if use_integers_for_enums else _enum_converter(field)
+    else:
+        return None
+
+    if not _is_repeated(field):
+        return convert
+    if convert is _identity:
+        return list
+    return lambda values: [convert(value) for value in values]
+
+
+def to_dict(
+    query_params: message.Message, use_integers_for_enums: bool = False
+) -> Dict[str, Any]:
+    """Convert a transcoded query parameter message to a dictionary.
+
+    Equivalent to
+    ``json.loads(json_format.MessageToJson(query_params, use_integers_for_enums))``.
+
+    Args:
+        query_params (google.protobuf.message.Message): The
+            ``query_params`` of a request transcoded by
+            :func:`google.api_core.path_template.transcode`.
+        use_integers_for_enums (bool): Whether to encode enums as numbers
+            rather than names.
+
+    Returns:
+        Dict[str, Any]: The query parameters, keyed by JSON field name.
+    """
+    try:
+        result = _convert(query_params, use_integers_for_enums)
+    except Exception:
+        # Never fail where the JSON round trip would not.
+        _LOGGER.debug("Falling back to json_format.", exc_info=True)
+        result = None
+    if result is None:
+        return json.loads(
+            json_format.MessageToJson(
+                query_params,
+                use_integers_for_enums=use_integers_for_enums,
+            )
+        )
+    return result
+
+
+def _convert(
+    query_params: message.Message, use_integers_for_enums: bool
+) -> Optional[Dict[str, Any]]:
+    """Convert the fields of a message, or return ``None`` if one needs JSON."""
+    converters = _converters[use_integers_for_enums]
+    result = {}
+    for field, value in query_params.ListFields():
+        try:
+            convert = converters[field]
+        except KeyError:
+            convert = converters[field] = _make_converter(field, use_integers_for_enums)
+        if convert is None:
+            return None
+        result[field.json_name] = convert(value)
+    return result
@@ -0,0 +1,431 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Streaming and fan-out strategies for compute aggregated lists.
+
+``aggregated_list`` returns every scope of a project in a single response,
+which the generated REST transport decodes in full before the pager yields
+anything. The helpers in this module offer two alternatives:
+
+* :func:`iter_aggregated_list` decodes the response incrementally and yields
+  each ``(scope, scoped_list)`` pair as soon as that scope has been read.
+* :func:`fan_out_list` issues concurrent per-zone (or per-region) ``list``
+  calls on a thread pool and yields the same pairs as each call completes.
+
+Example::
+
+    from google.cloud import compute_v1
+    from google.cloud.compute_v1 import aggregated
+
+    client = compute_v1.InstancesClient()
+    for scope, scoped_list in aggregated.iter_aggregated_list(
+        client, project="my-project"
+    ):
+        for instance in scoped_list.instances:
+            print(scope, instance.name)
+"""
+
+import codecs
+from concurrent import futures
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1, path_template, rest_helpers
+from google.api_core import retry as retries
+from google.protobuf import json_format
+import proto  # type: ignore
+
+from google.cloud.compute_v1 import _query_params
+from google.cloud.compute_v1 import gapic_version as package_version
+from google.cloud.compute_v1.types import compute
+
+try:
+    OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault, None]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
+
+# Services whose aggregated collection is not named after the client.
+_COLLECTION_OVERRIDES = {
+    "GlobalOperations": "operations",
+    "RegionCommitments": "commitments",
+}
+
+_AGGREGATED_URI = "/compute/v1/projects/{{project}}/aggregated/{collection}"
+
+_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+_DEFAULT_MAX_WORKERS = 8
+
+_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
+    gapic_version=package_version.__version__
+)
+
+
+def _service_name(client) -> str:
+    name = type(client).__name__
+    if not name.endswith("Client"):
+        raise TypeError("Expected a compute_v1 service client, got {}.".format(name))
+    return name[: -len("Client")]
+
+
+def _collection(service: str) -> str:
+    collection = _COLLECTION_OVERRIDES.get(service)
+    if collection is None:
+        collection = service[0].lower() + service[1:]
+    return collection
+
+
+def _scoped_list_type(service: str):
+    collection = _collection(service)
+    name = collection[0].upper() + collection[1:] + "ScopedList"
+    try:
+        return getattr(compute, name)
+    except AttributeError:
+        raise TypeError(
+            "{}Client does not support aggregated lists.".format(service)
+        ) from None
+
+
+def _parse_scoped_list(scoped_list_type, value: Dict[str, Any]):
+    scoped_list = scoped_list_type()
+    json_format.ParseDict(
+        value, scoped_list_type.pb(scoped_list), ignore_unknown_fields=True
+    )
+    return scoped_list
+
+
+class _JsonStream(object):
+    """Decodes JSON values one at a time from a stream of text chunks.
+
+    Only the text of the value currently being decoded is kept in memory,
+    so the members of a very large object can be consumed one by one.
+    """
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._buffer = ""
+        self._pos = 0
+        self._exhausted = False
+        self._decoder = json.JSONDecoder()
+
+    def _read_more(self) -> bool:
+        # Read at least as much as is already buffered, so that repeatedly
+        # re-decoding a large value costs amortized linear time.
+        pending = self._buffer[self._pos :]
+        parts = [pending]
+        wanted = max(len(pending), _CHUNK_SIZE)
+        received = 0
+        while received < wanted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._exhausted = True
+                break
+            parts.append(chunk)
+            received += len(chunk)
+        self._buffer = "".join(parts)
+        self._pos = 0
+        return received > 0
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read_more():
+                raise ValueError("Unexpected end of JSON response.")
+
+    def expect(self, *chars: str) -> str:
+        """Consume the next non-whitespace character, which must be in ``chars``."""
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(
+                "Expected one of {!r} in JSON response, got {!r}.".format(chars, char)
+            )
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # A bare number at the end of the buffer may have been truncated.
+            if end == len(self._buffer) and not self._exhausted:
+                if not isinstance(value, (dict, list, str)) and self._read_more():
+                    continue
+            self._pos = end
+            return value
+
+    def members(self) -> Iterator[str]:
+        """Yield the keys of the next JSON object.
+
+        The caller must consume each member's value (for example with
+        :meth:`value`) before advancing the iterator.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.expect("}")
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.expect(",", "}") == "}":
+                return
+
+
+def _open_page(transport, http_options, request, *, timeout=None, metadata=()):
+    """Send one aggregated list request, and return the unread response.
+
+    Mirrors the generated REST stub, except that the response body is
+    streamed rather than read and decoded in full.
+    """
+    request, metadata = transport._interceptor.pre_aggregated_list(request, metadata)
+    transcoded_request = path_template.transcode(
+        http_options, type(request).pb(request)
+    )
+    query_params = _query_params.to_dict(
+        transcoded_request["query_params"], use_integers_for_enums=False
+    )
+    headers = dict(metadata)
+    headers["Content-Type"] = "application/json"
+    response = getattr(transport._session, transcoded_request["method"])(
+        "{host}{uri}".format(host=transport.host, uri=transcoded_request["uri"]),
+        timeout=timeout,
+        headers=headers,
+        params=rest_helpers.flatten_query_params(query_params, strict=True),
+        stream=True,
+    )
+    if response.status_code >= 400:
+        try:
+            raise core_exceptions.from_http_response(response)
+        finally:
+            response.close()
+    return response
+
+
+# The generated transports wrap every compute ``aggregated_list`` method with
+# no default retry or timeout.
+_open_page_rpc = gapic_v1.method.wrap_method(
+    _open_page, default_timeout=None, client_info=_CLIENT_INFO
+)
+
+
+def _decode_chunks(response) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+def iter_aggregated_list(
+    client,
+    request: Optional[Union[proto.Message, dict]] = None,
+    *,
+    project: Optional[str] = None,
+    retry: OptionalRetry = gapic_v1.method.DEFAULT,
+    timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> Iterator[Tuple[str, proto.Message]]:
+    """Stream the scopes of an aggregated list as they are decoded.
+
+    Unlike ``client.aggregated_list``, the response is read from the
+    network and decoded incrementally, one scope at a time. Only the scope
+    being decoded is held in memory, and the caller may stop iterating at
+    any point. Subsequent pages are requested as needed.
+
+    Each page is requested over the REST transport of ``client``. As with
+    ``client.aggregated_list``, there is no retry or timeout by default; a
+    given retry and timeout apply until the response starts to arrive. The
+    interceptor's ``pre_aggregated_list`` hook is applied, but the
+    ``post_aggregated_list`` hook is not, since no aggregated list message
+    is ever materialized.
+
+    Args:
+        client: A compute_v1 service client with an ``aggregated_list``
+            method, such as :class:`~google.cloud.compute_v1.InstancesClient`.
+        request (Union[proto.Message, dict]): The ``AggregatedList`` request
+            for the client's service.
+        project (str): Project ID for this request. This should not be set
+            if ``request`` is provided.
+        retry (google.api_core.retry.Retry): Designation of what errors, if
+            any, should be retried when requesting each page.
+        timeout (float): The timeout for each HTTP request.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with the request as metadata.
+
+    Returns:
+        Iterator[Tuple[str, proto.Message]]: ``(scope, scoped_list)`` pairs,
+        such as ``("zones/us-central1-a", InstancesScopedList(...))``.
+
+    Raises:
+        ValueError: If both ``request`` and ``project`` are set.
+        TypeError: If ``client`` does not support aggregated lists.
+        google.api_core.exceptions.GoogleAPICallError: If a request fails.
+    """
+    service = _service_name(client)
+    scoped_list_type = _scoped_list_type(service)
+    request_type = getattr(compute, "AggregatedList{}Request".format(service))
+
+    if request is not None and project is not None:
+        raise ValueError(
+            "If the `request` argument is set, then none of "
+            "the individual field arguments should be set."
+        )
+    request = request_type(request)
+    if project is not None:
+        request.project = project
+
+    transport = client.transport
+    http_options = [
+        {
+            "method": "get",
+            "uri": _AGGREGATED_URI.format(collection=_collection(service)),
+        }
+    ]
+    metadata = tuple(metadata) + (
+        gapic_v1.routing_header.to_grpc_metadata((("project", request.project),)),
+    )
+    client._validate_universe_domain()
+
+    while True:
+        response = _open_page_rpc(
+            transport,
+            http_options,
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        try:
+            next_page_token = ""
+            stream = _JsonStream(_decode_chunks(response))
+            for key in stream.members():
+                if key == "items":
+                    for scope in stream.members():
+                        yield scope, _parse_scoped_list(
+                            scoped_list_type, stream.value()
+                        )
+                elif key == "nextPageToken":
+                    next_page_token = stream.value()
+                else:
+                    stream.value()
+        finally:
+            response.close()
+
+        if not next_page_token:
+            return
+        request.page_token = next_page_token
+
+
+def fan_out_list(
+    client,
+    scopes: Iterable[str],
+    request: Optional[Dict[str, Any]] = None,
+    *,
+    project: Optional[str] = None,
+    max_workers: int = _DEFAULT_MAX_WORKERS,
+    retry: OptionalRetry = gapic_v1.method.DEFAULT,
+    timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> Iterator[Tuple[str, proto.Message]]:
+    """Emulate an aggregated list with concurrent per-scope ``list`` calls.
+
+    Each scope is listed (with all of its pages) on a thread pool, and
+    results are yielded as each scope completes, so the order of the
+    scopes is not preserved. This is useful when only a known subset of
+    zones or regions is of interest, or to spread decoding of a very large
+    project across several connections.
+
+    Args:
+        client: A compute_v1 service client whose ``list`` method takes a
+            ``zone`` or ``region``, such as
+            :class:`~google.cloud.compute_v1.InstancesClient`.
+        scopes (Iterable[str]): The scopes to list, in the same form as the
+            keys of an aggregated list, e.g. ``"zones/us-central1-a"`` or
+            ``"regions/us-central1"``.
+        request (dict): Additional ``List`` request fields (such as
+            ``filter``) applied to every call.
+        project (str): Project ID for this request. May also be given in
+            ``request``.
+        max_workers (int): The maximum number of concurrent ``list`` calls.
+        retry (google.api_core.retry.Retry): Designation of what errors, if
+            any, should be retried. Defaults to the retry of ``list``.
+        timeout (float): The timeout for each request. Defaults to the
+            timeout of ``list``.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with the request as metadata.
+
+    Returns:
+        Iterator[Tuple[str, proto.Message]]: ``(scope, scoped_list)`` pairs,
+        such as ``("zones/us-central1-a", InstancesScopedList(...))``.
+
+    Raises:
+        ValueError: If a scope is not of the form ``zones/*`` or
+            ``regions/*``.
+        TypeError: If ``client`` does not support aggregated lists.
+        google.api_core.exceptions.GoogleAPICallError: If a request fails.
+    """
+    scoped_list_type = _scoped_list_type(_service_name(client))
+    items_field = next(
+        field.name
+        for field in scoped_list_type.pb().DESCRIPTOR.fields
+        if field.name != "warning"
+    )
+
+    base_request = dict(request or {})
+    if project is not None:
+        base_request["project"] = project
+
+    scope_requests = []
+    for scope in scopes:
+        kind, _, name = scope.partition("/")
+        if kind not in ("zones", "regions") or not name:
+            raise ValueError("Unsupported scope {!r}.".format(scope))
+        scope_request = dict(base_request)
+        scope_request[kind[:-1]] = name
+        scope_requests.append((scope, scope_request))
+
+    def list_scope(scope_request):
+        pager = client.list(
+            request=scope_request, retry=retry, timeout=timeout, metadata=metadata
+        )
+        return scoped_list_type({items_field: list(pager)})
+
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {
+            executor.submit(list_scope, scope_request): scope
+            for scope, scope_request in scope_requests
+        }
+        try:
+            for future in futures.as_completed(pending):
+                yield pending[future], future.result()
+        finally:
+            for future in pending:
+                future.cancel()
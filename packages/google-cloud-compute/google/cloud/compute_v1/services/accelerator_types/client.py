@@ -655,6 +655,7 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves an aggregated list of accelerator types.
 
@@ -700,6 +701,10 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.accelerator_types.pagers.AggregatedListPager:
@@ -757,6 +762,7 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -909,6 +915,7 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves a list of accelerator types that are
         available to the specified project.
@@ -963,6 +970,10 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.accelerator_types.pagers.ListPager:
@@ -1029,6 +1040,7 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
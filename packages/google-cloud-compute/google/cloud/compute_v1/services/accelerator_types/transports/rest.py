@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import AcceleratorTypesTransport
@@ -168,6 +169,7 @@ class AcceleratorTypesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: AcceleratorTypesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
@@ -202,6 +204,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
         url_scheme: str = "https",
         interceptor: Optional[AcceleratorTypesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -238,6 +241,12 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -266,6 +275,9 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or AcceleratorTypesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(AcceleratorTypesRestStub):
@@ -322,11 +334,9 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -349,7 +359,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             resp = compute.AcceleratorTypeAggregatedList()
             pb_resp = compute.AcceleratorTypeAggregatedList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -415,11 +425,9 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -442,7 +450,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             resp = compute.AcceleratorType()
             pb_resp = compute.AcceleratorType.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -500,11 +508,9 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -527,7 +533,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             resp = compute.AcceleratorTypeList()
             pb_resp = compute.AcceleratorTypeList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -540,7 +546,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -548,7 +554,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
     ) -> Callable[[compute.GetAcceleratorTypeRequest], compute.AcceleratorType]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -556,7 +562,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
     ) -> Callable[[compute.ListAcceleratorTypesRequest], compute.AcceleratorTypeList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 from collections import OrderedDict
-import functools
 import os
 import re
 from typing import (
@@ -50,6 +49,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import extended_operation  # type: ignore
 
+from google.cloud.compute_v1 import _operations
 from google.cloud.compute_v1.services.addresses import pagers
 from google.cloud.compute_v1.types import compute
 
@@ -648,6 +648,7 @@ class AddressesClient(metaclass=AddressesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves an aggregated list of addresses.
 
@@ -693,6 +694,10 @@ class AddressesClient(metaclass=AddressesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.addresses.pagers.AggregatedListPager:
@@ -750,6 +755,7 @@ class AddressesClient(metaclass=AddressesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -1012,30 +1018,9 @@ class AddressesClient(metaclass=AddressesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._region_operations_client
-        operation_request = compute.GetRegionOperationRequest()
-        operation_request.project = request.project
-        operation_request.region = request.region
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.RegionOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1425,30 +1410,9 @@ class AddressesClient(metaclass=AddressesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._region_operations_client
-        operation_request = compute.GetRegionOperationRequest()
-        operation_request.project = request.project
-        operation_request.region = request.region
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.RegionOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1462,6 +1426,7 @@ class AddressesClient(metaclass=AddressesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves a list of addresses contained within the
         specified region.
@@ -1513,6 +1478,10 @@ class AddressesClient(metaclass=AddressesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.addresses.pagers.ListPager:
@@ -1579,6 +1548,7 @@ class AddressesClient(metaclass=AddressesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -1867,30 +1837,9 @@ class AddressesClient(metaclass=AddressesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._region_operations_client
-        operation_request = compute.GetRegionOperationRequest()
-        operation_request.project = request.project
-        operation_request.region = request.region
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.RegionOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2182,30 +2131,9 @@ class AddressesClient(metaclass=AddressesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._region_operations_client
-        operation_request = compute.GetRegionOperationRequest()
-        operation_request.project = request.project
-        operation_request.region = request.region
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.RegionOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import AddressesTransport
@@ -270,6 +271,7 @@ class AddressesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: AddressesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class AddressesRestTransport(AddressesTransport):
@@ -302,6 +304,7 @@ class AddressesRestTransport(AddressesTransport):
         url_scheme: str = "https",
         interceptor: Optional[AddressesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -338,6 +341,12 @@ class AddressesRestTransport(AddressesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -366,6 +375,9 @@ class AddressesRestTransport(AddressesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or AddressesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(AddressesRestStub):
@@ -422,11 +434,9 @@ class AddressesRestTransport(AddressesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -449,7 +459,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.AddressAggregatedList()
             pb_resp = compute.AddressAggregatedList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -524,11 +534,9 @@ class AddressesRestTransport(AddressesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -551,7 +559,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -615,11 +623,9 @@ class AddressesRestTransport(AddressesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -642,7 +648,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.Address()
             pb_resp = compute.Address.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -723,11 +729,9 @@ class AddressesRestTransport(AddressesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -751,7 +755,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -808,11 +812,9 @@ class AddressesRestTransport(AddressesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -835,7 +837,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.AddressList()
             pb_resp = compute.AddressList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -915,11 +917,9 @@ class AddressesRestTransport(AddressesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -943,7 +943,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_move(resp)
             return resp
 
@@ -1024,11 +1024,9 @@ class AddressesRestTransport(AddressesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1052,7 +1050,7 @@ class AddressesRestTransport(AddressesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_labels(resp)
             return resp
 
@@ -1064,37 +1062,37 @@ class AddressesRestTransport(AddressesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(self) -> Callable[[compute.DeleteAddressRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(self) -> Callable[[compute.GetAddressRequest], compute.Address]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(self) -> Callable[[compute.InsertAddressRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(self) -> Callable[[compute.ListAddressesRequest], compute.AddressList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def move(self) -> Callable[[compute.MoveAddressRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Move(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Move(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_labels(
@@ -1102,7 +1100,7 @@ class AddressesRestTransport(AddressesTransport):
     ) -> Callable[[compute.SetLabelsAddressRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetLabels(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetLabels(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import AutoscalersTransport
@@ -278,6 +279,7 @@ class AutoscalersRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: AutoscalersRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class AutoscalersRestTransport(AutoscalersTransport):
@@ -310,6 +312,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
         url_scheme: str = "https",
         interceptor: Optional[AutoscalersRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -346,6 +349,12 @@ class AutoscalersRestTransport(AutoscalersTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -374,6 +383,9 @@ class AutoscalersRestTransport(AutoscalersTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or AutoscalersRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(AutoscalersRestStub):
@@ -430,11 +442,9 @@ class AutoscalersRestTransport(AutoscalersTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -457,7 +467,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.AutoscalerAggregatedList()
             pb_resp = compute.AutoscalerAggregatedList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -532,11 +542,9 @@ class AutoscalersRestTransport(AutoscalersTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -559,7 +567,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -629,11 +637,9 @@ class AutoscalersRestTransport(AutoscalersTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -656,7 +662,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.Autoscaler()
             pb_resp = compute.Autoscaler.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -737,11 +743,9 @@ class AutoscalersRestTransport(AutoscalersTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -765,7 +769,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -825,11 +829,9 @@ class AutoscalersRestTransport(AutoscalersTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -852,7 +854,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.AutoscalerList()
             pb_resp = compute.AutoscalerList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -933,11 +935,9 @@ class AutoscalersRestTransport(AutoscalersTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -961,7 +961,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -1042,11 +1042,9 @@ class AutoscalersRestTransport(AutoscalersTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1070,7 +1068,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update(resp)
             return resp
 
@@ -1082,25 +1080,25 @@ class AutoscalersRestTransport(AutoscalersTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(self) -> Callable[[compute.DeleteAutoscalerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(self) -> Callable[[compute.GetAutoscalerRequest], compute.Autoscaler]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(self) -> Callable[[compute.InsertAutoscalerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -1108,19 +1106,19 @@ class AutoscalersRestTransport(AutoscalersTransport):
     ) -> Callable[[compute.ListAutoscalersRequest], compute.AutoscalerList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(self) -> Callable[[compute.PatchAutoscalerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def update(self) -> Callable[[compute.UpdateAutoscalerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Update(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Update(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 from collections import OrderedDict
-import functools
 import os
 import re
 from typing import (
@@ -50,6 +49,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import extended_operation  # type: ignore
 
+from google.cloud.compute_v1 import _operations
 from google.cloud.compute_v1.services.backend_buckets import pagers
 from google.cloud.compute_v1.types import compute
 
@@ -908,29 +908,9 @@ class BackendBucketsClient(metaclass=BackendBucketsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1172,29 +1152,9 @@ class BackendBucketsClient(metaclass=BackendBucketsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1468,29 +1428,9 @@ class BackendBucketsClient(metaclass=BackendBucketsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1982,29 +1922,9 @@ class BackendBucketsClient(metaclass=BackendBucketsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2017,6 +1937,7 @@ class BackendBucketsClient(metaclass=BackendBucketsClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves the list of BackendBucket resources
         available to the specified project.
@@ -2063,6 +1984,10 @@ class BackendBucketsClient(metaclass=BackendBucketsClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.backend_buckets.pagers.ListPager:
@@ -2122,6 +2047,7 @@ class BackendBucketsClient(metaclass=BackendBucketsClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -2386,29 +2312,9 @@ class BackendBucketsClient(metaclass=BackendBucketsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2686,29 +2592,9 @@ class BackendBucketsClient(metaclass=BackendBucketsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3258,29 +3144,9 @@ class BackendBucketsClient(metaclass=BackendBucketsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
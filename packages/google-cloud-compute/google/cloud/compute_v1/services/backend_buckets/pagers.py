@@ -24,6 +24,7 @@ from typing import (
     Tuple,
 )
 
+from google.cloud.compute_v1 import _prefetch
 from google.cloud.compute_v1.types import compute
 
 
@@ -51,7 +52,8 @@ class ListPager:
         request: compute.ListBackendBucketsRequest,
         response: compute.BackendBucketList,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0
     ):
         """Instantiate the pager.
 
@@ -64,17 +66,32 @@ class ListPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch ahead on a
+                background thread while the current page is consumed.
+                The default of ``0`` fetches each page only when needed.
         """
         self._method = method
         self._request = compute.ListBackendBucketsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch_pages = prefetch_pages
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     def pages(self) -> Iterator[compute.BackendBucketList]:
+        if self._prefetch_pages:
+            for page in _prefetch.prefetch_pages(
+                self._method,
+                self._request,
+                self._response,
+                metadata=self._metadata,
+                depth=self._prefetch_pages,
+            ):
+                self._response = page
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
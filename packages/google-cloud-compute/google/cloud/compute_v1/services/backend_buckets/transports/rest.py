@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import BackendBucketsTransport
@@ -437,6 +438,7 @@ class BackendBucketsRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: BackendBucketsRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class BackendBucketsRestTransport(BackendBucketsTransport):
@@ -469,6 +471,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
         url_scheme: str = "https",
         interceptor: Optional[BackendBucketsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -505,6 +508,12 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -533,6 +542,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or BackendBucketsRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AddSignedUrlKey(BackendBucketsRestStub):
@@ -614,11 +626,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -642,7 +652,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_signed_url_key(resp)
             return resp
 
@@ -717,11 +727,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -744,7 +752,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -823,11 +831,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -850,7 +856,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete_signed_url_key(resp)
             return resp
 
@@ -913,11 +919,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -940,7 +944,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.BackendBucket()
             pb_resp = compute.BackendBucket.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -1021,11 +1025,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1048,7 +1050,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_iam_policy(resp)
             return resp
 
@@ -1129,11 +1131,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1157,7 +1157,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -1217,11 +1217,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1244,7 +1242,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.BackendBucketList()
             pb_resp = compute.BackendBucketList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1325,11 +1323,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1353,7 +1349,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -1436,11 +1432,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1464,7 +1458,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_edge_security_policy(resp)
             return resp
 
@@ -1551,11 +1545,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1579,7 +1571,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_iam_policy(resp)
             return resp
 
@@ -1645,11 +1637,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1673,7 +1663,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.TestPermissionsResponse()
             pb_resp = compute.TestPermissionsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_test_iam_permissions(resp)
             return resp
 
@@ -1754,11 +1744,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1782,7 +1770,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update(resp)
             return resp
 
@@ -1792,7 +1780,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.AddSignedUrlKeyBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddSignedUrlKey(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddSignedUrlKey(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -1800,7 +1788,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.DeleteBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete_signed_url_key(
@@ -1808,13 +1796,13 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.DeleteSignedUrlKeyBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._DeleteSignedUrlKey(self._session, self._host, self._interceptor)  # type: ignore
+        return self._DeleteSignedUrlKey(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(self) -> Callable[[compute.GetBackendBucketRequest], compute.BackendBucket]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_iam_policy(
@@ -1822,7 +1810,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.GetIamPolicyBackendBucketRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetIamPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -1830,7 +1818,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.InsertBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -1838,13 +1826,13 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.ListBackendBucketsRequest], compute.BackendBucketList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(self) -> Callable[[compute.PatchBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_edge_security_policy(
@@ -1854,7 +1842,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetEdgeSecurityPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetEdgeSecurityPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_iam_policy(
@@ -1862,7 +1850,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.SetIamPolicyBackendBucketRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetIamPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def test_iam_permissions(
@@ -1873,7 +1861,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._TestIamPermissions(self._session, self._host, self._interceptor)  # type: ignore
+        return self._TestIamPermissions(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def update(
@@ -1881,7 +1869,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     ) -> Callable[[compute.UpdateBackendBucketRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Update(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Update(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 from collections import OrderedDict
-import functools
 import os
 import re
 from typing import (
@@ -50,6 +49,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import extended_operation  # type: ignore
 
+from google.cloud.compute_v1 import _operations
 from google.cloud.compute_v1.services.backend_services import pagers
 from google.cloud.compute_v1.types import compute
 
@@ -908,29 +908,9 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -945,6 +925,7 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves the list of all BackendService resources,
         regional and global, available to the specified project.
@@ -993,6 +974,10 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.backend_services.pagers.AggregatedListPager:
@@ -1052,6 +1037,7 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -1294,29 +1280,9 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1590,29 +1556,9 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2252,29 +2198,9 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2287,6 +2213,7 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves the list of BackendService resources
         available to the specified project.
@@ -2333,6 +2260,10 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.backend_services.pagers.ListPager:
@@ -2392,6 +2323,7 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -2405,6 +2337,7 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListUsablePager:
         r"""Retrieves an aggregated list of all usable backend
         services in the specified project.
@@ -2451,6 +2384,10 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.backend_services.pagers.ListUsablePager:
@@ -2510,6 +2447,7 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -2776,29 +2714,9 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3078,29 +2996,9 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3537,29 +3435,9 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3956,29 +3834,9 @@ class BackendServicesClient(metaclass=BackendServicesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_operations_client
-        operation_request = compute.GetGlobalOperationRequest()
-        operation_request.project = request.project
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
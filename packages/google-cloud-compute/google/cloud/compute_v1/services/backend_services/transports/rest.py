@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import BackendServicesTransport
@@ -563,6 +564,7 @@ class BackendServicesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: BackendServicesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class BackendServicesRestTransport(BackendServicesTransport):
@@ -595,6 +597,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
         url_scheme: str = "https",
         interceptor: Optional[BackendServicesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -631,6 +634,12 @@ class BackendServicesRestTransport(BackendServicesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -659,6 +668,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or BackendServicesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AddSignedUrlKey(BackendServicesRestStub):
@@ -740,11 +752,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -768,7 +778,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_signed_url_key(resp)
             return resp
 
@@ -828,11 +838,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -855,7 +863,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.BackendServiceAggregatedList()
             pb_resp = compute.BackendServiceAggregatedList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -930,11 +938,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -957,7 +963,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -1036,11 +1042,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1063,7 +1067,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete_signed_url_key(resp)
             return resp
 
@@ -1136,11 +1140,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1163,7 +1165,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.BackendService()
             pb_resp = compute.BackendService.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -1227,11 +1229,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1255,7 +1255,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.BackendServiceGroupHealth()
             pb_resp = compute.BackendServiceGroupHealth.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_health(resp)
             return resp
 
@@ -1336,11 +1336,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1363,7 +1361,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_iam_policy(resp)
             return resp
 
@@ -1444,11 +1442,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1472,7 +1468,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -1532,11 +1528,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1559,7 +1553,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.BackendServiceList()
             pb_resp = compute.BackendServiceList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1619,11 +1613,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1646,7 +1638,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.BackendServiceListUsable()
             pb_resp = compute.BackendServiceListUsable.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_usable(resp)
             return resp
 
@@ -1727,11 +1719,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1755,7 +1745,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -1838,11 +1828,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1866,7 +1854,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_edge_security_policy(resp)
             return resp
 
@@ -1953,11 +1941,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1981,7 +1967,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_iam_policy(resp)
             return resp
 
@@ -2064,11 +2050,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2092,7 +2076,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_security_policy(resp)
             return resp
 
@@ -2158,11 +2142,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2186,7 +2168,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.TestPermissionsResponse()
             pb_resp = compute.TestPermissionsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_test_iam_permissions(resp)
             return resp
 
@@ -2267,11 +2249,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2295,7 +2275,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update(resp)
             return resp
 
@@ -2305,7 +2285,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.AddSignedUrlKeyBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddSignedUrlKey(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddSignedUrlKey(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def aggregated_list(
@@ -2316,7 +2296,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -2324,7 +2304,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.DeleteBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete_signed_url_key(
@@ -2332,7 +2312,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.DeleteSignedUrlKeyBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._DeleteSignedUrlKey(self._session, self._host, self._interceptor)  # type: ignore
+        return self._DeleteSignedUrlKey(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -2340,7 +2320,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.GetBackendServiceRequest], compute.BackendService]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_health(
@@ -2350,7 +2330,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetHealth(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetHealth(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_iam_policy(
@@ -2358,7 +2338,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.GetIamPolicyBackendServiceRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetIamPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -2366,7 +2346,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.InsertBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -2374,7 +2354,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.ListBackendServicesRequest], compute.BackendServiceList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list_usable(
@@ -2384,7 +2364,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListUsable(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListUsable(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(
@@ -2392,7 +2372,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.PatchBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_edge_security_policy(
@@ -2402,7 +2382,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetEdgeSecurityPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetEdgeSecurityPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_iam_policy(
@@ -2410,7 +2390,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.SetIamPolicyBackendServiceRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetIamPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_security_policy(
@@ -2418,7 +2398,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.SetSecurityPolicyBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetSecurityPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetSecurityPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def test_iam_permissions(
@@ -2429,7 +2409,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._TestIamPermissions(self._session, self._host, self._interceptor)  # type: ignore
+        return self._TestIamPermissions(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def update(
@@ -2437,7 +2417,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[[compute.UpdateBackendServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Update(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Update(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -645,6 +645,7 @@ class DiskTypesClient(metaclass=DiskTypesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves an aggregated list of disk types.
 
@@ -690,6 +691,10 @@ class DiskTypesClient(metaclass=DiskTypesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.disk_types.pagers.AggregatedListPager:
@@ -747,6 +752,7 @@ class DiskTypesClient(metaclass=DiskTypesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -899,6 +905,7 @@ class DiskTypesClient(metaclass=DiskTypesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves a list of disk types available to the
         specified project.
@@ -952,6 +959,10 @@ class DiskTypesClient(metaclass=DiskTypesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.disk_types.pagers.ListPager:
@@ -1018,6 +1029,7 @@ class DiskTypesClient(metaclass=DiskTypesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
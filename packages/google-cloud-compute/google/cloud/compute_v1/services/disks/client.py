@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 from collections import OrderedDict
-import functools
 import os
 import re
 from typing import (
@@ -50,6 +49,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import extended_operation  # type: ignore
 
+from google.cloud.compute_v1 import _operations
 from google.cloud.compute_v1.services.disks import pagers
 from google.cloud.compute_v1.types import compute
 
@@ -929,30 +929,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -965,6 +944,7 @@ class DisksClient(metaclass=DisksClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves an aggregated list of persistent disks.
 
@@ -1010,6 +990,10 @@ class DisksClient(metaclass=DisksClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.disks.pagers.AggregatedListPager:
@@ -1067,6 +1051,7 @@ class DisksClient(metaclass=DisksClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -1333,30 +1318,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1646,30 +1610,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1941,30 +1884,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2526,30 +2448,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2563,6 +2464,7 @@ class DisksClient(metaclass=DisksClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves a list of persistent disks contained within
         the specified zone.
@@ -2616,6 +2518,10 @@ class DisksClient(metaclass=DisksClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.disks.pagers.ListPager:
@@ -2682,6 +2588,7 @@ class DisksClient(metaclass=DisksClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -2976,30 +2883,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3277,30 +3163,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3757,30 +3622,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -4072,30 +3916,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -4359,30 +4182,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -4668,30 +4470,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -5118,30 +4899,9 @@ class DisksClient(metaclass=DisksClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -257,6 +258,7 @@ class ExternalVpnGatewaysRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: ExternalVpnGatewaysRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
@@ -289,6 +291,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
         url_scheme: str = "https",
         interceptor: Optional[ExternalVpnGatewaysRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -325,6 +328,12 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -353,6 +362,9 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or ExternalVpnGatewaysRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _Delete(ExternalVpnGatewaysRestStub):
@@ -426,11 +438,9 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -453,7 +463,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -525,11 +535,9 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -552,7 +560,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             resp = compute.ExternalVpnGateway()
             pb_resp = compute.ExternalVpnGateway.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -633,11 +641,9 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -661,7 +667,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -721,11 +727,9 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -748,7 +752,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             resp = compute.ExternalVpnGatewayList()
             pb_resp = compute.ExternalVpnGatewayList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -829,11 +833,9 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -857,7 +859,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_labels(resp)
             return resp
 
@@ -923,11 +925,9 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -951,7 +951,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             resp = compute.TestPermissionsResponse()
             pb_resp = compute.TestPermissionsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_test_iam_permissions(resp)
             return resp
 
@@ -961,7 +961,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
     ) -> Callable[[compute.DeleteExternalVpnGatewayRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -969,7 +969,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
     ) -> Callable[[compute.GetExternalVpnGatewayRequest], compute.ExternalVpnGateway]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -977,7 +977,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
     ) -> Callable[[compute.InsertExternalVpnGatewayRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -987,7 +987,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_labels(
@@ -995,7 +995,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
     ) -> Callable[[compute.SetLabelsExternalVpnGatewayRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetLabels(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetLabels(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def test_iam_permissions(
@@ -1006,7 +1006,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._TestIamPermissions(self._session, self._host, self._interceptor)  # type: ignore
+        return self._TestIamPermissions(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 from collections import OrderedDict
-import functools
 import os
 import re
 from typing import (
@@ -50,6 +49,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import extended_operation  # type: ignore
 
+from google.cloud.compute_v1 import _operations
 from google.cloud.compute_v1.services.firewall_policies import pagers
 from google.cloud.compute_v1.types import compute
 
@@ -892,28 +892,9 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_organization_operations_client
-        operation_request = compute.GetGlobalOrganizationOperationRequest()
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOrganizationOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1147,28 +1128,9 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_organization_operations_client
-        operation_request = compute.GetGlobalOrganizationOperationRequest()
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOrganizationOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1386,28 +1348,9 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_organization_operations_client
-        operation_request = compute.GetGlobalOrganizationOperationRequest()
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOrganizationOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1625,28 +1568,9 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_organization_operations_client
-        operation_request = compute.GetGlobalOrganizationOperationRequest()
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOrganizationOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2323,29 +2247,9 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_organization_operations_client
-        operation_request = compute.GetGlobalOrganizationOperationRequest()
-        operation_request.parent_id = request.parent_id
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOrganizationOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2357,6 +2261,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Lists all the policies that have been configured for
         the specified folder or organization.
@@ -2397,6 +2302,10 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.firewall_policies.pagers.ListPager:
@@ -2435,6 +2344,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -2758,29 +2668,9 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_organization_operations_client
-        operation_request = compute.GetGlobalOrganizationOperationRequest()
-        operation_request.parent_id = request.parent_id
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOrganizationOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3016,28 +2906,9 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_organization_operations_client
-        operation_request = compute.GetGlobalOrganizationOperationRequest()
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOrganizationOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3271,28 +3142,9 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_organization_operations_client
-        operation_request = compute.GetGlobalOrganizationOperationRequest()
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOrganizationOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3516,28 +3368,9 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_organization_operations_client
-        operation_request = compute.GetGlobalOrganizationOperationRequest()
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOrganizationOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3755,28 +3588,9 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._global_organization_operations_client
-        operation_request = compute.GetGlobalOrganizationOperationRequest()
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.GlobalOrganizationOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
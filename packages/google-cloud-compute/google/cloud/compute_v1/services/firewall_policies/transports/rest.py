@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -613,6 +614,7 @@ class FirewallPoliciesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: FirewallPoliciesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
@@ -645,6 +647,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
         url_scheme: str = "https",
         interceptor: Optional[FirewallPoliciesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -681,6 +684,12 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -709,6 +718,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or FirewallPoliciesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AddAssociation(FirewallPoliciesRestStub):
@@ -788,11 +800,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -816,7 +826,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_association(resp)
             return resp
 
@@ -897,11 +907,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -925,7 +933,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_rule(resp)
             return resp
 
@@ -1000,11 +1008,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1027,7 +1033,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_clone_rules(resp)
             return resp
 
@@ -1102,11 +1108,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1129,7 +1133,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -1189,11 +1193,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1216,7 +1218,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.FirewallPolicy()
             pb_resp = compute.FirewallPolicy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -1274,11 +1276,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1301,7 +1301,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.FirewallPolicyAssociation()
             pb_resp = compute.FirewallPolicyAssociation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_association(resp)
             return resp
 
@@ -1382,11 +1382,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1409,7 +1407,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_iam_policy(resp)
             return resp
 
@@ -1471,11 +1469,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1498,7 +1494,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.FirewallPolicyRule()
             pb_resp = compute.FirewallPolicyRule.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_rule(resp)
             return resp
 
@@ -1581,11 +1577,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1609,7 +1603,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -1657,11 +1651,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
 
             # Send the request
@@ -1683,7 +1675,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.FirewallPolicyList()
             pb_resp = compute.FirewallPolicyList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1733,11 +1725,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
 
             # Send the request
@@ -1759,7 +1749,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.FirewallPoliciesListAssociationsResponse()
             pb_resp = compute.FirewallPoliciesListAssociationsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_associations(resp)
             return resp
 
@@ -1836,11 +1826,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1863,7 +1851,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_move(resp)
             return resp
 
@@ -1944,11 +1932,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1972,7 +1958,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -2053,11 +2039,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2081,7 +2065,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch_rule(resp)
             return resp
 
@@ -2158,11 +2142,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2185,7 +2167,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_remove_association(resp)
             return resp
 
@@ -2260,11 +2242,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2287,7 +2267,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_remove_rule(resp)
             return resp
 
@@ -2374,11 +2354,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2402,7 +2380,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_iam_policy(resp)
             return resp
 
@@ -2468,11 +2446,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2496,7 +2472,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             resp = compute.TestPermissionsResponse()
             pb_resp = compute.TestPermissionsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_test_iam_permissions(resp)
             return resp
 
@@ -2506,7 +2482,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.AddAssociationFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddAssociation(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddAssociation(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def add_rule(
@@ -2514,7 +2490,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.AddRuleFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def clone_rules(
@@ -2522,7 +2498,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.CloneRulesFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._CloneRules(self._session, self._host, self._interceptor)  # type: ignore
+        return self._CloneRules(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -2530,7 +2506,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.DeleteFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -2538,7 +2514,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.GetFirewallPolicyRequest], compute.FirewallPolicy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_association(
@@ -2548,7 +2524,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetAssociation(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetAssociation(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_iam_policy(
@@ -2556,7 +2532,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.GetIamPolicyFirewallPolicyRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetIamPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_rule(
@@ -2564,7 +2540,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.GetRuleFirewallPolicyRequest], compute.FirewallPolicyRule]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -2572,7 +2548,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.InsertFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -2580,7 +2556,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.ListFirewallPoliciesRequest], compute.FirewallPolicyList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list_associations(
@@ -2591,13 +2567,13 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListAssociations(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListAssociations(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def move(self) -> Callable[[compute.MoveFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Move(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Move(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(
@@ -2605,7 +2581,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.PatchFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch_rule(
@@ -2613,7 +2589,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.PatchRuleFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._PatchRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._PatchRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def remove_association(
@@ -2621,7 +2597,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.RemoveAssociationFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._RemoveAssociation(self._session, self._host, self._interceptor)  # type: ignore
+        return self._RemoveAssociation(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def remove_rule(
@@ -2629,7 +2605,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.RemoveRuleFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._RemoveRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._RemoveRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_iam_policy(
@@ -2637,7 +2613,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[[compute.SetIamPolicyFirewallPolicyRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetIamPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def test_iam_permissions(
@@ -2648,7 +2624,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._TestIamPermissions(self._session, self._host, self._interceptor)  # type: ignore
+        return self._TestIamPermissions(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
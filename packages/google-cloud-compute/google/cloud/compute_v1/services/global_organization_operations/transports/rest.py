@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -170,6 +171,7 @@ class GlobalOrganizationOperationsRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: GlobalOrganizationOperationsRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTransport):
@@ -202,6 +204,7 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
         url_scheme: str = "https",
         interceptor: Optional[GlobalOrganizationOperationsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -238,6 +241,12 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -266,6 +275,9 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or GlobalOrganizationOperationsRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _Delete(GlobalOrganizationOperationsRestStub):
@@ -325,11 +337,9 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -352,7 +362,7 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             resp = compute.DeleteGlobalOrganizationOperationResponse()
             pb_resp = compute.DeleteGlobalOrganizationOperationResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -427,11 +437,9 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -454,7 +462,7 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -504,11 +512,9 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
 
             # Send the request
@@ -530,7 +536,7 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             resp = compute.OperationList()
             pb_resp = compute.OperationList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -543,7 +549,7 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -551,7 +557,7 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
     ) -> Callable[[compute.GetGlobalOrganizationOperationRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -561,7 +567,7 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
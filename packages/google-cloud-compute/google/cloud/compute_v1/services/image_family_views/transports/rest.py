@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -104,6 +105,7 @@ class ImageFamilyViewsRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: ImageFamilyViewsRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class ImageFamilyViewsRestTransport(ImageFamilyViewsTransport):
@@ -136,6 +138,7 @@ class ImageFamilyViewsRestTransport(ImageFamilyViewsTransport):
         url_scheme: str = "https",
         interceptor: Optional[ImageFamilyViewsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -172,6 +175,12 @@ class ImageFamilyViewsRestTransport(ImageFamilyViewsTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -200,6 +209,9 @@ class ImageFamilyViewsRestTransport(ImageFamilyViewsTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or ImageFamilyViewsRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _Get(ImageFamilyViewsRestStub):
@@ -256,11 +268,9 @@ class ImageFamilyViewsRestTransport(ImageFamilyViewsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -283,7 +293,7 @@ class ImageFamilyViewsRestTransport(ImageFamilyViewsTransport):
             resp = compute.ImageFamilyView()
             pb_resp = compute.ImageFamilyView.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -293,7 +303,7 @@ class ImageFamilyViewsRestTransport(ImageFamilyViewsTransport):
     ) -> Callable[[compute.GetImageFamilyViewRequest], compute.ImageFamilyView]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 from collections import OrderedDict
-import functools
 import os
 import re
 from typing import (
@@ -50,6 +49,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import extended_operation  # type: ignore
 
+from google.cloud.compute_v1 import _operations
 from google.cloud.compute_v1.services.instance_group_managers import pagers
 from google.cloud.compute_v1.types import compute
 
@@ -980,30 +980,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1018,6 +997,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves the list of managed instance groups and
         groups them by zone.
@@ -1064,6 +1044,10 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.instance_group_managers.pagers.AggregatedListPager:
@@ -1121,6 +1105,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -1447,30 +1432,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1794,30 +1758,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2093,30 +2036,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2452,30 +2374,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2805,30 +2706,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3254,30 +3134,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -3291,6 +3150,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves a list of managed instance groups that are
         contained within the specified project and zone.
@@ -3345,6 +3205,10 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.instance_group_managers.pagers.ListPager:
@@ -3410,6 +3274,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -3427,6 +3292,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListErrorsPager:
         r"""Lists all errors thrown by actions on instances for a
         given managed instance group. The filter and orderBy
@@ -3493,6 +3359,10 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.instance_group_managers.pagers.ListErrorsPager:
@@ -3560,6 +3430,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -3577,6 +3448,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListManagedInstancesPager:
         r"""Lists all of the instances in the managed instance group. Each
         instance in the list has a currentAction, which indicates the
@@ -3646,6 +3518,10 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.instance_group_managers.pagers.ListManagedInstancesPager:
@@ -3715,6 +3591,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -3732,6 +3609,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPerInstanceConfigsPager:
         r"""Lists all of the per-instance configurations defined
         for the managed instance group. The orderBy query
@@ -3796,6 +3674,10 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.instance_group_managers.pagers.ListPerInstanceConfigsPager:
@@ -3869,6 +3751,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -4185,30 +4068,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -4542,30 +4404,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -4903,30 +4744,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -5264,30 +5084,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -5613,30 +5412,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -5958,30 +5736,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -6315,30 +6072,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
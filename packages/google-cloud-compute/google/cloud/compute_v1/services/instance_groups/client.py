@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 from collections import OrderedDict
-import functools
 import os
 import re
 from typing import (
@@ -50,6 +49,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import extended_operation  # type: ignore
 
+from google.cloud.compute_v1 import _operations
 from google.cloud.compute_v1.services.instance_groups import pagers
 from google.cloud.compute_v1.types import compute
 
@@ -950,30 +950,9 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -988,6 +967,7 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves the list of instance groups and sorts them
         by zone.
@@ -1034,6 +1014,10 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.instance_groups.pagers.AggregatedListPager:
@@ -1091,6 +1075,7 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -1363,30 +1348,9 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1792,30 +1756,9 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1829,6 +1772,7 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves the list of zonal instance group resources
         contained within the specified zone. For managed
@@ -1885,6 +1829,10 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.instance_groups.pagers.ListPager:
@@ -1951,6 +1899,7 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -1971,6 +1920,7 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListInstancesPager:
         r"""Lists the instances in the specified instance group. The orderBy
         query parameter is not supported. The filter query parameter is
@@ -2041,6 +1991,10 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.instance_groups.pagers.ListInstancesPager:
@@ -2119,6 +2073,7 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -2437,30 +2392,9 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2770,30 +2704,9 @@ class InstanceGroupsClient(metaclass=InstanceGroupsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -342,6 +343,7 @@ class InstanceGroupsRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: InstanceGroupsRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class InstanceGroupsRestTransport(InstanceGroupsTransport):
@@ -374,6 +376,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
         url_scheme: str = "https",
         interceptor: Optional[InstanceGroupsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -410,6 +413,12 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -438,6 +447,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or InstanceGroupsRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AddInstances(InstanceGroupsRestStub):
@@ -517,11 +529,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -545,7 +555,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_instances(resp)
             return resp
 
@@ -603,11 +613,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -630,7 +638,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             resp = compute.InstanceGroupAggregatedList()
             pb_resp = compute.InstanceGroupAggregatedList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -705,11 +713,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -732,7 +738,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -804,11 +810,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -831,7 +835,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             resp = compute.InstanceGroup()
             pb_resp = compute.InstanceGroup.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -912,11 +916,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -940,7 +942,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -998,11 +1000,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1025,7 +1025,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             resp = compute.InstanceGroupList()
             pb_resp = compute.InstanceGroupList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1089,11 +1089,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1117,7 +1115,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             resp = compute.InstanceGroupsListInstances()
             pb_resp = compute.InstanceGroupsListInstances.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_instances(resp)
             return resp
 
@@ -1200,11 +1198,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1228,7 +1224,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_remove_instances(resp)
             return resp
 
@@ -1309,11 +1305,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1337,7 +1331,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_named_ports(resp)
             return resp
 
@@ -1347,7 +1341,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     ) -> Callable[[compute.AddInstancesInstanceGroupRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddInstances(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddInstances(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def aggregated_list(
@@ -1358,7 +1352,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -1366,13 +1360,13 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     ) -> Callable[[compute.DeleteInstanceGroupRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(self) -> Callable[[compute.GetInstanceGroupRequest], compute.InstanceGroup]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -1380,7 +1374,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     ) -> Callable[[compute.InsertInstanceGroupRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -1388,7 +1382,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     ) -> Callable[[compute.ListInstanceGroupsRequest], compute.InstanceGroupList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list_instances(
@@ -1399,7 +1393,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListInstances(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListInstances(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def remove_instances(
@@ -1407,7 +1401,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     ) -> Callable[[compute.RemoveInstancesInstanceGroupRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._RemoveInstances(self._session, self._host, self._interceptor)  # type: ignore
+        return self._RemoveInstances(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_named_ports(
@@ -1415,7 +1409,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     ) -> Callable[[compute.SetNamedPortsInstanceGroupRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetNamedPorts(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetNamedPorts(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
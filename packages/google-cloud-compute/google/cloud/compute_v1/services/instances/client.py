@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 from collections import OrderedDict
-import functools
 import os
 import re
 from typing import (
@@ -50,6 +49,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import extended_operation  # type: ignore
 
+from google.cloud.compute_v1 import _operations
 from google.cloud.compute_v1.services.instances import pagers
 from google.cloud.compute_v1.types import compute
 
@@ -941,30 +941,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1262,30 +1241,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1298,6 +1256,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves an aggregated list of all of the instances
         in your project across all regions and zones. The
@@ -1347,6 +1306,10 @@ class InstancesClient(metaclass=InstancesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.instances.pagers.AggregatedListPager:
@@ -1404,6 +1367,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -1690,30 +1654,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1987,30 +1930,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2278,30 +2200,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2613,30 +2514,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -2924,30 +2804,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -4167,30 +4026,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -4204,6 +4042,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves the list of instances contained within the
         specified zone.
@@ -4257,6 +4096,10 @@ class InstancesClient(metaclass=InstancesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.instances.pagers.ListPager:
@@ -4323,6 +4166,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -4338,6 +4182,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListReferrersPager:
         r"""Retrieves a list of resources that refer to the VM
         instance specified in the request. For example, if the
@@ -4406,6 +4251,10 @@ class InstancesClient(metaclass=InstancesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.instances.pagers.ListReferrersPager:
@@ -4475,6 +4324,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -4745,30 +4595,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -5072,30 +4901,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -5365,30 +5173,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -5656,30 +5443,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -6086,30 +5852,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -6421,30 +6166,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -6905,30 +6629,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -7228,30 +6931,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -7547,30 +7229,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -7854,30 +7515,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -8177,30 +7817,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -8490,30 +8109,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -8801,30 +8399,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -9124,30 +8701,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -9445,30 +9001,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -9780,30 +9315,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -10087,30 +9601,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -10386,30 +9879,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -10679,30 +10151,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -11018,30 +10469,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -11317,30 +10747,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -11622,30 +11031,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -12080,30 +11468,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -12417,30 +11784,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -12732,30 +12078,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -13075,30 +12400,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -13406,30 +12710,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._zone_operations_client
-        operation_request = compute.GetZoneOperationRequest()
-        operation_request.project = request.project
-        operation_request.zone = request.zone
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.ZoneOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -1524,6 +1525,7 @@ class InstancesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: InstancesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class InstancesRestTransport(InstancesTransport):
@@ -1556,6 +1558,7 @@ class InstancesRestTransport(InstancesTransport):
         url_scheme: str = "https",
         interceptor: Optional[InstancesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -1592,6 +1595,12 @@ class InstancesRestTransport(InstancesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -1620,6 +1629,9 @@ class InstancesRestTransport(InstancesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or InstancesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AddAccessConfig(InstancesRestStub):
@@ -1703,11 +1715,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1731,7 +1741,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_access_config(resp)
             return resp
 
@@ -1814,11 +1824,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1842,7 +1850,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_resource_policies(resp)
             return resp
 
@@ -1900,11 +1908,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1927,7 +1933,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.InstanceAggregatedList()
             pb_resp = compute.InstanceAggregatedList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -2008,11 +2014,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2036,7 +2040,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_attach_disk(resp)
             return resp
 
@@ -2117,11 +2121,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2145,7 +2147,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_bulk_insert(resp)
             return resp
 
@@ -2220,11 +2222,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2247,7 +2247,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -2327,11 +2327,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2354,7 +2352,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete_access_config(resp)
             return resp
 
@@ -2431,11 +2429,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2458,7 +2454,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_detach_disk(resp)
             return resp
 
@@ -2520,11 +2516,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2547,7 +2541,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Instance()
             pb_resp = compute.Instance.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -2609,11 +2603,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2636,7 +2628,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.InstancesGetEffectiveFirewallsResponse()
             pb_resp = compute.InstancesGetEffectiveFirewallsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_effective_firewalls(resp)
             return resp
 
@@ -2696,11 +2688,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2723,7 +2713,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.GuestAttributes()
             pb_resp = compute.GuestAttributes.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_guest_attributes(resp)
             return resp
 
@@ -2804,11 +2794,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2831,7 +2819,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_iam_policy(resp)
             return resp
 
@@ -2889,11 +2877,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2916,7 +2902,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Screenshot()
             pb_resp = compute.Screenshot.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_screenshot(resp)
             return resp
 
@@ -2976,11 +2962,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3003,7 +2987,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.SerialPortOutput()
             pb_resp = compute.SerialPortOutput.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_serial_port_output(resp)
             return resp
 
@@ -3064,11 +3048,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3091,7 +3073,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.ShieldedInstanceIdentity()
             pb_resp = compute.ShieldedInstanceIdentity.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_shielded_instance_identity(resp)
             return resp
 
@@ -3172,11 +3154,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3200,7 +3180,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -3257,11 +3237,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3284,7 +3262,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.InstanceList()
             pb_resp = compute.InstanceList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -3344,11 +3322,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3371,7 +3347,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.InstanceListReferrers()
             pb_resp = compute.InstanceListReferrers.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_referrers(resp)
             return resp
 
@@ -3448,11 +3424,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3475,7 +3449,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_perform_maintenance(resp)
             return resp
 
@@ -3558,11 +3532,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3586,7 +3558,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_remove_resource_policies(resp)
             return resp
 
@@ -3661,11 +3633,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3688,7 +3658,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_reset(resp)
             return resp
 
@@ -3763,11 +3733,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3790,7 +3758,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_resume(resp)
             return resp
 
@@ -3853,11 +3821,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3880,7 +3846,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.SendDiagnosticInterruptInstanceResponse()
             pb_resp = compute.SendDiagnosticInterruptInstanceResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_send_diagnostic_interrupt(resp)
             return resp
 
@@ -3957,11 +3923,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3984,7 +3948,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_deletion_protection(resp)
             return resp
 
@@ -4064,11 +4028,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4091,7 +4053,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_disk_auto_delete(resp)
             return resp
 
@@ -4178,11 +4140,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4206,7 +4166,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_iam_policy(resp)
             return resp
 
@@ -4287,11 +4247,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4315,7 +4273,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_labels(resp)
             return resp
 
@@ -4398,11 +4356,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4426,7 +4382,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_machine_resources(resp)
             return resp
 
@@ -4509,11 +4465,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4537,7 +4491,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_machine_type(resp)
             return resp
 
@@ -4618,11 +4572,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4646,7 +4598,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_metadata(resp)
             return resp
 
@@ -4729,11 +4681,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4757,7 +4707,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_min_cpu_platform(resp)
             return resp
 
@@ -4838,11 +4788,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4866,7 +4814,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_name(resp)
             return resp
 
@@ -4947,11 +4895,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4975,7 +4921,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_scheduling(resp)
             return resp
 
@@ -5058,11 +5004,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -5086,7 +5030,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_security_policy(resp)
             return resp
 
@@ -5169,11 +5113,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -5197,7 +5139,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_service_account(resp)
             return resp
 
@@ -5286,11 +5228,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -5314,7 +5254,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_shielded_instance_integrity_policy(resp)
             return resp
 
@@ -5395,11 +5335,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -5423,7 +5361,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_tags(resp)
             return resp
 
@@ -5501,11 +5439,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -5528,7 +5464,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_simulate_maintenance_event(resp)
             return resp
 
@@ -5603,11 +5539,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -5630,7 +5564,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_start(resp)
             return resp
 
@@ -5713,11 +5647,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -5741,7 +5673,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_start_with_encryption_key(resp)
             return resp
 
@@ -5815,11 +5747,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -5842,7 +5772,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_stop(resp)
             return resp
 
@@ -5917,11 +5847,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -5944,7 +5872,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_suspend(resp)
             return resp
 
@@ -6010,11 +5938,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -6038,7 +5964,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.TestPermissionsResponse()
             pb_resp = compute.TestPermissionsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_test_iam_permissions(resp)
             return resp
 
@@ -6119,11 +6045,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -6147,7 +6071,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update(resp)
             return resp
 
@@ -6232,11 +6156,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -6260,7 +6182,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update_access_config(resp)
             return resp
 
@@ -6343,11 +6265,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -6371,7 +6291,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update_display_device(resp)
             return resp
 
@@ -6456,11 +6376,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -6484,7 +6402,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update_network_interface(resp)
             return resp
 
@@ -6568,11 +6486,9 @@ class InstancesRestTransport(InstancesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -6596,7 +6512,7 @@ class InstancesRestTransport(InstancesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update_shielded_instance_config(resp)
             return resp
 
@@ -6606,7 +6522,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.AddAccessConfigInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddAccessConfig(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddAccessConfig(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def add_resource_policies(
@@ -6614,7 +6530,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.AddResourcePoliciesInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddResourcePolicies(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddResourcePolicies(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def aggregated_list(
@@ -6624,7 +6540,7 @@ class InstancesRestTransport(InstancesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def attach_disk(
@@ -6632,7 +6548,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.AttachDiskInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AttachDisk(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AttachDisk(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def bulk_insert(
@@ -6640,13 +6556,13 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.BulkInsertInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._BulkInsert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._BulkInsert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(self) -> Callable[[compute.DeleteInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete_access_config(
@@ -6654,7 +6570,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.DeleteAccessConfigInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._DeleteAccessConfig(self._session, self._host, self._interceptor)  # type: ignore
+        return self._DeleteAccessConfig(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def detach_disk(
@@ -6662,13 +6578,13 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.DetachDiskInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._DetachDisk(self._session, self._host, self._interceptor)  # type: ignore
+        return self._DetachDisk(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(self) -> Callable[[compute.GetInstanceRequest], compute.Instance]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_effective_firewalls(
@@ -6679,7 +6595,7 @@ class InstancesRestTransport(InstancesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetEffectiveFirewalls(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetEffectiveFirewalls(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_guest_attributes(
@@ -6687,7 +6603,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.GetGuestAttributesInstanceRequest], compute.GuestAttributes]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetGuestAttributes(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetGuestAttributes(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_iam_policy(
@@ -6695,7 +6611,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.GetIamPolicyInstanceRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetIamPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_screenshot(
@@ -6703,7 +6619,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.GetScreenshotInstanceRequest], compute.Screenshot]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetScreenshot(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetScreenshot(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_serial_port_output(
@@ -6713,7 +6629,7 @@ class InstancesRestTransport(InstancesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetSerialPortOutput(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetSerialPortOutput(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_shielded_instance_identity(
@@ -6724,19 +6640,19 @@ class InstancesRestTransport(InstancesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetShieldedInstanceIdentity(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetShieldedInstanceIdentity(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(self) -> Callable[[compute.InsertInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(self) -> Callable[[compute.ListInstancesRequest], compute.InstanceList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list_referrers(
@@ -6746,7 +6662,7 @@ class InstancesRestTransport(InstancesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListReferrers(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListReferrers(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def perform_maintenance(
@@ -6754,7 +6670,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.PerformMaintenanceInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._PerformMaintenance(self._session, self._host, self._interceptor)  # type: ignore
+        return self._PerformMaintenance(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def remove_resource_policies(
@@ -6762,19 +6678,19 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.RemoveResourcePoliciesInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._RemoveResourcePolicies(self._session, self._host, self._interceptor)  # type: ignore
+        return self._RemoveResourcePolicies(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def reset(self) -> Callable[[compute.ResetInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Reset(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Reset(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def resume(self) -> Callable[[compute.ResumeInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Resume(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Resume(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def send_diagnostic_interrupt(
@@ -6785,7 +6701,7 @@ class InstancesRestTransport(InstancesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SendDiagnosticInterrupt(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SendDiagnosticInterrupt(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_deletion_protection(
@@ -6793,7 +6709,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SetDeletionProtectionInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetDeletionProtection(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetDeletionProtection(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_disk_auto_delete(
@@ -6801,7 +6717,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SetDiskAutoDeleteInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetDiskAutoDelete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetDiskAutoDelete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_iam_policy(
@@ -6809,7 +6725,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SetIamPolicyInstanceRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetIamPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_labels(
@@ -6817,7 +6733,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SetLabelsInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetLabels(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetLabels(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_machine_resources(
@@ -6825,7 +6741,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SetMachineResourcesInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetMachineResources(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetMachineResources(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_machine_type(
@@ -6833,7 +6749,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SetMachineTypeInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetMachineType(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetMachineType(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_metadata(
@@ -6841,7 +6757,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SetMetadataInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetMetadata(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetMetadata(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_min_cpu_platform(
@@ -6849,13 +6765,13 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SetMinCpuPlatformInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetMinCpuPlatform(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetMinCpuPlatform(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_name(self) -> Callable[[compute.SetNameInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetName(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetName(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_scheduling(
@@ -6863,7 +6779,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SetSchedulingInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetScheduling(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetScheduling(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_security_policy(
@@ -6871,7 +6787,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SetSecurityPolicyInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetSecurityPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetSecurityPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_service_account(
@@ -6879,7 +6795,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SetServiceAccountInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetServiceAccount(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetServiceAccount(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_shielded_instance_integrity_policy(
@@ -6889,13 +6805,13 @@ class InstancesRestTransport(InstancesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetShieldedInstanceIntegrityPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetShieldedInstanceIntegrityPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_tags(self) -> Callable[[compute.SetTagsInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetTags(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetTags(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def simulate_maintenance_event(
@@ -6903,13 +6819,13 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.SimulateMaintenanceEventInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SimulateMaintenanceEvent(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SimulateMaintenanceEvent(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def start(self) -> Callable[[compute.StartInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Start(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Start(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def start_with_encryption_key(
@@ -6917,19 +6833,19 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.StartWithEncryptionKeyInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._StartWithEncryptionKey(self._session, self._host, self._interceptor)  # type: ignore
+        return self._StartWithEncryptionKey(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def stop(self) -> Callable[[compute.StopInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Stop(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Stop(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def suspend(self) -> Callable[[compute.SuspendInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Suspend(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Suspend(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def test_iam_permissions(
@@ -6939,13 +6855,13 @@ class InstancesRestTransport(InstancesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._TestIamPermissions(self._session, self._host, self._interceptor)  # type: ignore
+        return self._TestIamPermissions(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def update(self) -> Callable[[compute.UpdateInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Update(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Update(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def update_access_config(
@@ -6953,7 +6869,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.UpdateAccessConfigInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._UpdateAccessConfig(self._session, self._host, self._interceptor)  # type: ignore
+        return self._UpdateAccessConfig(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def update_display_device(
@@ -6961,7 +6877,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.UpdateDisplayDeviceInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._UpdateDisplayDevice(self._session, self._host, self._interceptor)  # type: ignore
+        return self._UpdateDisplayDevice(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def update_network_interface(
@@ -6969,7 +6885,7 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[[compute.UpdateNetworkInterfaceInstanceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._UpdateNetworkInterface(self._session, self._host, self._interceptor)  # type: ignore
+        return self._UpdateNetworkInterface(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def update_shielded_instance_config(
@@ -6979,7 +6895,7 @@ class InstancesRestTransport(InstancesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._UpdateShieldedInstanceConfig(self._session, self._host, self._interceptor)  # type: ignore
+        return self._UpdateShieldedInstanceConfig(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -779,6 +779,7 @@ class InterconnectLocationsClient(metaclass=InterconnectLocationsClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves the list of interconnect locations
         available to the specified project.
@@ -825,6 +826,10 @@ class InterconnectLocationsClient(metaclass=InterconnectLocationsClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.interconnect_locations.pagers.ListPager:
@@ -884,6 +889,7 @@ class InterconnectLocationsClient(metaclass=InterconnectLocationsClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
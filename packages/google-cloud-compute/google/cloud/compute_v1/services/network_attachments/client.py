@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 from collections import OrderedDict
-import functools
 import os
 import re
 from typing import (
@@ -50,6 +49,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import extended_operation  # type: ignore
 
+from google.cloud.compute_v1 import _operations
 from google.cloud.compute_v1.services.network_attachments import pagers
 from google.cloud.compute_v1.types import compute
 
@@ -655,6 +655,7 @@ class NetworkAttachmentsClient(metaclass=NetworkAttachmentsClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves the list of all NetworkAttachment
         resources, regional and global, available to the
@@ -702,6 +703,10 @@ class NetworkAttachmentsClient(metaclass=NetworkAttachmentsClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.network_attachments.pagers.AggregatedListPager:
@@ -761,6 +766,7 @@ class NetworkAttachmentsClient(metaclass=NetworkAttachmentsClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -1025,30 +1031,9 @@ class NetworkAttachmentsClient(metaclass=NetworkAttachmentsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._region_operations_client
-        operation_request = compute.GetRegionOperationRequest()
-        operation_request.project = request.project
-        operation_request.region = request.region
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.RegionOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1592,30 +1577,9 @@ class NetworkAttachmentsClient(metaclass=NetworkAttachmentsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._region_operations_client
-        operation_request = compute.GetRegionOperationRequest()
-        operation_request.project = request.project
-        operation_request.region = request.region
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.RegionOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
@@ -1629,6 +1593,7 @@ class NetworkAttachmentsClient(metaclass=NetworkAttachmentsClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Lists the NetworkAttachments for a project in the
         given scope.
@@ -1681,6 +1646,10 @@ class NetworkAttachmentsClient(metaclass=NetworkAttachmentsClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.network_attachments.pagers.ListPager:
@@ -1745,6 +1714,7 @@ class NetworkAttachmentsClient(metaclass=NetworkAttachmentsClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -2033,30 +2003,9 @@ class NetworkAttachmentsClient(metaclass=NetworkAttachmentsClientMeta):
             metadata=metadata,
         )
 
-        operation_service = self._transport._region_operations_client
-        operation_request = compute.GetRegionOperationRequest()
-        operation_request.project = request.project
-        operation_request.region = request.region
-        operation_request.operation = response.name
-
-        get_operation = functools.partial(operation_service.get, operation_request)
-        # Cancel is not part of extended operations yet.
-        cancel_operation = lambda: None
-
-        # Note: this class is an implementation detail to provide a uniform
-        # set of names for certain fields in the extended operation proto message.
-        # See google.api_core.extended_operation.ExtendedOperation for details
-        # on these properties and the  expected interface.
-        class _CustomOperation(extended_operation.ExtendedOperation):
-            @property
-            def error_message(self):
-                return self._extended_operation.http_error_message
-
-            @property
-            def error_code(self):
-                return self._extended_operation.http_error_status_code
-
-        response = _CustomOperation.make(get_operation, cancel_operation, response)
+        response = _operations.RegionOperation.from_response(
+            self._transport, request, response
+        )
 
         # Done; return the response.
         return response
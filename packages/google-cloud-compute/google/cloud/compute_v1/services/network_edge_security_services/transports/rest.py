@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -233,6 +234,7 @@ class NetworkEdgeSecurityServicesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: NetworkEdgeSecurityServicesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransport):
@@ -265,6 +267,7 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
         url_scheme: str = "https",
         interceptor: Optional[NetworkEdgeSecurityServicesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -301,6 +304,12 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -329,6 +338,9 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or NetworkEdgeSecurityServicesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(NetworkEdgeSecurityServicesRestStub):
@@ -387,11 +399,9 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -414,7 +424,7 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
             resp = compute.NetworkEdgeSecurityServiceAggregatedList()
             pb_resp = compute.NetworkEdgeSecurityServiceAggregatedList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -489,11 +499,9 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -516,7 +524,7 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -576,11 +584,9 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -603,7 +609,7 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
             resp = compute.NetworkEdgeSecurityService()
             pb_resp = compute.NetworkEdgeSecurityService.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -684,11 +690,9 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -712,7 +716,7 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -793,11 +797,9 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -821,7 +823,7 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -834,7 +836,7 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -842,7 +844,7 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
     ) -> Callable[[compute.DeleteNetworkEdgeSecurityServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -853,7 +855,7 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -861,7 +863,7 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
     ) -> Callable[[compute.InsertNetworkEdgeSecurityServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(
@@ -869,7 +871,7 @@ class NetworkEdgeSecurityServicesRestTransport(NetworkEdgeSecurityServicesTransp
     ) -> Callable[[compute.PatchNetworkEdgeSecurityServiceRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
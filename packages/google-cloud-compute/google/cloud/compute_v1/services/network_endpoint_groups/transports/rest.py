@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -363,6 +364,7 @@ class NetworkEndpointGroupsRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: NetworkEndpointGroupsRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
@@ -395,6 +397,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
         url_scheme: str = "https",
         interceptor: Optional[NetworkEndpointGroupsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -431,6 +434,12 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -459,6 +468,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or NetworkEndpointGroupsRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(NetworkEndpointGroupsRestStub):
@@ -515,11 +527,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -542,7 +552,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             resp = compute.NetworkEndpointGroupAggregatedList()
             pb_resp = compute.NetworkEndpointGroupAggregatedList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -627,11 +637,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -655,7 +663,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_attach_network_endpoints(resp)
             return resp
 
@@ -730,11 +738,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -757,7 +763,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -842,11 +848,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -870,7 +874,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_detach_network_endpoints(resp)
             return resp
 
@@ -936,11 +940,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -963,7 +965,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             resp = compute.NetworkEndpointGroup()
             pb_resp = compute.NetworkEndpointGroup.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -1044,11 +1046,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1072,7 +1072,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -1130,11 +1130,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1157,7 +1155,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             resp = compute.NetworkEndpointGroupList()
             pb_resp = compute.NetworkEndpointGroupList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1225,11 +1223,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1253,7 +1249,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             resp = compute.NetworkEndpointGroupsListNetworkEndpoints()
             pb_resp = compute.NetworkEndpointGroupsListNetworkEndpoints.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_network_endpoints(resp)
             return resp
 
@@ -1321,11 +1317,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1349,7 +1343,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             resp = compute.TestPermissionsResponse()
             pb_resp = compute.TestPermissionsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_test_iam_permissions(resp)
             return resp
 
@@ -1362,7 +1356,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def attach_network_endpoints(
@@ -1372,7 +1366,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AttachNetworkEndpoints(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AttachNetworkEndpoints(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -1380,7 +1374,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ) -> Callable[[compute.DeleteNetworkEndpointGroupRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def detach_network_endpoints(
@@ -1390,7 +1384,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._DetachNetworkEndpoints(self._session, self._host, self._interceptor)  # type: ignore
+        return self._DetachNetworkEndpoints(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -1400,7 +1394,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -1408,7 +1402,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ) -> Callable[[compute.InsertNetworkEndpointGroupRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -1418,7 +1412,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list_network_endpoints(
@@ -1429,7 +1423,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListNetworkEndpoints(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListNetworkEndpoints(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def test_iam_permissions(
@@ -1440,7 +1434,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._TestIamPermissions(self._session, self._host, self._interceptor)  # type: ignore
+        return self._TestIamPermissions(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -566,6 +567,7 @@ class NetworkFirewallPoliciesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: NetworkFirewallPoliciesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
@@ -598,6 +600,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
         url_scheme: str = "https",
         interceptor: Optional[NetworkFirewallPoliciesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -634,6 +637,12 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -662,6 +671,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or NetworkFirewallPoliciesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AddAssociation(NetworkFirewallPoliciesRestStub):
@@ -741,11 +753,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -769,7 +779,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_association(resp)
             return resp
 
@@ -850,11 +860,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -878,7 +886,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_rule(resp)
             return resp
 
@@ -953,11 +961,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -980,7 +986,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_clone_rules(resp)
             return resp
 
@@ -1055,11 +1061,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1082,7 +1086,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -1142,11 +1146,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1169,7 +1171,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.FirewallPolicy()
             pb_resp = compute.FirewallPolicy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -1227,11 +1229,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1254,7 +1254,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.FirewallPolicyAssociation()
             pb_resp = compute.FirewallPolicyAssociation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_association(resp)
             return resp
 
@@ -1335,11 +1335,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1362,7 +1360,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_iam_policy(resp)
             return resp
 
@@ -1424,11 +1422,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1451,7 +1447,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.FirewallPolicyRule()
             pb_resp = compute.FirewallPolicyRule.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_rule(resp)
             return resp
 
@@ -1532,11 +1528,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1560,7 +1554,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -1618,11 +1612,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1645,7 +1637,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.FirewallPolicyList()
             pb_resp = compute.FirewallPolicyList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1726,11 +1718,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1754,7 +1744,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -1835,11 +1825,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1863,7 +1851,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch_rule(resp)
             return resp
 
@@ -1942,11 +1930,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1969,7 +1955,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_remove_association(resp)
             return resp
 
@@ -2044,11 +2030,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2071,7 +2055,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_remove_rule(resp)
             return resp
 
@@ -2158,11 +2142,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2186,7 +2168,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.Policy()
             pb_resp = compute.Policy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_iam_policy(resp)
             return resp
 
@@ -2254,11 +2236,9 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2282,7 +2262,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
             resp = compute.TestPermissionsResponse()
             pb_resp = compute.TestPermissionsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_test_iam_permissions(resp)
             return resp
 
@@ -2294,7 +2274,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddAssociation(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddAssociation(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def add_rule(
@@ -2302,7 +2282,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ) -> Callable[[compute.AddRuleNetworkFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def clone_rules(
@@ -2310,7 +2290,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ) -> Callable[[compute.CloneRulesNetworkFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._CloneRules(self._session, self._host, self._interceptor)  # type: ignore
+        return self._CloneRules(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -2318,7 +2298,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ) -> Callable[[compute.DeleteNetworkFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -2326,7 +2306,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ) -> Callable[[compute.GetNetworkFirewallPolicyRequest], compute.FirewallPolicy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_association(
@@ -2337,7 +2317,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetAssociation(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetAssociation(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_iam_policy(
@@ -2345,7 +2325,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ) -> Callable[[compute.GetIamPolicyNetworkFirewallPolicyRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetIamPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_rule(
@@ -2355,7 +2335,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -2363,7 +2343,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ) -> Callable[[compute.InsertNetworkFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -2373,7 +2353,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(
@@ -2381,7 +2361,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ) -> Callable[[compute.PatchNetworkFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch_rule(
@@ -2389,7 +2369,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ) -> Callable[[compute.PatchRuleNetworkFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._PatchRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._PatchRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def remove_association(
@@ -2399,7 +2379,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._RemoveAssociation(self._session, self._host, self._interceptor)  # type: ignore
+        return self._RemoveAssociation(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def remove_rule(
@@ -2407,7 +2387,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ) -> Callable[[compute.RemoveRuleNetworkFirewallPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._RemoveRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._RemoveRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_iam_policy(
@@ -2415,7 +2395,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ) -> Callable[[compute.SetIamPolicyNetworkFirewallPolicyRequest], compute.Policy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetIamPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def test_iam_permissions(
@@ -2426,7 +2406,7 @@ class NetworkFirewallPoliciesRestTransport(NetworkFirewallPoliciesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._TestIamPermissions(self._session, self._host, self._interceptor)  # type: ignore
+        return self._TestIamPermissions(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -286,6 +287,7 @@ class PublicAdvertisedPrefixesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: PublicAdvertisedPrefixesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
@@ -318,6 +320,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
         url_scheme: str = "https",
         interceptor: Optional[PublicAdvertisedPrefixesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -354,6 +357,12 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -382,6 +391,9 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or PublicAdvertisedPrefixesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _Announce(PublicAdvertisedPrefixesRestStub):
@@ -455,11 +467,9 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -482,7 +492,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_announce(resp)
             return resp
 
@@ -557,11 +567,9 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -584,7 +592,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -648,11 +656,9 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -675,7 +681,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             resp = compute.PublicAdvertisedPrefix()
             pb_resp = compute.PublicAdvertisedPrefix.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -756,11 +762,9 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -784,7 +788,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -842,11 +846,9 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -869,7 +871,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             resp = compute.PublicAdvertisedPrefixList()
             pb_resp = compute.PublicAdvertisedPrefixList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -950,11 +952,9 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -978,7 +978,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -1053,11 +1053,9 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1080,7 +1078,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_withdraw(resp)
             return resp
 
@@ -1090,7 +1088,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
     ) -> Callable[[compute.AnnouncePublicAdvertisedPrefixeRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Announce(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Announce(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -1098,7 +1096,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
     ) -> Callable[[compute.DeletePublicAdvertisedPrefixeRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -1108,7 +1106,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -1116,7 +1114,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
     ) -> Callable[[compute.InsertPublicAdvertisedPrefixeRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -1127,7 +1125,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(
@@ -1135,7 +1133,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
     ) -> Callable[[compute.PatchPublicAdvertisedPrefixeRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def withdraw(
@@ -1143,7 +1141,7 @@ class PublicAdvertisedPrefixesRestTransport(PublicAdvertisedPrefixesTransport):
     ) -> Callable[[compute.WithdrawPublicAdvertisedPrefixeRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Withdraw(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Withdraw(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -319,6 +320,7 @@ class PublicDelegatedPrefixesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: PublicDelegatedPrefixesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
@@ -351,6 +353,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
         url_scheme: str = "https",
         interceptor: Optional[PublicDelegatedPrefixesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -387,6 +390,12 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -415,6 +424,9 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or PublicDelegatedPrefixesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(PublicDelegatedPrefixesRestStub):
@@ -473,11 +485,9 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -500,7 +510,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             resp = compute.PublicDelegatedPrefixAggregatedList()
             pb_resp = compute.PublicDelegatedPrefixAggregatedList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -575,11 +585,9 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -602,7 +610,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_announce(resp)
             return resp
 
@@ -677,11 +685,9 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -704,7 +710,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -771,11 +777,9 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -798,7 +802,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             resp = compute.PublicDelegatedPrefix()
             pb_resp = compute.PublicDelegatedPrefix.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -879,11 +883,9 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -907,7 +909,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -965,11 +967,9 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -992,7 +992,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             resp = compute.PublicDelegatedPrefixList()
             pb_resp = compute.PublicDelegatedPrefixList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1073,11 +1073,9 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1101,7 +1099,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -1176,11 +1174,9 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1203,7 +1199,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_withdraw(resp)
             return resp
 
@@ -1216,7 +1212,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def announce(
@@ -1224,7 +1220,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
     ) -> Callable[[compute.AnnouncePublicDelegatedPrefixeRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Announce(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Announce(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -1232,7 +1228,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
     ) -> Callable[[compute.DeletePublicDelegatedPrefixeRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -1242,7 +1238,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -1250,7 +1246,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
     ) -> Callable[[compute.InsertPublicDelegatedPrefixeRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -1260,7 +1256,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(
@@ -1268,7 +1264,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
     ) -> Callable[[compute.PatchPublicDelegatedPrefixeRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def withdraw(
@@ -1276,7 +1272,7 @@ class PublicDelegatedPrefixesRestTransport(PublicDelegatedPrefixesTransport):
     ) -> Callable[[compute.WithdrawPublicDelegatedPrefixeRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Withdraw(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Withdraw(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
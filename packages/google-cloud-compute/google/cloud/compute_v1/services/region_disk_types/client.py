@@ -790,6 +790,7 @@ class RegionDiskTypesClient(metaclass=RegionDiskTypesClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves a list of regional disk types available to
         the specified project.
@@ -844,6 +845,10 @@ class RegionDiskTypesClient(metaclass=RegionDiskTypesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.region_disk_types.pagers.ListPager:
@@ -908,6 +913,7 @@ class RegionDiskTypesClient(metaclass=RegionDiskTypesClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -135,6 +136,7 @@ class RegionDiskTypesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: RegionDiskTypesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class RegionDiskTypesRestTransport(RegionDiskTypesTransport):
@@ -167,6 +169,7 @@ class RegionDiskTypesRestTransport(RegionDiskTypesTransport):
         url_scheme: str = "https",
         interceptor: Optional[RegionDiskTypesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -203,6 +206,12 @@ class RegionDiskTypesRestTransport(RegionDiskTypesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -231,6 +240,9 @@ class RegionDiskTypesRestTransport(RegionDiskTypesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or RegionDiskTypesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _Get(RegionDiskTypesRestStub):
@@ -298,11 +310,9 @@ class RegionDiskTypesRestTransport(RegionDiskTypesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -325,7 +335,7 @@ class RegionDiskTypesRestTransport(RegionDiskTypesTransport):
             resp = compute.DiskType()
             pb_resp = compute.DiskType.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -383,11 +393,9 @@ class RegionDiskTypesRestTransport(RegionDiskTypesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -410,7 +418,7 @@ class RegionDiskTypesRestTransport(RegionDiskTypesTransport):
             resp = compute.RegionDiskTypeList()
             pb_resp = compute.RegionDiskTypeList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -418,7 +426,7 @@ class RegionDiskTypesRestTransport(RegionDiskTypesTransport):
     def get(self) -> Callable[[compute.GetRegionDiskTypeRequest], compute.DiskType]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -426,7 +434,7 @@ class RegionDiskTypesRestTransport(RegionDiskTypesTransport):
     ) -> Callable[[compute.ListRegionDiskTypesRequest], compute.RegionDiskTypeList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
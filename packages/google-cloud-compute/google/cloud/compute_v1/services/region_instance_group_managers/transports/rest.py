@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -694,6 +695,7 @@ class RegionInstanceGroupManagersRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: RegionInstanceGroupManagersRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransport):
@@ -726,6 +728,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         url_scheme: str = "https",
         interceptor: Optional[RegionInstanceGroupManagersRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -762,6 +765,12 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -790,6 +799,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or RegionInstanceGroupManagersRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AbandonInstances(RegionInstanceGroupManagersRestStub):
@@ -873,11 +885,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -901,7 +911,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_abandon_instances(resp)
             return resp
 
@@ -989,11 +999,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1017,7 +1025,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_apply_updates_to_instances(resp)
             return resp
 
@@ -1102,11 +1110,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1130,7 +1136,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_create_instances(resp)
             return resp
 
@@ -1205,11 +1211,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1232,7 +1236,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -1317,11 +1321,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1345,7 +1347,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete_instances(resp)
             return resp
 
@@ -1433,11 +1435,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1461,7 +1461,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete_per_instance_configs(resp)
             return resp
 
@@ -1528,11 +1528,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1555,7 +1553,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.InstanceGroupManager()
             pb_resp = compute.InstanceGroupManager.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -1636,11 +1634,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1664,7 +1660,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -1724,11 +1720,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1751,7 +1745,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.RegionInstanceGroupManagerList()
             pb_resp = compute.RegionInstanceGroupManagerList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1811,11 +1805,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1838,7 +1830,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.RegionInstanceGroupManagersListErrorsResponse()
             pb_resp = compute.RegionInstanceGroupManagersListErrorsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_errors(resp)
             return resp
 
@@ -1902,11 +1894,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1929,7 +1919,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.RegionInstanceGroupManagersListInstancesResponse()
             pb_resp = compute.RegionInstanceGroupManagersListInstancesResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_managed_instances(resp)
             return resp
 
@@ -1993,11 +1983,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2022,7 +2010,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 resp
             )
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_per_instance_configs(resp)
             return resp
 
@@ -2103,11 +2091,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2131,7 +2117,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -2219,11 +2205,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2247,7 +2231,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch_per_instance_configs(resp)
             return resp
 
@@ -2332,11 +2316,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2360,7 +2342,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_recreate_instances(resp)
             return resp
 
@@ -2437,11 +2419,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2464,7 +2444,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_resize(resp)
             return resp
 
@@ -2549,11 +2529,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2577,7 +2555,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_instance_template(resp)
             return resp
 
@@ -2662,11 +2640,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2690,7 +2666,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_target_pools(resp)
             return resp
 
@@ -2778,11 +2754,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2806,7 +2780,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update_per_instance_configs(resp)
             return resp
 
@@ -2818,7 +2792,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AbandonInstances(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AbandonInstances(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def apply_updates_to_instances(
@@ -2829,7 +2803,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ApplyUpdatesToInstances(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ApplyUpdatesToInstances(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def create_instances(
@@ -2839,7 +2813,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._CreateInstances(self._session, self._host, self._interceptor)  # type: ignore
+        return self._CreateInstances(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -2847,7 +2821,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ) -> Callable[[compute.DeleteRegionInstanceGroupManagerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete_instances(
@@ -2857,7 +2831,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._DeleteInstances(self._session, self._host, self._interceptor)  # type: ignore
+        return self._DeleteInstances(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete_per_instance_configs(
@@ -2868,7 +2842,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._DeletePerInstanceConfigs(self._session, self._host, self._interceptor)  # type: ignore
+        return self._DeletePerInstanceConfigs(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -2878,7 +2852,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -2886,7 +2860,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ) -> Callable[[compute.InsertRegionInstanceGroupManagerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -2897,7 +2871,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list_errors(
@@ -2908,7 +2882,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListErrors(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListErrors(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list_managed_instances(
@@ -2919,7 +2893,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListManagedInstances(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListManagedInstances(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list_per_instance_configs(
@@ -2930,7 +2904,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListPerInstanceConfigs(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListPerInstanceConfigs(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(
@@ -2938,7 +2912,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ) -> Callable[[compute.PatchRegionInstanceGroupManagerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch_per_instance_configs(
@@ -2949,7 +2923,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._PatchPerInstanceConfigs(self._session, self._host, self._interceptor)  # type: ignore
+        return self._PatchPerInstanceConfigs(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def recreate_instances(
@@ -2959,7 +2933,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._RecreateInstances(self._session, self._host, self._interceptor)  # type: ignore
+        return self._RecreateInstances(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def resize(
@@ -2967,7 +2941,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ) -> Callable[[compute.ResizeRegionInstanceGroupManagerRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Resize(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Resize(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_instance_template(
@@ -2978,7 +2952,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetInstanceTemplate(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetInstanceTemplate(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_target_pools(
@@ -2988,7 +2962,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetTargetPools(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetTargetPools(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def update_per_instance_configs(
@@ -2999,7 +2973,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._UpdatePerInstanceConfigs(self._session, self._host, self._interceptor)  # type: ignore
+        return self._UpdatePerInstanceConfigs(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -199,6 +200,7 @@ class RegionInstanceGroupsRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: RegionInstanceGroupsRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
@@ -231,6 +233,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
         url_scheme: str = "https",
         interceptor: Optional[RegionInstanceGroupsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -267,6 +270,12 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -295,6 +304,9 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or RegionInstanceGroupsRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _Get(RegionInstanceGroupsRestStub):
@@ -365,11 +377,9 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -392,7 +402,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             resp = compute.InstanceGroup()
             pb_resp = compute.InstanceGroup.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -452,11 +462,9 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -479,7 +487,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             resp = compute.RegionInstanceGroupList()
             pb_resp = compute.RegionInstanceGroupList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -543,11 +551,9 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -571,7 +577,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             resp = compute.RegionInstanceGroupsListInstances()
             pb_resp = compute.RegionInstanceGroupsListInstances.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_instances(resp)
             return resp
 
@@ -652,11 +658,9 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -680,7 +684,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_named_ports(resp)
             return resp
 
@@ -690,7 +694,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
     ) -> Callable[[compute.GetRegionInstanceGroupRequest], compute.InstanceGroup]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -700,7 +704,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list_instances(
@@ -711,7 +715,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListInstances(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListInstances(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_named_ports(
@@ -719,7 +723,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
     ) -> Callable[[compute.SetNamedPortsRegionInstanceGroupRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetNamedPorts(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetNamedPorts(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
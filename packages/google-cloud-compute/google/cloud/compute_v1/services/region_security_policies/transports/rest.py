@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -342,6 +343,7 @@ class RegionSecurityPoliciesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: RegionSecurityPoliciesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
@@ -374,6 +376,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
         url_scheme: str = "https",
         interceptor: Optional[RegionSecurityPoliciesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -410,6 +413,12 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -438,6 +447,9 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or RegionSecurityPoliciesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AddRule(RegionSecurityPoliciesRestStub):
@@ -517,11 +529,9 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -545,7 +555,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_rule(resp)
             return resp
 
@@ -620,11 +630,9 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -647,7 +655,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -711,11 +719,9 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -738,7 +744,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             resp = compute.SecurityPolicy()
             pb_resp = compute.SecurityPolicy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -800,11 +806,9 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -827,7 +831,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             resp = compute.SecurityPolicyRule()
             pb_resp = compute.SecurityPolicyRule.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_rule(resp)
             return resp
 
@@ -908,11 +912,9 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -936,7 +938,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -994,11 +996,9 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1021,7 +1021,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             resp = compute.SecurityPolicyList()
             pb_resp = compute.SecurityPolicyList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1102,11 +1102,9 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1130,7 +1128,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -1211,11 +1209,9 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1239,7 +1235,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch_rule(resp)
             return resp
 
@@ -1314,11 +1310,9 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1341,7 +1335,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_remove_rule(resp)
             return resp
 
@@ -1351,7 +1345,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
     ) -> Callable[[compute.AddRuleRegionSecurityPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -1359,7 +1353,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
     ) -> Callable[[compute.DeleteRegionSecurityPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -1367,7 +1361,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
     ) -> Callable[[compute.GetRegionSecurityPolicyRequest], compute.SecurityPolicy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_rule(
@@ -1377,7 +1371,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -1385,7 +1379,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
     ) -> Callable[[compute.InsertRegionSecurityPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -1395,7 +1389,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(
@@ -1403,7 +1397,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
     ) -> Callable[[compute.PatchRegionSecurityPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch_rule(
@@ -1411,7 +1405,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
     ) -> Callable[[compute.PatchRuleRegionSecurityPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._PatchRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._PatchRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def remove_rule(
@@ -1419,7 +1413,7 @@ class RegionSecurityPoliciesRestTransport(RegionSecurityPoliciesTransport):
     ) -> Callable[[compute.RemoveRuleRegionSecurityPolicyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._RemoveRule(self._session, self._host, self._interceptor)  # type: ignore
+        return self._RemoveRule(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -224,6 +225,7 @@ class RegionTargetHttpProxiesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: RegionTargetHttpProxiesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
@@ -256,6 +258,7 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
         url_scheme: str = "https",
         interceptor: Optional[RegionTargetHttpProxiesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -292,6 +295,12 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -320,6 +329,9 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or RegionTargetHttpProxiesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _Delete(RegionTargetHttpProxiesRestStub):
@@ -393,11 +405,9 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -420,7 +430,7 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -494,11 +504,9 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -521,7 +529,7 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
             resp = compute.TargetHttpProxy()
             pb_resp = compute.TargetHttpProxy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -602,11 +610,9 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -630,7 +636,7 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -688,11 +694,9 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -715,7 +719,7 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
             resp = compute.TargetHttpProxyList()
             pb_resp = compute.TargetHttpProxyList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -796,11 +800,9 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -824,7 +826,7 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_url_map(resp)
             return resp
 
@@ -834,7 +836,7 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
     ) -> Callable[[compute.DeleteRegionTargetHttpProxyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -842,7 +844,7 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
     ) -> Callable[[compute.GetRegionTargetHttpProxyRequest], compute.TargetHttpProxy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -850,7 +852,7 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
     ) -> Callable[[compute.InsertRegionTargetHttpProxyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -860,7 +862,7 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_url_map(
@@ -868,7 +870,7 @@ class RegionTargetHttpProxiesRestTransport(RegionTargetHttpProxiesTransport):
     ) -> Callable[[compute.SetUrlMapRegionTargetHttpProxyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetUrlMap(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetUrlMap(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
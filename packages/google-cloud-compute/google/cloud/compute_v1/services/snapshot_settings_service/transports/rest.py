@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -133,6 +134,7 @@ class SnapshotSettingsServiceRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: SnapshotSettingsServiceRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class SnapshotSettingsServiceRestTransport(SnapshotSettingsServiceTransport):
@@ -165,6 +167,7 @@ class SnapshotSettingsServiceRestTransport(SnapshotSettingsServiceTransport):
         url_scheme: str = "https",
         interceptor: Optional[SnapshotSettingsServiceRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -201,6 +204,12 @@ class SnapshotSettingsServiceRestTransport(SnapshotSettingsServiceTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -229,6 +238,9 @@ class SnapshotSettingsServiceRestTransport(SnapshotSettingsServiceTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or SnapshotSettingsServiceRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _Get(SnapshotSettingsServiceRestStub):
@@ -285,11 +297,9 @@ class SnapshotSettingsServiceRestTransport(SnapshotSettingsServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -312,7 +322,7 @@ class SnapshotSettingsServiceRestTransport(SnapshotSettingsServiceTransport):
             resp = compute.SnapshotSettings()
             pb_resp = compute.SnapshotSettings.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -393,11 +403,9 @@ class SnapshotSettingsServiceRestTransport(SnapshotSettingsServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -421,7 +429,7 @@ class SnapshotSettingsServiceRestTransport(SnapshotSettingsServiceTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -431,7 +439,7 @@ class SnapshotSettingsServiceRestTransport(SnapshotSettingsServiceTransport):
     ) -> Callable[[compute.GetSnapshotSettingRequest], compute.SnapshotSettings]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(
@@ -439,7 +447,7 @@ class SnapshotSettingsServiceRestTransport(SnapshotSettingsServiceTransport):
     ) -> Callable[[compute.PatchSnapshotSettingRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -410,6 +411,7 @@ class TargetHttpsProxiesRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: TargetHttpsProxiesRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
@@ -442,6 +444,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
         url_scheme: str = "https",
         interceptor: Optional[TargetHttpsProxiesRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -478,6 +481,12 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -506,6 +515,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or TargetHttpsProxiesRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(TargetHttpsProxiesRestStub):
@@ -562,11 +574,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -589,7 +599,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             resp = compute.TargetHttpsProxyAggregatedList()
             pb_resp = compute.TargetHttpsProxyAggregatedList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -664,11 +674,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -691,7 +699,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -765,11 +773,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -792,7 +798,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             resp = compute.TargetHttpsProxy()
             pb_resp = compute.TargetHttpsProxy.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -873,11 +879,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -901,7 +905,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -961,11 +965,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -988,7 +990,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             resp = compute.TargetHttpsProxyList()
             pb_resp = compute.TargetHttpsProxyList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1069,11 +1071,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1097,7 +1097,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_patch(resp)
             return resp
 
@@ -1180,11 +1180,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1208,7 +1206,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_certificate_map(resp)
             return resp
 
@@ -1291,11 +1289,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1319,7 +1315,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_quic_override(resp)
             return resp
 
@@ -1402,11 +1398,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1430,7 +1424,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_ssl_certificates(resp)
             return resp
 
@@ -1511,11 +1505,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1539,7 +1531,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_ssl_policy(resp)
             return resp
 
@@ -1620,11 +1612,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1648,7 +1638,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_url_map(resp)
             return resp
 
@@ -1661,7 +1651,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(
@@ -1669,7 +1659,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ) -> Callable[[compute.DeleteTargetHttpsProxyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(
@@ -1677,7 +1667,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ) -> Callable[[compute.GetTargetHttpsProxyRequest], compute.TargetHttpsProxy]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(
@@ -1685,7 +1675,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ) -> Callable[[compute.InsertTargetHttpsProxyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -1695,7 +1685,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def patch(
@@ -1703,7 +1693,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ) -> Callable[[compute.PatchTargetHttpsProxyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Patch(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Patch(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_certificate_map(
@@ -1713,7 +1703,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetCertificateMap(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetCertificateMap(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_quic_override(
@@ -1721,7 +1711,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ) -> Callable[[compute.SetQuicOverrideTargetHttpsProxyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetQuicOverride(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetQuicOverride(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_ssl_certificates(
@@ -1731,7 +1721,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetSslCertificates(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetSslCertificates(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_ssl_policy(
@@ -1739,7 +1729,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ) -> Callable[[compute.SetSslPolicyTargetHttpsProxyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetSslPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetSslPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_url_map(
@@ -1747,7 +1737,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ) -> Callable[[compute.SetUrlMapTargetHttpsProxyRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetUrlMap(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetUrlMap(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
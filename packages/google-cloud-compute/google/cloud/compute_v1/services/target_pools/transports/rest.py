@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -36,6 +35,8 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
 
 
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1 import _query_params
 from google.cloud.compute_v1.types import compute
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -429,6 +430,7 @@ class TargetPoolsRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: TargetPoolsRestInterceptor
+    _parse_json: Callable = json_format.Parse
 
 
 class TargetPoolsRestTransport(TargetPoolsTransport):
@@ -461,6 +463,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
         url_scheme: str = "https",
         interceptor: Optional[TargetPoolsRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        fast_json_decoding: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -497,6 +500,12 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
              url_scheme: the protocol scheme for the API endpoint.  Normally
                  "https", but for testing or local servers,
                  "http" can be specified.
+             fast_json_decoding (bool): Whether to decode responses with a
+                 per-message plan compiled on first use (and ``orjson``,
+                 if installed) rather than with
+                 :func:`google.protobuf.json_format.Parse`. The decoded
+                 messages are the same; large responses such as lists
+                 decode several times faster.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -525,6 +534,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
         self._interceptor = interceptor or TargetPoolsRestInterceptor()
+        self._parse_json = (
+            _json_decoding.parse if fast_json_decoding else json_format.Parse
+        )
         self._prep_wrapped_messages(client_info)
 
     class _AddHealthCheck(TargetPoolsRestStub):
@@ -606,11 +618,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -634,7 +644,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_health_check(resp)
             return resp
 
@@ -715,11 +725,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -743,7 +751,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_add_instance(resp)
             return resp
 
@@ -801,11 +809,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -828,7 +834,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.TargetPoolAggregatedList()
             pb_resp = compute.TargetPoolAggregatedList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_aggregated_list(resp)
             return resp
 
@@ -903,11 +909,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -930,7 +934,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete(resp)
             return resp
 
@@ -996,11 +1000,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1023,7 +1025,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.TargetPool()
             pb_resp = compute.TargetPool.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get(resp)
             return resp
 
@@ -1087,11 +1089,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1115,7 +1115,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.TargetPoolInstanceHealth()
             pb_resp = compute.TargetPoolInstanceHealth.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_health(resp)
             return resp
 
@@ -1196,11 +1196,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1224,7 +1222,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_insert(resp)
             return resp
 
@@ -1284,11 +1282,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1311,7 +1307,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.TargetPoolList()
             pb_resp = compute.TargetPoolList.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list(resp)
             return resp
 
@@ -1394,11 +1390,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1422,7 +1416,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_remove_health_check(resp)
             return resp
 
@@ -1503,11 +1497,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1531,7 +1523,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_remove_instance(resp)
             return resp
 
@@ -1612,11 +1604,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1640,7 +1630,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_backup(resp)
             return resp
 
@@ -1723,11 +1713,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=False,
-                )
+            query_params = _query_params.to_dict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=False,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -1751,7 +1739,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             resp = compute.Operation()
             pb_resp = compute.Operation.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_set_security_policy(resp)
             return resp
 
@@ -1761,7 +1749,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     ) -> Callable[[compute.AddHealthCheckTargetPoolRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddHealthCheck(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddHealthCheck(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def add_instance(
@@ -1769,7 +1757,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     ) -> Callable[[compute.AddInstanceTargetPoolRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AddInstance(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AddInstance(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def aggregated_list(
@@ -1779,19 +1767,19 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._AggregatedList(self._session, self._host, self._interceptor)  # type: ignore
+        return self._AggregatedList(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def delete(self) -> Callable[[compute.DeleteTargetPoolRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Delete(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Delete(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get(self) -> Callable[[compute.GetTargetPoolRequest], compute.TargetPool]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Get(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Get(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def get_health(
@@ -1801,13 +1789,13 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetHealth(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetHealth(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def insert(self) -> Callable[[compute.InsertTargetPoolRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._Insert(self._session, self._host, self._interceptor)  # type: ignore
+        return self._Insert(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def list(
@@ -1815,7 +1803,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     ) -> Callable[[compute.ListTargetPoolsRequest], compute.TargetPoolList]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._List(self._session, self._host, self._interceptor)  # type: ignore
+        return self._List(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def remove_health_check(
@@ -1823,7 +1811,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     ) -> Callable[[compute.RemoveHealthCheckTargetPoolRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._RemoveHealthCheck(self._session, self._host, self._interceptor)  # type: ignore
+        return self._RemoveHealthCheck(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def remove_instance(
@@ -1831,7 +1819,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     ) -> Callable[[compute.RemoveInstanceTargetPoolRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._RemoveInstance(self._session, self._host, self._interceptor)  # type: ignore
+        return self._RemoveInstance(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_backup(
@@ -1839,7 +1827,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     ) -> Callable[[compute.SetBackupTargetPoolRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetBackup(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetBackup(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def set_security_policy(
@@ -1847,7 +1835,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     ) -> Callable[[compute.SetSecurityPolicyTargetPoolRequest], compute.Operation]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._SetSecurityPolicy(self._session, self._host, self._interceptor)  # type: ignore
+        return self._SetSecurityPolicy(self._session, self._host, self._interceptor, self._parse_json)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -929,6 +929,7 @@ class ZoneOperationsClient(metaclass=ZoneOperationsClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPager:
         r"""Retrieves a list of Operation resources contained
         within the specified zone.
@@ -981,6 +982,10 @@ class ZoneOperationsClient(metaclass=ZoneOperationsClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of pages to fetch
+                ahead on a background thread while the current
+                page is consumed. The default of ``0`` fetches
+                each page only when needed.
 
         Returns:
             google.cloud.compute_v1.services.zone_operations.pagers.ListPager:
@@ -1047,6 +1052,7 @@ class ZoneOperationsClient(metaclass=ZoneOperationsClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Wait for many compute extended operations at once.
+
+Calling ``result()`` on each of hundreds of operations polls them one after
+another, and polling each from its own thread needs one sleeping thread per
+operation. :func:`as_completed` and :func:`wait_all` instead poll all of the
+operations from a single scheduler, with a bounded number of polling requests
+in flight.
+
+Operations are grouped by the zone or region they run in. Each operation
+backs off independently while it is pending, and when one operation in a
+group completes, the other operations in that group are polled again soon,
+since operations issued together tend to complete together.
+
+Example::
+
+    from google.cloud import compute_v1
+    from google.cloud.compute_v1 import waiter
+
+    client = compute_v1.InstancesClient()
+    operations = [
+        client.start(project="my-project", zone=zone, instance=name)
+        for zone, name in instances
+    ]
+    for operation in waiter.as_completed(operations, timeout=600):
+        operation.result()
+"""
+
+from concurrent import futures
+import heapq
+import itertools
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import extended_operation
+
+from google.cloud.compute_v1.types import compute
+
+_DEFAULT_MAX_IN_FLIGHT = 8
+_DEFAULT_INITIAL_DELAY = 1.0
+_DEFAULT_MAXIMUM_DELAY = 20.0
+_DEFAULT_MULTIPLIER = 1.5
+
+# Polling errors which are retried rather than failing the operation.
+_RETRYABLE_EXCEPTIONS = (
+    core_exceptions.TooManyRequests,
+    core_exceptions.InternalServerError,
+    core_exceptions.BadGateway,
+    core_exceptions.ServiceUnavailable,
+)
+
+_GLOBAL_SCOPE = "global"
+
+
+def _scope(operation) -> str:
+    return operation.zone or operation.region or _GLOBAL_SCOPE
+
+
+def _is_complete(operation) -> bool:
+    return operation.status == compute.Operation.Status.DONE
+
+
+class _Pending(object):
+    """Scheduling state of an operation that has not completed."""
+
+    __slots__ = ("operation", "scope", "delay", "due", "entry")
+
+    def __init__(self, operation, scope, delay):
+        self.operation = operation
+        self.scope = scope
+        self.delay = delay
+        self.due = None
+        self.entry = None
+
+
+def as_completed(
+    operations: Iterable[extended_operation.ExtendedOperation],
+    timeout: Optional[float] = None,
+    *,
+    max_in_flight: int = _DEFAULT_MAX_IN_FLIGHT,
+    initial_delay: float = _DEFAULT_INITIAL_DELAY,
+    maximum_delay: float = _DEFAULT_MAXIMUM_DELAY,
+    multiplier: float = _DEFAULT_MULTIPLIER,
+) -> Iterator[extended_operation.ExtendedOperation]:
+    """Yield compute operations as they complete.
+
+    Each operation is polled with its own refresh method, so operations
+    configured with ``use_server_wait()`` are polled with ``wait``.
+    Operations which fail are yielded too; their ``result()`` raises the
+    error. A polling request which fails with a non-retryable error fails
+    the operation it polled.
+
+    Args:
+        operations (Iterable[google.api_core.extended_operation.ExtendedOperation]):
+            The operations returned by compute client methods.
+        timeout (float): The number of seconds to wait for all operations.
+            ``None`` waits indefinitely.
+        max_in_flight (int): The maximum number of concurrent polling
+            requests.
+        initial_delay (float): The delay, in seconds, before an operation
+            is first polled, and after a sibling operation completes.
+        maximum_delay (float): The maximum delay, in seconds, between polls
+            of an operation.
+        multiplier (float): The factor by which the delay between polls of
+            a pending operation grows.
+
+    Returns:
+        Iterator[google.api_core.extended_operation.ExtendedOperation]:
+            The operations, in the order they complete.
+
+    Raises:
+        concurrent.futures.TimeoutError: If ``timeout`` elapses before all
+            operations have completed.
+        ValueError: If ``max_in_flight`` is not positive.
+    """
+    if max_in_flight < 1:
+        raise ValueError(
+            "max_in_flight must be positive, got {}.".format(max_in_flight)
+        )
+    return _as_completed(
+        list(operations),
+        timeout,
+        max_in_flight,
+        initial_delay,
+        maximum_delay,
+        multiplier,
+    )
+
+
+def _as_completed(
+    operations, timeout, max_in_flight, initial_delay, maximum_delay, multiplier
+):
+    start = time.monotonic()
+    deadline = None if timeout is None else start + timeout
+    counter = itertools.count()
+    schedule: List = []
+    by_scope: Dict[str, Dict[int, _Pending]] = {}
+
+    def push(pending, due):
+        pending.due = due
+        pending.entry = [due, next(counter), pending]
+        heapq.heappush(schedule, pending.entry)
+
+    for operation in operations:
+        if _is_complete(operation):
+            yield operation
+            continue
+        pending = _Pending(operation, _scope(operation), initial_delay)
+        by_scope.setdefault(pending.scope, {})[id(pending)] = pending
+        push(pending, start + initial_delay)
+
+    executor = futures.ThreadPoolExecutor(
+        max_workers=max_in_flight, thread_name_prefix="compute-operation-poll"
+    )
+    in_flight: Dict[futures.Future, _Pending] = {}
+    try:
+        while schedule or in_flight:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                remaining = sum(len(scope) for scope in by_scope.values())
+                raise futures.TimeoutError(
+                    "{} (of {}) operations did not complete within {} "
+                    "seconds.".format(remaining, len(operations), timeout)
+                )
+
+            while schedule and schedule[0][0] <= now and len(in_flight) < max_in_flight:
+                _, _, pending = heapq.heappop(schedule)
+                if pending is None:  # Rescheduled.
+                    continue
+                pending.entry = None
+                in_flight[executor.submit(pending.operation.done)] = pending
+
+            wait_for = None
+            if schedule and len(in_flight) < max_in_flight:
+                wait_for = max(schedule[0][0] - now, 0)
+            if deadline is not None:
+                remaining = deadline - now
+                wait_for = remaining if wait_for is None else min(wait_for, remaining)
+
+            if not in_flight:
+                time.sleep(wait_for)
+                continue
+
+            finished, _ = futures.wait(
+                in_flight, timeout=wait_for, return_when=futures.FIRST_COMPLETED
+            )
+            now = time.monotonic()
+            for future in finished:
+                pending = in_flight.pop(future)
+                operation = pending.operation
+                try:
+                    done = future.result()
+                except _RETRYABLE_EXCEPTIONS:
+                    done = False
+                except Exception as exc:
+                    operation.set_exception(exc)
+                    done = True
+
+                siblings = by_scope[pending.scope]
+                if not done:
+                    push(pending, now + pending.delay)
+                    pending.delay = min(pending.delay * multiplier, maximum_delay)
+                    continue
+
+                del siblings[id(pending)]
+                # Operations issued together tend to complete together, so
+                # poll the rest of this zone or region again soon.
+                for sibling in siblings.values():
+                    sibling.delay = initial_delay
+                    if sibling.entry is not None and sibling.due > now + initial_delay:
+                        sibling.entry[2] = None
+                        push(sibling, now + initial_delay)
+                yield operation
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def wait_all(
+    operations: Iterable[extended_operation.ExtendedOperation],
+    timeout: Optional[float] = None,
+    **kwargs,
+) -> List[extended_operation.ExtendedOperation]:
+    """Wait for all of the given compute operations to complete.
+
+    Args:
+        operations (Iterable[google.api_core.extended_operation.ExtendedOperation]):
+            The operations returned by compute client methods.
+        timeout (float): The number of seconds to wait for all operations.
+            ``None`` waits indefinitely.
+        kwargs: Polling options, as accepted by :func:`as_completed`.
+
+    Returns:
+        List[google.api_core.extended_operation.ExtendedOperation]:
+            The operations, in the order given. Call ``result()`` on each
+            to check for errors.
+
+    Raises:
+        concurrent.futures.TimeoutError: If ``timeout`` elapses before all
+            operations have completed.
+    """
+    operations = list(operations)
+    for _ in as_completed(operations, timeout, **kwargs):
+        pass
+    return operations
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measure the per-call cost of wrapping a compute Operation.
+
+Compares the previous generated code, which defined a new
+``ExtendedOperation`` subclass inside every mutating method, with the shared
+wrapper classes in :mod:`google.cloud.compute_v1._operations`.
+
+Usage::
+
+    python scripts/benchmarks/extended_operation_overhead.py [--number N]
+"""
+
+import argparse
+import functools
+import timeit
+from unittest import mock
+
+from google.api_core import extended_operation
+
+from google.cloud.compute_v1 import _operations
+from google.cloud.compute_v1.types import compute
+
+
+def _wrap_inline(transport, request, response):
+    # The code previously generated in each compute client method.
+    operation_service = transport._zone_operations_client
+    operation_request = compute.GetZoneOperationRequest()
+    operation_request.project = request.project
+    operation_request.zone = request.zone
+    operation_request.operation = response.name
+
+    get_operation = functools.partial(operation_service.get, operation_request)
+    cancel_operation = lambda: None  # noqa: E731
+
+    class _CustomOperation(extended_operation.ExtendedOperation):
+        @property
+        def error_message(self):
+            return self._extended_operation.http_error_message
+
+        @property
+        def error_code(self):
+            return self._extended_operation.http_error_status_code
+
+    return _CustomOperation.make(get_operation, cancel_operation, response)
+
+
+def _wrap_shared(transport, request, response):
+    return _operations.ZoneOperation.from_response(transport, request, response)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    transport = mock.Mock()
+    request = compute.InsertInstanceRequest(project="project", zone="zone")
+    response = compute.Operation(
+        name="operation", status=compute.Operation.Status.RUNNING
+    )
+
+    for label, wrap in (("inline class", _wrap_inline), ("shared class", _wrap_shared)):
+        timings = timeit.repeat(
+            functools.partial(wrap, transport, request, response),
+            number=args.number,
+            repeat=args.repeat,
+        )
+        print("{:<14} {:8.2f} us/call".format(label, min(timings) / args.number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
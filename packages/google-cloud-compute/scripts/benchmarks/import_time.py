@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measure the time and memory taken to import the compute package.
+
+Each scenario runs in a fresh interpreter, as a short-lived job or a cold
+start would. ``everything`` imports every client and message type, which
+is what ``from google.cloud import compute_v1`` used to cost.
+
+Usage::
+
+    python scripts/benchmarks/import_time.py [--repeat N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+_SCENARIOS = {
+    "import compute_v1": "from google.cloud import compute_v1",
+    "import compute": "from google.cloud import compute",
+    "InstancesClient": (
+        "from google.cloud import compute_v1\ncompute_v1.InstancesClient"
+    ),
+    "everything": "from google.cloud.compute_v1 import *",
+}
+
+_MEASURE = """
+import resource, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, rss)
+"""
+
+
+def _measure(code):
+    output = subprocess.run(
+        [sys.executable, "-c", _MEASURE.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    elapsed, rss = output.split()
+    return float(elapsed), int(rss)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Populate the bytecode cache, so that every scenario measures a warm
+    # start.
+    _measure(_SCENARIOS["everything"])
+
+    baseline = _measure("pass")[1]
+    print("{:<20} {:>12} {:>14}".format("scenario", "time", "max RSS"))
+    for name, code in _SCENARIOS.items():
+        results = [_measure(code) for _ in range(args.repeat)]
+        elapsed = statistics.median(result[0] for result in results)
+        rss = statistics.median(result[1] for result in results)
+        print(
+            "{:<20} {:>9.1f} ms {:>+10.1f} MiB".format(
+                name, elapsed * 1e3, (rss - baseline) / 1024
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
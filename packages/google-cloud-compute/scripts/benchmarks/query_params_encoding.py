@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measure the cost of encoding compute REST query parameters.
+
+Compares the JSON round trip previously used by the REST transports with
+:func:`google.cloud.compute_v1._query_params.to_dict`, for the query
+parameters of representative compute requests.
+
+Usage::
+
+    python scripts/benchmarks/query_params_encoding.py [--number N]
+"""
+
+import argparse
+import functools
+import json
+import timeit
+
+from google.api_core import path_template, rest_helpers
+from google.protobuf import json_format
+
+from google.cloud.compute_v1 import _query_params
+from google.cloud.compute_v1.types import compute
+
+_REQUESTS = {
+    "instances.get": (
+        "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}",
+        compute.GetInstanceRequest(project="p", zone="z", instance="i"),
+    ),
+    "instances.list": (
+        "/compute/v1/projects/{project}/zones/{zone}/instances",
+        compute.ListInstancesRequest(
+            project="p",
+            zone="z",
+            filter='status = "RUNNING"',
+            max_results=500,
+            order_by="creationTimestamp desc",
+            page_token="CkQI7_vT2dYyEjkKMAgDEix6b25lcy91cy1jZW50cmFsMS1h",
+            return_partial_success=True,
+        ),
+    ),
+    "instances.aggregatedList": (
+        "/compute/v1/projects/{project}/aggregated/instances",
+        compute.AggregatedListInstancesRequest(
+            project="p",
+            include_all_scopes=True,
+            max_results=500,
+            service_project_number=123456789012,
+        ),
+    ),
+    "instances.delete": (
+        "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}",
+        compute.DeleteInstanceRequest(
+            project="p",
+            zone="z",
+            instance="i",
+            request_id="3f2b8a34-3d0b-4c4e-9a63-0c5e9a7f1b2d",
+        ),
+    ),
+}
+
+
+def _json_round_trip(query_params):
+    query_params = json.loads(
+        json_format.MessageToJson(query_params, use_integers_for_enums=False)
+    )
+    return rest_helpers.flatten_query_params(query_params, strict=True)
+
+
+def _direct(query_params):
+    query_params = _query_params.to_dict(query_params, use_integers_for_enums=False)
+    return rest_helpers.flatten_query_params(query_params, strict=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        "{:<26} {:>12} {:>12} {:>8}".format(
+            "request", "round trip", "direct", "speedup"
+        )
+    )
+    for name, (uri, request) in _REQUESTS.items():
+        http_options = [{"method": "get", "uri": uri}]
+        transcoded = path_template.transcode(http_options, type(request).pb(request))
+        query_params = transcoded["query_params"]
+        assert _direct(query_params) == _json_round_trip(query_params)
+
+        timings = []
+        for encode in (_json_round_trip, _direct):
+            best = min(
+                timeit.repeat(
+                    functools.partial(encode, query_params),
+                    number=args.number,
+                    repeat=args.repeat,
+                )
+            )
+            timings.append(best / args.number * 1e6)
+        print(
+            "{:<26} {:>9.2f} us {:>9.2f} us {:>7.1f}x".format(
+                name, timings[0], timings[1], timings[0] / timings[1]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measure the cost of decoding compute REST responses.
+
+Compares :func:`google.protobuf.json_format.Parse`, used by the REST
+transports by default, with :func:`google.cloud.compute_v1._json_decoding.parse`,
+used when a transport is created with ``fast_json_decoding=True``. The
+payloads are modelled on real responses: a full page of 500 instances, an
+aggregated list across 40 zones, and a single operation.
+
+Usage::
+
+    python scripts/benchmarks/response_decoding.py [--number N]
+"""
+
+import argparse
+import timeit
+
+from google.protobuf import json_format
+
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1.types import compute
+
+
+def _instance(zone, index):
+    project = "https://www.googleapis.com/compute/v1/projects/my-project"
+    name = "instance-{:04d}".format(index)
+    return compute.Instance(
+        kind="compute#instance",
+        id=7000000000000000000 + index,
+        creation_timestamp="2023-05-04T03:02:01.000-07:00",
+        name=name,
+        description="A web server.",
+        tags=compute.Tags(items=["http-server", "https-server"], fingerprint="Xm="),
+        machine_type="{}/zones/{}/machineTypes/e2-standard-4".format(project, zone),
+        status="RUNNING",
+        zone="{}/zones/{}".format(project, zone),
+        can_ip_forward=False,
+        network_interfaces=[
+            compute.NetworkInterface(
+                kind="compute#networkInterface",
+                network="{}/global/networks/default".format(project),
+                subnetwork="{}/regions/{}/subnetworks/default".format(
+                    project, zone[:-2]
+                ),
+                network_i_p="10.128.0.{}".format(index % 256),
+                name="nic0",
+                access_configs=[
+                    compute.AccessConfig(
+                        kind="compute#accessConfig",
+                        type_="ONE_TO_ONE_NAT",
+                        name="External NAT",
+                        nat_i_p="203.0.113.{}".format(index % 256),
+                        network_tier="PREMIUM",
+                    )
+                ],
+                fingerprint="f1=",
+                stack_type="IPV4_ONLY",
+            )
+        ],
+        disks=[
+            compute.AttachedDisk(
+                kind="compute#attachedDisk",
+                type_="PERSISTENT",
+                mode="READ_WRITE",
+                source="{}/zones/{}/disks/{}".format(project, zone, name),
+                device_name="persistent-disk-0",
+                index=0,
+                boot=True,
+                auto_delete=True,
+                licenses=[
+                    "https://www.googleapis.com/compute/v1/projects/debian-cloud"
+                    "/global/licenses/debian-11-bullseye"
+                ],
+                interface="SCSI",
+                guest_os_features=[
+                    compute.GuestOsFeature(type_="UEFI_COMPATIBLE"),
+                    compute.GuestOsFeature(type_="VIRTIO_SCSI_MULTIQUEUE"),
+                    compute.GuestOsFeature(type_="GVNIC"),
+                ],
+                disk_size_gb=20,
+                architecture="X86_64",
+            )
+        ],
+        metadata=compute.Metadata(
+            kind="compute#metadata",
+            fingerprint="m1=",
+            items=[
+                compute.Items(key="startup-script", value="#! /bin/bash\necho ok"),
+                compute.Items(key="enable-oslogin", value="TRUE"),
+            ],
+        ),
+        service_accounts=[
+            compute.ServiceAccount(
+                email="123456789012-compute@developer.gserviceaccount.com",
+                scopes=["https://www.googleapis.com/auth/cloud-platform"],
+            )
+        ],
+        self_link="{}/zones/{}/instances/{}".format(project, zone, name),
+        scheduling=compute.Scheduling(
+            on_host_maintenance="MIGRATE",
+            automatic_restart=True,
+            preemptible=False,
+            provisioning_model="STANDARD",
+        ),
+        cpu_platform="Intel Broadwell",
+        labels={"env": "prod", "team": "web", "index": str(index)},
+        label_fingerprint="l1=",
+        start_restricted=False,
+        deletion_protection=False,
+        shielded_instance_config=compute.ShieldedInstanceConfig(
+            enable_secure_boot=False, enable_vtpm=True, enable_integrity_monitoring=True
+        ),
+        fingerprint="i1=",
+        last_start_timestamp="2023-05-04T03:02:11.000-07:00",
+    )
+
+
+def _payloads():
+    zones = ["us-central1-{}".format(c) for c in "abcf"] + [
+        "region{}-zone-{}".format(r, c) for r in range(12) for c in "abc"
+    ]
+    return {
+        "Operation": compute.Operation(
+            kind="compute#operation",
+            id=1234567890123456789,
+            name="operation-1683194521000-5fa9c2",
+            operation_type="insert",
+            target_link="https://www.googleapis.com/compute/v1/projects/p/zones/z"
+            "/instances/instance-0001",
+            status=compute.Operation.Status.DONE,
+            progress=100,
+            insert_time="2023-05-04T03:02:01.000-07:00",
+        ),
+        "InstanceList (500)": compute.InstanceList(
+            kind="compute#instanceList",
+            items=[_instance(zones[0], i) for i in range(500)],
+            next_page_token="CkQI7_vT2dYyEjkKMAgDEix6b25lcy91cy1jZW50cmFsMS1h",
+        ),
+        "InstanceAggregatedList (40x25)": compute.InstanceAggregatedList(
+            kind="compute#instanceAggregatedList",
+            items={
+                "zones/{}".format(zone): compute.InstancesScopedList(
+                    instances=[_instance(zone, i) for i in range(25)]
+                )
+                for zone in zones
+            },
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        "{:<32} {:>10} {:>12} {:>12} {:>8}".format(
+            "response", "size", "json_format", "fast", "speedup"
+        )
+    )
+    for name, response in _payloads().items():
+        response_type = type(response)
+        content = response_type.to_json(response).encode("utf-8")
+
+        timings = []
+        for parse in (json_format.Parse, _json_decoding.parse):
+            message = response_type.pb()()
+            parse(content, message, ignore_unknown_fields=True)
+            assert message == response_type.pb(response)
+
+            def decode(parse=parse):
+                parse(content, response_type.pb()(), ignore_unknown_fields=True)
+
+            number = args.number * (200 if name == "Operation" else 1)
+            best = min(timeit.repeat(decode, number=number, repeat=args.repeat))
+            timings.append(best / number * 1e3)
+        print(
+            "{:<32} {:>7} KiB {:>9.3f} ms {:>9.3f} ms {:>7.1f}x".format(
+                name,
+                len(content) // 1024,
+                timings[0],
+                timings[1],
+                timings[0] / timings[1],
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
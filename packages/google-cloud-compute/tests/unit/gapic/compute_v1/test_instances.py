@@ -10779,6 +10779,99 @@ def test_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_rest_pager_prefetch(transport: str = "rest"):
+    client = InstancesClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.InstanceList(
+                items=[
+                    compute.Instance(),
+                    compute.Instance(),
+                    compute.Instance(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.InstanceList(
+                items=[],
+                next_page_token="def",
+            ),
+            compute.InstanceList(
+                items=[
+                    compute.Instance(),
+                ],
+                next_page_token="ghi",
+            ),
+            compute.InstanceList(
+                items=[
+                    compute.Instance(),
+                    compute.Instance(),
+                ],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.InstanceList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pager = client.list(request=sample_request, prefetch_pages=2)
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, compute.Instance) for i in results)
+        assert pager.next_page_token == ""
+
+        pager = client.list(request=sample_request, prefetch_pages=2)
+        pages = list(pager.pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.parametrize("fast_json_decoding", [True, False])
+def test_list_rest_fast_json_decoding(fast_json_decoding):
+    transport = transports.InstancesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        fast_json_decoding=fast_json_decoding,
+    )
+    client = InstancesClient(transport=transport)
+
+    expected = compute.InstanceList(
+        id="id_value",
+        items=[
+            compute.Instance(
+                name="name_value",
+                id=1234567890123,
+                labels={"key": "value"},
+                disks=[compute.AttachedDisk(boot=True, disk_size_gb=10)],
+            ),
+        ],
+        next_page_token="",
+    )
+    with mock.patch.object(Session, "request") as req:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = compute.InstanceList.to_json(expected).encode("UTF-8")
+        req.return_value = response_value
+
+        pager = client.list(request={"project": "sample1", "zone": "sample2"})
+        page = next(iter(pager.pages))
+
+    assert page.raw_page == expected
+
+
 @pytest.mark.parametrize(
     "request_type",
     [
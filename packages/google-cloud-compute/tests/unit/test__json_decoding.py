@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.protobuf import json_format, struct_pb2
+import pytest
+
+from google.cloud.compute_v1 import _json_decoding
+from google.cloud.compute_v1.types import compute
+
+
+def _instance(name):
+    return compute.Instance(
+        name=name,
+        id=1234567890123456789,
+        status="RUNNING",
+        can_ip_forward=True,
+        labels={"env": "prod", "team": "compute"},
+        tags=compute.Tags(items=["http", "https"], fingerprint="abc="),
+        disks=[
+            compute.AttachedDisk(
+                boot=True,
+                disk_size_gb=100,
+                licenses=["projects/debian-cloud/global/licenses/debian-11"],
+            )
+        ],
+        network_interfaces=[
+            compute.NetworkInterface(
+                network="global/networks/default",
+                access_configs=[compute.AccessConfig(nat_i_p="203.0.113.1")],
+            )
+        ],
+        metadata=compute.Metadata(items=[compute.Items(key="k", value="v")]),
+    )
+
+
+_RESPONSES = [
+    compute.Operation(
+        name="operation-1",
+        status=compute.Operation.Status.DONE,
+        progress=100,
+        error=compute.Error(errors=[compute.Errors(code="QUOTA_EXCEEDED")]),
+    ),
+    compute.InstanceList(
+        items=[_instance("a"), _instance("b")], next_page_token="token"
+    ),
+    compute.InstanceAggregatedList(
+        items={
+            "zones/us-central1-a": compute.InstancesScopedList(
+                instances=[_instance("a")]
+            ),
+            "zones/us-central1-b": compute.InstancesScopedList(
+                warning=compute.Warning(
+                    code="NO_RESULTS_ON_PAGE",
+                    data=[compute.Data(key="scope", value="zones/us-central1-b")],
+                )
+            ),
+        },
+        unreachables=["zones/us-east1-a"],
+    ),
+    compute.Firewall(
+        allowed=[compute.Allowed(I_p_protocol="tcp", ports=["80", "443"])],
+        priority=1000,
+    ),
+    compute.Quota(limit=24.0, usage=1.5, metric="CPUS"),
+]
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def loads(request):
+    if request.param:
+        pytest.importorskip("orjson")
+        yield
+    else:
+        with mock.patch.object(_json_decoding, "orjson", None):
+            yield
+
+
+@pytest.mark.parametrize("response", _RESPONSES, ids=lambda r: type(r).__name__)
+def test_parse_matches_json_format(response, loads):
+    response_type = type(response)
+    content = response_type.to_json(response).encode("utf-8")
+
+    expected = response_type.pb()()
+    json_format.Parse(content, expected, ignore_unknown_fields=True)
+    actual = response_type.pb()()
+    result = _json_decoding.parse(content, actual, ignore_unknown_fields=True)
+
+    assert result is actual
+    assert actual == expected == response_type.pb(response)
+
+
+def test_parse_uses_fast_path():
+    content = compute.InstanceList.to_json(_RESPONSES[1])
+    message = compute.InstanceList.pb()()
+    with mock.patch.object(json_format, "Parse") as parse:
+        _json_decoding.parse(content, message, ignore_unknown_fields=True)
+    parse.assert_not_called()
+    assert message == compute.InstanceList.pb(_RESPONSES[1])
+
+
+def test_parse_accepts_original_field_names_and_nulls():
+    content = json.dumps(
+        {
+            "name": "a",
+            "can_ip_forward": True,
+            "description": None,
+            "unknownField": {"nested": [1, 2]},
+        }
+    )
+    message = compute.Instance.pb()()
+    _json_decoding.parse(content, message, ignore_unknown_fields=True)
+    assert message == compute.Instance.pb(
+        compute.Instance(name="a", can_ip_forward=True)
+    )
+
+
+def test_parse_merges_into_message():
+    message = compute.Instance.pb(compute.Instance(name="a", zone="z"))
+    _json_decoding.parse('{"name": "b"}', message, ignore_unknown_fields=True)
+    assert message == compute.Instance.pb(compute.Instance(name="b", zone="z"))
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        # Not JSON.
+        "{",
+        # An integer which is out of range.
+        '{"id": "18446744073709551616"}',
+        # A value of the wrong type.
+        '{"name": 1}',
+        # Integers which are not integral.
+        '{"id": 1.7}',
+        '{"id": true}',
+    ],
+)
+def test_parse_errors_match_json_format(content):
+    with pytest.raises(json_format.ParseError) as expected:
+        json_format.Parse(content, compute.Instance.pb()(), ignore_unknown_fields=True)
+    with pytest.raises(json_format.ParseError) as actual:
+        _json_decoding.parse(
+            content, compute.Instance.pb()(), ignore_unknown_fields=True
+        )
+    assert str(actual.value) == str(expected.value)
+
+
+def test_parse_accepts_integral_floats():
+    message = compute.Operation.pb()()
+    _json_decoding.parse('{"progress": 2.0}', message, ignore_unknown_fields=True)
+    assert message.progress == 2
+
+
+def test_parse_does_not_cache_a_failed_plan():
+    content = compute.Instance.to_json(_instance("a"))
+    expected = json_format.Parse(
+        content, compute.Instance.pb()(), ignore_unknown_fields=True
+    )
+    field_converter = _json_decoding._field_converter
+    calls = []
+
+    def failing_once(field):
+        calls.append(field)
+        if len(calls) == 1:
+            raise AttributeError("label")
+        return field_converter(field)
+
+    with mock.patch.object(_json_decoding, "_plans", {}):
+        with mock.patch.object(_json_decoding, "_field_converter", failing_once):
+            for _ in range(2):
+                message = compute.Instance.pb()()
+                _json_decoding.parse(content, message, ignore_unknown_fields=True)
+                assert message == expected
+        assert compute.Instance.pb().DESCRIPTOR in _json_decoding._plans
+
+
+def test_parse_falls_back_for_well_known_types():
+    message = struct_pb2.Struct()
+    _json_decoding.parse('{"a": [1, "b"]}', message, ignore_unknown_fields=True)
+    expected = struct_pb2.Struct()
+    expected.update({"a": [1, "b"]})
+    assert message == expected
+
+
+def test_parse_unknown_fields_rejected_without_ignore():
+    with pytest.raises(json_format.ParseError):
+        _json_decoding.parse('{"notAField": 1}', compute.Instance.pb()())
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.cloud.compute_v1 import _operations
+from google.cloud.compute_v1.types import compute
+
+
+def _make_transport():
+    transport = mock.Mock(
+        spec=[
+            "_zone_operations_client",
+            "_region_operations_client",
+            "_global_operations_client",
+            "_global_organization_operations_client",
+        ]
+    )
+    return transport
+
+
+def _pending(name="op"):
+    return compute.Operation(name=name, status=compute.Operation.Status.RUNNING)
+
+
+def _done(name="op", **kwargs):
+    return compute.Operation(name=name, status=compute.Operation.Status.DONE, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "operation_class,service_name,request_,expected",
+    [
+        (
+            _operations.ZoneOperation,
+            "_zone_operations_client",
+            compute.InsertInstanceRequest(project="p", zone="z"),
+            compute.GetZoneOperationRequest(project="p", zone="z", operation="op"),
+        ),
+        (
+            _operations.RegionOperation,
+            "_region_operations_client",
+            compute.InsertAddressRequest(project="p", region="r"),
+            compute.GetRegionOperationRequest(project="p", region="r", operation="op"),
+        ),
+        (
+            _operations.GlobalOperation,
+            "_global_operations_client",
+            compute.InsertNetworkRequest(project="p"),
+            compute.GetGlobalOperationRequest(project="p", operation="op"),
+        ),
+        (
+            _operations.GlobalOrganizationOperation,
+            "_global_organization_operations_client",
+            compute.InsertFirewallPolicyRequest(parent_id="parent"),
+            compute.GetGlobalOrganizationOperationRequest(
+                parent_id="parent", operation="op"
+            ),
+        ),
+        (
+            _operations.GlobalOrganizationOperation,
+            "_global_organization_operations_client",
+            compute.DeleteFirewallPolicyRequest(firewall_policy="fp"),
+            compute.GetGlobalOrganizationOperationRequest(operation="op"),
+        ),
+    ],
+)
+def test_from_response_polls_operation_service(
+    operation_class, service_name, request_, expected
+):
+    transport = _make_transport()
+    operation_service = getattr(transport, service_name)
+    operation_service.get.return_value = _done()
+
+    operation = operation_class.from_response(transport, request_, _pending())
+
+    assert isinstance(operation, operation_class)
+    assert operation.name == "op"
+    assert operation.done()
+    operation_service.get.assert_called_once_with(expected)
+
+
+def test_from_response_maps_http_errors():
+    transport = _make_transport()
+    response = _done(http_error_status_code=404, http_error_message="missing")
+
+    operation = _operations.ZoneOperation.from_response(
+        transport, compute.InsertInstanceRequest(project="p", zone="z"), response
+    )
+
+    assert operation.error_code == 404
+    assert operation.error_message == "missing"
+    with pytest.raises(core_exceptions.NotFound):
+        operation.result()
+
+
+def test_cancel_is_a_no_op():
+    transport = _make_transport()
+    transport._zone_operations_client.get.return_value = _pending()
+
+    operation = _operations.ZoneOperation.from_response(
+        transport, compute.InsertInstanceRequest(project="p", zone="z"), _pending()
+    )
+
+    assert operation.cancel()
+
+
+@pytest.mark.parametrize(
+    "operation_class,service_name,request_,expected",
+    [
+        (
+            _operations.ZoneOperation,
+            "_zone_operations_client",
+            compute.InsertInstanceRequest(project="p", zone="z"),
+            compute.WaitZoneOperationRequest(project="p", zone="z", operation="op"),
+        ),
+        (
+            _operations.RegionOperation,
+            "_region_operations_client",
+            compute.InsertAddressRequest(project="p", region="r"),
+            compute.WaitRegionOperationRequest(project="p", region="r", operation="op"),
+        ),
+        (
+            _operations.GlobalOperation,
+            "_global_operations_client",
+            compute.InsertNetworkRequest(project="p"),
+            compute.WaitGlobalOperationRequest(project="p", operation="op"),
+        ),
+    ],
+)
+def test_use_server_wait_polls_with_wait(
+    operation_class, service_name, request_, expected
+):
+    transport = _make_transport()
+    operation_service = getattr(transport, service_name)
+    operation_service.wait.side_effect = [_pending(), _done()]
+
+    operation = operation_class.from_response(transport, request_, _pending())
+    assert operation.use_server_wait() is operation
+
+    assert not operation.done()
+    assert operation.done()
+    assert operation_service.wait.call_count == 2
+    operation_service.wait.assert_called_with(expected)
+    operation_service.get.assert_not_called()
+
+
+def test_use_server_wait_disabled_polls_with_get():
+    transport = _make_transport()
+    operation_service = transport._zone_operations_client
+    operation_service.get.return_value = _done()
+
+    operation = _operations.ZoneOperation.from_response(
+        transport, compute.InsertInstanceRequest(project="p", zone="z"), _pending()
+    )
+    operation.use_server_wait()
+    operation.use_server_wait(False)
+
+    assert operation.done()
+    operation_service.get.assert_called_once()
+    operation_service.wait.assert_not_called()
+
+
+def test_use_server_wait_unsupported():
+    transport = _make_transport()
+
+    operation = _operations.GlobalOrganizationOperation.from_response(
+        transport, compute.DeleteFirewallPolicyRequest(), _pending()
+    )
+
+    with pytest.raises(ValueError):
+        operation.use_server_wait()
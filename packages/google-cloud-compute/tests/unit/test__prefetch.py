@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+
+import pytest
+
+from google.cloud.compute_v1 import _prefetch
+from google.cloud.compute_v1.types import compute
+
+
+def _make_pages(count):
+    pages = [
+        compute.InstanceList(
+            items=[compute.Instance(name="i{}".format(i))],
+            next_page_token="t{}".format(i + 1),
+        )
+        for i in range(count)
+    ]
+    pages[-1].next_page_token = ""
+    return pages
+
+
+class _Method(object):
+    def __init__(self, pages):
+        self._pages = {"t{}".format(i): page for i, page in enumerate(pages)}
+        self.tokens = []
+        self.metadata = []
+
+    def __call__(self, request, metadata=()):
+        self.tokens.append(request.page_token)
+        self.metadata.append(metadata)
+        return self._pages[request.page_token]
+
+
+def test_prefetch_pages_yields_all_pages_in_order():
+    pages = _make_pages(5)
+    method = _Method(pages)
+    request = compute.ListInstancesRequest(project="p", zone="z")
+
+    result = list(
+        _prefetch.prefetch_pages(
+            method, request, pages[0], metadata=(("a", "b"),), depth=2
+        )
+    )
+
+    assert result == pages
+    assert method.tokens == ["t1", "t2", "t3", "t4"]
+    assert method.metadata == [(("a", "b"),)] * 4
+
+
+def test_prefetch_pages_single_page_does_not_fetch():
+    pages = _make_pages(1)
+    method = _Method(pages)
+
+    result = list(
+        _prefetch.prefetch_pages(method, compute.ListInstancesRequest(), pages[0])
+    )
+
+    assert result == pages
+    assert method.tokens == []
+
+
+def test_prefetch_pages_bounds_buffered_pages():
+    pages = _make_pages(10)
+    method = _Method(pages)
+    fetched = threading.Semaphore(0)
+
+    def tracking_method(request, metadata=()):
+        page = method(request, metadata=metadata)
+        fetched.release()
+        return page
+
+    iterator = _prefetch.prefetch_pages(
+        tracking_method, compute.ListInstancesRequest(), pages[0], depth=2
+    )
+    assert next(iterator) is pages[0]
+    assert next(iterator) is pages[1]
+
+    # One page consumed, two buffered and one held by the blocked producer.
+    for _ in range(4):
+        assert fetched.acquire(timeout=5)
+    assert not fetched.acquire(timeout=0.3)
+    assert len(method.tokens) == 4
+
+    iterator.close()
+
+
+def test_prefetch_pages_reraises_fetch_errors():
+    pages = _make_pages(3)
+
+    def failing_method(request, metadata=()):
+        raise RuntimeError("boom")
+
+    iterator = _prefetch.prefetch_pages(
+        failing_method, compute.ListInstancesRequest(), pages[0]
+    )
+    assert next(iterator) is pages[0]
+    with pytest.raises(RuntimeError, match="boom"):
+        next(iterator)
+
+
+def test_prefetch_pages_stops_producer_when_closed():
+    pages = _make_pages(50)
+    method = _Method(pages)
+
+    iterator = _prefetch.prefetch_pages(
+        method, compute.ListInstancesRequest(), pages[0], depth=1
+    )
+    next(iterator)
+    next(iterator)
+    iterator.close()
+
+    for thread in threading.enumerate():
+        if thread.name == "compute-page-prefetch":
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+    assert len(method.tokens) < 50
+
+
+def test_prefetch_pages_rejects_non_positive_depth():
+    with pytest.raises(ValueError):
+        _prefetch.prefetch_pages(
+            None, compute.ListInstancesRequest(), compute.InstanceList(), depth=0
+        )
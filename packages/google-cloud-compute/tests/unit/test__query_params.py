@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.protobuf import descriptor, json_format
+import pytest
+
+from google.cloud.compute_v1 import _query_params
+from google.cloud.compute_v1.types import compute
+
+
+def _round_trip(message, use_integers_for_enums):
+    return json.loads(
+        json_format.MessageToJson(
+            message, use_integers_for_enums=use_integers_for_enums
+        )
+    )
+
+
+@pytest.mark.parametrize("use_integers_for_enums", [False, True])
+@pytest.mark.parametrize(
+    "request_",
+    [
+        compute.ListInstancesRequest(),
+        compute.ListInstancesRequest(
+            project="p",
+            zone="z",
+            filter='name = "a"',
+            max_results=500,
+            order_by="creationTimestamp desc",
+            page_token="token",
+            return_partial_success=False,
+        ),
+        compute.AggregatedListInstancesRequest(
+            project="p",
+            include_all_scopes=True,
+            service_project_number=1234567890123,
+        ),
+        compute.GetSerialPortOutputInstanceRequest(port=2, start=-5),
+        compute.GetIamPolicyInstanceRequest(options_requested_policy_version=3),
+        compute.ListUsableSubnetworksRequest(project="p", max_results=0),
+    ],
+)
+def test_to_dict_matches_json_round_trip(request_, use_integers_for_enums):
+    message = type(request_).pb(request_)
+
+    assert _query_params.to_dict(message, use_integers_for_enums) == _round_trip(
+        message, use_integers_for_enums
+    )
+
+
+@pytest.mark.parametrize("use_integers_for_enums", [False, True])
+def test_to_dict_enums(use_integers_for_enums):
+    request_ = compute.Operation(
+        status=compute.Operation.Status.DONE, warnings=[compute.Warnings()]
+    )
+    message = compute.Operation.pb(request_)
+
+    # Messages fall back to the JSON round trip.
+    assert _query_params.to_dict(message, use_integers_for_enums) == _round_trip(
+        message, use_integers_for_enums
+    )
+
+    request_ = compute.Operation(status=compute.Operation.Status.DONE)
+    message = compute.Operation.pb(request_)
+    assert _query_params.to_dict(message, use_integers_for_enums) == _round_trip(
+        message, use_integers_for_enums
+    )
+
+
+def test_to_dict_repeated_fields():
+    request_ = compute.InstancesSetServiceAccountRequest(email="e", scopes=["a", "b"])
+    message = compute.InstancesSetServiceAccountRequest.pb(request_)
+
+    result = _query_params.to_dict(message)
+
+    assert result == {"email": "e", "scopes": ["a", "b"]}
+    assert result == _round_trip(message, False)
+
+
+def test_to_dict_falls_back_when_a_converter_fails():
+    request_ = compute.ListInstancesRequest(project="p", max_results=5)
+    message = compute.ListInstancesRequest.pb(request_)
+
+    make_converter = mock.Mock(side_effect=AttributeError("label"))
+    with mock.patch.object(_query_params, "_converters", {False: {}, True: {}}):
+        with mock.patch.object(_query_params, "_make_converter", make_converter):
+            result = _query_params.to_dict(message)
+
+    make_converter.assert_called()
+
+    assert result == _round_trip(message, False)
+
+
+def _scalar_value(field):
+    types = descriptor.FieldDescriptor
+    if field.type == types.TYPE_STRING:
+        return "value"
+    if field.type == types.TYPE_BOOL:
+        return True
+    if field.type == types.TYPE_ENUM:
+        return field.enum_type.values[-1].number
+    if field.type in (types.TYPE_INT64, types.TYPE_SINT64, types.TYPE_SFIXED64):
+        return -(2**40)
+    if field.type in (types.TYPE_UINT64, types.TYPE_FIXED64):
+        return 2**40
+    if field.type in (types.TYPE_INT32, types.TYPE_SINT32, types.TYPE_SFIXED32):
+        return -7
+    if field.type in (types.TYPE_UINT32, types.TYPE_FIXED32):
+        return 7
+    return None
+
+
+def test_to_dict_matches_json_round_trip_for_all_request_scalars():
+    for name in dir(compute):
+        if not name.endswith("Request"):
+            continue
+        message = getattr(compute, name).pb()()
+        for field in message.DESCRIPTOR.fields:
+            value = _scalar_value(field)
+            if value is None:
+                continue
+            if _query_params._is_repeated(field):
+                getattr(message, field.name).extend([value, value])
+            else:
+                setattr(message, field.name, value)
+
+        for use_integers_for_enums in (False, True):
+            assert _query_params.to_dict(
+                message, use_integers_for_enums
+            ) == _round_trip(message, use_integers_for_enums), name
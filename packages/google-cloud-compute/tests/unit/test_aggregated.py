@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+import json
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+from google.api_core import retry as retries
+from google.auth import credentials as ga_credentials
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.cloud.compute_v1 import aggregated
+from google.cloud.compute_v1.services.instances import InstancesClient
+from google.cloud.compute_v1.services.region_commitments import RegionCommitmentsClient
+from google.cloud.compute_v1.services.zones import ZonesClient
+from google.cloud.compute_v1.types import compute
+
+
+def _make_client(client_class=InstancesClient):
+    return client_class(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport="rest",
+    )
+
+
+def _make_response(payload, status_code=200):
+    response = Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(json.dumps(payload).encode("utf-8"))
+    return response
+
+
+def _instance_page(zones, next_page_token=None):
+    payload = {
+        "kind": "compute#instanceAggregatedList",
+        "items": {
+            zone: {"instances": [{"name": name} for name in names]}
+            for zone, names in zones.items()
+        },
+        "selfLink": "https://example.com/ünïcode",
+    }
+    if next_page_token:
+        payload["nextPageToken"] = next_page_token
+    return payload
+
+
+def _chunked(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_json_stream_members(chunk_size):
+    text = json.dumps(
+        {"a": 12345, "items": {"x": {"v": [1, 2]}, "y": {}}, "b": [True, None]}
+    )
+    stream = aggregated._JsonStream(_chunked(text, chunk_size))
+
+    result = {}
+    for key in stream.members():
+        if key == "items":
+            result[key] = [(scope, stream.value()) for scope in stream.members()]
+        else:
+            result[key] = stream.value()
+
+    assert result == {
+        "a": 12345,
+        "items": [("x", {"v": [1, 2]}), ("y", {})],
+        "b": [True, None],
+    }
+
+
+def test_json_stream_truncated():
+    stream = aggregated._JsonStream(_chunked('{"items": {"x": {"v"', 4))
+    with pytest.raises(ValueError):
+        for _ in stream.members():
+            for _ in stream.members():
+                stream.value()
+
+
+def test_iter_aggregated_list():
+    client = _make_client()
+    pages = [
+        _instance_page({"zones/a": ["i1", "i2"], "zones/b": []}, "token"),
+        _instance_page({"zones/c": ["i3"]}),
+    ]
+
+    with mock.patch.object(Session, "request") as req:
+        req.side_effect = [_make_response(page) for page in pages]
+        results = list(
+            aggregated.iter_aggregated_list(
+                client,
+                {"project": "proj", "filter": "status = RUNNING"},
+                metadata=(("x-test", "1"),),
+            )
+        )
+
+    assert [scope for scope, _ in results] == ["zones/a", "zones/b", "zones/c"]
+    assert all(isinstance(value, compute.InstancesScopedList) for _, value in results)
+    assert [i.name for i in results[0][1].instances] == ["i1", "i2"]
+    assert [i.name for i in results[2][1].instances] == ["i3"]
+
+    assert req.call_count == 2
+    first, second = req.call_args_list
+    assert first.args[0] == "GET"
+    assert first.args[1].endswith("/compute/v1/projects/proj/aggregated/instances")
+    assert first.kwargs["stream"] is True
+    assert first.kwargs["headers"]["x-test"] == "1"
+    assert first.kwargs["headers"]["x-goog-request-params"] == "project=proj"
+    assert "x-goog-api-client" in first.kwargs["headers"]
+    assert first.kwargs["timeout"] is None
+    assert ("filter", "status = RUNNING") in first.kwargs["params"]
+    assert ("pageToken", "token") in second.kwargs["params"]
+
+
+def test_iter_aggregated_list_collection_override():
+    client = _make_client(RegionCommitmentsClient)
+    payload = {"items": {"regions/r": {"commitments": [{"name": "c1"}]}}}
+
+    with mock.patch.object(Session, "request") as req:
+        req.return_value = _make_response(payload)
+        results = list(aggregated.iter_aggregated_list(client, project="proj"))
+
+    assert req.call_args.args[1].endswith("/projects/proj/aggregated/commitments")
+    assert results[0][0] == "regions/r"
+    assert results[0][1].commitments[0].name == "c1"
+
+
+def test_iter_aggregated_list_error():
+    client = _make_client()
+
+    with mock.patch.object(Session, "request") as req:
+        response = _make_response({"error": {"message": "nope"}}, status_code=404)
+        response.request = mock.Mock()
+        req.return_value = response
+        with pytest.raises(core_exceptions.NotFound):
+            list(aggregated.iter_aggregated_list(client, project="proj"))
+
+
+def test_iter_aggregated_list_retry_and_interceptor():
+    client = _make_client()
+    transport = client._transport
+    unavailable = _make_response({"error": {"message": "busy"}}, status_code=503)
+    unavailable.request = mock.Mock()
+    retry = retries.Retry(
+        predicate=retries.if_exception_type(core_exceptions.ServiceUnavailable),
+        initial=0.01,
+        maximum=0.01,
+    )
+
+    with mock.patch.object(Session, "request") as req, mock.patch.object(
+        transport._interceptor,
+        "pre_aggregated_list",
+        side_effect=lambda request, metadata: (request, metadata),
+    ) as pre:
+        req.side_effect = [
+            unavailable,
+            _make_response(_instance_page({"zones/a": ["i1"]})),
+        ]
+        results = list(
+            aggregated.iter_aggregated_list(
+                client, project="proj", retry=retry, timeout=5.0
+            )
+        )
+
+    assert [scope for scope, _ in results] == ["zones/a"]
+    assert req.call_count == 2
+    assert pre.call_count == 2
+    assert 0 < req.call_args.kwargs["timeout"] <= 5.0
+
+
+@pytest.mark.parametrize("client_class", [InstancesClient, RegionCommitmentsClient])
+def test_iter_aggregated_list_transport_internals(client_class):
+    # iter_aggregated_list bypasses the generated aggregated_list stub, and
+    # relies on these non-public parts of the generated client and transport.
+    client = _make_client(client_class)
+    transport = client.transport
+    assert isinstance(transport._session, Session)
+    assert callable(transport._interceptor.pre_aggregated_list)
+    assert callable(client._validate_universe_domain)
+
+    # The defaults of aggregated._open_page_rpc must match the generated ones.
+    wrapped = transport._wrapped_methods[transport.aggregated_list]
+    assert wrapped._retry is None
+    assert wrapped._timeout is None
+
+
+def test_iter_aggregated_list_request_and_project():
+    client = _make_client()
+    with pytest.raises(ValueError):
+        list(aggregated.iter_aggregated_list(client, {"project": "p"}, project="p"))
+
+
+def test_iter_aggregated_list_unsupported_client():
+    client = _make_client(ZonesClient)
+    with pytest.raises(TypeError):
+        list(aggregated.iter_aggregated_list(client, project="p"))
+
+
+def test_fan_out_list():
+    client = _make_client()
+    names = {"a": ["i1"], "b": ["i2", "i3"]}
+
+    def fake_list(request, retry, timeout, metadata=()):
+        # The client's defaults apply.
+        assert retry is gapic_v1.method.DEFAULT
+        assert timeout is gapic_v1.method.DEFAULT
+        assert request["project"] == "proj"
+        assert request["filter"] == "f"
+        return [compute.Instance(name=name) for name in names[request["zone"]]]
+
+    with mock.patch.object(InstancesClient, "list", side_effect=fake_list):
+        results = dict(
+            aggregated.fan_out_list(
+                client, ["zones/a", "zones/b"], {"filter": "f"}, project="proj"
+            )
+        )
+
+    assert set(results) == {"zones/a", "zones/b"}
+    assert isinstance(results["zones/a"], compute.InstancesScopedList)
+    assert [i.name for i in results["zones/b"].instances] == ["i2", "i3"]
+
+
+def test_fan_out_list_bad_scope():
+    client = _make_client()
+    with pytest.raises(ValueError):
+        list(aggregated.fan_out_list(client, ["global"], project="proj"))
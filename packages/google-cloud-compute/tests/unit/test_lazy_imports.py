@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from google.cloud import compute, compute_v1
+from google.cloud.compute_v1.services.instances import client as instances_client
+from google.cloud.compute_v1.types import compute as compute_types
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@pytest.mark.parametrize("package", ["compute", "compute_v1"])
+def test_import_does_not_load_clients_or_types(package):
+    loaded = _run(
+        """
+        import sys
+        from google.cloud import {}
+        print(sorted(
+            name for name in sys.modules
+            if name.startswith(("google.cloud.compute_v1.services",
+                                "google.cloud.compute_v1.types"))
+        ))
+        """.format(
+            package
+        )
+    )
+    assert loaded.strip() == "[]"
+
+
+def test_client_is_loaded_on_access():
+    assert compute_v1.InstancesClient is instances_client.InstancesClient
+
+
+def test_type_is_loaded_on_access():
+    assert compute_v1.Instance is compute_types.Instance
+
+
+def test_submodules_are_loaded_on_access():
+    loaded = _run(
+        """
+        from google.cloud import compute_v1
+        print(compute_v1.types.Instance.__name__)
+        """
+    )
+    assert loaded.strip() == "Instance"
+
+
+def test_all_names_resolve():
+    for name in compute_v1.__all__:
+        assert getattr(compute_v1, name) is getattr(compute, name)
+
+
+def test_star_import():
+    namespace = {}
+    exec("from google.cloud.compute_v1 import *", namespace)
+    assert namespace["InstancesClient"] is instances_client.InstancesClient
+    assert namespace["Instance"] is compute_types.Instance
+
+
+@pytest.mark.parametrize("module", [compute, compute_v1])
+def test_unknown_attribute(module):
+    with pytest.raises(AttributeError):
+        module.NotAClient
+
+
+@pytest.mark.parametrize("module", [compute, compute_v1])
+def test_dir_lists_all_names(module):
+    assert set(module.__all__) <= set(dir(module))
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from concurrent import futures
+import threading
+from unittest import mock
+
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.cloud.compute_v1 import _operations, waiter
+from google.cloud.compute_v1.types import compute
+
+_FAST = {"initial_delay": 0.001, "maximum_delay": 0.01}
+
+
+def _operation(name, responses, zone="zones/z"):
+    """Make a zone operation whose polls return ``responses`` in turn.
+
+    Each response is a status, or an exception to raise.
+    """
+    transport = mock.Mock(spec=["_zone_operations_client"])
+
+    def get(request):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return compute.Operation(name=name, zone=zone, status=response)
+
+    transport._zone_operations_client.get.side_effect = get
+    initial = compute.Operation(
+        name=name, zone=zone, status=compute.Operation.Status.RUNNING
+    )
+    return _operations.ZoneOperation.from_response(
+        transport, compute.InsertInstanceRequest(project="p", zone="z"), initial
+    )
+
+
+RUNNING = compute.Operation.Status.RUNNING
+DONE = compute.Operation.Status.DONE
+
+
+def test_as_completed_yields_in_completion_order():
+    slow = _operation("slow", [RUNNING, RUNNING, RUNNING, DONE], zone="zones/a")
+    fast = _operation("fast", [DONE], zone="zones/b")
+
+    completed = list(waiter.as_completed([slow, fast], **_FAST))
+
+    assert [op.name for op in completed] == ["fast", "slow"]
+    assert all(op.done() for op in completed)
+
+
+def test_as_completed_yields_already_done_operations():
+    operation = _operation("op", [])
+    operation._extended_operation = compute.Operation(name="op", status=DONE)
+
+    assert list(waiter.as_completed([operation])) == [operation]
+
+
+def test_as_completed_bounds_in_flight_polls():
+    lock = threading.Lock()
+    state = {"current": 0, "peak": 0}
+    operations = [_operation("op{}".format(i), [DONE]) for i in range(20)]
+
+    for operation in operations:
+        original = operation.done
+
+        def done(original=original):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            try:
+                threading.Event().wait(0.005)
+                return original()
+            finally:
+                with lock:
+                    state["current"] -= 1
+
+        operation.done = done
+
+    completed = list(waiter.as_completed(operations, max_in_flight=3, **_FAST))
+
+    assert len(completed) == 20
+    assert 1 <= state["peak"] <= 3
+
+
+def test_as_completed_retries_transient_errors():
+    operation = _operation(
+        "op", [core_exceptions.ServiceUnavailable("later"), RUNNING, DONE]
+    )
+
+    (completed,) = waiter.as_completed([operation], **_FAST)
+
+    assert completed.result() is None
+
+
+def test_as_completed_fails_operation_on_permanent_error():
+    operation = _operation("op", [core_exceptions.PermissionDenied("no")])
+
+    (completed,) = waiter.as_completed([operation], **_FAST)
+
+    with pytest.raises(core_exceptions.PermissionDenied):
+        completed.result()
+
+
+def test_as_completed_timeout():
+    operation = _operation("op", [RUNNING] * 10000)
+
+    with pytest.raises(futures.TimeoutError):
+        list(waiter.as_completed([operation], timeout=0.05, **_FAST))
+
+
+def test_as_completed_polls_siblings_after_completion():
+    first = _operation("first", [RUNNING, DONE], zone="zones/a")
+    second = _operation("second", [RUNNING, RUNNING, DONE], zone="zones/a")
+
+    completed = list(
+        waiter.as_completed(
+            [first, second], initial_delay=0.01, maximum_delay=60, multiplier=1000
+        )
+    )
+
+    # Without the reset, the third poll of "second" would wait 10 seconds.
+    assert [op.name for op in completed] == ["first", "second"]
+
+
+def test_as_completed_rejects_bad_max_in_flight():
+    with pytest.raises(ValueError):
+        waiter.as_completed([], max_in_flight=0)
+
+
+def test_wait_all_returns_operations_in_order():
+    operations = [
+        _operation("a", [RUNNING, DONE]),
+        _operation("b", [DONE], zone="zones/other"),
+    ]
+
+    assert waiter.wait_all(operations, timeout=30, **_FAST) == operations
+    assert all(op.done() for op in operations)
@@ -0,0 +1,556 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Envelope encryption with data keys wrapped by a Cloud KMS key.
+
+:class:`EnvelopeCipher` encrypts data locally with AES-256-GCM under data
+encryption keys (DEKs) which it generates, and stores each DEK with the
+data, wrapped with ``encrypt`` by a Cloud KMS key. A DEK is used for many
+messages, and unwrapped DEKs are cached, so that only one ``encrypt`` or
+``decrypt`` request is made for many messages. Requires the
+``cryptography`` package, which is installed with the ``cryptography``
+extra.
+
+.. code-block:: python
+
+    from google.cloud import kms_v1
+    from google.cloud.kms_v1.envelope import EnvelopeCipher
+
+    client = kms_v1.KeyManagementServiceClient()
+    cipher = EnvelopeCipher(client, crypto_key_name)
+    ciphertext = cipher.encrypt(b"record")
+    assert cipher.decrypt(ciphertext) == b"record"
+
+    with open("data", "rb") as source, open("data.enc", "wb") as destination:
+        cipher.encrypt_stream(source, destination)
+"""
+
+import collections
+from concurrent import futures
+import os
+import struct
+import threading
+import time
+from typing import BinaryIO, Optional
+
+from google.api_core import exceptions as core_exceptions
+import google_crc32c
+
+try:
+    from cryptography import exceptions as crypto_exceptions
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+except ImportError:  # pragma: NO COVER
+    AESGCM = None
+
+from google.cloud.kms_v1.types import service
+
+DEFAULT_MAX_AGE = 300.0
+DEFAULT_MAX_MESSAGES = 2**20
+DEFAULT_MAX_BYTES = 2**30
+DEFAULT_MAX_CACHED_KEYS = 100
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_KEY_SIZE = 32
+_NONCE_SIZE = 12
+_TAG_SIZE = 16
+_SALT_SIZE = 16
+# The nonce of a chunk is this prefix, the index of the chunk and a flag
+# marking the last chunk.
+_NONCE_PREFIX_SIZE = 7
+_MAX_CHUNKS = 2**32
+
+_MESSAGE_VERSION = 1
+_STREAM_VERSION = 2
+# The version and the size of the wrapped key.
+_HEADER = struct.Struct(">BH")
+# The salt, the nonce prefix and the chunk size of a stream.
+_STREAM_HEADER = struct.Struct(">{}s{}sI".format(_SALT_SIZE, _NONCE_PREFIX_SIZE))
+_CHUNK_NONCE = struct.Struct(">{}sIB".format(_NONCE_PREFIX_SIZE))
+
+
+def _check_cryptography():
+    if AESGCM is None:
+        raise RuntimeError("This method requires `cryptography` to be installed.")
+
+
+def _read_full(source, size):
+    """Read up to size bytes, fewer only at the end of the source."""
+    data = source.read(size)
+    if data is None or len(data) == size or not data:
+        return data or b""
+    parts = [data]
+    remaining = size - len(data)
+    while remaining:
+        part = source.read(remaining)
+        if not part:
+            break
+        parts.append(part)
+        remaining -= len(part)
+    return b"".join(parts)
+
+
+class _DataKey(object):
+    """An unwrapped data encryption key."""
+
+    __slots__ = ("key", "wrapped", "aead", "created", "messages", "bytes")
+
+    def __init__(self, key, wrapped):
+        self.key = key
+        self.wrapped = wrapped
+        self.aead = AESGCM(key)
+        # The time.monotonic() at which the key was unwrapped or created.
+        self.created = time.monotonic()
+        # The number of messages and bytes encrypted with the key.
+        self.messages = 0
+        self.bytes = 0
+
+    def zeroize(self):
+        """Overwrite the key, and drop the cipher holding a copy of it.
+
+        This is best effort: immutable copies of the key, such as the
+        :class:`bytes` sent to wrap it and the plaintext of the response
+        which unwrapped it, cannot be overwritten.
+        """
+        self.key[:] = bytes(len(self.key))
+        self.aead = None
+
+
+def _get_aead(data_key):
+    return data_key.aead
+
+
+class EnvelopeCipher(object):
+    """Encrypts data with data keys wrapped by a Cloud KMS key.
+
+    Messages are encrypted with the current DEK, which is generated locally
+    and wrapped with one ``encrypt`` request. A new DEK is generated once
+    the current one is ``max_age`` seconds old, or has encrypted
+    ``max_messages`` messages or ``max_bytes`` bytes.
+
+    Each ciphertext holds its wrapped DEK. Unwrapped DEKs, including those
+    generated here, are cached for ``max_age`` seconds, so that decrypting
+    many messages encrypted under the same DEK makes one ``decrypt``
+    request, and concurrent decryptions under a DEK which is not cached
+    wait for a single request. Up to ``max_cached_keys`` DEKs are cached,
+    and the least recently used are dropped. Dropped DEKs are overwritten in memory; other
+    copies, such as those made by Python or OpenSSL, may remain until their
+    memory is reused.
+
+    Args:
+        client (google.cloud.kms_v1.KeyManagementServiceClient): The client
+            used to wrap and unwrap keys.
+        key_name (str): The name of the
+            :class:`~google.cloud.kms_v1.types.CryptoKey` which wraps the
+            keys. Its purpose must be ``ENCRYPT_DECRYPT``.
+        max_age (float): The number of seconds for which a DEK is used and
+            cached.
+        max_messages (int): The maximum number of messages, or streams,
+            encrypted with a DEK.
+        max_bytes (int): The maximum number of bytes encrypted with a DEK.
+        max_cached_keys (int): The maximum number of cached DEKs.
+        timeout (Optional[float]): The timeout of each request.
+
+    Raises:
+        ValueError: If an option is out of range.
+    """
+
+    def __init__(
+        self,
+        client,
+        key_name: str,
+        *,
+        max_age: float = DEFAULT_MAX_AGE,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_cached_keys: int = DEFAULT_MAX_CACHED_KEYS,
+        timeout: Optional[float] = None,
+    ):
+        if max_age <= 0:
+            raise ValueError("max_age must be positive.")
+        if not 1 <= max_messages <= 2**32:
+            raise ValueError("max_messages must be between 1 and 2**32.")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive.")
+        if max_cached_keys < 1:
+            raise ValueError("max_cached_keys must be positive.")
+        self._client = client
+        self._key_name = key_name
+        self._max_age = max_age
+        self._max_messages = max_messages
+        self._max_bytes = max_bytes
+        self._max_cached_keys = max_cached_keys
+        self._timeout = timeout
+
+        self._lock = threading.Lock()
+        # Held while a new DEK is generated, so that only one is.
+        self._rotate_lock = threading.Lock()
+        self._current = None
+        # The cached DEKs by wrapped key, least recently used first.
+        self._keys = collections.OrderedDict()
+        # The futures of the DEKs being unwrapped, by wrapped key.
+        self._loading = {}
+
+    def encrypt(self, plaintext: bytes, associated_data: bytes = b"") -> bytes:
+        """Encrypt a message.
+
+        Args:
+            plaintext (bytes): The message.
+            associated_data (bytes): Data which is authenticated but not
+                encrypted. The same data must be given to :meth:`decrypt`.
+
+        Returns:
+            bytes: The ciphertext, with the wrapped DEK.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If wrapping a new
+                DEK fails.
+            RuntimeError: If ``cryptography`` is not installed.
+        """
+        data_key, aead = self._encryption_key(len(plaintext))
+        header = (
+            _HEADER.pack(_MESSAGE_VERSION, len(data_key.wrapped)) + data_key.wrapped
+        )
+        nonce = os.urandom(_NONCE_SIZE)
+        return b"".join(
+            [
+                header,
+                nonce,
+                aead.encrypt(nonce, bytes(plaintext), header + associated_data),
+            ]
+        )
+
+    def decrypt(self, ciphertext: bytes, associated_data: bytes = b"") -> bytes:
+        """Decrypt a message encrypted with :meth:`encrypt`.
+
+        Args:
+            ciphertext (bytes): The ciphertext.
+            associated_data (bytes): The associated data given to
+                :meth:`encrypt`.
+
+        Returns:
+            bytes: The message.
+
+        Raises:
+            ValueError: If the ciphertext is invalid, or was altered.
+            google.api_core.exceptions.GoogleAPICallError: If unwrapping the
+                DEK fails.
+            RuntimeError: If ``cryptography`` is not installed.
+        """
+        ciphertext = memoryview(ciphertext)
+        version, wrapped, offset = self._parse_header(ciphertext)
+        if version != _MESSAGE_VERSION:
+            raise ValueError("The ciphertext is not a message.")
+        header = bytes(ciphertext[:offset])
+        nonce = bytes(ciphertext[offset : offset + _NONCE_SIZE])
+        aead = self._decryption_key(wrapped)
+        try:
+            return aead.decrypt(
+                nonce, ciphertext[offset + _NONCE_SIZE :], header + associated_data
+            )
+        except crypto_exceptions.InvalidTag:
+            raise ValueError("The ciphertext could not be decrypted.")
+
+    def encrypt_stream(
+        self,
+        source: BinaryIO,
+        destination: BinaryIO,
+        associated_data: bytes = b"",
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Encrypt a stream, a chunk at a time.
+
+        The stream is encrypted with a key derived from the DEK and a random
+        salt, in chunks of ``chunk_size`` bytes. Each chunk is authenticated
+        along with its position, and the last chunk is marked, so chunks
+        cannot be reordered, dropped or truncated without detection.
+
+        Args:
+            source (BinaryIO): The file-like object to read from.
+            destination (BinaryIO): The file-like object to write the
+                ciphertext to.
+            associated_data (bytes): Data which is authenticated but not
+                encrypted. The same data must be given to
+                :meth:`decrypt_stream`.
+            chunk_size (int): The number of bytes in each chunk.
+
+        Returns:
+            int: The number of bytes encrypted.
+
+        Raises:
+            ValueError: If the chunk size is out of range, or the stream is
+                too long for it.
+        """
+        if not 1 <= chunk_size < 2**32 - _TAG_SIZE:
+            raise ValueError("chunk_size must be between 1 and 2**32 - 17.")
+        salt = os.urandom(_SALT_SIZE)
+        nonce_prefix = os.urandom(_NONCE_PREFIX_SIZE)
+
+        def derive(data_key):
+            header = b"".join(
+                [
+                    _HEADER.pack(_STREAM_VERSION, len(data_key.wrapped)),
+                    data_key.wrapped,
+                    _STREAM_HEADER.pack(salt, nonce_prefix, chunk_size),
+                ]
+            )
+            return header, self._stream_aead(data_key.key, salt, header)
+
+        data_key, (header, stream_aead) = self._encryption_key(0, derive)
+        destination.write(header)
+
+        total = 0
+        chunk = _read_full(source, chunk_size)
+        for index in range(_MAX_CHUNKS):
+            following = (
+                _read_full(source, chunk_size) if len(chunk) == chunk_size else b""
+            )
+            last = not following
+            nonce = _CHUNK_NONCE.pack(nonce_prefix, index, last)
+            destination.write(stream_aead.encrypt(nonce, chunk, associated_data))
+            total += len(chunk)
+            if last:
+                break
+            chunk = following
+        else:
+            raise ValueError("The stream has too many chunks.")
+
+        with self._lock:
+            data_key.bytes += total
+        return total
+
+    def decrypt_stream(
+        self,
+        source: BinaryIO,
+        destination: BinaryIO,
+        associated_data: bytes = b"",
+    ) -> int:
+        """Decrypt a stream encrypted with :meth:`encrypt_stream`.
+
+        Each chunk is authenticated before it is written. If the stream was
+        altered, the error is raised after writing the chunks before the
+        altered one.
+
+        Args:
+            source (BinaryIO): The file-like object to read the ciphertext
+                from.
+            destination (BinaryIO): The file-like object to write to.
+            associated_data (bytes): The associated data given to
+                :meth:`encrypt_stream`.
+
+        Returns:
+            int: The number of bytes decrypted.
+
+        Raises:
+            ValueError: If the stream is invalid, or was altered or
+                truncated.
+        """
+        prefix = _read_full(source, _HEADER.size)
+        if len(prefix) < _HEADER.size:
+            raise ValueError("The stream is truncated.")
+        version, wrapped_size = _HEADER.unpack(prefix)
+        if version != _STREAM_VERSION:
+            raise ValueError("The ciphertext is not a stream.")
+        rest = _read_full(source, wrapped_size + _STREAM_HEADER.size)
+        if len(rest) < wrapped_size + _STREAM_HEADER.size:
+            raise ValueError("The stream is truncated.")
+        header = prefix + rest
+        wrapped = rest[:wrapped_size]
+        salt, nonce_prefix, chunk_size = _STREAM_HEADER.unpack(rest[wrapped_size:])
+
+        stream_aead = self._decryption_key(
+            wrapped, lambda data_key: self._stream_aead(data_key.key, salt, header)
+        )
+
+        total = 0
+        size = chunk_size + _TAG_SIZE
+        chunk = _read_full(source, size)
+        for index in range(_MAX_CHUNKS):
+            following = _read_full(source, size) if len(chunk) == size else b""
+            last = not following
+            nonce = _CHUNK_NONCE.pack(nonce_prefix, index, last)
+            try:
+                plaintext = stream_aead.decrypt(nonce, chunk, associated_data)
+            except crypto_exceptions.InvalidTag:
+                raise ValueError("The stream could not be decrypted.")
+            destination.write(plaintext)
+            total += len(plaintext)
+            if last:
+                return total
+            chunk = following
+        raise ValueError("The stream has too many chunks.")
+
+    def clear(self):
+        """Drop and overwrite every cached DEK, and stop using the current one."""
+        with self._lock:
+            keys = list(self._keys.values())
+            if self._current is not None and self._current.wrapped not in self._keys:
+                keys.append(self._current)
+            self._keys.clear()
+            self._current = None
+            for data_key in keys:
+                data_key.zeroize()
+
+    @staticmethod
+    def _stream_aead(key, salt, header):
+        hkdf = HKDF(algorithm=hashes.SHA256(), length=_KEY_SIZE, salt=salt, info=header)
+        return AESGCM(hkdf.derive(bytes(key)))
+
+    @staticmethod
+    def _parse_header(ciphertext):
+        if len(ciphertext) < _HEADER.size:
+            raise ValueError("The ciphertext is truncated.")
+        version, wrapped_size = _HEADER.unpack(ciphertext[: _HEADER.size])
+        offset = _HEADER.size + wrapped_size
+        if len(ciphertext) < offset + _NONCE_SIZE + _TAG_SIZE:
+            raise ValueError("The ciphertext is truncated.")
+        return version, bytes(ciphertext[_HEADER.size : offset]), offset
+
+    def _usable(self, data_key, size):
+        return (
+            time.monotonic() - data_key.created < self._max_age
+            and data_key.messages < self._max_messages
+            and (not data_key.bytes or data_key.bytes + size <= self._max_bytes)
+        )
+
+    def _use(self, size, derive):
+        """Count a message against the current DEK, if it can be used.
+
+        Must be called with the lock held, so that the DEK is not
+        overwritten while ``derive`` uses it.
+        """
+        data_key = self._current
+        if data_key is None or not self._usable(data_key, size):
+            return None
+        data_key.messages += 1
+        data_key.bytes += size
+        return data_key, derive(data_key)
+
+    def _encryption_key(self, size, derive=_get_aead):
+        """Get the current DEK, and ``derive(DEK)``, to encrypt a message."""
+        _check_cryptography()
+        with self._lock:
+            used = self._use(size, derive)
+        if used is not None:
+            return used
+
+        with self._rotate_lock:
+            with self._lock:
+                used = self._use(size, derive)
+            if used is not None:
+                return used
+            key = bytearray(os.urandom(_KEY_SIZE))
+            data_key = _DataKey(key, self._wrap(key))
+            with self._lock:
+                previous, self._current = self._current, data_key
+                if previous is not None and previous.wrapped not in self._keys:
+                    previous.zeroize()
+                self._cache(data_key)
+                return self._use(size, derive)
+
+    def _decryption_key(self, wrapped, derive=_get_aead):
+        """Get ``derive(DEK)``, unwrapping the DEK if it is not cached."""
+        _check_cryptography()
+        while True:
+            with self._lock:
+                data_key = self._keys.get(wrapped)
+                if data_key is not None:
+                    if time.monotonic() - data_key.created < self._max_age:
+                        self._keys.move_to_end(wrapped)
+                        return derive(data_key)
+                    self._evict(wrapped)
+                future = self._loading.get(wrapped)
+                if future is None:
+                    future = self._loading[wrapped] = futures.Future()
+                    break
+            # Wait for the DEK being unwrapped by another thread, then look
+            # it up again.
+            future.result()
+
+        try:
+            data_key = _DataKey(self._unwrap(wrapped), wrapped)
+        except BaseException as exception:
+            with self._lock:
+                del self._loading[wrapped]
+            future.set_exception(exception)
+            raise
+        with self._lock:
+            del self._loading[wrapped]
+            self._cache(data_key)
+            future.set_result(None)
+            return derive(data_key)
+
+    def _cache(self, data_key):
+        """Cache a DEK. Must be called with the lock held."""
+        if data_key.wrapped in self._keys:
+            self._evict(data_key.wrapped)
+        self._keys[data_key.wrapped] = data_key
+        while len(self._keys) > self._max_cached_keys:
+            self._evict(next(iter(self._keys)))
+
+    def _evict(self, wrapped):
+        """Drop a cached DEK. Must be called with the lock held."""
+        data_key = self._keys.pop(wrapped)
+        if data_key is not self._current:
+            data_key.zeroize()
+
+    def _call(self, method, request):
+        if self._timeout is None:
+            return method(request=request)
+        return method(request=request, timeout=self._timeout)
+
+    def _wrap(self, key):
+        key = bytes(key)
+        request = service.EncryptRequest(
+            name=self._key_name,
+            plaintext=key,
+            plaintext_crc32c=google_crc32c.value(key),
+        )
+        response = self._call(self._client.encrypt, request)
+        response_pb = service.EncryptResponse.pb(response)
+        if not response_pb.verified_plaintext_crc32c or (
+            response_pb.HasField("ciphertext_crc32c")
+            and google_crc32c.value(response_pb.ciphertext)
+            != response_pb.ciphertext_crc32c.value
+        ):
+            raise core_exceptions.DataLoss(
+                "The data key was corrupted in transit while being wrapped."
+            )
+        if len(response_pb.ciphertext) >= 2**16:
+            raise ValueError("The wrapped data key is too long.")
+        return response_pb.ciphertext
+
+    def _unwrap(self, wrapped):
+        request = service.DecryptRequest(
+            name=self._key_name,
+            ciphertext=wrapped,
+            ciphertext_crc32c=google_crc32c.value(wrapped),
+        )
+        response = self._call(self._client.decrypt, request)
+        response_pb = service.DecryptResponse.pb(response)
+        if (
+            response_pb.HasField("plaintext_crc32c")
+            and google_crc32c.value(response_pb.plaintext)
+            != response_pb.plaintext_crc32c.value
+        ):
+            raise core_exceptions.DataLoss(
+                "The data key was corrupted in transit while being unwrapped."
+            )
+        key = bytearray(response_pb.plaintext)
+        if len(key) != _KEY_SIZE:
+            raise ValueError("The wrapped data key is not an AES-256 key.")
+        return key
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cached public keys, and local verification and encryption with them.
+
+Signatures made with ``asymmetric_sign`` can be verified, and data to be
+decrypted with ``asymmetric_decrypt`` can be encrypted, with the public key
+of the key version alone. :class:`PublicKeyCache` fetches the public key of
+each key version once, and does both locally. Requires the
+``cryptography`` package, which is installed with the ``cryptography``
+extra.
+
+.. code-block:: python
+
+    from google.cloud import kms_v1
+    from google.cloud.kms_v1.public_keys import PublicKeyCache
+
+    client = kms_v1.KeyManagementServiceClient()
+    public_keys = PublicKeyCache(client)
+    if public_keys.verify(key_version_name, signature, data):
+        ...
+"""
+
+import collections
+from concurrent import futures
+import threading
+from typing import NamedTuple, Optional
+
+from google.api_core import exceptions as core_exceptions
+import google_crc32c
+
+try:
+    from cryptography import exceptions as crypto_exceptions
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, padding, utils
+except ImportError:  # pragma: NO COVER
+    serialization = None
+
+from google.cloud.kms_v1.types import resources
+
+DEFAULT_MAX_ENTRIES = 1000
+# The number of times to fetch a public key whose checksum does not match.
+DEFAULT_MAX_ATTEMPTS = 3
+
+_Algorithm = resources.CryptoKeyVersion.CryptoKeyVersionAlgorithm
+
+# The signature scheme and hash of each signing algorithm.
+_SIGNING_ALGORITHMS = {
+    _Algorithm.RSA_SIGN_PSS_2048_SHA256: ("pss", "SHA256"),
+    _Algorithm.RSA_SIGN_PSS_3072_SHA256: ("pss", "SHA256"),
+    _Algorithm.RSA_SIGN_PSS_4096_SHA256: ("pss", "SHA256"),
+    _Algorithm.RSA_SIGN_PSS_4096_SHA512: ("pss", "SHA512"),
+    _Algorithm.RSA_SIGN_PKCS1_2048_SHA256: ("pkcs1", "SHA256"),
+    _Algorithm.RSA_SIGN_PKCS1_3072_SHA256: ("pkcs1", "SHA256"),
+    _Algorithm.RSA_SIGN_PKCS1_4096_SHA256: ("pkcs1", "SHA256"),
+    _Algorithm.RSA_SIGN_PKCS1_4096_SHA512: ("pkcs1", "SHA512"),
+    _Algorithm.RSA_SIGN_RAW_PKCS1_2048: ("raw_pkcs1", None),
+    _Algorithm.RSA_SIGN_RAW_PKCS1_3072: ("raw_pkcs1", None),
+    _Algorithm.RSA_SIGN_RAW_PKCS1_4096: ("raw_pkcs1", None),
+    _Algorithm.EC_SIGN_P256_SHA256: ("ec", "SHA256"),
+    _Algorithm.EC_SIGN_P384_SHA384: ("ec", "SHA384"),
+    _Algorithm.EC_SIGN_SECP256K1_SHA256: ("ec", "SHA256"),
+}
+
+# The OAEP hash of each encryption algorithm.
+_ENCRYPTION_ALGORITHMS = {
+    _Algorithm.RSA_DECRYPT_OAEP_2048_SHA256: "SHA256",
+    _Algorithm.RSA_DECRYPT_OAEP_3072_SHA256: "SHA256",
+    _Algorithm.RSA_DECRYPT_OAEP_4096_SHA256: "SHA256",
+    _Algorithm.RSA_DECRYPT_OAEP_4096_SHA512: "SHA512",
+    _Algorithm.RSA_DECRYPT_OAEP_2048_SHA1: "SHA1",
+    _Algorithm.RSA_DECRYPT_OAEP_3072_SHA1: "SHA1",
+    _Algorithm.RSA_DECRYPT_OAEP_4096_SHA1: "SHA1",
+}
+
+
+def _check_cryptography():
+    if serialization is None:
+        raise RuntimeError("This method requires `cryptography` to be installed.")
+
+
+class CachedPublicKey(NamedTuple):
+    """A public key of a key version, as cached by :class:`PublicKeyCache`."""
+
+    public_key: resources.PublicKey
+    """The response of ``get_public_key``."""
+    key: object
+    """The key, loaded by :mod:`cryptography` from the PEM."""
+
+
+class PublicKeyCache(object):
+    """Caches the public keys of asymmetric key versions.
+
+    The public key of a key version never changes, so each is fetched once
+    with ``get_public_key``, checked against its CRC32C checksum, and kept
+    until it is among the least recently used of more than ``max_entries``
+    keys. Concurrent requests for a key which is not cached wait for a
+    single request.
+
+    Args:
+        client (google.cloud.kms_v1.KeyManagementServiceClient): The client
+            used to fetch public keys.
+        max_entries (int): The maximum number of cached keys.
+        max_attempts (int): The number of times to fetch a key whose
+            checksum does not match before giving up.
+        timeout (Optional[float]): The timeout of each request.
+
+    Raises:
+        ValueError: If an option is out of range.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        timeout: Optional[float] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive.")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be positive.")
+        self._client = client
+        self._max_entries = max_entries
+        self._max_attempts = max_attempts
+        self._timeout = timeout
+
+        self._lock = threading.Lock()
+        # The cached keys by key version name, least recently used first.
+        self._entries = collections.OrderedDict()
+        # The futures of the keys being fetched, by key version name.
+        self._loading = {}
+
+    def get(self, name: str) -> CachedPublicKey:
+        """Get the public key of a key version.
+
+        Args:
+            name (str): The name of the
+                :class:`~google.cloud.kms_v1.types.CryptoKeyVersion`.
+
+        Returns:
+            CachedPublicKey: The public key.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If the request
+                fails.
+            google.api_core.exceptions.DataLoss: If the checksum of the key
+                does not match in any of ``max_attempts`` responses.
+            RuntimeError: If ``cryptography`` is not installed.
+        """
+        _check_cryptography()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                self._entries.move_to_end(name)
+                return entry
+            future = self._loading.get(name)
+            if future is None:
+                future = self._loading[name] = futures.Future()
+                loading = True
+            else:
+                loading = False
+        if not loading:
+            return future.result()
+
+        try:
+            entry = self._fetch(name)
+        except BaseException as exception:
+            with self._lock:
+                del self._loading[name]
+            future.set_exception(exception)
+            raise
+        with self._lock:
+            del self._loading[name]
+            self._entries[name] = entry
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        future.set_result(entry)
+        return entry
+
+    def clear(self):
+        """Drop every cached key."""
+        with self._lock:
+            self._entries.clear()
+
+    def verify(
+        self,
+        name: str,
+        signature: bytes,
+        data: Optional[bytes] = None,
+        *,
+        digest: Optional[bytes] = None,
+    ) -> bool:
+        """Verify a signature made with ``asymmetric_sign``.
+
+        Args:
+            name (str): The name of the
+                :class:`~google.cloud.kms_v1.types.CryptoKeyVersion` which
+                made the signature.
+            signature (bytes): The signature.
+            data (bytes): The data which was signed. Exactly one of
+                ``data`` and ``digest`` is required.
+            digest (bytes): The digest which was signed, made with the hash
+                of the key's algorithm. Not supported by raw PKCS#1 keys.
+
+        Returns:
+            bool: Whether the signature is valid.
+
+        Raises:
+            ValueError: If the key is not a signing key, or the arguments do
+                not suit it.
+        """
+        if (data is None) == (digest is None):
+            raise ValueError("Exactly one of data and digest is required.")
+        entry = self.get(name)
+        algorithm = entry.public_key.algorithm
+        if algorithm not in _SIGNING_ALGORITHMS:
+            raise ValueError("{} keys cannot verify signatures.".format(algorithm.name))
+        scheme, hash_name = _SIGNING_ALGORITHMS[algorithm]
+
+        if scheme == "raw_pkcs1":
+            if digest is not None:
+                raise ValueError("Raw PKCS#1 signatures are of data, not digests.")
+            try:
+                recovered = entry.key.recover_data_from_signature(
+                    signature, padding.PKCS1v15(), None
+                )
+            except crypto_exceptions.InvalidSignature:
+                return False
+            return recovered == data
+
+        hash_class = getattr(hashes, hash_name)
+        hash_algorithm = hash_class()
+        if digest is not None:
+            if len(digest) != hash_algorithm.digest_size:
+                raise ValueError(
+                    "The digest must be a {} digest.".format(hash_algorithm.name)
+                )
+            data = digest
+            hash_algorithm = utils.Prehashed(hash_algorithm)
+        if scheme == "ec":
+            arguments = (ec.ECDSA(hash_algorithm),)
+        elif scheme == "pss":
+            arguments = (
+                padding.PSS(
+                    mgf=padding.MGF1(hash_class()), salt_length=hash_class.digest_size
+                ),
+                hash_algorithm,
+            )
+        else:
+            arguments = (padding.PKCS1v15(), hash_algorithm)
+        try:
+            entry.key.verify(signature, data, *arguments)
+        except crypto_exceptions.InvalidSignature:
+            return False
+        return True
+
+    def encrypt(self, name: str, plaintext: bytes) -> bytes:
+        """Encrypt data to be decrypted with ``asymmetric_decrypt``.
+
+        Args:
+            name (str): The name of the
+                :class:`~google.cloud.kms_v1.types.CryptoKeyVersion` to
+                encrypt with.
+            plaintext (bytes): The data.
+
+        Returns:
+            bytes: The ciphertext.
+
+        Raises:
+            ValueError: If the key is not an encryption key, or the
+                plaintext is too long for it.
+        """
+        entry = self.get(name)
+        algorithm = entry.public_key.algorithm
+        if algorithm not in _ENCRYPTION_ALGORITHMS:
+            raise ValueError("{} keys cannot encrypt.".format(algorithm.name))
+        hash_class = getattr(hashes, _ENCRYPTION_ALGORITHMS[algorithm])
+        return entry.key.encrypt(
+            bytes(plaintext),
+            padding.OAEP(
+                mgf=padding.MGF1(algorithm=hash_class()),
+                algorithm=hash_class(),
+                label=None,
+            ),
+        )
+
+    def _fetch(self, name):
+        for _ in range(self._max_attempts):
+            if self._timeout is None:
+                public_key = self._client.get_public_key(name=name)
+            else:
+                public_key = self._client.get_public_key(
+                    name=name, timeout=self._timeout
+                )
+            public_key_pb = resources.PublicKey.pb(public_key)
+            pem = public_key_pb.pem.encode("utf-8")
+            if (
+                not public_key_pb.HasField("pem_crc32c")
+                or google_crc32c.value(pem) == public_key_pb.pem_crc32c.value
+            ):
+                break
+        else:
+            raise core_exceptions.DataLoss(
+                "The public key of {} was corrupted in transit.".format(name)
+            )
+        if public_key.name and public_key.name != name:
+            raise core_exceptions.DataLoss(
+                "Received the public key of {} rather than {}.".format(
+                    public_key.name, name
+                )
+            )
+        return CachedPublicKey(public_key, serialization.load_pem_public_key(pem))
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+import os
+import threading
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from google.api_core import exceptions as core_exceptions
+import google_crc32c
+import pytest
+
+from google.cloud import kms_v1
+from google.cloud.kms_v1 import envelope
+from google.cloud.kms_v1.envelope import EnvelopeCipher
+
+KEY_NAME = "projects/p/locations/global/keyRings/r/cryptoKeys/k"
+
+
+def make_client(corrupt_decrypt=False):
+    """Make a client which wraps keys with a local AES key."""
+    kek = AESGCM(AESGCM.generate_key(bit_length=256))
+
+    def encrypt(request, **kwargs):
+        assert request.name == KEY_NAME
+        assert request.plaintext_crc32c == google_crc32c.value(request.plaintext)
+        nonce = os.urandom(12)
+        ciphertext = nonce + kek.encrypt(nonce, request.plaintext, None)
+        return kms_v1.EncryptResponse(
+            name=KEY_NAME + "/cryptoKeyVersions/1",
+            ciphertext=ciphertext,
+            ciphertext_crc32c=google_crc32c.value(ciphertext),
+            verified_plaintext_crc32c=True,
+        )
+
+    def decrypt(request, **kwargs):
+        assert request.ciphertext_crc32c == google_crc32c.value(request.ciphertext)
+        ciphertext = request.ciphertext
+        plaintext = kek.decrypt(ciphertext[:12], ciphertext[12:], None)
+        crc32c = google_crc32c.value(plaintext)
+        if corrupt_decrypt:
+            plaintext = bytes(len(plaintext))
+        return kms_v1.DecryptResponse(plaintext=plaintext, plaintext_crc32c=crc32c)
+
+    client = mock.Mock(spec=["encrypt", "decrypt"])
+    client.encrypt.side_effect = encrypt
+    client.decrypt.side_effect = decrypt
+    return client
+
+
+def test_constructor_invalid_options():
+    client = make_client()
+    with pytest.raises(ValueError):
+        EnvelopeCipher(client, KEY_NAME, max_age=0)
+    with pytest.raises(ValueError):
+        EnvelopeCipher(client, KEY_NAME, max_messages=0)
+    with pytest.raises(ValueError):
+        EnvelopeCipher(client, KEY_NAME, max_bytes=0)
+    with pytest.raises(ValueError):
+        EnvelopeCipher(client, KEY_NAME, max_cached_keys=0)
+
+
+def test_encrypt_decrypt_reuses_data_key():
+    client = make_client()
+    cipher = EnvelopeCipher(client, KEY_NAME, timeout=5.0)
+
+    first = cipher.encrypt(b"first", b"context")
+    second = cipher.encrypt(b"second", b"context")
+
+    assert first != second
+    assert cipher.decrypt(first, b"context") == b"first"
+    assert cipher.decrypt(second, b"context") == b"second"
+    assert client.encrypt.call_count == 1
+    assert client.encrypt.call_args.kwargs["timeout"] == 5.0
+    # The data key generated here is cached for decryption.
+    client.decrypt.assert_not_called()
+
+
+def test_decrypt_unwraps_once_per_data_key():
+    client = make_client()
+    ciphertexts = [EnvelopeCipher(client, KEY_NAME).encrypt(b"data")] * 3
+
+    cipher = EnvelopeCipher(client, KEY_NAME)
+    for ciphertext in ciphertexts:
+        assert cipher.decrypt(ciphertext) == b"data"
+    assert client.decrypt.call_count == 1
+
+
+def test_decrypt_concurrent_misses_share_a_request():
+    client = make_client()
+    ciphertext = EnvelopeCipher(client, KEY_NAME).encrypt(b"data")
+    decrypt = client.decrypt.side_effect
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_decrypt(request, **kwargs):
+        started.set()
+        release.wait()
+        return decrypt(request)
+
+    client.decrypt.side_effect = slow_decrypt
+    cipher = EnvelopeCipher(client, KEY_NAME)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cipher.decrypt(ciphertext)))
+        for _ in range(4)
+    ]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [b"data"] * 4
+    assert client.decrypt.call_count == 1
+    assert not cipher._loading
+
+
+def test_decrypt_failed_unwrap_is_not_cached():
+    client = make_client()
+    ciphertext = EnvelopeCipher(client, KEY_NAME).encrypt(b"data")
+    decrypt = client.decrypt.side_effect
+    client.decrypt.side_effect = core_exceptions.ServiceUnavailable("down")
+
+    cipher = EnvelopeCipher(client, KEY_NAME)
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        cipher.decrypt(ciphertext)
+    assert not cipher._loading
+    client.decrypt.side_effect = decrypt
+    assert cipher.decrypt(ciphertext) == b"data"
+
+
+def test_decrypt_rejects_altered_ciphertext():
+    cipher = EnvelopeCipher(make_client(), KEY_NAME)
+    ciphertext = bytearray(cipher.encrypt(b"data", b"context"))
+
+    with pytest.raises(ValueError):
+        cipher.decrypt(bytes(ciphertext), b"other")
+    ciphertext[-1] ^= 1
+    with pytest.raises(ValueError):
+        cipher.decrypt(bytes(ciphertext), b"context")
+    with pytest.raises(ValueError):
+        cipher.decrypt(bytes(ciphertext[:10]))
+    ciphertext[0] = 9
+    with pytest.raises(ValueError):
+        cipher.decrypt(bytes(ciphertext))
+
+
+def test_rotates_after_max_messages():
+    client = make_client()
+    cipher = EnvelopeCipher(client, KEY_NAME, max_messages=2)
+
+    ciphertexts = [cipher.encrypt(b"data") for _ in range(5)]
+
+    assert client.encrypt.call_count == 3
+    assert all(cipher.decrypt(ciphertext) == b"data" for ciphertext in ciphertexts)
+
+
+def test_rotates_after_max_bytes():
+    client = make_client()
+    cipher = EnvelopeCipher(client, KEY_NAME, max_bytes=10)
+
+    cipher.encrypt(b"x" * 6)
+    cipher.encrypt(b"x" * 4)
+    assert client.encrypt.call_count == 1
+    cipher.encrypt(b"x")
+    assert client.encrypt.call_count == 2
+
+
+def test_max_age():
+    client = make_client()
+    ciphertext = EnvelopeCipher(client, KEY_NAME).encrypt(b"data")
+    cipher = EnvelopeCipher(client, KEY_NAME, max_age=10.0)
+
+    with mock.patch("time.monotonic", return_value=100.0):
+        cipher.encrypt(b"data")
+        cipher.decrypt(ciphertext)
+    with mock.patch("time.monotonic", return_value=111.0):
+        cipher.encrypt(b"data")
+        cipher.decrypt(ciphertext)
+
+    assert client.encrypt.call_count == 3
+    assert client.decrypt.call_count == 2
+
+
+def test_eviction_zeroizes_keys():
+    client = make_client()
+    cipher = EnvelopeCipher(client, KEY_NAME, max_messages=1, max_cached_keys=1)
+
+    cipher.encrypt(b"data")
+    first = cipher._current
+    cipher.encrypt(b"data")
+    second = cipher._current
+
+    assert first.key == bytes(32)
+    assert first.aead is None
+    assert second.key != bytes(32)
+
+    cipher.clear()
+    assert second.key == bytes(32)
+    assert not cipher._keys
+    assert cipher._current is None
+
+
+def test_wrap_checksum_mismatch():
+    client = make_client()
+    encrypt = client.encrypt.side_effect
+
+    def unverified(request, **kwargs):
+        response = encrypt(request)
+        response.verified_plaintext_crc32c = False
+        return response
+
+    client.encrypt.side_effect = unverified
+    with pytest.raises(core_exceptions.DataLoss):
+        EnvelopeCipher(client, KEY_NAME).encrypt(b"data")
+
+
+def test_unwrap_checksum_mismatch():
+    client = make_client(corrupt_decrypt=True)
+    ciphertext = EnvelopeCipher(client, KEY_NAME).encrypt(b"data")
+
+    with pytest.raises(core_exceptions.DataLoss):
+        EnvelopeCipher(client, KEY_NAME).decrypt(ciphertext)
+
+
+@pytest.mark.parametrize("size", [0, 1, 99, 100, 101, 1000])
+def test_stream_round_trip(size):
+    client = make_client()
+    plaintext = os.urandom(size)
+    destination = io.BytesIO()
+
+    cipher = EnvelopeCipher(client, KEY_NAME)
+    written = cipher.encrypt_stream(
+        io.BytesIO(plaintext), destination, b"context", chunk_size=100
+    )
+    assert written == size
+
+    result = io.BytesIO()
+    other = EnvelopeCipher(client, KEY_NAME)
+    assert (
+        other.decrypt_stream(io.BytesIO(destination.getvalue()), result, b"context")
+        == size
+    )
+    assert result.getvalue() == plaintext
+
+
+def test_stream_short_reads():
+    class ShortReader(io.BytesIO):
+        def read(self, size=-1):
+            return super(ShortReader, self).read(min(size, 7))
+
+    cipher = EnvelopeCipher(make_client(), KEY_NAME)
+    plaintext = os.urandom(250)
+    destination = io.BytesIO()
+    cipher.encrypt_stream(ShortReader(plaintext), destination, chunk_size=100)
+
+    result = io.BytesIO()
+    cipher.decrypt_stream(ShortReader(destination.getvalue()), result)
+    assert result.getvalue() == plaintext
+
+
+def test_stream_detects_truncation_and_reordering():
+    cipher = EnvelopeCipher(make_client(), KEY_NAME)
+    destination = io.BytesIO()
+    cipher.encrypt_stream(io.BytesIO(bytes(300)), destination, chunk_size=100)
+    ciphertext = destination.getvalue()
+    chunk = 100 + 16
+    header_size = len(ciphertext) - 3 * chunk
+    header = ciphertext[:header_size]
+    chunks = [
+        ciphertext[header_size + index * chunk : header_size + (index + 1) * chunk]
+        for index in range(3)
+    ]
+
+    for altered in [
+        header + chunks[0] + chunks[1],
+        header + chunks[1] + chunks[0] + chunks[2],
+        header + chunks[0] + chunks[1] + chunks[2][:-1],
+        header[:-1] + bytes([header[-1] ^ 1]) + b"".join(chunks),
+        header[:5],
+    ]:
+        with pytest.raises(ValueError):
+            cipher.decrypt_stream(io.BytesIO(altered), io.BytesIO())
+    with pytest.raises(ValueError):
+        cipher.decrypt_stream(io.BytesIO(ciphertext), io.BytesIO(), b"other")
+
+
+def test_message_and_stream_formats_are_distinct():
+    cipher = EnvelopeCipher(make_client(), KEY_NAME)
+    destination = io.BytesIO()
+    cipher.encrypt_stream(io.BytesIO(b"data"), destination)
+
+    with pytest.raises(ValueError):
+        cipher.decrypt(destination.getvalue())
+    with pytest.raises(ValueError):
+        cipher.decrypt_stream(io.BytesIO(cipher.encrypt(b"data")), io.BytesIO())
+
+
+def test_stream_invalid_chunk_size():
+    cipher = EnvelopeCipher(make_client(), KEY_NAME)
+    with pytest.raises(ValueError):
+        cipher.encrypt_stream(io.BytesIO(), io.BytesIO(), chunk_size=0)
+
+
+def test_requires_cryptography():
+    cipher = EnvelopeCipher(make_client(), KEY_NAME)
+    with mock.patch.object(envelope, "AESGCM", None):
+        with pytest.raises(RuntimeError):
+            cipher.encrypt(b"data")
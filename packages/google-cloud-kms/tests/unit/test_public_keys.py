@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import hashlib
+import threading
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+from google.api_core import exceptions as core_exceptions
+import google_crc32c
+import pytest
+
+from google.cloud import kms_v1
+from google.cloud.kms_v1.public_keys import PublicKeyCache
+
+Algorithm = kms_v1.CryptoKeyVersion.CryptoKeyVersionAlgorithm
+
+RSA_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+EC_KEY = ec.generate_private_key(ec.SECP256R1())
+DATA = b"header.payload"
+
+
+def key_name(algorithm):
+    return (
+        "projects/p/locations/global/keyRings/r/cryptoKeys/{}/cryptoKeyVersions/1"
+    ).format(algorithm.name.lower())
+
+
+def public_key_response(private_key, algorithm, crc32c=None):
+    pem = (
+        private_key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode("ascii")
+    )
+    if crc32c is None:
+        crc32c = google_crc32c.value(pem.encode("ascii"))
+    return kms_v1.PublicKey(
+        pem=pem,
+        algorithm=algorithm,
+        pem_crc32c=crc32c,
+        name=key_name(algorithm),
+    )
+
+
+def make_client(*keys):
+    """Make a client with the public keys of (private key, algorithm) pairs."""
+    responses = {
+        key_name(algorithm): public_key_response(private_key, algorithm)
+        for private_key, algorithm in keys
+    }
+    client = mock.Mock(spec=["get_public_key"])
+    client.get_public_key.side_effect = lambda name, **kwargs: responses[name]
+    return client
+
+
+def test_constructor_invalid_options():
+    for options in ({"max_entries": 0}, {"max_attempts": 0}):
+        with pytest.raises(ValueError):
+            PublicKeyCache(make_client(), **options)
+
+
+def test_get_cached():
+    algorithm = Algorithm.EC_SIGN_P256_SHA256
+    client = make_client((EC_KEY, algorithm))
+    cache = PublicKeyCache(client, timeout=2.5)
+
+    first = cache.get(key_name(algorithm))
+    second = cache.get(key_name(algorithm))
+
+    assert first is second
+    assert first.public_key.algorithm == algorithm
+    assert first.key.public_numbers() == EC_KEY.public_key().public_numbers()
+    client.get_public_key.assert_called_once_with(name=key_name(algorithm), timeout=2.5)
+
+
+def test_get_max_entries():
+    algorithms = [
+        Algorithm.EC_SIGN_P256_SHA256,
+        Algorithm.RSA_SIGN_PSS_2048_SHA256,
+        Algorithm.RSA_DECRYPT_OAEP_2048_SHA256,
+    ]
+    client = make_client(
+        (EC_KEY, algorithms[0]), (RSA_KEY, algorithms[1]), (RSA_KEY, algorithms[2])
+    )
+    cache = PublicKeyCache(client, max_entries=2)
+    for algorithm in algorithms + algorithms[-1:] + algorithms[:1]:
+        cache.get(key_name(algorithm))
+
+    # The first key was dropped for the third, and fetched again.
+    assert client.get_public_key.call_count == 4
+
+
+def test_get_checksum_mismatch():
+    algorithm = Algorithm.EC_SIGN_P256_SHA256
+    good = public_key_response(EC_KEY, algorithm)
+    bad = public_key_response(EC_KEY, algorithm, crc32c=1)
+    client = mock.Mock(spec=["get_public_key"])
+    client.get_public_key.side_effect = [bad, good]
+    cache = PublicKeyCache(client)
+
+    assert cache.get(key_name(algorithm)).public_key == good
+
+    client.get_public_key.side_effect = [bad, bad]
+    cache = PublicKeyCache(client, max_attempts=2)
+    with pytest.raises(core_exceptions.DataLoss):
+        cache.get(key_name(algorithm))
+
+
+def test_get_wrong_name():
+    algorithm = Algorithm.EC_SIGN_P256_SHA256
+    client = make_client((EC_KEY, algorithm))
+    client.get_public_key.side_effect = lambda name, **kwargs: public_key_response(
+        EC_KEY, algorithm
+    )
+    with pytest.raises(core_exceptions.DataLoss):
+        PublicKeyCache(client).get(key_name(Algorithm.EC_SIGN_P384_SHA384))
+
+
+def test_get_concurrent_single_request():
+    algorithm = Algorithm.EC_SIGN_P256_SHA256
+    response = public_key_response(EC_KEY, algorithm)
+    started = threading.Event()
+    release = threading.Event()
+
+    def get_public_key(name, **kwargs):
+        started.set()
+        release.wait(5)
+        return response
+
+    client = mock.Mock(spec=["get_public_key"])
+    client.get_public_key.side_effect = get_public_key
+    cache = PublicKeyCache(client)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get(key_name(algorithm))))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    started.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 4
+    assert all(result is results[0] for result in results)
+    client.get_public_key.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "algorithm,sign",
+    [
+        (
+            Algorithm.EC_SIGN_P256_SHA256,
+            lambda data: EC_KEY.sign(data, ec.ECDSA(hashes.SHA256())),
+        ),
+        (
+            Algorithm.RSA_SIGN_PSS_2048_SHA256,
+            lambda data: RSA_KEY.sign(
+                data,
+                padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=32),
+                hashes.SHA256(),
+            ),
+        ),
+        (
+            Algorithm.RSA_SIGN_PKCS1_4096_SHA512,
+            lambda data: RSA_KEY.sign(data, padding.PKCS1v15(), hashes.SHA512()),
+        ),
+    ],
+)
+def test_verify(algorithm, sign):
+    private_key = EC_KEY if algorithm == Algorithm.EC_SIGN_P256_SHA256 else RSA_KEY
+    cache = PublicKeyCache(make_client((private_key, algorithm)))
+    name = key_name(algorithm)
+    signature = sign(DATA)
+
+    assert cache.verify(name, signature, DATA)
+    assert not cache.verify(name, signature, DATA + b"!")
+    hash_name = (
+        "sha512" if algorithm == Algorithm.RSA_SIGN_PKCS1_4096_SHA512 else "sha256"
+    )
+    digest = hashlib.new(hash_name, DATA).digest()
+    assert cache.verify(name, signature, digest=digest)
+
+    with pytest.raises(ValueError):
+        cache.verify(name, signature)
+    with pytest.raises(ValueError):
+        cache.verify(name, signature, DATA, digest=digest)
+    with pytest.raises(ValueError):
+        cache.verify(name, signature, digest=digest[:-1])
+
+
+def test_verify_raw_pkcs1():
+    algorithm = Algorithm.RSA_SIGN_RAW_PKCS1_2048
+    cache = PublicKeyCache(make_client((RSA_KEY, algorithm)))
+    numbers = RSA_KEY.private_numbers()
+    size = RSA_KEY.key_size // 8
+    # PKCS#1 v1.5 padding of the data itself, without a DigestInfo.
+    padded = b"\x00\x01" + b"\xff" * (size - len(DATA) - 3) + b"\x00" + DATA
+    signature = pow(
+        int.from_bytes(padded, "big"), numbers.d, numbers.public_numbers.n
+    ).to_bytes(size, "big")
+
+    assert cache.verify(key_name(algorithm), signature, DATA)
+    assert not cache.verify(key_name(algorithm), signature, b"other")
+    assert not cache.verify(key_name(algorithm), bytes(size), DATA)
+    with pytest.raises(ValueError):
+        cache.verify(key_name(algorithm), signature, digest=bytes(32))
+
+
+def test_verify_encryption_key():
+    algorithm = Algorithm.RSA_DECRYPT_OAEP_2048_SHA256
+    cache = PublicKeyCache(make_client((RSA_KEY, algorithm)))
+    with pytest.raises(ValueError):
+        cache.verify(key_name(algorithm), b"signature", DATA)
+
+
+@pytest.mark.parametrize(
+    "algorithm,hash_class",
+    [
+        (Algorithm.RSA_DECRYPT_OAEP_2048_SHA256, hashes.SHA256),
+        (Algorithm.RSA_DECRYPT_OAEP_4096_SHA512, hashes.SHA512),
+        (Algorithm.RSA_DECRYPT_OAEP_2048_SHA1, hashes.SHA1),
+    ],
+)
+def test_encrypt(algorithm, hash_class):
+    cache = PublicKeyCache(make_client((RSA_KEY, algorithm)))
+
+    ciphertext = cache.encrypt(key_name(algorithm), DATA)
+
+    plaintext = RSA_KEY.decrypt(
+        ciphertext,
+        padding.OAEP(
+            mgf=padding.MGF1(algorithm=hash_class()),
+            algorithm=hash_class(),
+            label=None,
+        ),
+    )
+    assert plaintext == DATA
+
+
+def test_encrypt_signing_key():
+    algorithm = Algorithm.EC_SIGN_P256_SHA256
+    cache = PublicKeyCache(make_client((EC_KEY, algorithm)))
+    with pytest.raises(ValueError):
+        cache.encrypt(key_name(algorithm), DATA)
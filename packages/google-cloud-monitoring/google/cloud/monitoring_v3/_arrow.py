@@ -0,0 +1,214 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time series as :mod:`pyarrow` tables.
+
+Points are laid out in "long" form: one row per point, with a column for
+the end time of the point, one for each label, and one for the value. The
+points of each page of results are converted to a record batch as soon as
+the page arrives, so the messages of only one page are held at a time.
+"""
+
+import array
+import itertools
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+from google.cloud import monitoring_v3
+from google.cloud.monitoring_v3 import _dataframe
+
+TIME_COLUMN = "end_time"
+VALUE_COLUMN = "value"
+
+_NANOS_PER_SECOND = 10**9
+
+# The typecode of the buffer holding values of each type, or None if the
+# values are held in a list.
+_VALUE_TYPECODES = {
+    "bool_value": None,
+    "int64_value": "q",
+    "double_value": "d",
+    "string_value": None,
+}
+
+
+def _value_types():
+    return {
+        "bool_value": pyarrow.bool_(),
+        "int64_value": pyarrow.int64(),
+        "double_value": pyarrow.float64(),
+        "string_value": pyarrow.string(),
+    }
+
+
+def _check_pyarrow():
+    if pyarrow is None:
+        raise RuntimeError("This method requires `pyarrow` to be installed.")
+
+
+def _from_buffer(arrow_type, buffer):
+    return pyarrow.Array.from_buffers(
+        arrow_type, len(buffer), [None, pyarrow.py_buffer(buffer)]
+    )
+
+
+def _label_column(indices, values):
+    """Build a dictionary-encoded column of the label values of each point."""
+    return pyarrow.DictionaryArray.from_arrays(
+        indices, pyarrow.array(values, type=pyarrow.string())
+    )
+
+
+def _build_record_batch(time_series_iterable, labels=None):
+    """Build a :mod:`pyarrow` record batch out of time series.
+
+    :type time_series_iterable:
+        iterable over :class:`~google.cloud.monitoring_v3.TimeSeries`
+    :param time_series_iterable:
+        An iterable (e.g., a page of results) yielding time series.
+
+    :type labels: list of strings, or None
+    :param labels:
+        The label names to include as columns. Defaults to the resource
+        type and all resource and metric labels of the time series.
+
+    :rtype: :class:`pyarrow.RecordBatch`
+    :returns: A record batch with a row for each point.
+
+    :raises: :exc:`RuntimeError` if `pyarrow` is not installed.
+        :exc:`ValueError` if the values of the points are not all of the
+        same scalar type.
+    """
+    _check_pyarrow()
+    if labels is not None and not labels:
+        raise ValueError("At least one label is required.")
+
+    series_labels = []
+    resource_labels = set()
+    metric_labels = set()
+    times = array.array("q")
+    indices = array.array("i")
+    field = None
+    values = None
+    for time_series in time_series_iterable:
+        time_series_pb = monitoring_v3.TimeSeries.pb(time_series)
+        points = time_series_pb.points
+        if not points:
+            continue
+
+        point_field = points[0].value.WhichOneof("value")
+        if field is None:
+            if point_field not in _VALUE_TYPECODES:
+                raise ValueError(
+                    "Points with {} values cannot be converted.".format(point_field)
+                )
+            field = point_field
+            typecode = _VALUE_TYPECODES[field]
+            values = [] if typecode is None else array.array(typecode)
+        elif point_field != field:
+            raise ValueError(
+                "Cannot convert points with both {} and {} values.".format(
+                    field, point_field
+                )
+            )
+
+        resource_labels.update(time_series_pb.resource.labels)
+        metric_labels.update(time_series_pb.metric.labels)
+        indices.extend(itertools.repeat(len(series_labels), len(points)))
+        series_labels.append(_dataframe._extract_labels(time_series_pb))
+        times.extend(
+            point.interval.end_time.seconds * _NANOS_PER_SECOND
+            + point.interval.end_time.nanos
+            for point in points
+        )
+        values.extend(getattr(point.value, field) for point in points)
+
+    if labels is None:
+        labels = (
+            ["resource_type"]
+            + _dataframe._sorted_resource_labels(resource_labels)
+            + sorted(metric_labels)
+        )
+
+    value_types = _value_types()
+    if field is None:
+        value_column = pyarrow.array([], type=value_types["double_value"])
+    elif isinstance(values, list):
+        value_column = pyarrow.array(values, type=value_types[field])
+    else:
+        value_column = _from_buffer(value_types[field], values)
+
+    indices = _from_buffer(pyarrow.int32(), indices)
+    columns = [_from_buffer(pyarrow.timestamp("ns"), times)]
+    for key in labels:
+        columns.append(
+            _label_column(indices, [each.get(key, "") for each in series_labels])
+        )
+    columns.append(value_column)
+    return pyarrow.RecordBatch.from_arrays(
+        columns, names=[TIME_COLUMN] + list(labels) + [VALUE_COLUMN]
+    )
+
+
+def _build_table(record_batches):
+    """Combine record batches into a :mod:`pyarrow` table.
+
+    Batches may have different label columns, as when each is built with
+    the default labels of its time series. The table has every label
+    column, in the order they first appear; the points of batches without
+    a label have an empty value for it.
+
+    :type record_batches: iterable over :class:`pyarrow.RecordBatch`
+    :param record_batches: Record batches built by
+        :func:`_build_record_batch`.
+
+    :rtype: :class:`pyarrow.Table`
+    :returns: A table with a row for each point.
+
+    :raises: :exc:`RuntimeError` if `pyarrow` is not installed.
+        :exc:`ValueError` if the batches have values of different types.
+    """
+    _check_pyarrow()
+    record_batches = list(record_batches)
+    # Batches without any points have no meaningful value type.
+    nonempty = [batch for batch in record_batches if batch.num_rows]
+    if not nonempty:
+        return pyarrow.Table.from_batches(
+            record_batches[:1] or [_build_record_batch([])]
+        )
+
+    value_type = nonempty[0].schema.field(VALUE_COLUMN).type
+    labels = []
+    for batch in nonempty:
+        if batch.schema.field(VALUE_COLUMN).type != value_type:
+            raise ValueError("Cannot combine points with values of different types.")
+        for name in batch.schema.names[1:-1]:
+            if name not in labels:
+                labels.append(name)
+
+    names = [TIME_COLUMN] + labels + [VALUE_COLUMN]
+    aligned = []
+    for batch in nonempty:
+        columns = []
+        for name in names:
+            index = batch.schema.get_field_index(name)
+            if index >= 0:
+                columns.append(batch.column(index))
+            else:
+                columns.append(pyarrow.repeat("", batch.num_rows).dictionary_encode())
+        aligned.append(pyarrow.RecordBatch.from_arrays(columns, names=names))
+    return pyarrow.Table.from_batches(aligned)
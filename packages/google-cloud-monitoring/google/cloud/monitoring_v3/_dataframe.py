@@ -14,9 +14,11 @@
 
 """Time series as :mod:`pandas` dataframes."""
 
+import array
 import itertools
 
 try:
+    import numpy
     import pandas
 except ImportError:  # pragma: NO COVER
     pandas = None
@@ -25,15 +27,20 @@ from google.cloud import monitoring_v3
 
 TOP_RESOURCE_LABELS = ("project_id", "aws_account", "location", "region", "zone")
 
+_NANOS_PER_SECOND = 10**9
 
-def _extract_header(time_series):
-    """Return a copy of time_series with the points removed."""
-    return monitoring_v3.TimeSeries(
-        metric=time_series.metric,
-        resource=time_series.resource,
-        metric_kind=time_series.metric_kind,
-        value_type=time_series.value_type,
-    )
+# The NumPy types of the scalar point values. Values of any other type
+# are kept as proto-plus messages.
+_VALUE_DTYPES = {
+    "bool_value": "bool",
+    "int64_value": "int64",
+    "double_value": "float64",
+    "string_value": "object",
+}
+
+# The typecodes of the buffers holding values of each NumPy type. Values of
+# other types are held in lists.
+_ARRAY_TYPECODES = {"bool": "B", "int64": "q", "float64": "d"}
 
 
 def _extract_labels(time_series):
@@ -93,56 +100,155 @@ def _build_dataframe(time_series_iterable, label=None, labels=None):  # pragma:
             raise ValueError("Cannot specify both `label` and `labels`.")
         labels = (label,)
 
-    columns = []
-    headers = []
+    columns = _Columns()
     for time_series in time_series_iterable:
-        pandas_series = pandas.Series(
-            data=[_extract_value(point.value) for point in time_series.points],
-            index=[
-                point.interval.end_time.timestamp_pb().ToNanoseconds()
-                for point in time_series.points
-            ],
-        )
-        columns.append(pandas_series)
-        headers.append(_extract_header(time_series))
+        columns.append(time_series)
 
     # Implement a smart default of using all available labels.
     if labels is None:
-        resource_labels = set(
-            itertools.chain.from_iterable(header.resource.labels for header in headers)
-        )
-        metric_labels = set(
-            itertools.chain.from_iterable(header.metric.labels for header in headers)
-        )
         labels = (
             ["resource_type"]
-            + _sorted_resource_labels(resource_labels)
-            + sorted(metric_labels)
+            + _sorted_resource_labels(columns.resource_labels)
+            + sorted(columns.metric_labels)
         )
 
-    # Assemble the columns into a DataFrame.
-    dataframe = pandas.DataFrame.from_records(columns).T
-
-    # Convert the timestamp strings into a DatetimeIndex.
-    dataframe.index = pandas.to_datetime(dataframe.index)
-
     # Build a multi-level stack of column headers. Some labels may
-    # be undefined for some time series.
-    levels = []
-    for key in labels:
-        level = [_extract_labels(header).get(key, "") for header in headers]
-        levels.append(level)
-
-    # Build a column Index or MultiIndex. Do not include level names
+    # be undefined for some time series. Do not include level names
     # in the column header if the user requested a single-level header
     # by specifying "label".
-    dataframe.columns = pandas.MultiIndex.from_arrays(
-        levels, names=labels if not label else None
+    header = pandas.MultiIndex.from_arrays(
+        [
+            [series_labels.get(key, "") for series_labels in columns.labels]
+            for key in labels
+        ],
+        names=labels if not label else None,
     )
 
-    # Sort the rows just in case (since the API doesn't guarantee the
-    # ordering), and sort the columns lexicographically.
-    return dataframe.sort_index(axis=0).sort_index(axis=1)
+    dataframe = columns.to_dataframe(header)
+
+    # The rows are sorted by timestamp already (the API doesn't guarantee
+    # the ordering). Sort the columns lexicographically.
+    return dataframe.sort_index(axis=1)
+
+
+class _Columns(object):
+    """Accumulates the points of many time series, one column per series.
+
+    The timestamps and values of all the points are gathered in a single
+    pass into flat, typed buffers, one block per type of value, and each
+    block is then scattered into a two-dimensional NumPy array. Only the
+    time series being appended is held as a message.
+    """
+
+    def __init__(self):
+        self.labels = []
+        self.resource_labels = set()
+        self.metric_labels = set()
+        self._blocks = {}
+
+    def append(self, time_series):
+        """Add a time series as the next column."""
+        time_series_pb = monitoring_v3.TimeSeries.pb(time_series)
+        resource = time_series_pb.resource
+        metric = time_series_pb.metric
+
+        self.resource_labels.update(resource.labels)
+        self.metric_labels.update(metric.labels)
+
+        points = time_series_pb.points
+        field = points[0].value.WhichOneof("value") if points else "double_value"
+        block = self._blocks.get(field)
+        if block is None:
+            block = self._blocks[field] = _Block(_VALUE_DTYPES.get(field, "object"))
+        block.columns.append(len(self.labels))
+        self.labels.append(_extract_labels(time_series_pb))
+
+        block.times.extend(
+            point.interval.end_time.seconds * _NANOS_PER_SECOND
+            + point.interval.end_time.nanos
+            for point in points
+        )
+        block.positions.extend(itertools.repeat(len(block.columns) - 1, len(points)))
+        if field in _VALUE_DTYPES:
+            block.values.extend(getattr(point.value, field) for point in points)
+        else:
+            # Message values, such as distributions, are returned as
+            # proto-plus messages.
+            block.values.extend(
+                _extract_value(point.value) for point in time_series.points
+            )
+
+    def to_dataframe(self, header):
+        """Assemble the columns into a dataframe with the given header."""
+        blocks = list(self._blocks.values())
+        block_times = [
+            numpy.frombuffer(block.times, dtype=numpy.int64) for block in blocks
+        ]
+        if block_times:
+            times = numpy.concatenate(block_times)
+        else:
+            times = numpy.empty(0, dtype=numpy.int64)
+        # The unique timestamps are sorted, and become the rows.
+        index_values, rows = numpy.unique(times, return_inverse=True)
+        index = pandas.to_datetime(index_values)
+
+        frames = []
+        offset = 0
+        for block, times in zip(blocks, block_times):
+            block_rows = rows[offset : offset + len(times)]
+            offset += len(times)
+            frames.append(
+                pandas.DataFrame(
+                    block.scatter(block_rows, len(index)),
+                    index=index,
+                    columns=header[block.columns],
+                )
+            )
+
+        if not frames:
+            return pandas.DataFrame(index=index, columns=header)
+        if len(frames) == 1:
+            return frames[0]
+        return pandas.concat(frames, axis=1)
+
+
+class _Block(object):
+    """The points of the time series whose values have the same type."""
+
+    def __init__(self, dtype):
+        self.dtype = dtype
+        # The column number of each time series in the block.
+        self.columns = []
+        # The timestamp, position in ``columns`` and value of each point.
+        self.times = array.array("q")
+        self.positions = array.array("q")
+        typecode = _ARRAY_TYPECODES.get(dtype)
+        self.values = [] if typecode is None else array.array(typecode)
+
+    def scatter(self, rows, row_count):
+        """Place the values in an array, with missing points as NaN."""
+        dtype = self.dtype
+        if isinstance(self.values, list):
+            values = numpy.empty(len(self.values), dtype=object)
+            values[:] = self.values
+        else:
+            values = numpy.frombuffer(self.values, dtype=dtype)
+        positions = numpy.frombuffer(self.positions, dtype=numpy.int64)
+
+        shape = (row_count, len(self.columns))
+        if dtype in ("int64", "bool"):
+            filled = numpy.zeros(shape, dtype=bool)
+            filled[rows, positions] = True
+            if filled.all():
+                data = numpy.empty(shape, dtype=dtype)
+                data[rows, positions] = values
+                return data
+            # Missing points are NaN, so integers become floats and booleans
+            # become objects, as in pandas.
+            dtype = "float64" if dtype == "int64" else "object"
+        data = numpy.full(shape, numpy.nan, dtype=dtype)
+        data[rows, positions] = values
+        return data
 
 
 def _sorted_resource_labels(labels):
@@ -0,0 +1,376 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Buffered, batching writer for time series points.
+
+``create_time_series`` accepts up to 200 time series per request, each with
+exactly one point, and the points of a time series must be written in order.
+:class:`TimeSeriesBatchWriter` buffers points written from any number of
+threads and coalesces them into requests which respect these rules.
+
+Example::
+
+    from google.cloud import monitoring_v3
+    from google.cloud.monitoring_v3 import batch_writer
+
+    client = monitoring_v3.MetricServiceClient()
+    with batch_writer.TimeSeriesBatchWriter(client, 'my-project') as writer:
+        for time_series in compute_metrics():
+            writer.write(time_series)
+"""
+
+import collections
+from concurrent import futures
+import heapq
+import logging
+import threading
+import time
+
+import google.cloud.monitoring_v3 as monitoring_v3
+
+_LOGGER = logging.getLogger(__name__)
+
+# The maximum number of time series in a create_time_series request.
+MAX_BATCH_SIZE = 200
+
+_DEFAULT_MAX_LATENCY = 5.0
+_DEFAULT_MAX_IN_FLIGHT = 4
+_DEFAULT_MAX_PENDING_POINTS = 10000
+
+
+class _Series(object):
+    """The pending points of one time series."""
+
+    __slots__ = ("header", "points", "busy")
+
+    def __init__(self, header):
+        # The time series without its points.
+        self.header = header
+        # Pairs of the time each point was written and the point.
+        self.points = collections.deque()
+        # Whether a point of the series is being written.
+        self.busy = False
+
+
+def _end_time_key(point):
+    end_time = point.interval.end_time
+    return end_time.seconds, end_time.nanos
+
+
+class TimeSeriesBatchWriter(object):
+    """Writes time series points in batches.
+
+    Points are buffered and written by a background thread, in requests
+    holding one point each of up to ``max_batch_size`` time series. A
+    request is sent as soon as enough time series have points pending, or
+    once a point has been pending for ``max_latency`` seconds. Up to
+    ``max_in_flight`` requests are sent concurrently, but only one point of
+    each time series is being written at a time, so the points of a time
+    series are written in the order they were given.
+
+    Once ``max_pending_points`` points are buffered or being written,
+    :meth:`write` blocks until some of them have been written.
+
+    Points which cannot be written are passed to ``on_error``; by default
+    they are logged and dropped.
+
+    :type client: :class:`~google.cloud.monitoring_v3.MetricServiceClient`
+    :param client: The client to use.
+
+    :type project: str
+    :param project: The project ID or number.
+
+    :type max_batch_size: int
+    :param max_batch_size: (Optional) The maximum number of time series in
+        each request. Defaults to, and cannot exceed, 200.
+
+    :type max_latency: float
+    :param max_latency: (Optional) The number of seconds a point may be
+        buffered before it is sent, even in a partial batch. Defaults to 5.
+
+    :type max_in_flight: int
+    :param max_in_flight: (Optional) The maximum number of concurrent
+        requests. Defaults to 4.
+
+    :type max_pending_points: int
+    :param max_pending_points: (Optional) The number of buffered points at
+        which :meth:`write` blocks. Defaults to 10000.
+
+    :type service_time_series: bool
+    :param service_time_series: (Optional) Whether to write the points with
+        ``create_service_time_series``, for metrics of Google Cloud
+        services, rather than ``create_time_series``.
+
+    :type timeout: float
+    :param timeout: (Optional) The timeout of each request.
+
+    :type on_error: callable
+    :param on_error: (Optional) Called with the exception and the list of
+        :class:`~google.cloud.monitoring_v3.types.TimeSeries` of each
+        request which fails. It is called from a background thread.
+
+    :raises: :exc:`ValueError` if an option is out of range.
+    """
+
+    def __init__(
+        self,
+        client,
+        project,
+        max_batch_size=MAX_BATCH_SIZE,
+        max_latency=_DEFAULT_MAX_LATENCY,
+        max_in_flight=_DEFAULT_MAX_IN_FLIGHT,
+        max_pending_points=_DEFAULT_MAX_PENDING_POINTS,
+        service_time_series=False,
+        timeout=None,
+        on_error=None,
+    ):
+        if not 1 <= max_batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(
+                "max_batch_size must be between 1 and {}.".format(MAX_BATCH_SIZE)
+            )
+        if max_latency < 0:
+            raise ValueError("max_latency must not be negative.")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be positive.")
+        if max_pending_points < 1:
+            raise ValueError("max_pending_points must be positive.")
+
+        self._client = client
+        self._project_path = f"projects/{project}"
+        self._max_batch_size = max_batch_size
+        self._max_latency = max_latency
+        self._max_in_flight = max_in_flight
+        self._max_pending_points = max_pending_points
+        if service_time_series:
+            self._create = client.create_service_time_series
+        else:
+            self._create = client.create_time_series
+        self._timeout = timeout
+        self._on_error = on_error
+
+        self._condition = threading.Condition()
+        # Every time series with pending points, by identity.
+        self._series = {}
+        # The identities of the time series with points ready to be sent,
+        # that is, with pending points and none being written, in order.
+        self._ready = collections.OrderedDict()
+        # A heap of the times the oldest points of the ready time series
+        # were written, with their identities. Entries whose time series is
+        # no longer ready, or has sent that point, are dropped lazily.
+        self._oldest = []
+        self._pending_points = 0
+        self._in_flight = 0
+        self._flushing = 0
+        self._closed = False
+
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="monitoring-batch-writer"
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="monitoring-batch-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, time_series):
+        """Buffer the points of a time series to be written.
+
+        The points are written oldest first, each in a separate request.
+
+        :type time_series: :class:`~google.cloud.monitoring_v3.types.TimeSeries`
+            or dict
+        :param time_series: The time series, with its points.
+
+        :raises: :exc:`RuntimeError` if the writer is closed.
+        """
+        if isinstance(time_series, dict):
+            time_series = monitoring_v3.TimeSeries(time_series)
+        time_series_pb = monitoring_v3.TimeSeries.pb(time_series)
+        if not time_series_pb.points:
+            return
+
+        key = (
+            time_series_pb.metric.SerializeToString(deterministic=True),
+            time_series_pb.resource.SerializeToString(deterministic=True),
+        )
+        points = sorted(time_series_pb.points, key=_end_time_key)
+
+        with self._condition:
+            while self._pending_points >= self._max_pending_points and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                raise RuntimeError("Cannot write to a closed TimeSeriesBatchWriter.")
+
+            series = self._series.get(key)
+            if series is None:
+                header = type(time_series_pb)()
+                header.CopyFrom(time_series_pb)
+                del header.points[:]
+                series = self._series[key] = _Series(header)
+            now = time.monotonic()
+            if not series.points and not series.busy:
+                self._add_ready(key, series, now)
+            series.points.extend((now, point) for point in points)
+            self._pending_points += len(points)
+
+            # Wake the background thread when a batch is full, or to start
+            # the timer of the first point.
+            if len(self._ready) in (1, self._max_batch_size):
+                self._condition.notify_all()
+
+    def flush(self):
+        """Send all buffered points and wait until they have been written.
+
+        Points written while waiting are also sent.
+        """
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                while self._pending_points:
+                    self._condition.wait()
+            finally:
+                self._flushing -= 1
+
+    def close(self):
+        """Write all buffered points and stop the writer.
+
+        Calling :meth:`write` after this raises an error. Calling
+        :meth:`close` more than once is allowed.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _run(self):
+        """Send batches of points until the writer is closed and drained."""
+        with self._condition:
+            while True:
+                if self._closed and not self._pending_points:
+                    return
+
+                timeout = None
+                if self._ready and self._in_flight < self._max_in_flight:
+                    draining = (
+                        self._flushing
+                        or self._closed
+                        or self._pending_points >= self._max_pending_points
+                    )
+                    if draining or len(self._ready) >= self._max_batch_size:
+                        self._send_batch()
+                        continue
+                    timeout = self._oldest_time() + self._max_latency - time.monotonic()
+                    if timeout <= 0:
+                        # A point has waited long enough. Send every ready
+                        # time series, as in a flush.
+                        while self._ready and self._in_flight < self._max_in_flight:
+                            self._send_batch()
+                        continue
+                self._condition.wait(timeout)
+
+    def _add_ready(self, key, series, written):
+        """Mark a time series as ready to be sent.
+
+        Must be called with the lock held.
+
+        :type written: float
+        :param written: The time its oldest pending point was written.
+        """
+        self._ready[key] = series
+        heapq.heappush(self._oldest, (written, key))
+
+    def _oldest_time(self):
+        """Return the time the oldest ready point was written.
+
+        Must be called with the lock held, while some time series are ready.
+        """
+        while True:
+            written, key = self._oldest[0]
+            series = self._ready.get(key)
+            if series is not None and series.points[0][0] == written:
+                return written
+            heapq.heappop(self._oldest)
+
+    def _send_batch(self):
+        """Send the next point of up to max_batch_size ready time series.
+
+        Must be called with the lock held.
+        """
+        batch = []
+        time_series = []
+        while self._ready and len(batch) < self._max_batch_size:
+            key, series = self._ready.popitem(last=False)
+            _, point = series.points.popleft()
+            series.busy = True
+            batch.append(key)
+            item = type(series.header)()
+            item.CopyFrom(series.header)
+            item.points.append(point)
+            time_series.append(monitoring_v3.TimeSeries.wrap(item))
+        if not self._ready:
+            del self._oldest[:]
+        self._in_flight += 1
+        self._executor.submit(self._write_batch, batch, time_series)
+
+    def _write_batch(self, batch, time_series):
+        """Write a batch from a worker thread, without holding the lock, so
+        that ``on_error`` is not called with it held.
+        """
+        request = monitoring_v3.CreateTimeSeriesRequest(
+            name=self._project_path, time_series=time_series
+        )
+        try:
+            if self._timeout is None:
+                self._create(request=request)
+            else:
+                self._create(request=request, timeout=self._timeout)
+        except Exception as exception:
+            self._report_error(exception, time_series)
+        finally:
+            self._batch_done(batch)
+
+    def _report_error(self, exception, time_series):
+        if self._on_error is None:
+            _LOGGER.error(
+                "Failed to write %d time series.",
+                len(time_series),
+                exc_info=exception,
+            )
+            return
+        try:
+            self._on_error(exception, time_series)
+        except Exception:
+            _LOGGER.exception("Error in the on_error callback.")
+
+    def _batch_done(self, batch):
+        with self._condition:
+            self._in_flight -= 1
+            self._pending_points -= len(batch)
+            for key in batch:
+                series = self._series[key]
+                series.busy = False
+                if series.points:
+                    self._add_ready(key, series, series.points[0][0])
+                else:
+                    del self._series[key]
+            self._condition.notify_all()
@@ -19,14 +19,20 @@
     projects.timeSeries/list
 """
 
+from concurrent import futures
 import copy
 import datetime
+import itertools
+import queue
+import threading
 
 import google.cloud.monitoring_v3 as monitoring_v3
-from google.cloud.monitoring_v3 import _dataframe, types
+from google.cloud.monitoring_v3 import _arrow, _dataframe, types
 
 _UTCNOW = datetime.datetime.utcnow  # To be replaced by tests.
 
+_DEFAULT_MAX_WORKERS = 8
+
 
 class Query(object):
     """Query object for retrieving metric data.
@@ -110,6 +116,10 @@ class Query(object):
         self._cross_series_reducer = 0
         self._group_by_fields = ()
 
+        self._shard_duration = None
+        self._shard_filters = ()
+        self._max_workers = _DEFAULT_MAX_WORKERS
+
     def __iter__(self):
         return self.iter()
 
@@ -407,6 +417,89 @@ class Query(object):
         new_query._group_by_fields = group_by_fields
         return new_query
 
+    def shard(self, duration=None, projects=(), resources=(), max_workers=None):
+        """Copy the query and execute it as several concurrent requests.
+
+        Long or high-cardinality queries can be slow to list in a single
+        request. A sharded query splits the time interval into windows of
+        the given ``duration``, and/or splits the selected resources into
+        one shard per project or per resource filter, and lists every
+        combination of window and resource shard concurrently on a thread
+        pool. The points of each time series are merged back into a single
+        :class:`~google.cloud.monitoring_v3.types.TimeSeries`, so
+        :meth:`iter` and :meth:`as_dataframe` return the same results as
+        for the unsharded query.
+
+        Examples::
+
+            import datetime
+
+            query = query.shard(duration=datetime.timedelta(days=1))
+            query = query.shard(
+                resources=[{'zone': 'us-central1-a'}, {'zone': 'us-east1-b'}],
+                max_workers=4)
+
+        Each window is an interval ``(start, end]``, starting from the end
+        time of the query, so a window never holds the points of another.
+        The resource shards, however, must not overlap, or time series
+        matching several of them are listed more than once.
+
+        :type duration: :class:`datetime.timedelta`
+        :param duration: (Optional) The length of each window of the time
+            interval. When the query is aligned, this must be a multiple
+            of the alignment period, so that the windows start and end on
+            the same period boundaries as the whole interval.
+
+        :type projects: tuple
+        :param projects: (Optional) Project IDs, each listed as a separate
+            shard, as if selected with :meth:`select_projects`.
+
+        :type resources: list of dicts or strings
+        :param resources: (Optional) Resource filters, each listed as a
+            separate shard. A dict holds label filters as accepted by
+            :meth:`select_resources` as keyword arguments, and a string is
+            a raw filter expression. Each is combined with the filter of
+            the query, and with each of ``projects``.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of concurrent
+            requests. Defaults to 8.
+
+        :rtype: :class:`Query`
+        :returns: The new query object.
+
+        :raises: :exc:`ValueError` if ``duration`` or ``max_workers`` is
+            not positive.
+        """
+        if duration is not None and duration <= datetime.timedelta(0):
+            raise ValueError("Shard duration must be positive.")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be positive.")
+
+        project_filters = [
+            'project = "{project}"'.format(project=project) for project in projects
+        ]
+        resource_filters = [
+            resource
+            if isinstance(resource, str)
+            else _build_label_filter("resource", **resource)
+            for resource in resources
+        ]
+        if project_filters and resource_filters:
+            shard_filters = [
+                " AND ".join(terms)
+                for terms in itertools.product(project_filters, resource_filters)
+            ]
+        else:
+            shard_filters = project_filters or resource_filters
+
+        new_query = copy.deepcopy(self)
+        new_query._shard_duration = duration
+        new_query._shard_filters = tuple(shard_filters)
+        if max_workers is not None:
+            new_query._max_workers = max_workers
+        return new_query
+
     def iter(self, headers_only=False, page_size=None):
         """Yield all time series objects selected by the query.
 
@@ -434,17 +527,166 @@ class Query(object):
             to a sensible value set by the API.
 
         :raises: :exc:`ValueError` if the query time interval has not been
-            specified.
+            specified, or if a sharded query cannot be split as requested
+            (see :meth:`shard`).
+
+        .. note::
+
+            A sharded query (see :meth:`shard`) lists every shard before
+            yielding the first time series, since the points of a time
+            series may come from any shard, so all of its results are held
+            in memory at once.
         """
         if self._end_time is None:
             raise ValueError("Query time interval not specified.")
 
-        params = self._build_query_params(headers_only, page_size)
+        shards = self._shards()
+        if len(shards) == 1:
+            params = shards[0]._build_query_params(headers_only, page_size)
+
+            request = monitoring_v3.ListTimeSeriesRequest(**params)
+            for ts in self._client.list_time_series(request):
+                yield ts
+            return
 
-        request = monitoring_v3.ListTimeSeriesRequest(**params)
-        for ts in self._client.list_time_series(request):
+        requests = [
+            monitoring_v3.ListTimeSeriesRequest(
+                **shard._build_query_params(headers_only, page_size)
+            )
+            for shard in shards
+        ]
+        for ts in _merge_time_series(self._list_concurrently(requests)):
             yield ts
 
+    def _shards(self):
+        """Split the query into the queries listed by a sharded query.
+
+        The windows are ordered from newest to oldest, as the points of a
+        time series are, so that concatenating the points of the shards
+        in order keeps them sorted.
+
+        :rtype: list of :class:`Query`
+        :returns: The queries of the shards, or just this query if it is
+            not sharded.
+        """
+        windows = [(self._start_time, self._end_time)]
+        if self._shard_duration is not None and self._start_time is not None:
+            period = datetime.timedelta(seconds=self._alignment_period_seconds)
+            if period and self._shard_duration % period:
+                raise ValueError(
+                    "Shard duration must be a multiple of the alignment period."
+                )
+            windows = []
+            end_time = self._end_time
+            while end_time > self._start_time:
+                start_time = max(end_time - self._shard_duration, self._start_time)
+                windows.append((start_time, end_time))
+                end_time = start_time
+
+        if not self._shard_filters:
+            if len(windows) == 1:
+                return [self]
+        elif self._cross_series_reducer:
+            raise ValueError(
+                "Cannot shard the resources of a query with cross-series "
+                "reduction, which would reduce each shard separately."
+            )
+
+        shards = []
+        for shard_filter in self._shard_filters or (None,):
+            for start_time, end_time in windows:
+                shard = self.select_interval(end_time, start_time)
+                shard._filter.shard_filter = shard_filter
+                shards.append(shard)
+        return shards
+
+    def _list_concurrently(self, requests):
+        """List the time series of each request on a thread pool.
+
+        :type requests: list of
+            :class:`~google.cloud.monitoring_v3.types.ListTimeSeriesRequest`
+        :param requests: The requests of the shards.
+
+        :rtype: list
+        :returns: The time series of each request, in the order of the
+            requests.
+        """
+
+        def list_time_series(request):
+            return list(self._client.list_time_series(request))
+
+        max_workers = min(self._max_workers, len(requests))
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = [
+                executor.submit(list_time_series, request) for request in requests
+            ]
+            try:
+                return [future.result() for future in pending]
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _stream_concurrently(self, requests, produce):
+        """Yield the results of each request as they are produced.
+
+        The requests are listed on a thread pool, like
+        :meth:`_list_concurrently`, but each worker passes the items
+        produced from its pager through a queue bounded by the number of
+        workers, and waits while the queue is full, so that only a few items
+        are held at a time.
+
+        :type requests: list of
+            :class:`~google.cloud.monitoring_v3.types.ListTimeSeriesRequest`
+        :param requests: The requests of the shards.
+
+        :type produce: callable
+        :param produce: Called on the worker thread with the pager of each
+            request, returning an iterator of the items to yield.
+
+        :rtype: iterator
+        :returns: The items produced for every request, in the order they
+            are produced.
+        """
+        max_workers = min(self._max_workers, len(requests))
+        results = queue.Queue(maxsize=max_workers)
+        stopped = threading.Event()
+
+        def list_time_series(request):
+            try:
+                for item in produce(self._client.list_time_series(request)):
+                    if stopped.is_set():
+                        return
+                    results.put((True, item))
+            except Exception as exc:
+                results.put((False, exc))
+            else:
+                results.put((False, None))
+
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        pending = [executor.submit(list_time_series, request) for request in requests]
+        try:
+            remaining = len(requests)
+            while remaining:
+                is_item, value = results.get()
+                if is_item:
+                    yield value
+                elif value is not None:
+                    raise value
+                else:
+                    remaining -= 1
+        finally:
+            # Unblock the workers waiting to put their results, and stop
+            # them before they produce any more.
+            stopped.set()
+            for future in pending:
+                future.cancel()
+            while not all(future.done() for future in pending):
+                try:
+                    results.get(timeout=0.01)
+                except queue.Empty:
+                    pass
+            executor.shutdown(wait=True)
+
     def _build_query_params(self, headers_only=False, page_size=None):
         """Return key-value pairs for the list_time_series API call.
 
@@ -488,6 +730,112 @@ class Query(object):
 
         return params
 
+    def iter_record_batches(self, labels=None, page_size=None):
+        """Yield the selected points as :mod:`pyarrow` record batches.
+
+        .. note::
+
+            Use of this method requires that you have :mod:`pyarrow`
+            installed.
+
+        Each page of results is converted to a record batch as soon as it
+        arrives, and its messages are discarded, so results of any size can
+        be streamed with the memory of a single page. See
+        :meth:`as_arrow` for the columns of each batch.
+
+        The shards of a sharded query (see :meth:`shard`) are listed
+        concurrently, and their batches are yielded in the order they are
+        converted, so the batches of different shards are interleaved. Each
+        worker waits while ``max_workers`` batches are waiting to be
+        yielded, so about two pages per worker are held at a time.
+
+        Example::
+
+            for batch in query.iter_record_batches(page_size=100000):
+                writer.write_batch(batch)
+
+        :type labels: list of strings, or None
+        :param labels: (Optional) The label names to include as columns.
+            Defaults to the resource type and all resource and metric labels
+            of the time series in each batch, so batches may have different
+            columns.
+
+        :type page_size: int
+        :param page_size:
+            (Optional) The maximum number of points in each page of results
+            from this request. Non-positive values are ignored. Defaults
+            to a sensible value set by the API.
+
+        :raises: :exc:`ValueError` if the query time interval has not been
+            specified, or if the values of the points are not all of the
+            same scalar type.
+        """
+        if self._end_time is None:
+            raise ValueError("Query time interval not specified.")
+
+        def to_record_batches(pager):
+            for page in pager.pages:
+                yield _arrow._build_record_batch(page.time_series, labels)
+
+        requests = [
+            monitoring_v3.ListTimeSeriesRequest(
+                **shard._build_query_params(page_size=page_size)
+            )
+            for shard in self._shards()
+        ]
+        if len(requests) == 1:
+            for batch in to_record_batches(self._client.list_time_series(requests[0])):
+                yield batch
+            return
+
+        # The rows of the shards are independent, so there is nothing to
+        # merge; each shard is converted on its worker thread, and its
+        # batches are yielded as they arrive.
+        for batch in self._stream_concurrently(requests, to_record_batches):
+            yield batch
+
+    def as_arrow(self, labels=None, page_size=None):
+        """Return all the selected points as a :mod:`pyarrow` table.
+
+        .. note::
+
+            Use of this method requires that you have :mod:`pyarrow`
+            installed.
+
+        The table has a row for each point, with the columns:
+
+        * ``end_time``: the end time of the point, as a timestamp.
+        * One dictionary-encoded string column for each label, holding an
+          empty string for time series without the label.
+        * ``value``: the value of the point. Only boolean, integer, double
+          and string values are supported.
+
+        Unlike :meth:`as_dataframe`, which needs every time series before
+        it can build its columns, the table is built a page at a time (see
+        :meth:`iter_record_batches`), so the messages of only one page (or
+        a few per worker, for a sharded query) are held at a time.
+
+        Examples::
+
+            table = query.as_arrow()
+            table = query.as_arrow(labels=['zone', 'instance_name'])
+
+        :type labels: list of strings, or None
+        :param labels: (Optional) The label names to include as columns.
+            Defaults to the resource type and all resource and metric
+            labels.
+
+        :type page_size: int
+        :param page_size:
+            (Optional) The maximum number of points in each page of results
+            from this request. Non-positive values are ignored. Defaults
+            to a sensible value set by the API.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: A table where each row represents one point.
+        """
+        return _arrow._build_table(self.iter_record_batches(labels, page_size))
+
     def as_dataframe(self, label=None, labels=None):
         """Return all the selected time series as a :mod:`pandas` dataframe.
 
@@ -548,6 +896,35 @@ class Query(object):
         return new_query
 
 
+def _merge_time_series(results):
+    """Merge the time series listed by the shards of a query.
+
+    Time series with the same metric and monitored resource are combined
+    into the first of them, with the points of the others appended in
+    order.
+
+    :type results: list of lists of
+        :class:`~google.cloud.monitoring_v3.types.TimeSeries`
+    :param results: The time series listed by each shard.
+
+    :rtype: list of :class:`~google.cloud.monitoring_v3.types.TimeSeries`
+    :returns: The merged time series, in the order they were first listed.
+    """
+    merged = {}
+    for time_series in itertools.chain.from_iterable(results):
+        time_series_pb = monitoring_v3.TimeSeries.pb(time_series)
+        key = (
+            time_series_pb.metric.SerializeToString(deterministic=True),
+            time_series_pb.resource.SerializeToString(deterministic=True),
+        )
+        first = merged.get(key)
+        if first is None:
+            merged[key] = time_series
+        else:
+            monitoring_v3.TimeSeries.pb(first).points.extend(time_series_pb.points)
+    return list(merged.values())
+
+
 class _Filter(object):
     """Helper for assembling a filter string."""
 
@@ -557,6 +934,7 @@ class _Filter(object):
         self.projects = ()
         self.resource_label_filter = None
         self.metric_label_filter = None
+        self.shard_filter = None
 
     def select_resources(self, *args, **kwargs):
         """Select by resource labels.
@@ -587,6 +965,8 @@ class _Filter(object):
             filters.append(self.resource_label_filter)
         if self.metric_label_filter:
             filters.append(self.metric_label_filter)
+        if self.shard_filter:
+            filters.append(self.shard_filter)
 
         # Parentheses are never actually required, because OR binds more
         # tightly than AND in the Monitoring API's filter syntax.
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measure the cost of building dataframes from time series.
+
+Compares :func:`google.cloud.monitoring_v3._dataframe._build_dataframe`,
+used by ``Query.as_dataframe``, with the previous implementation, which
+built a :class:`pandas.Series` per time series and transposed the result
+of ``DataFrame.from_records``. Both are checked to build equal dataframes.
+
+Usage::
+
+    python scripts/benchmarks/dataframe.py [--series N] [--points N]
+"""
+
+import argparse
+import datetime
+import itertools
+import time
+
+import pandas
+
+from google.cloud import monitoring_v3
+from google.cloud.monitoring_v3 import _dataframe
+
+
+def _previous_build_dataframe(time_series_iterable, label=None, labels=None):
+    if label is not None:
+        labels = (label,)
+
+    columns = []
+    headers = []
+    for time_series in time_series_iterable:
+        pandas_series = pandas.Series(
+            data=[
+                _dataframe._extract_value(point.value) for point in time_series.points
+            ],
+            index=[
+                point.interval.end_time.timestamp_pb().ToNanoseconds()
+                for point in time_series.points
+            ],
+        )
+        columns.append(pandas_series)
+        headers.append(
+            monitoring_v3.TimeSeries(
+                metric=time_series.metric, resource=time_series.resource
+            )
+        )
+
+    if labels is None:
+        resource_labels = set(
+            itertools.chain.from_iterable(header.resource.labels for header in headers)
+        )
+        metric_labels = set(
+            itertools.chain.from_iterable(header.metric.labels for header in headers)
+        )
+        labels = (
+            ["resource_type"]
+            + _dataframe._sorted_resource_labels(resource_labels)
+            + sorted(metric_labels)
+        )
+
+    dataframe = pandas.DataFrame.from_records(columns).T
+    dataframe.index = pandas.to_datetime(dataframe.index)
+
+    levels = []
+    for key in labels:
+        level = [_dataframe._extract_labels(header).get(key, "") for header in headers]
+        levels.append(level)
+
+    dataframe.columns = pandas.MultiIndex.from_arrays(
+        levels, names=labels if not label else None
+    )
+    return dataframe.sort_index(axis=0).sort_index(axis=1)
+
+
+def _time_series(series_count, point_count):
+    start = datetime.datetime(2023, 5, 4, 3, 2, 1)
+    result = []
+    for series in range(series_count):
+        points = [
+            monitoring_v3.Point(
+                interval=monitoring_v3.TimeInterval(
+                    end_time=start + datetime.timedelta(minutes=point)
+                ),
+                value={"double_value": series + point / 10.0},
+            )
+            for point in range(point_count)
+        ]
+        result.append(
+            monitoring_v3.TimeSeries(
+                metric={
+                    "type": "compute.googleapis.com/instance/cpu/utilization",
+                    "labels": {"instance_name": "instance-{:05d}".format(series)},
+                },
+                resource={
+                    "type": "gce_instance",
+                    "labels": {
+                        "project_id": "my-project",
+                        "zone": "us-central1-{}".format("abcf"[series % 4]),
+                        "instance_id": str(1000000000 + series),
+                    },
+                },
+                points=points,
+            )
+        )
+    return result
+
+
+def _best_of(repeat, function, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=2000)
+    parser.add_argument("--points", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    time_series = _time_series(args.series, args.points)
+    previous, expected = _best_of(args.repeat, _previous_build_dataframe, time_series)
+    current, actual = _best_of(args.repeat, _dataframe._build_dataframe, time_series)
+    pandas.testing.assert_frame_equal(actual, expected)
+
+    print(
+        "{} series x {} points: previous {:.3f}s, columnar {:.3f}s "
+        "({:.1f}x)".format(
+            args.series, args.points, previous, current, previous / current
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import unittest
+
+import pyarrow
+
+from google.cloud import monitoring_v3
+from google.cloud.monitoring_v3 import _arrow
+
+PROJECT = "my-project"
+
+METRIC_TYPE = "compute.googleapis.com/instance/cpu/utilization"
+RESOURCE_TYPE = "gce_instance"
+
+T0 = datetime.datetime(2016, 4, 6, 22, 5, 0)
+T1 = datetime.datetime(2016, 4, 6, 22, 6, 0)
+
+
+def generate_time_series(instance_name, zone, values, times=(T1, T0)):
+    return monitoring_v3.TimeSeries(
+        metric={"type": METRIC_TYPE, "labels": {"instance_name": instance_name}},
+        resource={
+            "type": RESOURCE_TYPE,
+            "labels": {"project_id": PROJECT, "zone": zone},
+        },
+        points=[
+            {"interval": {"end_time": end_time}, "value": value}
+            for end_time, value in zip(times, values)
+        ],
+    )
+
+
+class Test__build_record_batch(unittest.TestCase):
+    def _call_fut(self, *args, **kwargs):
+        return _arrow._build_record_batch(*args, **kwargs)
+
+    def test_empty_labels_illegal(self):
+        with self.assertRaises(ValueError):
+            self._call_fut([], labels=[])
+
+    def test_smart_labels(self):
+        batch = self._call_fut(
+            [
+                generate_time_series(
+                    "instance-1",
+                    "us-east1-a",
+                    [{"double_value": 0.5}, {"double_value": 0.25}],
+                ),
+                generate_time_series("instance-2", "us-east1-b", []),
+                generate_time_series(
+                    "instance-3", "us-east1-b", [{"double_value": 0.75}], times=[T0]
+                ),
+            ]
+        )
+
+        self.assertEqual(
+            batch.schema.names,
+            [
+                "end_time",
+                "resource_type",
+                "project_id",
+                "zone",
+                "instance_name",
+                "value",
+            ],
+        )
+        self.assertEqual(batch.schema.field("end_time").type, pyarrow.timestamp("ns"))
+        self.assertEqual(
+            batch.schema.field("zone").type,
+            pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+        )
+        self.assertEqual(batch.column("end_time").to_pylist(), [T1, T0, T0])
+        self.assertEqual(
+            batch.column("instance_name").to_pylist(),
+            ["instance-1", "instance-1", "instance-3"],
+        )
+        self.assertEqual(batch.column("value").to_pylist(), [0.5, 0.25, 0.75])
+
+    def test_labels(self):
+        batch = self._call_fut(
+            [generate_time_series("instance-1", "us-east1-a", [{"int64_value": 7}])],
+            labels=["zone", "missing"],
+        )
+
+        self.assertEqual(batch.schema.names, ["end_time", "zone", "missing", "value"])
+        self.assertEqual(batch.column("missing").to_pylist(), [""])
+        self.assertEqual(batch.schema.field("value").type, pyarrow.int64())
+        self.assertEqual(batch.column("value").to_pylist(), [7])
+
+    def test_bool_and_string_values(self):
+        for value, expected in (
+            ({"bool_value": True}, True),
+            ({"string_value": "up"}, "up"),
+        ):
+            batch = self._call_fut(
+                [generate_time_series("instance-1", "us-east1-a", [value])]
+            )
+            self.assertEqual(batch.column("value").to_pylist(), [expected])
+
+    def test_distribution_values_illegal(self):
+        with self.assertRaises(ValueError):
+            self._call_fut(
+                [
+                    generate_time_series(
+                        "instance-1",
+                        "us-east1-a",
+                        [{"distribution_value": {"count": 1}}],
+                    )
+                ]
+            )
+
+    def test_mixed_values_illegal(self):
+        with self.assertRaises(ValueError):
+            self._call_fut(
+                [
+                    generate_time_series(
+                        "instance-1", "us-east1-a", [{"double_value": 1.0}]
+                    ),
+                    generate_time_series(
+                        "instance-2", "us-east1-a", [{"int64_value": 1}]
+                    ),
+                ]
+            )
+
+    def test_empty(self):
+        batch = self._call_fut([])
+
+        self.assertEqual(batch.num_rows, 0)
+        self.assertEqual(batch.schema.names, ["end_time", "resource_type", "value"])
+
+
+class Test__build_table(unittest.TestCase):
+    def _call_fut(self, *args, **kwargs):
+        return _arrow._build_table(*args, **kwargs)
+
+    def test_different_labels(self):
+        first = _arrow._build_record_batch(
+            [generate_time_series("instance-1", "us-east1-a", [{"double_value": 1.0}])]
+        )
+        second = _arrow._build_record_batch(
+            [
+                monitoring_v3.TimeSeries(
+                    metric={"type": METRIC_TYPE},
+                    resource={"type": "global", "labels": {"region": "us-east1"}},
+                    points=[
+                        {"interval": {"end_time": T0}, "value": {"double_value": 2.0}}
+                    ],
+                )
+            ]
+        )
+        empty = _arrow._build_record_batch([], labels=["other"])
+        table = self._call_fut([first, empty, second])
+
+        self.assertEqual(
+            table.schema.names,
+            [
+                "end_time",
+                "resource_type",
+                "project_id",
+                "zone",
+                "instance_name",
+                "region",
+                "value",
+            ],
+        )
+        self.assertEqual(
+            table.column("resource_type").to_pylist(), [RESOURCE_TYPE, "global"]
+        )
+        self.assertEqual(table.column("zone").to_pylist(), ["us-east1-a", ""])
+        self.assertEqual(table.column("region").to_pylist(), ["", "us-east1"])
+        self.assertEqual(table.column("value").to_pylist(), [1.0, 2.0])
+
+    def test_different_value_types_illegal(self):
+        first = _arrow._build_record_batch(
+            [generate_time_series("instance-1", "us-east1-a", [{"double_value": 1.0}])]
+        )
+        second = _arrow._build_record_batch(
+            [generate_time_series("instance-1", "us-east1-a", [{"int64_value": 1}])]
+        )
+        with self.assertRaises(ValueError):
+            self._call_fut([first, second])
+
+    def test_empty(self):
+        table = self._call_fut([])
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema.names, ["end_time", "resource_type", "value"])
+
+    def test_only_empty_batches(self):
+        table = self._call_fut([_arrow._build_record_batch([], labels=["zone"])])
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema.names, ["end_time", "zone", "value"])
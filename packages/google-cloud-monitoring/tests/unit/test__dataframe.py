@@ -82,6 +82,24 @@ def generate_query_results():
         )
 
 
+def generate_time_series(instance_name, value, timestamps):
+    points = []
+    for timestamp in timestamps:
+        end_time = datetime_helpers.from_rfc3339(timestamp).replace(tzinfo=None)
+        points.append(
+            monitoring_v3.Point(
+                interval=monitoring_v3.TimeInterval(end_time=end_time), value=value
+            )
+        )
+    return monitoring_v3.TimeSeries(
+        metric=metric_pb2.Metric(
+            type=METRIC_TYPE, labels={"instance_name": instance_name}
+        ),
+        resource=monitored_resource_pb2.MonitoredResource(type=RESOURCE_TYPE),
+        points=points,
+    )
+
+
 class Test__build_dataframe(unittest.TestCase):
     def _call_fut(self, *args, **kwargs):
         return _dataframe._build_dataframe(*args, **kwargs)
@@ -203,6 +221,88 @@ class Test__build_dataframe(unittest.TestCase):
         self.assertIsNone(dataframe.index.name)
         self.assertIsInstance(dataframe.index, pandas.DatetimeIndex)
 
+    def test_missing_points(self):
+        series = [
+            generate_time_series("a", {"double_value": 1.5}, TIMESTAMPS[:2]),
+            generate_time_series("b", {"double_value": 2.5}, TIMESTAMPS[1:]),
+        ]
+        dataframe = self._call_fut(series, label="instance_name")
+
+        self.assertEqual(list(dataframe.index), parse_timestamps())
+        self.assertEqual(list(dataframe.dtypes), ["float64", "float64"])
+        self.assertEqual(list(dataframe[("a",)].isna()), [False, False, True])
+        self.assertEqual(list(dataframe[("b",)].isna()), [True, False, False])
+        self.assertEqual(dataframe[("a",)].iloc[1], 1.5)
+        self.assertEqual(dataframe[("b",)].iloc[1], 2.5)
+
+    def test_unordered_points(self):
+        series = [
+            generate_time_series(
+                "a", {"double_value": 1.0}, list(reversed(TIMESTAMPS))
+            ),
+        ]
+        dataframe = self._call_fut(series, label="instance_name")
+
+        self.assertEqual(list(dataframe.index), parse_timestamps())
+
+    def test_int64_values(self):
+        series = [
+            generate_time_series("a", {"int64_value": 7}, TIMESTAMPS),
+            generate_time_series("b", {"int64_value": 8}, TIMESTAMPS),
+        ]
+        dataframe = self._call_fut(series, label="instance_name")
+
+        self.assertEqual(list(dataframe.dtypes), ["int64", "int64"])
+        self.assertEqual(dataframe.values.tolist(), [[7, 8]] * len(TIMESTAMPS))
+
+    def test_int64_values_with_missing_points(self):
+        series = [
+            generate_time_series("a", {"int64_value": 7}, TIMESTAMPS),
+            generate_time_series("b", {"int64_value": 8}, TIMESTAMPS[:1]),
+        ]
+        dataframe = self._call_fut(series, label="instance_name")
+
+        self.assertEqual(list(dataframe.dtypes), ["float64", "float64"])
+        self.assertEqual(list(dataframe[("a",)]), [7.0] * len(TIMESTAMPS))
+        self.assertEqual(list(dataframe[("b",)].isna()), [False, True, True])
+
+    def test_bool_and_string_values(self):
+        series = [
+            generate_time_series("a", {"bool_value": True}, TIMESTAMPS),
+            generate_time_series("b", {"string_value": "up"}, TIMESTAMPS),
+        ]
+        dataframe = self._call_fut(series, label="instance_name")
+
+        self.assertEqual(dataframe[("a",)].dtype, "bool")
+        self.assertEqual(list(dataframe[("a",)]), [True] * len(TIMESTAMPS))
+        self.assertEqual(list(dataframe[("b",)]), ["up"] * len(TIMESTAMPS))
+
+    def test_distribution_values(self):
+        distribution = {"count": 3, "mean": 2.0}
+        series = [
+            generate_time_series(
+                "a", {"distribution_value": distribution}, TIMESTAMPS[:2]
+            ),
+            generate_time_series("b", {"double_value": 1.0}, TIMESTAMPS),
+        ]
+        dataframe = self._call_fut(series, label="instance_name")
+
+        values = dataframe[("a",)]
+        self.assertEqual(values.iloc[0].count, 3)
+        self.assertEqual(values.iloc[1].mean, 2.0)
+        self.assertTrue(pandas.isna(values.iloc[2]))
+        self.assertEqual(list(dataframe[("b",)]), [1.0] * len(TIMESTAMPS))
+
+    def test_series_without_points(self):
+        series = [
+            generate_time_series("a", {"double_value": 1.0}, TIMESTAMPS),
+            generate_time_series("b", {"double_value": 1.0}, []),
+        ]
+        dataframe = self._call_fut(series, label="instance_name")
+
+        self.assertEqual(dataframe.shape, DIMENSIONS)
+        self.assertTrue(dataframe[("b",)].isna().all())
+
 
 class Test__sorted_resource_labels(unittest.TestCase):
     def _call_fut(self, labels):
@@ -0,0 +1,246 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+
+import mock
+
+from google.cloud import monitoring_v3
+
+PROJECT = "my-project"
+
+METRIC_TYPE = "custom.googleapis.com/my_metric"
+RESOURCE_TYPE = "global"
+
+
+def make_time_series(series, *seconds):
+    return monitoring_v3.TimeSeries(
+        metric={"type": METRIC_TYPE, "labels": {"series": str(series)}},
+        resource={"type": RESOURCE_TYPE, "labels": {"project_id": PROJECT}},
+        points=[
+            {
+                "interval": {"end_time": {"seconds": second}},
+                "value": {"int64_value": second},
+            }
+            for second in seconds
+        ],
+    )
+
+
+def summarize(request):
+    return [
+        (time_series.metric.labels["series"], time_series.points[0].value.int64_value)
+        for time_series in request.time_series
+    ]
+
+
+class TestTimeSeriesBatchWriter(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.monitoring_v3.batch_writer import TimeSeriesBatchWriter
+
+        return TimeSeriesBatchWriter
+
+    def _make_one(self, *args, **kwargs):
+        writer = self._get_target_class()(*args, **kwargs)
+        self.addCleanup(writer.close)
+        return writer
+
+    @staticmethod
+    def _make_client():
+        client = mock.Mock(spec=["create_time_series", "create_service_time_series"])
+        client.requests = []
+
+        def create_time_series(request, **kwargs):
+            client.requests.append(request)
+
+        client.create_time_series.side_effect = create_time_series
+        client.create_service_time_series.side_effect = create_time_series
+        return client
+
+    def test_constructor_invalid_options(self):
+        client = self._make_client()
+        for options in (
+            {"max_batch_size": 0},
+            {"max_batch_size": 201},
+            {"max_latency": -1},
+            {"max_in_flight": 0},
+            {"max_pending_points": 0},
+        ):
+            with self.assertRaises(ValueError):
+                self._get_target_class()(client, PROJECT, **options)
+
+    def test_flush_batches(self):
+        client = self._make_client()
+        writer = self._make_one(
+            client, PROJECT, max_batch_size=2, max_latency=60, max_in_flight=1
+        )
+        writer.write(make_time_series("a", 2, 1, 3))
+        writer.write(make_time_series("b", 1))
+        writer.write(make_time_series("c", 1, 2))
+        writer.flush()
+
+        requests = [summarize(request) for request in client.requests]
+        for request in client.requests:
+            self.assertEqual(request.name, "projects/" + PROJECT)
+        for time_series in requests:
+            self.assertLessEqual(len(time_series), 2)
+            # At most one point of each time series per request.
+            self.assertEqual(
+                len(set(name for name, _ in time_series)), len(time_series)
+            )
+        points = [point for time_series in requests for point in time_series]
+        self.assertEqual(len(points), 6)
+        for name, values in (("a", [1, 2, 3]), ("b", [1]), ("c", [1, 2])):
+            self.assertEqual([value for key, value in points if key == name], values)
+        self.assertEqual(len(requests), 3)
+
+    def test_full_batch_sent_without_flush(self):
+        client = self._make_client()
+        writer = self._make_one(client, PROJECT, max_batch_size=2, max_latency=60)
+        writer.write(make_time_series("a", 1))
+        writer.write(make_time_series("b", 1))
+
+        deadline = time.monotonic() + 5
+        while not client.requests and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(summarize(client.requests[0]), [("a", 1), ("b", 1)])
+
+    def test_partial_batch_sent_after_max_latency(self):
+        client = self._make_client()
+        writer = self._make_one(client, PROJECT, max_latency=0.05)
+        writer.write(make_time_series("a", 1))
+
+        deadline = time.monotonic() + 5
+        while not client.requests and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(summarize(client.requests[0]), [("a", 1)])
+
+    def test_service_time_series(self):
+        client = self._make_client()
+        writer = self._make_one(client, PROJECT, service_time_series=True)
+        writer.write(make_time_series("a", 1))
+        writer.flush()
+
+        client.create_time_series.assert_not_called()
+        client.create_service_time_series.assert_called_once()
+
+    def test_timeout(self):
+        client = self._make_client()
+        writer = self._make_one(client, PROJECT, timeout=7.5)
+        writer.write(make_time_series("a", 1))
+        writer.flush()
+
+        _, kwargs = client.create_time_series.call_args
+        self.assertEqual(kwargs["timeout"], 7.5)
+
+    def test_on_error(self):
+        from google.api_core import exceptions
+
+        client = self._make_client()
+        error = exceptions.InvalidArgument("bad point")
+        client.create_time_series.side_effect = error
+        on_error = mock.Mock()
+        writer = self._make_one(client, PROJECT, on_error=on_error)
+        writer.write(make_time_series("a", 1))
+        writer.flush()
+
+        on_error.assert_called_once()
+        exception, time_series = on_error.call_args[0]
+        self.assertIs(exception, error)
+        self.assertEqual(len(time_series), 1)
+        self.assertEqual(time_series[0].metric.labels["series"], "a")
+
+    def test_on_error_called_without_lock(self):
+        from google.api_core import exceptions
+
+        client = self._make_client()
+        client.create_time_series.side_effect = exceptions.InvalidArgument("bad")
+        acquired = []
+
+        def on_error(exception, time_series):
+            # Another thread can take the lock while the callback runs.
+            def acquire():
+                if writer._condition.acquire(timeout=5):
+                    acquired.append(True)
+                    writer._condition.release()
+
+            thread = threading.Thread(target=acquire)
+            thread.start()
+            thread.join()
+
+        writer = self._make_one(client, PROJECT, on_error=on_error)
+        writer.write(make_time_series("a", 1))
+        writer.flush()
+
+        self.assertEqual(acquired, [True])
+
+    def test_oldest_time_skips_stale_entries(self):
+        client = self._make_client()
+        writer = self._make_one(client, PROJECT, max_latency=60)
+        writer.write(make_time_series("a", 1, 2))
+        writer.write(make_time_series("b", 1))
+
+        with writer._condition:
+            first, second = writer._ready.values()
+            self.assertEqual(writer._oldest_time(), first.points[0][0])
+            # A time series which is no longer ready is skipped.
+            writer._ready.popitem(last=False)
+            self.assertEqual(writer._oldest_time(), second.points[0][0])
+            self.assertEqual(len(writer._oldest), 1)
+            writer._add_ready(next(iter(writer._series)), first, first.points[0][0])
+
+    def test_backpressure(self):
+        client = self._make_client()
+        release = threading.Event()
+        client.create_time_series.side_effect = lambda request, **kwargs: release.wait()
+        writer = self._make_one(client, PROJECT, max_pending_points=1)
+        writer.write(make_time_series("a", 1))
+
+        written = threading.Event()
+
+        def write():
+            writer.write(make_time_series("b", 1))
+            written.set()
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        self.assertFalse(written.wait(0.1))
+        release.set()
+        self.assertTrue(written.wait(5))
+        thread.join()
+
+    def test_close(self):
+        client = self._make_client()
+        writer = self._make_one(client, PROJECT, max_latency=60)
+        with writer:
+            writer.write(make_time_series("a", 1, 2))
+
+        self.assertEqual(
+            [summarize(request) for request in client.requests],
+            [[("a", 1)], [("a", 2)]],
+        )
+        with self.assertRaises(RuntimeError):
+            writer.write(make_time_series("a", 3))
+        writer.close()
+
+    def test_write_without_points(self):
+        client = self._make_client()
+        writer = self._make_one(client, PROJECT)
+        writer.write(make_time_series("a"))
+        writer.flush()
+
+        client.create_time_series.assert_not_called()
@@ -15,6 +15,7 @@
 from __future__ import absolute_import
 
 import datetime
+import threading
 import unittest
 
 import mock
@@ -424,6 +425,357 @@ class TestQuery(unittest.TestCase):
         request = channel.requests[0][1]
         self.assertEqual(request, expected_request)
 
+    def test_shard_invalid_arguments(self):
+        client = self._create_client()
+        query = self._make_one(client, PROJECT, METRIC_TYPE)
+
+        with self.assertRaises(ValueError):
+            query.shard(duration=datetime.timedelta(0))
+        with self.assertRaises(ValueError):
+            query.shard(projects=["project-1"], max_workers=0)
+
+    def test_shard_duration_not_multiple_of_alignment_period(self):
+        T0 = datetime.datetime(2016, 4, 6, 22, 0, 0)
+        T1 = datetime.datetime(2016, 4, 7, 22, 0, 0)
+
+        client = self._create_client()
+        query = self._make_one(client, PROJECT, METRIC_TYPE)
+        query = query.select_interval(start_time=T0, end_time=T1)
+        query = query.align("ALIGN_MEAN", minutes=7)
+        query = query.shard(duration=datetime.timedelta(hours=1))
+
+        with self.assertRaises(ValueError):
+            list(query)
+
+    def test_shard_resources_with_reduction(self):
+        T1 = datetime.datetime(2016, 4, 7, 22, 0, 0)
+
+        client = self._create_client()
+        query = self._make_one(client, PROJECT, METRIC_TYPE)
+        query = query.select_interval(end_time=T1)
+        query = query.reduce("REDUCE_MEAN", "resource.zone")
+        query = query.shard(resources=[{"zone": "us-east1-a"}])
+
+        with self.assertRaises(ValueError):
+            list(query)
+
+    def test_shard_filters(self):
+        T1 = datetime.datetime(2016, 4, 7, 22, 0, 0)
+
+        client = self._create_client()
+        query = self._make_one(client, PROJECT, METRIC_TYPE)
+        query = query.select_interval(end_time=T1)
+        query = query.shard(
+            projects=["project-1", "project-2"],
+            resources=[{"zone": "us-east1-a"}, 'resource.type = "gce_instance"'],
+        )
+
+        filters = [shard.filter for shard in query._shards()]
+        expected = [
+            'metric.type = "{type}" AND project = "{project}" AND {resource}'.format(
+                type=METRIC_TYPE, project=project, resource=resource
+            )
+            for project in ("project-1", "project-2")
+            for resource in (
+                'resource.label.zone = "us-east1-a"',
+                'resource.type = "gce_instance"',
+            )
+        ]
+        self.assertEqual(filters, expected)
+        self.assertEqual(query.filter, 'metric.type = "{}"'.format(METRIC_TYPE))
+
+    def test_shard_windows(self):
+        T0 = datetime.datetime(2016, 4, 6, 22, 0, 0)
+        T1 = datetime.datetime(2016, 4, 7, 0, 30, 0)
+
+        client = self._create_client()
+        query = self._make_one(client, PROJECT, METRIC_TYPE)
+        query = query.select_interval(start_time=T0, end_time=T1)
+        query = query.align("ALIGN_MEAN", minutes=30)
+        query = query.shard(duration=datetime.timedelta(hours=1))
+
+        windows = [(shard._start_time, shard._end_time) for shard in query._shards()]
+        expected = [
+            (datetime.datetime(2016, 4, 6, 23, 30), T1),
+            (
+                datetime.datetime(2016, 4, 6, 22, 30),
+                datetime.datetime(2016, 4, 6, 23, 30),
+            ),
+            (T0, datetime.datetime(2016, 4, 6, 22, 30)),
+        ]
+        self.assertEqual(windows, expected)
+
+    def test_shard_point_in_time(self):
+        T1 = datetime.datetime(2016, 4, 7, 22, 0, 0)
+
+        client = self._create_client()
+        query = self._make_one(client, PROJECT, METRIC_TYPE)
+        query = query.select_interval(end_time=T1)
+        query = query.shard(duration=datetime.timedelta(hours=1))
+
+        self.assertEqual(query._shards(), [query])
+
+    def test_iteration_sharded(self):
+        T0 = datetime.datetime(2016, 4, 6, 22, 0, 0)
+        T1 = datetime.datetime(2016, 4, 6, 22, 2, 0)
+        T2 = datetime.datetime(2016, 4, 6, 22, 4, 0)
+        ZONES = [RESOURCE_LABELS["zone"], RESOURCE_LABELS2["zone"]]
+
+        def point(end_time, value):
+            return monitoring_v3.Point(
+                {
+                    "interval": self._make_interval(end_time),
+                    "value": {"double_value": value},
+                }
+            )
+
+        def list_time_series(request, **kwargs):
+            # One series per zone, with a point at each minute of the window.
+            end_time = request.interval.end_time.replace(tzinfo=None)
+            start_time = request.interval.start_time.replace(tzinfo=None)
+            minute = datetime.timedelta(minutes=1)
+            times = [end_time - minute * i for i in range(2)]
+            self.assertEqual(times[-1] - minute, start_time)
+            for zone, metric_labels, resource_labels in zip(
+                ZONES,
+                [METRIC_LABELS, METRIC_LABELS2],
+                [RESOURCE_LABELS, RESOURCE_LABELS2],
+            ):
+                if zone in request.filter:
+                    series = monitoring_v3.TimeSeries(
+                        {
+                            "metric": {"type": METRIC_TYPE, "labels": metric_labels},
+                            "resource": {
+                                "type": RESOURCE_TYPE,
+                                "labels": resource_labels,
+                            },
+                            "metric_kind": METRIC_KIND,
+                            "value_type": VALUE_TYPE,
+                            "points": [
+                                point(time, (time - T0).total_seconds())
+                                for time in times
+                            ],
+                        }
+                    )
+                    return monitoring_v3.ListTimeSeriesResponse(time_series=[series])
+
+        client = self._create_client()
+        query = self._make_one(client, PROJECT, METRIC_TYPE)
+        query = query.select_interval(start_time=T0, end_time=T2)
+        query = query.shard(
+            duration=datetime.timedelta(minutes=2),
+            resources=[{"zone": zone} for zone in ZONES],
+            max_workers=3,
+        )
+
+        with mock.patch.object(
+            type(client._transport.list_time_series), "__call__"
+        ) as call:
+            call.side_effect = list_time_series
+            response = list(query)
+
+        self.assertEqual(call.call_count, 4)
+        self.assertEqual(len(response), 2)
+        series1, series2 = response
+        self.assertEqual(series1.metric.labels, METRIC_LABELS)
+        self.assertEqual(series2.metric.labels, METRIC_LABELS2)
+        for series in response:
+            self.assertEqual(
+                [p.value.double_value for p in series.points],
+                [240.0, 180.0, 120.0, 60.0],
+            )
+
+    def _make_series(self, metric_labels, resource_labels, *values):
+        return monitoring_v3.TimeSeries(
+            {
+                "metric": {"type": METRIC_TYPE, "labels": metric_labels},
+                "resource": {"type": RESOURCE_TYPE, "labels": resource_labels},
+                "metric_kind": METRIC_KIND,
+                "value_type": VALUE_TYPE,
+                "points": [
+                    monitoring_v3.Point(
+                        {
+                            "interval": self._make_interval(end_time),
+                            "value": {"double_value": value},
+                        }
+                    )
+                    for end_time, value in zip([TS1, TS0], values)
+                ],
+            }
+        )
+
+    def test_iter_record_batches(self):
+        T0 = datetime.datetime(2016, 4, 6, 22, 5, 0)
+        T1 = datetime.datetime(2016, 4, 6, 22, 10, 0)
+
+        RESPONSES = [
+            monitoring_v3.ListTimeSeriesResponse(
+                time_series=[self._make_series(METRIC_LABELS, RESOURCE_LABELS, 1, 2)],
+                next_page_token="token",
+            ),
+            monitoring_v3.ListTimeSeriesResponse(
+                time_series=[self._make_series(METRIC_LABELS2, RESOURCE_LABELS2, 3)],
+            ),
+        ]
+
+        client = self._create_client()
+        query = self._make_one(client, PROJECT, METRIC_TYPE)
+        query = query.select_interval(start_time=T0, end_time=T1)
+
+        with mock.patch.object(
+            type(client._transport.list_time_series), "__call__"
+        ) as call:
+            call.side_effect = RESPONSES
+            batches = list(
+                query.iter_record_batches(labels=["instance_name"], page_size=2)
+            )
+
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(
+            [batch.column("instance_name").to_pylist() for batch in batches],
+            [["instance-1", "instance-1"], ["instance-2"]],
+        )
+        self.assertEqual(
+            [batch.column("value").to_pylist() for batch in batches],
+            [[1.0, 2.0], [3.0]],
+        )
+        request = call.call_args_list[1][0][0]
+        self.assertEqual(request.page_size, 2)
+        self.assertEqual(request.page_token, "token")
+
+    def test_as_arrow_sharded(self):
+        T0 = datetime.datetime(2016, 4, 6, 22, 0, 0)
+        T1 = datetime.datetime(2016, 4, 6, 22, 10, 0)
+
+        def list_time_series(request, **kwargs):
+            if RESOURCE_LABELS["zone"] in request.filter:
+                series = self._make_series(METRIC_LABELS, RESOURCE_LABELS, 1, 2)
+            else:
+                series = self._make_series(METRIC_LABELS2, RESOURCE_LABELS2, 3, 4)
+            return monitoring_v3.ListTimeSeriesResponse(time_series=[series])
+
+        client = self._create_client()
+        query = self._make_one(client, PROJECT, METRIC_TYPE)
+        query = query.select_interval(start_time=T0, end_time=T1)
+        query = query.shard(
+            resources=[
+                {"zone": RESOURCE_LABELS["zone"]},
+                {"zone": RESOURCE_LABELS2["zone"]},
+            ]
+        )
+
+        with mock.patch.object(
+            type(client._transport.list_time_series), "__call__"
+        ) as call:
+            call.side_effect = list_time_series
+            table = query.as_arrow()
+
+        self.assertEqual(call.call_count, 2)
+        self.assertEqual(
+            table.column_names,
+            [
+                "end_time",
+                "resource_type",
+                "project_id",
+                "zone",
+                "instance_id",
+                "instance_name",
+                "value",
+            ],
+        )
+        # The batches of the shards are in the order they arrived.
+        self.assertEqual(
+            sorted(
+                zip(table.column("value").to_pylist(), table.column("zone").to_pylist())
+            ),
+            [
+                (1.0, RESOURCE_LABELS["zone"]),
+                (2.0, RESOURCE_LABELS["zone"]),
+                (3.0, RESOURCE_LABELS2["zone"]),
+                (4.0, RESOURCE_LABELS2["zone"]),
+            ],
+        )
+
+    def _make_sharded_query(self, client):
+        T0 = datetime.datetime(2016, 4, 6, 22, 0, 0)
+        T1 = datetime.datetime(2016, 4, 6, 22, 10, 0)
+        query = self._make_one(client, PROJECT, METRIC_TYPE)
+        query = query.select_interval(start_time=T0, end_time=T1)
+        return query.shard(
+            resources=[
+                {"zone": RESOURCE_LABELS["zone"]},
+                {"zone": RESOURCE_LABELS2["zone"]},
+            ]
+        )
+
+    def test_iter_record_batches_sharded_streams(self):
+        release = threading.Event()
+
+        def list_time_series(request, **kwargs):
+            if RESOURCE_LABELS["zone"] in request.filter:
+                # This shard responds only once a batch of the other one
+                # has been yielded.
+                self.assertTrue(release.wait(5))
+                series = self._make_series(METRIC_LABELS, RESOURCE_LABELS, 1)
+            else:
+                series = self._make_series(METRIC_LABELS2, RESOURCE_LABELS2, 2)
+            return monitoring_v3.ListTimeSeriesResponse(time_series=[series])
+
+        client = self._create_client()
+        query = self._make_sharded_query(client)
+
+        with mock.patch.object(
+            type(client._transport.list_time_series), "__call__"
+        ) as call:
+            call.side_effect = list_time_series
+            batches = query.iter_record_batches()
+            first = next(batches)
+            release.set()
+            rest = list(batches)
+
+        self.assertEqual(first.column("value").to_pylist(), [2.0])
+        self.assertEqual([batch.column("value").to_pylist() for batch in rest], [[1.0]])
+
+    def test_iter_record_batches_sharded_error(self):
+        def list_time_series(request, **kwargs):
+            if RESOURCE_LABELS["zone"] in request.filter:
+                raise ValueError("shard failed")
+            series = self._make_series(METRIC_LABELS2, RESOURCE_LABELS2, 2)
+            return monitoring_v3.ListTimeSeriesResponse(time_series=[series])
+
+        client = self._create_client()
+        query = self._make_sharded_query(client)
+
+        with mock.patch.object(
+            type(client._transport.list_time_series), "__call__"
+        ) as call:
+            call.side_effect = list_time_series
+            with self.assertRaises(ValueError):
+                list(query.iter_record_batches())
+
+    def test_iter_record_batches_sharded_closed_early(self):
+        def list_time_series(request, **kwargs):
+            series = self._make_series(METRIC_LABELS, RESOURCE_LABELS, 1)
+            return monitoring_v3.ListTimeSeriesResponse(
+                time_series=[series], next_page_token="token"
+            )
+
+        client = self._create_client()
+        query = self._make_sharded_query(client)
+
+        with mock.patch.object(
+            type(client._transport.list_time_series), "__call__"
+        ) as call:
+            # Every shard has endless pages.
+            call.side_effect = list_time_series
+            batches = query.iter_record_batches()
+            next(batches)
+            batches.close()
+            call_count = call.call_count
+
+        # The workers stopped once the iterator was closed.
+        self.assertEqual(call.call_count, call_count)
+
 
 class Test_Filter(unittest.TestCase):
     @staticmethod
@@ -458,6 +810,19 @@ class Test_Filter(unittest.TestCase):
 
         self.assertEqual(str(obj), expected)
 
+    def test_shard_filter(self):
+        obj = self._make_one(METRIC_TYPE)
+        obj.select_resources(zone="us-east1-a")
+        obj.shard_filter = 'project = "project-1"'
+
+        expected = (
+            'metric.type = "{type}"'
+            ' AND resource.label.zone = "us-east1-a"'
+            ' AND project = "project-1"'
+        ).format(type=METRIC_TYPE)
+
+        self.assertEqual(str(obj), expected)
+
 
 class Test__build_label_filter(unittest.TestCase):
     def _call_fut(self, *args, **kwargs):
@@ -0,0 +1,457 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Client-side caches of the responses of ``access_secret_version``.
+
+:class:`SecretCache` and its asyncio counterpart :class:`AsyncSecretCache`
+answer repeated accesses of the same secret version, such as
+``.../versions/latest``, from memory, and refresh the cached payloads in
+the background so that callers rarely wait for a request.
+
+.. code-block:: python
+
+    from google.cloud import secretmanager_v1
+    from google.cloud.secretmanager_v1.secret_cache import SecretCache
+
+    client = secretmanager_v1.SecretManagerServiceClient()
+    with SecretCache(client) as cache:
+        response = cache.access_secret_version(
+            "projects/my-project/secrets/my-secret/versions/latest"
+        )
+        password = response.payload.data
+"""
+
+import asyncio
+import collections
+from concurrent import futures
+import functools
+import logging
+import threading
+import time
+from typing import Optional
+
+from google.api_core import exceptions as core_exceptions
+import google_crc32c
+
+from google.cloud.secretmanager_v1.types import service
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL = 300.0
+DEFAULT_EXPIRATION = 3600.0
+DEFAULT_MAX_REFRESHES = 4
+# The number of times to access a version whose checksum does not match.
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def _is_intact(response):
+    """Whether the payload of a response matches its checksum, if it has one."""
+    payload = service.AccessSecretVersionResponse.pb(response).payload
+    return (
+        not payload.HasField("data_crc32c")
+        or google_crc32c.value(payload.data) == payload.data_crc32c
+    )
+
+
+class _Entry(object):
+    """A cached response."""
+
+    __slots__ = ("response", "updated", "next_refresh", "refreshing")
+
+    def __init__(self, response, updated, next_refresh):
+        self.response = response
+        # The time.monotonic() at which the response was received.
+        self.updated = updated
+        # The time.monotonic() after which to refresh the response.
+        self.next_refresh = next_refresh
+        self.refreshing = False
+
+
+class _BaseSecretCache(object):
+    """The state and bookkeeping shared by the caches."""
+
+    def __init__(self, client, *, max_entries, ttl, expiration, max_attempts, timeout):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive.")
+        if ttl < 0:
+            raise ValueError("ttl must not be negative.")
+        if expiration < ttl:
+            raise ValueError("expiration must not be less than ttl.")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be positive.")
+
+        self._client = client
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._expiration = expiration
+        self._max_attempts = max_attempts
+        self._timeout = timeout
+
+        self._lock = threading.Lock()
+        # The entries by version name, least recently used first.
+        self._entries = collections.OrderedDict()
+        # The futures of the versions being accessed, by version name.
+        self._loading = {}
+        self._closed = False
+
+    def invalidate(self, name: str):
+        """Drop the cached response of a version, if there is one.
+
+        Args:
+            name (str): The name of the
+                :class:`~google.cloud.secretmanager_v1.types.SecretVersion`.
+        """
+        with self._lock:
+            self._entries.pop(name, None)
+
+    def clear(self):
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, name):
+        """Find the cached entry of a version.
+
+        Must be called with the lock held.
+
+        Returns:
+            Tuple[Optional[_Entry], bool]: The entry, or ``None`` if the
+            version is not cached or its response expired, and whether the
+            caller must refresh the entry.
+        """
+        now = time.monotonic()
+        entry = self._entries.get(name)
+        if entry is not None and now - entry.updated > self._expiration:
+            del self._entries[name]
+            entry = None
+        if entry is None:
+            return None, False
+        self._entries.move_to_end(name)
+        refresh = (
+            now >= entry.next_refresh and not entry.refreshing and not self._closed
+        )
+        if refresh:
+            entry.refreshing = True
+        return entry, refresh
+
+    def _store(self, name, response, replaced=None):
+        """Cache a response.
+
+        If ``replaced`` is given, the response is only cached if that entry
+        is still the cached one, so that a refresh does not undo
+        :meth:`invalidate`.
+        """
+        with self._lock:
+            if replaced is not None and self._entries.get(name) is not replaced:
+                return
+            now = time.monotonic()
+            self._entries[name] = _Entry(response, now, now + self._ttl)
+            self._entries.move_to_end(name)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _refresh_failed(self, entry):
+        _LOGGER.warning("Failed to refresh a cached secret version.", exc_info=True)
+        # Keep the cached response until it expires, and wait for the ttl
+        # before trying again.
+        with self._lock:
+            entry.refreshing = False
+            entry.next_refresh = time.monotonic() + self._ttl
+
+    def _check(self, name, response, attempt):
+        """Whether a response can be cached, or another attempt must be made.
+
+        Raises:
+            google.api_core.exceptions.DataLoss: If the payload is corrupt
+                and this was the last attempt.
+        """
+        if _is_intact(response):
+            return True
+        if attempt + 1 < self._max_attempts:
+            return False
+        raise core_exceptions.DataLoss(
+            "The payload of {} was corrupted in transit.".format(name)
+        )
+
+
+class SecretCache(_BaseSecretCache):
+    """Caches the responses of ``access_secret_version`` by version name.
+
+    A response is returned from the cache for up to ``ttl`` seconds after it
+    is received. After that, the cached response is still returned, but a
+    request is sent in the background to refresh it, so that a version
+    alias such as ``latest`` follows the secret. After ``expiration``
+    seconds without a successful refresh, the response is dropped and the
+    next access waits for a request.
+
+    Concurrent accesses of a version which is not cached wait for a single
+    request. Payloads are checked against their CRC32C checksum, and a
+    corrupt payload is requested again up to ``max_attempts`` times.
+
+    Args:
+        client (google.cloud.secretmanager_v1.SecretManagerServiceClient):
+            The client used to access secret versions.
+        max_entries (int): The maximum number of cached responses. The least
+            recently used response is dropped to make room for another.
+        ttl (float): The number of seconds after which a cached response is
+            refreshed.
+        expiration (float): The number of seconds after which a response
+            which could not be refreshed is dropped.
+        max_refreshes (int): The maximum number of concurrent refreshes.
+        max_attempts (int): The number of times to access a version whose
+            checksum does not match before giving up.
+        timeout (Optional[float]): The timeout of each request.
+
+    Raises:
+        ValueError: If an option is out of range.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        expiration: float = DEFAULT_EXPIRATION,
+        max_refreshes: int = DEFAULT_MAX_REFRESHES,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        timeout: Optional[float] = None,
+    ):
+        if max_refreshes < 1:
+            raise ValueError("max_refreshes must be positive.")
+        super(SecretCache, self).__init__(
+            client,
+            max_entries=max_entries,
+            ttl=ttl,
+            expiration=expiration,
+            max_attempts=max_attempts,
+            timeout=timeout,
+        )
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_refreshes, thread_name_prefix="secretmanager-secret-cache"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def access_secret_version(self, name: str) -> service.AccessSecretVersionResponse:
+        """Access a secret version, using a cached response if there is one.
+
+        Args:
+            name (str): The name of the
+                :class:`~google.cloud.secretmanager_v1.types.SecretVersion`,
+                such as ``projects/*/secrets/*/versions/latest``.
+
+        Returns:
+            google.cloud.secretmanager_v1.types.AccessSecretVersionResponse:
+                The response.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If a request made
+                for an access which missed the cache fails.
+            google.api_core.exceptions.DataLoss: If the checksum of the
+                payload does not match in any of ``max_attempts`` responses.
+        """
+        with self._lock:
+            entry, refresh = self._lookup(name)
+            if entry is not None:
+                if refresh:
+                    self._executor.submit(self._refresh, name, entry)
+                return entry.response
+            future = self._loading.get(name)
+            if future is None:
+                future = self._loading[name] = futures.Future()
+                loading = True
+            else:
+                loading = False
+        if not loading:
+            return future.result()
+
+        try:
+            response = self._fetch(name)
+        except BaseException as exception:
+            with self._lock:
+                del self._loading[name]
+            future.set_exception(exception)
+            raise
+        self._store(name, response)
+        with self._lock:
+            del self._loading[name]
+        future.set_result(response)
+        return response
+
+    def close(self):
+        """Wait for the refreshes in progress, and stop refreshing.
+
+        Cached responses are still returned until they expire.
+        """
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True)
+
+    def _fetch(self, name):
+        for attempt in range(self._max_attempts):
+            if self._timeout is None:
+                response = self._client.access_secret_version(name=name)
+            else:
+                response = self._client.access_secret_version(
+                    name=name, timeout=self._timeout
+                )
+            if self._check(name, response, attempt):
+                return response
+
+    def _refresh(self, name, entry):
+        try:
+            response = self._fetch(name)
+        except Exception:
+            self._refresh_failed(entry)
+            return
+        self._store(name, response, replaced=entry)
+
+
+class AsyncSecretCache(_BaseSecretCache):
+    """Caches the responses of ``access_secret_version`` for asyncio.
+
+    The asyncio counterpart of :class:`SecretCache`, with the same
+    behavior. Refreshes run as tasks on the event loop of the access which
+    starts them. A cache must only be used from one event loop.
+
+    Args:
+        client (google.cloud.secretmanager_v1.SecretManagerServiceAsyncClient):
+            The client used to access secret versions.
+        max_entries (int): The maximum number of cached responses. The least
+            recently used response is dropped to make room for another.
+        ttl (float): The number of seconds after which a cached response is
+            refreshed.
+        expiration (float): The number of seconds after which a response
+            which could not be refreshed is dropped.
+        max_attempts (int): The number of times to access a version whose
+            checksum does not match before giving up.
+        timeout (Optional[float]): The timeout of each request.
+
+    Raises:
+        ValueError: If an option is out of range.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        expiration: float = DEFAULT_EXPIRATION,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        timeout: Optional[float] = None,
+    ):
+        super(AsyncSecretCache, self).__init__(
+            client,
+            max_entries=max_entries,
+            ttl=ttl,
+            expiration=expiration,
+            max_attempts=max_attempts,
+            timeout=timeout,
+        )
+        # The refresh tasks in progress.
+        self._refreshes = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def access_secret_version(
+        self, name: str
+    ) -> service.AccessSecretVersionResponse:
+        """Access a secret version, using a cached response if there is one.
+
+        Args:
+            name (str): The name of the
+                :class:`~google.cloud.secretmanager_v1.types.SecretVersion`,
+                such as ``projects/*/secrets/*/versions/latest``.
+
+        Returns:
+            google.cloud.secretmanager_v1.types.AccessSecretVersionResponse:
+                The response.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If a request made
+                for an access which missed the cache fails.
+            google.api_core.exceptions.DataLoss: If the checksum of the
+                payload does not match in any of ``max_attempts`` responses.
+        """
+        with self._lock:
+            entry, refresh = self._lookup(name)
+            if entry is None:
+                task = self._loading.get(name)
+                if task is None:
+                    task = self._loading[name] = asyncio.ensure_future(self._load(name))
+                    task.add_done_callback(functools.partial(self._loaded, name))
+        if entry is not None:
+            if refresh:
+                task = asyncio.ensure_future(self._refresh(name, entry))
+                self._refreshes.add(task)
+                task.add_done_callback(self._refreshes.discard)
+            return entry.response
+        # Shield the request, which other accesses may be waiting for, from
+        # the cancellation of this one.
+        return await asyncio.shield(task)
+
+    async def close(self):
+        """Wait for the refreshes in progress, and stop refreshing.
+
+        Cached responses are still returned until they expire.
+        """
+        with self._lock:
+            self._closed = True
+        if self._refreshes:
+            await asyncio.gather(*self._refreshes, return_exceptions=True)
+
+    async def _fetch(self, name):
+        for attempt in range(self._max_attempts):
+            if self._timeout is None:
+                response = await self._client.access_secret_version(name=name)
+            else:
+                response = await self._client.access_secret_version(
+                    name=name, timeout=self._timeout
+                )
+            if self._check(name, response, attempt):
+                return response
+
+    async def _load(self, name):
+        response = await self._fetch(name)
+        self._store(name, response)
+        return response
+
+    def _loaded(self, name, task):
+        with self._lock:
+            if self._loading.get(name) is task:
+                del self._loading[name]
+        # Mark the exception as retrieved, in case every waiter was
+        # cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    async def _refresh(self, name, entry):
+        try:
+            response = await self._fetch(name)
+        except Exception:
+            self._refresh_failed(entry)
+            return
+        self._store(name, response, replaced=entry)
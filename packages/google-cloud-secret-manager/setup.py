@@ -46,6 +46,7 @@ dependencies = [
     "proto-plus >= 1.22.3, <2.0.0dev",
     "protobuf>=3.19.5,<5.0.0dev,!=3.20.0,!=3.20.1,!=4.21.0,!=4.21.1,!=4.21.2,!=4.21.3,!=4.21.4,!=4.21.5",
     "grpc-google-iam-v1 >= 0.12.4, <1.0.0dev",
+    "google-crc32c >= 1.0.0, <2.0.0dev",
 ]
 url = "https://github.com/googleapis/google-cloud-python/tree/main/packages/google-cloud-secret-manager"
 
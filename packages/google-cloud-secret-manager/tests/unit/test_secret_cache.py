@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import threading
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+import google_crc32c
+import pytest
+
+from google.cloud import secretmanager_v1
+from google.cloud.secretmanager_v1.secret_cache import AsyncSecretCache, SecretCache
+
+NAME = "projects/p/secrets/s/versions/latest"
+
+
+def make_response(data, version=1, crc32c=None):
+    if crc32c is None:
+        crc32c = google_crc32c.value(data)
+    return secretmanager_v1.AccessSecretVersionResponse(
+        name="projects/p/secrets/s/versions/{}".format(version),
+        payload=secretmanager_v1.SecretPayload(data=data, data_crc32c=crc32c),
+    )
+
+
+def make_client(*responses):
+    client = mock.Mock(spec=["access_secret_version"])
+    client.access_secret_version.side_effect = list(responses)
+    return client
+
+
+def make_async_client(*responses):
+    client = mock.Mock(spec=["access_secret_version"])
+    client.access_secret_version = mock.AsyncMock(side_effect=list(responses))
+    return client
+
+
+def test_constructor_invalid_options():
+    client = make_client()
+    with pytest.raises(ValueError):
+        SecretCache(client, max_entries=0)
+    with pytest.raises(ValueError):
+        SecretCache(client, ttl=-1)
+    with pytest.raises(ValueError):
+        SecretCache(client, ttl=10, expiration=5)
+    with pytest.raises(ValueError):
+        SecretCache(client, max_refreshes=0)
+    with pytest.raises(ValueError):
+        AsyncSecretCache(client, max_attempts=0)
+
+
+def test_access_hit():
+    client = make_client(make_response(b"secret"))
+    with SecretCache(client, timeout=5.0) as cache:
+        first = cache.access_secret_version(NAME)
+        second = cache.access_secret_version(NAME)
+
+    assert first.payload.data == b"secret"
+    assert second is first
+    client.access_secret_version.assert_called_once_with(name=NAME, timeout=5.0)
+
+
+def test_stale_while_revalidate():
+    client = make_client(make_response(b"old", 1), make_response(b"new", 2))
+    with mock.patch("time.monotonic", return_value=100.0):
+        cache = SecretCache(client, ttl=10.0, expiration=60.0)
+        cache.access_secret_version(NAME)
+
+    with mock.patch("time.monotonic", return_value=111.0):
+        assert cache.access_secret_version(NAME).payload.data == b"old"
+        cache.close()
+        assert cache.access_secret_version(NAME).payload.data == b"new"
+    assert client.access_secret_version.call_count == 2
+
+
+def test_failed_refresh_keeps_response_until_expiration():
+    client = make_client(
+        make_response(b"old"),
+        core_exceptions.ServiceUnavailable("down"),
+        make_response(b"new"),
+    )
+    with mock.patch("time.monotonic", return_value=100.0):
+        cache = SecretCache(client, ttl=10.0, expiration=60.0)
+        cache.access_secret_version(NAME)
+    with mock.patch("time.monotonic", return_value=111.0):
+        assert cache.access_secret_version(NAME).payload.data == b"old"
+        cache.close()
+        # The next refresh waits for the ttl.
+        assert cache.access_secret_version(NAME).payload.data == b"old"
+    with mock.patch("time.monotonic", return_value=161.0):
+        assert cache.access_secret_version(NAME).payload.data == b"new"
+    assert client.access_secret_version.call_count == 3
+
+
+def test_invalidate_and_clear():
+    client = make_client(make_response(b"a"), make_response(b"b"), make_response(b"c"))
+    cache = SecretCache(client)
+    cache.access_secret_version(NAME)
+    cache.invalidate(NAME)
+    assert cache.access_secret_version(NAME).payload.data == b"b"
+    cache.clear()
+    assert cache.access_secret_version(NAME).payload.data == b"c"
+
+
+def test_max_entries():
+    client = mock.Mock(spec=["access_secret_version"])
+    client.access_secret_version.side_effect = lambda name: make_response(
+        name.encode("ascii")
+    )
+    cache = SecretCache(client, max_entries=2)
+    for name in ["a", "b", "a", "c", "a", "b"]:
+        assert cache.access_secret_version(name).payload.data == name.encode("ascii")
+    # "b" was dropped for "c", as "a" was used more recently.
+    assert client.access_secret_version.call_count == 4
+
+
+def test_checksum_mismatch_retries():
+    client = make_client(make_response(b"secret", crc32c=1), make_response(b"secret"))
+    cache = SecretCache(client)
+    assert cache.access_secret_version(NAME).payload.data == b"secret"
+    assert client.access_secret_version.call_count == 2
+
+
+def test_checksum_mismatch_raises():
+    client = make_client(*[make_response(b"secret", crc32c=1)] * 2)
+    cache = SecretCache(client, max_attempts=2)
+    with pytest.raises(core_exceptions.DataLoss):
+        cache.access_secret_version(NAME)
+
+
+def test_response_without_checksum():
+    response = secretmanager_v1.AccessSecretVersionResponse(
+        payload=secretmanager_v1.SecretPayload(data=b"secret")
+    )
+    cache = SecretCache(make_client(response))
+    assert cache.access_secret_version(NAME).payload.data == b"secret"
+
+
+def test_concurrent_misses_share_a_request():
+    started = threading.Event()
+    release = threading.Event()
+
+    def access(name):
+        started.set()
+        release.wait()
+        return make_response(b"secret")
+
+    client = mock.Mock(spec=["access_secret_version"])
+    client.access_secret_version.side_effect = access
+    cache = SecretCache(client)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.access_secret_version(NAME))
+        )
+        for _ in range(4)
+    ]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 4
+    assert client.access_secret_version.call_count == 1
+
+
+def test_failed_access_is_not_cached():
+    client = make_client(core_exceptions.PermissionDenied("denied"))
+    cache = SecretCache(client)
+    with pytest.raises(core_exceptions.PermissionDenied):
+        cache.access_secret_version(NAME)
+    assert not cache._loading
+
+
+@pytest.mark.asyncio
+async def test_async_access_hit_and_refresh():
+    client = make_async_client(make_response(b"old", 1), make_response(b"new", 2))
+    with mock.patch("time.monotonic", return_value=100.0):
+        cache = AsyncSecretCache(client, ttl=10.0, expiration=60.0)
+        assert (await cache.access_secret_version(NAME)).payload.data == b"old"
+        assert (await cache.access_secret_version(NAME)).payload.data == b"old"
+    with mock.patch("time.monotonic", return_value=111.0):
+        assert (await cache.access_secret_version(NAME)).payload.data == b"old"
+        await cache.close()
+        assert (await cache.access_secret_version(NAME)).payload.data == b"new"
+    assert client.access_secret_version.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_misses_share_a_request():
+    release = asyncio.Event()
+
+    async def access(name, **kwargs):
+        await release.wait()
+        return make_response(b"secret")
+
+    client = mock.Mock(spec=["access_secret_version"])
+    client.access_secret_version = mock.AsyncMock(side_effect=access)
+    async with AsyncSecretCache(client, timeout=5.0) as cache:
+        accesses = [
+            asyncio.ensure_future(cache.access_secret_version(NAME)) for _ in range(4)
+        ]
+        await asyncio.sleep(0)
+        # Cancelling one access does not cancel the shared request.
+        accesses[0].cancel()
+        release.set()
+        results = await asyncio.gather(*accesses[1:])
+
+    assert all(result.payload.data == b"secret" for result in results)
+    client.access_secret_version.assert_awaited_once_with(name=NAME, timeout=5.0)
+    assert not cache._loading
+
+
+@pytest.mark.asyncio
+async def test_async_checksum_mismatch_raises():
+    client = make_async_client(*[make_response(b"secret", crc32c=1)] * 3)
+    cache = AsyncSecretCache(client)
+    with pytest.raises(core_exceptions.DataLoss):
+        await cache.access_secret_version(NAME)
+    assert client.access_secret_version.await_count == 3
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A client-side cache of the responses of ``check``.
+
+:class:`CheckCache` answers repeated checks of the same operation from
+memory, so that a server calling ``check`` on every request sends one
+request per operation signature and refresh interval rather than one per
+call.
+
+.. code-block:: python
+
+    from google.cloud import servicecontrol_v1
+    from google.cloud.servicecontrol_v1.check_cache import CheckCache
+
+    client = servicecontrol_v1.ServiceControllerClient()
+    with CheckCache(client) as cache:
+        response = cache.check(request)
+"""
+
+import collections
+from concurrent import futures
+import hashlib
+import logging
+import threading
+import time
+from typing import NamedTuple, Optional, Union
+
+from google.cloud.servicecontrol_v1.types import check_error, service_controller
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_REFRESH_INTERVAL = 1.0
+DEFAULT_EXPIRATION = 60.0
+DEFAULT_MAX_REFRESHES = 4
+
+# Errors which say that the server could not check the operation, rather
+# than that the operation is not allowed. Responses with only these errors
+# are not cached.
+_TRANSIENT_CODES = frozenset(
+    [
+        check_error.CheckError.Code.NAMESPACE_LOOKUP_UNAVAILABLE,
+        check_error.CheckError.Code.SERVICE_STATUS_UNAVAILABLE,
+        check_error.CheckError.Code.BILLING_STATUS_UNAVAILABLE,
+        check_error.CheckError.Code.CLOUD_RESOURCE_MANAGER_BACKEND_UNAVAILABLE,
+    ]
+)
+
+
+class CacheStats(NamedTuple):
+    """Counts of the checks made through a :class:`CheckCache`."""
+
+    hits: int
+    """Checks answered from the cache."""
+    misses: int
+    """Checks which waited for a request."""
+    refreshes: int
+    """Requests sent in the background to refresh a cached response."""
+
+
+def _signature(request):
+    """Compute the signature of a check request.
+
+    Requests with the same signature get the same response: the signature
+    covers the service, the consumer, the operation name, its labels and
+    its metric values, but not the ID, times or log entries of the
+    operation.
+
+    Args:
+        request: The ``CheckRequest`` protobuf message.
+
+    Returns:
+        bytes: The signature.
+    """
+    operation = type(request.operation)()
+    operation.CopyFrom(request.operation)
+    for field in ("operation_id", "start_time", "end_time", "log_entries"):
+        operation.ClearField(field)
+    for metric_value_set in operation.metric_value_sets:
+        for metric_value in metric_value_set.metric_values:
+            metric_value.ClearField("start_time")
+            metric_value.ClearField("end_time")
+
+    digest = hashlib.sha256()
+    digest.update(request.service_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(request.service_config_id.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(operation.SerializeToString(deterministic=True))
+    return digest.digest()
+
+
+def _is_cacheable(response):
+    """Whether a check response holds for other identical operations."""
+    return not response.check_errors or any(
+        error.code not in _TRANSIENT_CODES for error in response.check_errors
+    )
+
+
+class _Entry(object):
+    """A cached check response."""
+
+    __slots__ = ("response", "updated", "next_refresh", "refreshing")
+
+    def __init__(self, response, updated, next_refresh):
+        self.response = response
+        # The time.monotonic() at which the response was received.
+        self.updated = updated
+        # The time.monotonic() after which to refresh the response.
+        self.next_refresh = next_refresh
+        self.refreshing = False
+
+
+class CheckCache(object):
+    """Caches the responses of ``check`` by operation signature.
+
+    A response is returned from the cache for up to ``refresh_interval``
+    seconds after it is received. After that, the cached response is still
+    returned, but a request is sent in the background to refresh it. After
+    ``expiration`` seconds without a successful refresh, as when the
+    operation is no longer checked, the response is dropped and the next
+    check waits for a request.
+
+    Concurrent checks of a signature which is not cached wait for a single
+    request.
+
+    Responses which deny an operation are cached like those which allow it.
+    Responses whose errors only say that the server could not check the
+    operation, such as ``SERVICE_STATUS_UNAVAILABLE``, are not cached; when
+    a refresh gets one, the cached response is kept, as when the refresh
+    fails.
+
+    Cached responses are those of an earlier operation with the same
+    signature, so their ``operation_id`` is that of the earlier operation.
+
+    Args:
+        client (google.cloud.servicecontrol_v1.ServiceControllerClient): The
+            client used to check operations.
+        max_entries (int): The maximum number of cached responses. The least
+            recently used response is dropped to make room for another.
+        refresh_interval (float): The number of seconds after which a cached
+            response is refreshed.
+        expiration (float): The number of seconds after which a response
+            which could not be refreshed is dropped.
+        max_refreshes (int): The maximum number of concurrent refreshes.
+        timeout (Optional[float]): The timeout of each request.
+
+    Raises:
+        ValueError: If an option is out of range.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        expiration: float = DEFAULT_EXPIRATION,
+        max_refreshes: int = DEFAULT_MAX_REFRESHES,
+        timeout: Optional[float] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive.")
+        if refresh_interval < 0:
+            raise ValueError("refresh_interval must not be negative.")
+        if expiration < refresh_interval:
+            raise ValueError("expiration must not be less than refresh_interval.")
+        if max_refreshes < 1:
+            raise ValueError("max_refreshes must be positive.")
+
+        self._client = client
+        self._max_entries = max_entries
+        self._refresh_interval = refresh_interval
+        self._expiration = expiration
+        self._timeout = timeout
+
+        self._lock = threading.Lock()
+        # The entries by signature, least recently used first.
+        self._entries = collections.OrderedDict()
+        # The futures of the checks being sent for a miss, by signature.
+        self._loading = {}
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._closed = False
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_refreshes, thread_name_prefix="servicecontrol-check-cache"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def stats(self) -> CacheStats:
+        """CacheStats: The number of hits, misses and refreshes."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._refreshes)
+
+    def check(
+        self, request: Union[service_controller.CheckRequest, dict]
+    ) -> service_controller.CheckResponse:
+        """Check an operation, using a cached response if there is one.
+
+        Args:
+            request (Union[google.cloud.servicecontrol_v1.types.CheckRequest, dict]):
+                The request object.
+
+        Returns:
+            google.cloud.servicecontrol_v1.types.CheckResponse: The response.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If a request made
+                for a check which missed the cache fails.
+        """
+        if not isinstance(request, service_controller.CheckRequest):
+            request = service_controller.CheckRequest(request)
+        signature = _signature(service_controller.CheckRequest.pb(request))
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(signature)
+            if entry is not None and now - entry.updated > self._expiration:
+                del self._entries[signature]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(signature)
+                self._hits += 1
+                if (
+                    now >= entry.next_refresh
+                    and not entry.refreshing
+                    and not self._closed
+                ):
+                    entry.refreshing = True
+                    self._refreshes += 1
+                    self._executor.submit(self._refresh, signature, entry, request)
+                return entry.response
+            self._misses += 1
+            future = self._loading.get(signature)
+            if future is None:
+                future = self._loading[signature] = futures.Future()
+                loading = True
+            else:
+                loading = False
+        if not loading:
+            return future.result()
+
+        try:
+            response = self._check(request)
+        except BaseException as exception:
+            with self._lock:
+                del self._loading[signature]
+            future.set_exception(exception)
+            raise
+        self._store(signature, response)
+        with self._lock:
+            del self._loading[signature]
+        future.set_result(response)
+        return response
+
+    def clear(self):
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def close(self):
+        """Wait for the refreshes in progress, and stop refreshing.
+
+        Cached responses are still returned until they expire.
+        """
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True)
+
+    def _check(self, request):
+        if self._timeout is None:
+            return self._client.check(request=request)
+        return self._client.check(request=request, timeout=self._timeout)
+
+    def _store(self, signature, response, replaced=None):
+        """Cache a response.
+
+        If ``replaced`` is given, the response refreshes that entry: it is
+        only cached if the entry is still the cached one, and a response
+        which cannot be cached leaves the entry in place.
+        """
+        with self._lock:
+            if replaced is not None:
+                if self._entries.get(signature) is not replaced:
+                    return
+                if not _is_cacheable(response):
+                    self._retry_refresh(replaced)
+                    return
+            elif not _is_cacheable(response):
+                self._entries.pop(signature, None)
+                return
+            now = time.monotonic()
+            self._entries[signature] = _Entry(
+                response, now, now + self._refresh_interval
+            )
+            self._entries.move_to_end(signature)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _refresh(self, signature, entry, request):
+        try:
+            response = self._check(request)
+        except Exception:
+            _LOGGER.warning("Failed to refresh a cached check response.", exc_info=True)
+            with self._lock:
+                self._retry_refresh(entry)
+            return
+        self._store(signature, response, replaced=entry)
+
+    def _retry_refresh(self, entry):
+        """Keep a cached response which could not be refreshed until it
+        expires, and wait for the refresh interval before trying again.
+
+        Must be called with the lock held.
+        """
+        entry.refreshing = False
+        entry.next_refresh = time.monotonic() + self._refresh_interval
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Client-side aggregation of the operations sent with ``report``.
+
+:class:`ReportAggregator` merges the operations reported over a flush
+interval which have the same consumer, name and labels into a single
+operation, whose metric values are the sum of theirs, and reports the
+merged operations from a background thread.
+
+.. code-block:: python
+
+    from google.cloud import servicecontrol_v1
+    from google.cloud.servicecontrol_v1.report_aggregator import ReportAggregator
+
+    client = servicecontrol_v1.ServiceControllerClient()
+    with ReportAggregator(client) as aggregator:
+        aggregator.report(request)
+"""
+
+import collections
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Iterable, Optional, Union
+
+from google.cloud.servicecontrol_v1.types import operation as gas_operation
+from google.cloud.servicecontrol_v1.types import service_controller
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+# Report requests are limited to 1 MB, so send few enough operations that
+# requests are unlikely to exceed it.
+DEFAULT_MAX_OPERATIONS = 1000
+
+
+def _timestamp_key(timestamp):
+    return timestamp.seconds, timestamp.nanos
+
+
+def _merge_times(target, source):
+    """Widen the start and end times of a message to cover another's."""
+    if source.HasField("start_time") and (
+        not target.HasField("start_time")
+        or _timestamp_key(source.start_time) < _timestamp_key(target.start_time)
+    ):
+        target.start_time.CopyFrom(source.start_time)
+    if source.HasField("end_time") and (
+        not target.HasField("end_time")
+        or _timestamp_key(source.end_time) > _timestamp_key(target.end_time)
+    ):
+        target.end_time.CopyFrom(source.end_time)
+
+
+def _merge_distribution(target, source):
+    """Add the values of a ``Distribution`` to another.
+
+    Raises:
+        ValueError: If the distributions have different buckets.
+    """
+    if not target.count:
+        target.CopyFrom(source)
+        return
+    if not source.count:
+        return
+    option = target.WhichOneof("bucket_option")
+    if (
+        option != source.WhichOneof("bucket_option")
+        or (option and getattr(target, option) != getattr(source, option))
+        or len(target.bucket_counts) != len(source.bucket_counts)
+    ):
+        raise ValueError("Cannot merge distributions with different buckets.")
+
+    count = target.count + source.count
+    delta = source.mean - target.mean
+    # Combine the sums of squared deviations with Chan's formula.
+    target.sum_of_squared_deviation += (
+        source.sum_of_squared_deviation
+        + delta * delta * target.count * source.count / count
+    )
+    target.mean += delta * source.count / count
+    target.minimum = min(target.minimum, source.minimum)
+    target.maximum = max(target.maximum, source.maximum)
+    target.count = count
+    for index, bucket_count in enumerate(source.bucket_counts):
+        target.bucket_counts[index] += bucket_count
+    if source.exemplars:
+        # Exemplars must be in increasing order of value.
+        exemplars = []
+        for exemplar in itertools.chain(target.exemplars, source.exemplars):
+            copy = type(exemplar)()
+            copy.CopyFrom(exemplar)
+            exemplars.append(copy)
+        exemplars.sort(key=lambda exemplar: exemplar.value)
+        del target.exemplars[:]
+        target.exemplars.extend(exemplars)
+
+
+def _merge_metric_value(target, source, delta):
+    """Merge a ``MetricValue`` into another with the same labels.
+
+    Delta values are added; other values, and values which cannot be added,
+    are replaced by the later one.
+
+    Raises:
+        ValueError: If the values are of different types.
+    """
+    kind = source.WhichOneof("value")
+    if kind != target.WhichOneof("value"):
+        raise ValueError(
+            "Cannot merge {} and {} metric values.".format(
+                target.WhichOneof("value"), kind
+            )
+        )
+    if not delta or kind in ("bool_value", "string_value"):
+        if _timestamp_key(source.end_time) >= _timestamp_key(target.end_time):
+            target.CopyFrom(source)
+        return
+
+    _merge_times(target, source)
+    if kind == "int64_value":
+        target.int64_value += source.int64_value
+    elif kind == "double_value":
+        target.double_value += source.double_value
+    elif kind == "distribution_value":
+        _merge_distribution(target.distribution_value, source.distribution_value)
+
+
+def _labels_key(message):
+    return tuple(sorted(message.labels.items()))
+
+
+def _merge_operation(target, source, non_delta_metrics):
+    """Merge an ``Operation`` into another with the same signature."""
+    _merge_times(target, source)
+    target.log_entries.extend(source.log_entries)
+
+    metric_value_sets = {
+        metric_value_set.metric_name: metric_value_set
+        for metric_value_set in target.metric_value_sets
+    }
+    for source_set in source.metric_value_sets:
+        target_set = metric_value_sets.get(source_set.metric_name)
+        if target_set is None:
+            target_set = target.metric_value_sets.add()
+            target_set.CopyFrom(source_set)
+            metric_value_sets[source_set.metric_name] = target_set
+            continue
+
+        delta = source_set.metric_name not in non_delta_metrics
+        metric_values = {
+            _labels_key(metric_value): metric_value
+            for metric_value in target_set.metric_values
+        }
+        for source_value in source_set.metric_values:
+            target_value = metric_values.get(_labels_key(source_value))
+            if target_value is None:
+                target_value = target_set.metric_values.add()
+                target_value.CopyFrom(source_value)
+                metric_values[_labels_key(source_value)] = target_value
+            else:
+                _merge_metric_value(target_value, source_value, delta)
+
+
+def _operation_signature(operation):
+    return (operation.consumer_id, operation.operation_name, _labels_key(operation))
+
+
+class ReportAggregator(object):
+    """Merges reported operations and reports them periodically.
+
+    Operations with ``LOW`` importance, the default, are merged with the
+    pending operations of the same service, consumer, name and labels, and
+    reported within ``flush_interval`` seconds, in requests of up to
+    ``max_operations`` operations. Merged operations span the times of the
+    operations they merge, and keep their log entries. The metric values
+    with the same labels are added, including the counts, statistics and
+    buckets of distributions, except those of the metrics named in
+    ``non_delta_metrics``, of which only the latest value is kept.
+
+    Operations with ``HIGH`` importance are reported at once.
+
+    Failed requests, and operations rejected by the server, are passed to
+    ``on_error``; by default they are logged and dropped.
+
+    Args:
+        client (google.cloud.servicecontrol_v1.ServiceControllerClient): The
+            client used to report operations.
+        flush_interval (float): The maximum number of seconds an operation
+            is held before it is reported.
+        max_operations (int): The maximum number of operations in a request.
+        non_delta_metrics (Iterable[str]): The names of the metrics whose
+            values are not deltas, such as gauges.
+        timeout (Optional[float]): The timeout of each request.
+        on_error (Callable[[Exception, google.cloud.servicecontrol_v1.types.ReportRequest], None]):
+            Called from a background thread with the exception and the
+            request of each request which fails. Rejected operations are
+            passed as a ``ValueError`` with the request.
+
+    Raises:
+        ValueError: If an option is out of range.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_operations: int = DEFAULT_MAX_OPERATIONS,
+        non_delta_metrics: Iterable[str] = (),
+        timeout: Optional[float] = None,
+        on_error: Optional[Callable] = None,
+    ):
+        if flush_interval < 0:
+            raise ValueError("flush_interval must not be negative.")
+        if max_operations < 1:
+            raise ValueError("max_operations must be positive.")
+
+        self._client = client
+        self._flush_interval = flush_interval
+        self._max_operations = max_operations
+        self._non_delta_metrics = frozenset(non_delta_metrics)
+        self._timeout = timeout
+        self._on_error = on_error
+
+        self._condition = threading.Condition()
+        # The pending operations of each (service name, service config ID),
+        # by signature.
+        self._pending = collections.defaultdict(dict)
+        self._full = False
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="servicecontrol-report-aggregator", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def report(self, request: Union[service_controller.ReportRequest, dict]):
+        """Merge the operations of a request with the pending operations.
+
+        Args:
+            request (Union[google.cloud.servicecontrol_v1.types.ReportRequest, dict]):
+                The request object.
+
+        Raises:
+            RuntimeError: If the aggregator is closed.
+            ValueError: If a metric value cannot be merged with the pending
+                value with the same labels.
+            google.api_core.exceptions.GoogleAPICallError: If reporting an
+                operation with ``HIGH`` importance fails.
+        """
+        if not isinstance(request, service_controller.ReportRequest):
+            request = service_controller.ReportRequest(request)
+        request_pb = service_controller.ReportRequest.pb(request)
+        key = (request_pb.service_name, request_pb.service_config_id)
+
+        important = []
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot report to a closed ReportAggregator.")
+            pending = self._pending[key]
+            for operation in request_pb.operations:
+                if operation.importance == gas_operation.Operation.Importance.HIGH:
+                    important.append(operation)
+                    continue
+                signature = _operation_signature(operation)
+                merged = pending.get(signature)
+                if merged is None:
+                    merged = pending[signature] = type(operation)()
+                    merged.CopyFrom(operation)
+                else:
+                    _merge_operation(merged, operation, self._non_delta_metrics)
+            if len(pending) >= self._max_operations and not self._full:
+                self._full = True
+                self._condition.notify_all()
+
+        if important:
+            request = service_controller.ReportRequest(
+                service_name=key[0], service_config_id=key[1]
+            )
+            service_controller.ReportRequest.pb(request).operations.extend(important)
+            self._send(request, raise_errors=True)
+
+    def flush(self):
+        """Report every pending operation, and wait for the requests."""
+        for request in self._take_requests():
+            self._send(request)
+
+    def close(self):
+        """Report every pending operation and stop the aggregator.
+
+        Calling :meth:`report` after this raises an error. Calling
+        :meth:`close` more than once is allowed.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self.flush()
+
+    def _take_requests(self):
+        """Take the pending operations, in requests of max_operations."""
+        with self._condition:
+            pending, self._pending = self._pending, collections.defaultdict(dict)
+            self._full = False
+
+        requests = []
+        for (service_name, service_config_id), operations in pending.items():
+            operations = list(operations.values())
+            for start in range(0, len(operations), self._max_operations):
+                request = service_controller.ReportRequest(
+                    service_name=service_name, service_config_id=service_config_id
+                )
+                service_controller.ReportRequest.pb(request).operations.extend(
+                    operations[start : start + self._max_operations]
+                )
+                requests.append(request)
+        return requests
+
+    def _send(self, request, raise_errors=False):
+        try:
+            if self._timeout is None:
+                response = self._client.report(request=request)
+            else:
+                response = self._client.report(request=request, timeout=self._timeout)
+        except Exception as exception:
+            if raise_errors:
+                raise
+            self._handle_error(exception, request)
+            return
+
+        if response.report_errors:
+            exception = ValueError(
+                "{} of {} operations were rejected: {}".format(
+                    len(response.report_errors),
+                    len(request.operations),
+                    "; ".join(
+                        "{}: {}".format(error.operation_id, error.status.message)
+                        for error in response.report_errors
+                    ),
+                )
+            )
+            self._handle_error(exception, request)
+
+    def _handle_error(self, exception, request):
+        if self._on_error is None:
+            _LOGGER.error(
+                "Failed to report %d operations.",
+                len(request.operations),
+                exc_info=exception,
+            )
+            return
+        try:
+            self._on_error(exception, request)
+        except Exception:
+            _LOGGER.exception("Error in the on_error callback.")
+
+    def _run(self):
+        """Report the pending operations every flush interval until closed."""
+        deadline = time.monotonic() + self._flush_interval
+        while True:
+            with self._condition:
+                while not self._closed and not self._full:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+            deadline = time.monotonic() + self._flush_interval
+            self.flush()
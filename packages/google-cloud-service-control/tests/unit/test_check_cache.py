@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.cloud import servicecontrol_v1
+from google.cloud.servicecontrol_v1.check_cache import CacheStats, CheckCache
+
+SERVICE = "my-service.example.com"
+Code = servicecontrol_v1.CheckError.Code
+
+
+def make_request(operation_id="1", consumer="project:a", **operation):
+    return servicecontrol_v1.CheckRequest(
+        service_name=SERVICE,
+        operation=dict(
+            operation_id=operation_id,
+            operation_name="Get",
+            consumer_id=consumer,
+            start_time={"seconds": int(operation_id)},
+            **operation,
+        ),
+    )
+
+
+def make_client(*responses):
+    client = mock.Mock(spec=["check"])
+    client.check.side_effect = list(responses) or (
+        lambda request, **kwargs: servicecontrol_v1.CheckResponse(
+            operation_id=request.operation.operation_id
+        )
+    )
+    return client
+
+
+def test_constructor_invalid_options():
+    for options in (
+        {"max_entries": 0},
+        {"refresh_interval": -1},
+        {"refresh_interval": 10, "expiration": 5},
+        {"max_refreshes": 0},
+    ):
+        with pytest.raises(ValueError):
+            CheckCache(make_client(), **options)
+
+
+def test_check_hit():
+    client = make_client()
+    with CheckCache(client, refresh_interval=60) as cache:
+        first = cache.check(make_request("1"))
+        # The operation ID and times are not part of the signature.
+        second = cache.check(make_request("2"))
+        other = cache.check(make_request("3", consumer="project:b"))
+
+        assert first.operation_id == "1"
+        assert second.operation_id == "1"
+        assert other.operation_id == "3"
+        assert client.check.call_count == 2
+        assert cache.stats == CacheStats(hits=1, misses=2, refreshes=0)
+
+
+def test_check_labels_and_metrics_in_signature():
+    client = make_client()
+    with CheckCache(client, refresh_interval=60) as cache:
+        cache.check(make_request("1", labels={"a": "1"}))
+        cache.check(make_request("2", labels={"a": "2"}))
+        cache.check(
+            make_request(
+                "3",
+                labels={"a": "1"},
+                metric_value_sets=[
+                    {"metric_name": "requests", "metric_values": [{"int64_value": 1}]}
+                ],
+            )
+        )
+
+    assert client.check.call_count == 3
+
+
+def test_check_dict_request():
+    client = make_client()
+    with CheckCache(client, timeout=2.5) as cache:
+        response = cache.check({"service_name": SERVICE, "operation": {}})
+
+    assert isinstance(response, servicecontrol_v1.CheckResponse)
+    _, kwargs = client.check.call_args
+    assert kwargs["timeout"] == 2.5
+
+
+def test_check_refresh_in_background():
+    client = make_client()
+    with CheckCache(client, refresh_interval=0, expiration=60) as cache:
+        assert cache.check(make_request("1")).operation_id == "1"
+        # The stale response is returned while it is refreshed.
+        assert cache.check(make_request("2")).operation_id == "1"
+
+        deadline = time.monotonic() + 5
+        while cache.stats.refreshes < 1 or client.check.call_count < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    assert [
+        call[1]["request"].operation.operation_id
+        for call in client.check.call_args_list
+    ] == ["1", "2"]
+    assert cache.check(make_request("3")).operation_id == "2"
+
+
+def test_check_failed_refresh_keeps_response():
+    client = make_client(
+        servicecontrol_v1.CheckResponse(operation_id="1"),
+        core_exceptions.ServiceUnavailable("down"),
+    )
+    with CheckCache(client, refresh_interval=0, expiration=60) as cache:
+        cache.check(make_request("1"))
+        cache.check(make_request("2"))
+
+    assert cache.check(make_request("3")).operation_id == "1"
+    assert client.check.call_count == 2
+
+
+def test_check_uncacheable_refresh_keeps_response():
+    client = make_client(
+        servicecontrol_v1.CheckResponse(operation_id="1"),
+        servicecontrol_v1.CheckResponse(
+            check_errors=[{"code": Code.SERVICE_STATUS_UNAVAILABLE}]
+        ),
+    )
+    with mock.patch("time.monotonic", return_value=100.0):
+        cache = CheckCache(client, refresh_interval=10, expiration=60)
+        cache.check(make_request("1"))
+    with mock.patch("time.monotonic", return_value=111.0):
+        assert cache.check(make_request("2")).operation_id == "1"
+        cache.close()
+        # The next refresh waits for the refresh interval.
+        assert cache.check(make_request("3")).operation_id == "1"
+    assert client.check.call_count == 2
+
+
+def test_check_concurrent_misses_share_a_request():
+    started = threading.Event()
+    release = threading.Event()
+
+    def check(request, **kwargs):
+        started.set()
+        release.wait()
+        return servicecontrol_v1.CheckResponse(
+            operation_id=request.operation.operation_id
+        )
+
+    client = mock.Mock(spec=["check"])
+    client.check.side_effect = check
+    cache = CheckCache(client, refresh_interval=60)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda operation_id: results.append(
+                cache.check(make_request(operation_id))
+            ),
+            args=(str(index),),
+        )
+        for index in range(4)
+    ]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+    cache.close()
+
+    assert [response.operation_id for response in results] == ["0"] * 4
+    assert client.check.call_count == 1
+    assert not cache._loading
+
+
+def test_check_failed_miss_is_not_cached():
+    client = make_client(
+        core_exceptions.ServiceUnavailable("down"),
+        servicecontrol_v1.CheckResponse(operation_id="2"),
+    )
+    cache = CheckCache(client, refresh_interval=60)
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        cache.check(make_request("1"))
+    assert not cache._loading
+    assert cache.check(make_request("2")).operation_id == "2"
+    cache.close()
+
+
+def test_check_expiration():
+    client = make_client()
+    cache = CheckCache(client, refresh_interval=0.5, expiration=1)
+    with mock.patch("time.monotonic", return_value=100.0):
+        cache.check(make_request("1"))
+    with mock.patch("time.monotonic", return_value=102.0):
+        assert cache.check(make_request("2")).operation_id == "2"
+
+    assert cache.stats == CacheStats(hits=0, misses=2, refreshes=0)
+    cache.close()
+
+
+def test_check_transient_errors_not_cached():
+    unavailable = servicecontrol_v1.CheckResponse(
+        check_errors=[{"code": Code.SERVICE_STATUS_UNAVAILABLE}]
+    )
+    denied = servicecontrol_v1.CheckResponse(
+        check_errors=[{"code": Code.API_KEY_INVALID}]
+    )
+    client = make_client(unavailable, denied, denied)
+    with CheckCache(client, refresh_interval=60) as cache:
+        assert cache.check(make_request("1")) == unavailable
+        assert cache.check(make_request("2")) == denied
+        assert cache.check(make_request("3")) == denied
+
+    assert client.check.call_count == 2
+
+
+def test_check_max_entries():
+    client = make_client()
+    with CheckCache(client, max_entries=2, refresh_interval=60) as cache:
+        cache.check(make_request("1", consumer="project:a"))
+        cache.check(make_request("2", consumer="project:b"))
+        cache.check(make_request("3", consumer="project:a"))
+        cache.check(make_request("4", consumer="project:c"))
+        # project:b was the least recently used.
+        cache.check(make_request("5", consumer="project:a"))
+        cache.check(make_request("6", consumer="project:b"))
+
+    assert client.check.call_count == 4
+
+
+def test_check_error_not_cached():
+    client = make_client(
+        core_exceptions.ServiceUnavailable("down"),
+        servicecontrol_v1.CheckResponse(operation_id="2"),
+    )
+    with CheckCache(client) as cache:
+        with pytest.raises(core_exceptions.ServiceUnavailable):
+            cache.check(make_request("1"))
+        assert cache.check(make_request("2")).operation_id == "2"
+
+
+def test_clear():
+    client = make_client()
+    with CheckCache(client, refresh_interval=60) as cache:
+        cache.check(make_request("1"))
+        cache.clear()
+        cache.check(make_request("2"))
+
+    assert client.check.call_count == 2
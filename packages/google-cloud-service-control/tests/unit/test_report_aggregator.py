@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import statistics
+import time
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.cloud import servicecontrol_v1
+from google.cloud.servicecontrol_v1.report_aggregator import ReportAggregator
+
+SERVICE = "my-service.example.com"
+HIGH = servicecontrol_v1.Operation.Importance.HIGH
+
+
+def make_distribution(*values, bounds=(10.0, 20.0)):
+    buckets = [0] * (len(bounds) + 1)
+    for value in values:
+        buckets[sum(value >= bound for bound in bounds)] += 1
+    return {
+        "count": len(values),
+        "mean": statistics.mean(values),
+        "minimum": min(values),
+        "maximum": max(values),
+        "sum_of_squared_deviation": sum(
+            (value - statistics.mean(values)) ** 2 for value in values
+        ),
+        "bucket_counts": buckets,
+        "explicit_buckets": {"bounds": list(bounds)},
+    }
+
+
+def make_operation(operation_id, second, consumer="project:a", **metrics):
+    return {
+        "operation_id": operation_id,
+        "operation_name": "Get",
+        "consumer_id": consumer,
+        "start_time": {"seconds": second},
+        "end_time": {"seconds": second + 1},
+        "labels": {"method": "Get"},
+        "metric_value_sets": [
+            {"metric_name": name, "metric_values": [value]}
+            for name, value in metrics.items()
+        ],
+    }
+
+
+def make_request(*operations):
+    return servicecontrol_v1.ReportRequest(
+        service_name=SERVICE, operations=list(operations)
+    )
+
+
+def make_client():
+    client = mock.Mock(spec=["report"])
+    client.report.return_value = servicecontrol_v1.ReportResponse()
+    return client
+
+
+def sent_operations(client):
+    return [
+        operation
+        for call in client.report.call_args_list
+        for operation in call[1]["request"].operations
+    ]
+
+
+def test_constructor_invalid_options():
+    for options in ({"flush_interval": -1}, {"max_operations": 0}):
+        with pytest.raises(ValueError):
+            ReportAggregator(make_client(), **options)
+
+
+def test_report_merges_operations():
+    client = make_client()
+    with ReportAggregator(client, flush_interval=60) as aggregator:
+        aggregator.report(
+            make_request(
+                make_operation("1", 10, requests={"int64_value": 1}),
+                make_operation("2", 5, requests={"int64_value": 2}),
+            )
+        )
+        aggregator.report(
+            make_request(
+                make_operation(
+                    "3",
+                    20,
+                    requests={"int64_value": 3},
+                    bytes={"double_value": 1.5},
+                ),
+                make_operation("4", 1, consumer="project:b"),
+            )
+        )
+        client.report.assert_not_called()
+
+    client.report.assert_called_once()
+    request = client.report.call_args[1]["request"]
+    assert request.service_name == SERVICE
+    merged, other = request.operations
+    assert merged.operation_id == "1"
+    assert merged.start_time.timestamp() == 5
+    assert merged.end_time.timestamp() == 21
+    metrics = {
+        metric_value_set.metric_name: metric_value_set.metric_values
+        for metric_value_set in merged.metric_value_sets
+    }
+    assert [value.int64_value for value in metrics["requests"]] == [6]
+    assert [value.double_value for value in metrics["bytes"]] == [1.5]
+    assert other.consumer_id == "project:b"
+
+
+def test_report_metric_labels_kept_apart():
+    client = make_client()
+    with ReportAggregator(client, flush_interval=60) as aggregator:
+        for code, count in (("200", 1), ("500", 2), ("200", 4)):
+            aggregator.report(
+                make_request(
+                    make_operation(
+                        "1",
+                        1,
+                        requests={"labels": {"code": code}, "int64_value": count},
+                    )
+                )
+            )
+
+    (operation,) = sent_operations(client)
+    values = operation.metric_value_sets[0].metric_values
+    assert {value.labels["code"]: value.int64_value for value in values} == {
+        "200": 5,
+        "500": 2,
+    }
+
+
+def test_report_merges_distributions():
+    first = [1.0, 12.0, 15.0]
+    second = [25.0, 3.0]
+    client = make_client()
+    with ReportAggregator(client, flush_interval=60) as aggregator:
+        for values in (first, second):
+            aggregator.report(
+                make_request(
+                    make_operation(
+                        "1",
+                        1,
+                        latency={"distribution_value": make_distribution(*values)},
+                    )
+                )
+            )
+
+    (operation,) = sent_operations(client)
+    merged = operation.metric_value_sets[0].metric_values[0].distribution_value
+    expected = make_distribution(*(first + second))
+    assert merged.count == expected["count"]
+    assert merged.mean == pytest.approx(expected["mean"])
+    assert merged.sum_of_squared_deviation == pytest.approx(
+        expected["sum_of_squared_deviation"]
+    )
+    assert merged.minimum == 1.0
+    assert merged.maximum == 25.0
+    assert list(merged.bucket_counts) == expected["bucket_counts"]
+
+
+def test_report_distributions_with_different_buckets():
+    client = make_client()
+    aggregator = ReportAggregator(client, flush_interval=60)
+    aggregator.report(
+        make_request(
+            make_operation(
+                "1", 1, latency={"distribution_value": make_distribution(1.0)}
+            )
+        )
+    )
+    with pytest.raises(ValueError):
+        aggregator.report(
+            make_request(
+                make_operation(
+                    "2",
+                    1,
+                    latency={
+                        "distribution_value": make_distribution(1.0, bounds=(5.0,))
+                    },
+                )
+            )
+        )
+    aggregator.close()
+
+
+def test_report_non_delta_metrics():
+    client = make_client()
+    with ReportAggregator(
+        client, flush_interval=60, non_delta_metrics=["connections"]
+    ) as aggregator:
+        for second, connections in ((2, 7), (1, 9)):
+            aggregator.report(
+                make_request(
+                    make_operation(
+                        "1",
+                        second,
+                        connections={
+                            "end_time": {"seconds": second},
+                            "int64_value": connections,
+                        },
+                    )
+                )
+            )
+
+    (operation,) = sent_operations(client)
+    assert operation.metric_value_sets[0].metric_values[0].int64_value == 7
+
+
+def test_report_high_importance_sent_at_once():
+    client = make_client()
+    with ReportAggregator(client, flush_interval=60) as aggregator:
+        operation = make_operation("1", 1)
+        operation["importance"] = HIGH
+        aggregator.report(make_request(operation))
+        client.report.assert_called_once()
+
+        client.report.side_effect = core_exceptions.ServiceUnavailable("down")
+        with pytest.raises(core_exceptions.ServiceUnavailable):
+            aggregator.report(make_request(operation))
+        client.report.side_effect = None
+
+
+def test_report_max_operations():
+    client = make_client()
+    with ReportAggregator(client, flush_interval=60, max_operations=2) as aggregator:
+        aggregator.report(
+            make_request(
+                make_operation("1", 1, consumer="project:a"),
+                make_operation("2", 1, consumer="project:b"),
+            )
+        )
+        deadline = time.monotonic() + 5
+        while not client.report.called:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        aggregator.report(
+            make_request(
+                *(make_operation(str(i), 1, consumer=str(i)) for i in range(3))
+            )
+        )
+
+    assert [
+        len(call[1]["request"].operations) for call in client.report.call_args_list
+    ] == [2, 2, 1]
+
+
+def test_report_flush_interval():
+    client = make_client()
+    with ReportAggregator(client, flush_interval=0.05) as aggregator:
+        aggregator.report(make_request(make_operation("1", 1)))
+        deadline = time.monotonic() + 5
+        while not client.report.called:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+
+def test_report_errors():
+    client = make_client()
+    client.report.return_value = servicecontrol_v1.ReportResponse(
+        report_errors=[{"operation_id": "1", "status": {"message": "invalid"}}]
+    )
+    on_error = mock.Mock()
+    with ReportAggregator(client, flush_interval=60, on_error=on_error) as aggregator:
+        aggregator.report(make_request(make_operation("1", 1)))
+        aggregator.flush()
+
+    on_error.assert_called_once()
+    exception, request = on_error.call_args[0]
+    assert isinstance(exception, ValueError)
+    assert "invalid" in str(exception)
+    assert request.operations[0].operation_id == "1"
+
+
+def test_report_after_close():
+    aggregator = ReportAggregator(make_client())
+    aggregator.close()
+    with pytest.raises(RuntimeError):
+        aggregator.report(make_request(make_operation("1", 1)))
+    aggregator.close()
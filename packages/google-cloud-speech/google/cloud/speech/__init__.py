@@ -22,8 +22,7 @@ from google.cloud.speech_v1.services.adaptation.async_client import (
     AdaptationAsyncClient,
 )
 from google.cloud.speech_v1.services.adaptation.client import AdaptationClient
-from google.cloud.speech_v1.services.speech.async_client import SpeechAsyncClient
-from google.cloud.speech_v1 import SpeechClient
+from google.cloud.speech_v1 import SpeechAsyncClient, SpeechClient
 from google.cloud.speech_v1.types.cloud_speech import (
     LongRunningRecognizeMetadata,
     LongRunningRecognizeRequest,
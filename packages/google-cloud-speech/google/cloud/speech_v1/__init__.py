@@ -62,13 +62,17 @@ from .types.resource import (
     TranscriptNormalization,
 )
 
-from google.cloud.speech_v1.helpers import SpeechHelpers
+from google.cloud.speech_v1.helpers import SpeechAsyncHelpers, SpeechHelpers
 
 
 class SpeechClient(SpeechHelpers, SpeechClient):
     __doc__ = SpeechClient.__doc__
 
 
+class SpeechAsyncClient(SpeechAsyncHelpers, SpeechAsyncClient):
+    __doc__ = SpeechAsyncClient.__doc__
+
+
 __all__ = (
     "AdaptationAsyncClient",
     "SpeechAsyncClient",
@@ -16,6 +16,8 @@ from __future__ import absolute_import
 
 import google.api_core.gapic_v1.method
 
+from google.cloud.speech_v1 import streaming
+
 
 class SpeechHelpers(object):
     """A set of convenience methods to make the Speech client easier to use.
@@ -84,6 +86,89 @@ class SpeechHelpers(object):
             timeout=timeout,
         )
 
+    def streaming_recognize_audio(
+        self,
+        config,
+        audio,
+        *,
+        restart_interval=streaming.DEFAULT_RESTART_INTERVAL,
+        retry=google.api_core.gapic_v1.method.DEFAULT,
+        timeout=google.api_core.gapic_v1.method.DEFAULT,
+        metadata=(),
+    ):
+        """Perform bi-directional speech recognition of a source of audio.
+
+        Like :meth:`streaming_recognize`, but the requests are built from
+        the frames of an :class:`~.speech_v1.streaming.AudioSource`.
+
+        The service ends a stream after about five minutes of audio. For
+        uncompressed audio (or audio whose bit rate is given to the
+        :class:`~.speech_v1.streaming.AudioSource`), a new stream is started
+        after every ``restart_interval`` seconds of audio. The audio after
+        the last final result of a stream is sent again at the start of the
+        next one, and the ``result_end_time`` and word offsets of every
+        result are relative to the start of the audio, as if it were
+        recognized in a single stream.
+
+        Example:
+          >>> from google.cloud import speech_v1
+          >>> from google.cloud.speech_v1 import streaming
+          >>> client = speech_v1.SpeechClient()
+          >>> recognition_config = speech_v1.RecognitionConfig(
+          ...     encoding=speech_v1.RecognitionConfig.AudioEncoding.LINEAR16,
+          ...     sample_rate_hertz=16000,
+          ...     language_code='en-US',
+          ... )
+          >>> config = speech_v1.StreamingRecognitionConfig(
+          ...     config=recognition_config,
+          ... )
+          >>> with open('call.raw', 'rb') as audio_file:
+          ...     audio = streaming.AudioSource(
+          ...         audio_file, recognition_config, speed=1.0
+          ...     )
+          ...     for response in client.streaming_recognize_audio(config, audio):
+          ...         pass
+
+        Args:
+            config (:class:`~.types.StreamingRecognitionConfig`): The
+                configuration to use for each stream.
+            audio (Union[:class:`~.speech_v1.streaming.AudioSource`, bytes, BinaryIO]):
+                The audio. Any other source accepted by
+                :class:`~.speech_v1.streaming.AudioSource` is read
+                unpaced, with the format given by ``config``.
+            restart_interval (Optional[float]): The seconds of audio to send
+                in each stream. ``None`` sends all of the audio in a single
+                stream.
+            retry (Optional[google.api_core.retry.Retry]):  A retry object used
+                to retry requests. If ``None`` is specified, requests will not
+                be retried.
+            timeout (Optional[float]): The amount of time, in seconds, to wait
+                for each stream to complete. Note that if ``retry`` is
+                specified, the timeout applies to each individual attempt.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+          Iterable[:class:`~.types.StreamingRecognizeResponse`]
+
+        Raises:
+          :exc:`ValueError` if the parameters are invalid.
+        """
+        if not isinstance(audio, streaming.AudioSource):
+            audio = streaming.AudioSource(audio, config.config)
+
+        def streaming_recognize(requests):
+            return super(SpeechHelpers, self).streaming_recognize(
+                requests=requests,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+
+        return streaming._streaming_recognize_continuously(
+            streaming_recognize, config, audio, restart_interval
+        )
+
     def _streaming_request_iterable(self, config, requests):
         """A generator that yields the config followed by the requests.
 
@@ -103,3 +188,96 @@ class SpeechHelpers(object):
         yield {"streaming_config": config}
         for request in requests:
             yield request
+
+
+class SpeechAsyncHelpers(object):
+    """A set of convenience methods to make the Speech async client easier to use.
+
+    This class should be considered abstract; it is used as a superclass
+    in a multiple-inheritance construction alongside the applicable GAPIC.
+    See the :class:`~google.cloud.speech_v1.SpeechAsyncClient`.
+    """
+
+    async def streaming_recognize_audio(
+        self,
+        config,
+        audio,
+        *,
+        max_queue_size=streaming.DEFAULT_MAX_QUEUE_SIZE,
+        retry=google.api_core.gapic_v1.method.DEFAULT,
+        timeout=google.api_core.gapic_v1.method.DEFAULT,
+        metadata=(),
+    ):
+        """Perform bi-directional speech recognition of chunks of audio.
+
+        Like :meth:`streaming_recognize`, but the first request, with the
+        configuration, is sent for you, and ``audio`` may be an async
+        iterable of raw audio chunks. Only available via gRPC (not REST).
+
+        The requests are read into a queue of at most ``max_queue_size``
+        requests, from which they are sent. While the queue is full,
+        ``audio`` is not read, so that a stream which cannot keep up
+        slows its source rather than buffering audio without bound.
+
+        Example:
+          >>> from google.cloud import speech_v1
+          >>> client = speech_v1.SpeechAsyncClient()
+          >>> config = speech_v1.StreamingRecognitionConfig(
+          ...     config=speech_v1.RecognitionConfig(
+          ...         encoding=speech_v1.RecognitionConfig.AudioEncoding.LINEAR16,
+          ...         sample_rate_hertz=8000,
+          ...     ),
+          ... )
+          >>> async def audio_chunks(reader):
+          ...     while chunk := await reader.read(1600):
+          ...         yield chunk
+          >>> stream = await client.streaming_recognize_audio(
+          ...     config, audio_chunks(reader)
+          ... )
+          >>> async for response in stream:
+          ...     # process response
+          ...     pass
+
+        Args:
+            config (:class:`~.types.StreamingRecognitionConfig`): The
+                configuration to use for the stream.
+            audio (Union[AsyncIterable, Iterable]): The audio, as
+                bytes-like chunks, or
+                :class:`~.types.StreamingRecognizeRequest` objects.
+            max_queue_size (int): The maximum number of requests read ahead
+                of the stream.
+            retry (Optional[google.api_core.retry.Retry]):  A retry object used
+                to retry requests. If ``None`` is specified, requests will not
+                be retried.
+            timeout (Optional[float]): The amount of time, in seconds, to wait
+                for the request to complete. Note that if ``retry`` is
+                specified, the timeout applies to each individual attempt.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+          AsyncIterator[:class:`~.types.StreamingRecognizeResponse`]: The
+            responses. Once they end, any error raised while reading
+            ``audio`` is raised.
+
+        Raises:
+          :exc:`ValueError` if the parameters are invalid.
+        """
+
+        def streaming_recognize(requests):
+            return super(SpeechAsyncHelpers, self).streaming_recognize(
+                requests=requests,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+
+        # Use dictionaries rather than request objects since the helper is
+        # used by both the v1 and v1p1beta1
+        return await streaming._streaming_recognize_async(
+            streaming_recognize,
+            {"streaming_config": config},
+            "audio_content",
+            audio,
+            max_queue_size,
+        )
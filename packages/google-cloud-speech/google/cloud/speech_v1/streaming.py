@@ -0,0 +1,419 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Audio sources for streaming recognition.
+
+:class:`AudioSource` reads audio from a buffer, a file, a socket or an
+iterable of chunks, slices it into frames small enough for a single
+:class:`~google.cloud.speech_v1.types.StreamingRecognizeRequest`, and
+optionally paces the frames at (a multiple of) real time.
+
+:meth:`~google.cloud.speech_v1.SpeechClient.streaming_recognize_audio`
+streams an :class:`AudioSource`, restarting the stream before the server's
+limit on the duration of a stream.
+
+:meth:`~google.cloud.speech_v1.SpeechAsyncClient.streaming_recognize_audio`
+streams audio from an asynchronous iterator through a bounded queue.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import time
+
+# The maximum size of the audio content of a streaming request (25 KB).
+MAX_FRAME_SIZE = 25000
+
+# The duration of each frame of audio, in seconds. The service recommends
+# frames of around 100 milliseconds for a good tradeoff between latency
+# and efficiency.
+DEFAULT_FRAME_DURATION = 0.1
+
+# The size of each frame when the bit rate of the audio is unknown.
+DEFAULT_FRAME_SIZE = 4096
+
+# The seconds of audio sent in each stream before it is restarted. The
+# service ends streams after about five minutes of audio.
+DEFAULT_RESTART_INTERVAL = 240.0
+
+# The number of requests buffered between an asynchronous source of audio
+# and its stream. Once the queue is full, the source is not read until the
+# stream has sent a request.
+DEFAULT_MAX_QUEUE_SIZE = 10
+
+_NANOS_PER_SECOND = 10**9
+
+# The size of a sample of each encoding without compression.
+_BYTES_PER_SAMPLE = {"LINEAR16": 2, "MULAW": 1}
+
+
+def _audio_format(recognition_config):
+    """Return the bytes per second and per block of uncompressed audio.
+
+    Args:
+        recognition_config (~.speech_v1.types.RecognitionConfig): The
+            configuration of the audio.
+
+    Returns:
+        Tuple[int, int]: The number of bytes in each second of audio, and in
+            each sample of all of the channels, or ``(None, 1)`` if the audio
+            is compressed or the sample rate is not set.
+    """
+    encoding = getattr(recognition_config.encoding, "name", None)
+    sample_size = _BYTES_PER_SAMPLE.get(encoding)
+    if sample_size is None or not recognition_config.sample_rate_hertz:
+        return None, 1
+    block_size = sample_size * max(recognition_config.audio_channel_count, 1)
+    return block_size * recognition_config.sample_rate_hertz, block_size
+
+
+class AudioSource(object):
+    """Frames of audio read from a buffer, file, socket or chunks.
+
+    Iterating over the source yields :class:`bytes` frames of audio. Each
+    frame holds ``frame_duration`` seconds of audio, at most
+    :data:`MAX_FRAME_SIZE` bytes, and a whole number of samples, except
+    that reads from files and sockets may return shorter frames.
+
+    Audio is copied once, into the frame that holds it: buffers, such as
+    :class:`bytes`, :class:`memoryview` or :class:`mmap.mmap`, are sliced
+    in place, and files and sockets are read a frame at a time, so that
+    whole reads are yielded as they are. Frames are :class:`bytes` rather
+    than views, since request messages only hold :class:`bytes`.
+
+    The bit rate of the audio is determined from ``config`` for
+    uncompressed (``LINEAR16`` and ``MULAW``) audio, or may be given as
+    ``bytes_per_second``. It is needed to pace the audio and to size frames
+    by duration.
+
+    Example:
+      >>> from google.cloud import speech_v1
+      >>> from google.cloud.speech_v1 import streaming
+      >>> config = speech_v1.RecognitionConfig(
+      ...     encoding=speech_v1.RecognitionConfig.AudioEncoding.LINEAR16,
+      ...     sample_rate_hertz=16000,
+      ... )
+      >>> with open('audio.raw', 'rb') as audio_file:
+      ...     for frame in streaming.AudioSource(audio_file, config, speed=1.0):
+      ...         pass
+
+    Args:
+        source (Union[bytes, memoryview, BinaryIO, socket.socket, Iterable[bytes]]):
+            The audio. A bytes-like object, an object with a ``recv`` method,
+            such as a socket, an object with a ``read`` method, such as a
+            file opened in binary mode, or an iterable of bytes-like chunks.
+        config (Optional[~.speech_v1.types.RecognitionConfig]): The
+            configuration of the audio.
+        bytes_per_second (Optional[int]): The bit rate of the audio, in
+            bytes per second. Overrides the rate derived from ``config``.
+        frame_duration (float): The duration of each frame, in seconds.
+        speed (Optional[float]): The speed at which frames are yielded,
+            relative to real time, for example ``1.0`` to simulate a live
+            stream. ``None`` yields frames as fast as they can be read.
+
+    Raises:
+        ValueError: If ``speed`` is given but the bit rate is unknown, or
+            if ``frame_duration`` or ``speed`` is not positive.
+    """
+
+    def __init__(
+        self,
+        source,
+        config=None,
+        *,
+        bytes_per_second=None,
+        frame_duration=DEFAULT_FRAME_DURATION,
+        speed=None,
+    ):
+        block_size = 1
+        if config is not None:
+            rate, block_size = _audio_format(config)
+            if bytes_per_second is None:
+                bytes_per_second = rate
+        if frame_duration <= 0:
+            raise ValueError("frame_duration must be positive.")
+        if speed is not None:
+            if speed <= 0:
+                raise ValueError("speed must be positive.")
+            if bytes_per_second is None:
+                raise ValueError("Cannot pace audio with an unknown bit rate.")
+
+        if bytes_per_second is None:
+            frame_size = DEFAULT_FRAME_SIZE
+        else:
+            frame_size = min(int(bytes_per_second * frame_duration), MAX_FRAME_SIZE)
+        # Frames hold whole samples, so that a stream can start at any frame.
+        frame_size = max(frame_size - frame_size % block_size, block_size)
+
+        self._source = source
+        self._speed = speed
+        self.bytes_per_second = bytes_per_second
+        self.block_size = block_size
+        self.frame_size = frame_size
+
+    def _chunks(self):
+        source = self._source
+        frame_size = self.frame_size
+        try:
+            view = memoryview(source)
+        except TypeError:
+            pass
+        else:
+            view = view.cast("B")
+            for start in range(0, len(view), frame_size):
+                yield view[start : start + frame_size]
+            return
+
+        if hasattr(source, "recv"):
+            read = source.recv
+        elif hasattr(source, "read"):
+            read = source.read
+        else:
+            for chunk in source:
+                yield chunk
+            return
+        while True:
+            chunk = read(frame_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def _frames(self):
+        frame_size = self.frame_size
+        block_size = self.block_size
+        remainder = b""
+        for chunk in self._chunks():
+            view = memoryview(chunk).cast("B")
+            whole = not remainder
+            if remainder:
+                # Complete the partial sample carried over from the previous
+                # chunk, rather than copying it in front of the whole chunk.
+                size = len(remainder) + len(view)
+                first = min(size - size % block_size, frame_size) - len(remainder)
+                if first < 0:
+                    remainder = b"".join((remainder, view))
+                    continue
+                yield b"".join((remainder, view[:first]))
+                view = view[first:]
+                remainder = b""
+            size = len(view)
+            end = size - size % block_size
+            if whole and end == size <= frame_size and isinstance(chunk, bytes):
+                yield chunk
+                continue
+            for start in range(0, end, frame_size):
+                yield bytes(view[start : min(start + frame_size, end)])
+            remainder = bytes(view[end:])
+        if remainder:
+            yield remainder
+
+    def __iter__(self):
+        if self._speed is None:
+            for frame in self._frames():
+                yield frame
+            return
+
+        bytes_per_second = self.bytes_per_second * self._speed
+        start = time.monotonic()
+        offset = 0
+        for frame in self._frames():
+            delay = start + offset / bytes_per_second - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            yield frame
+            offset += len(frame)
+
+
+def _shift_duration(duration, nanos):
+    duration.FromNanoseconds(duration.ToNanoseconds() + nanos)
+
+
+def _shift_offsets(response, nanos):
+    """Add ``nanos`` to the audio offsets of the results of a response."""
+    response_pb = type(response).pb(response)
+    for result in response_pb.results:
+        _shift_duration(result.result_end_time, nanos)
+        for alternative in result.alternatives:
+            for word in alternative.words:
+                _shift_duration(word.start_time, nanos)
+                _shift_duration(word.end_time, nanos)
+
+
+def _streaming_recognize_continuously(
+    streaming_recognize, config, audio, restart_interval
+):
+    """Stream audio in consecutive streams, each within the server's limit.
+
+    When a stream has been sent ``restart_interval`` seconds of audio, its
+    requests end, and once its final responses have been received a new
+    stream is started. The new stream first resends the audio following the
+    last final result, so that no speech is lost at the boundary, and the
+    offsets in its results are shifted to be relative to the start of the
+    audio.
+
+    Args:
+        streaming_recognize (Callable[[Iterator[dict]], Iterable]): Starts a
+            stream with the given requests and returns its responses.
+        config (~.speech_v1.types.StreamingRecognitionConfig): The
+            configuration to use for each stream.
+        audio (AudioSource): The audio.
+        restart_interval (Optional[float]): The seconds of audio to send in
+            each stream. ``None`` sends all of the audio in one stream.
+
+    Yields:
+        ~.speech_v1.types.StreamingRecognizeResponse: The responses of all
+            of the streams.
+    """
+    frames = iter(audio)
+    rate = audio.bytes_per_second
+    limit = None
+    if restart_interval is not None and rate is not None:
+        limit = int(restart_interval * rate)
+
+    # The byte offset of the next frame of the source, the end of the
+    # audio recognized in a final result, and the frames to resend.
+    state = {"position": 0, "exhausted": False, "limited": False}
+    final_end = 0
+    replay = []
+    while True:
+        stream_start = replay[0][0] if replay else state["position"]
+        sent = list(replay)
+        state["limited"] = False
+
+        def requests(replay=replay, sent=sent, stream_start=stream_start):
+            yield {"streaming_config": config}
+            for _, frame in replay:
+                yield {"audio_content": frame}
+            while limit is None or state["position"] - stream_start < limit:
+                frame = next(frames, None)
+                if frame is None:
+                    state["exhausted"] = True
+                    return
+                sent.append((state["position"], frame))
+                state["position"] += len(frame)
+                yield {"audio_content": frame}
+            state["limited"] = True
+
+        shift = 0
+        if stream_start:
+            shift = stream_start * _NANOS_PER_SECOND // rate
+        for response in streaming_recognize(requests()):
+            if shift:
+                _shift_offsets(response, shift)
+            for result in type(response).pb(response).results:
+                if result.is_final and rate is not None:
+                    end = result.result_end_time.ToNanoseconds()
+                    final_end = max(final_end, end * rate // _NANOS_PER_SECOND)
+            yield response
+
+        if state["exhausted"] or not state["limited"]:
+            return
+        # Resend the audio after the last final result, but at most half a
+        # stream of it, so that every stream makes progress.
+        replay_start = max(final_end, state["position"] - limit // 2)
+        replay = [
+            (offset, frame)
+            for offset, frame in sent
+            if offset + len(frame) > replay_start
+        ]
+
+
+# Marks the end of the requests in the queue of an asynchronous stream.
+_END = object()
+
+
+async def _aiter(iterable):
+    """Iterate over an asynchronous or a plain iterable."""
+    if hasattr(iterable, "__aiter__"):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+async def _streaming_recognize_async(
+    streaming_recognize, first_request, audio_field, requests, max_queue_size
+):
+    """Start a stream fed by a bounded queue of requests.
+
+    A task reads ``requests`` into a queue of at most ``max_queue_size``
+    requests, from which the stream sends them. When the stream falls
+    behind, the task stops reading until there is room in the queue, so
+    that a slow stream slows the source of audio rather than buffering it
+    without bound. The task is started when the stream starts sending, and
+    cancelled when the stream ends.
+
+    Args:
+        streaming_recognize (Callable[[AsyncIterator[dict]], Awaitable[AsyncIterable]]):
+            Starts a stream with the given requests.
+        first_request (dict): The request which configures the stream.
+        audio_field (str): The field of a request holding audio content.
+        requests (Union[AsyncIterable, Iterable]): The requests to send
+            after ``first_request``. Bytes-like items are sent as requests
+            with the bytes in ``audio_field``.
+        max_queue_size (int): The maximum number of queued requests.
+
+    Returns:
+        AsyncIterator: The responses of the stream. Once they end, any
+            error raised by ``requests`` is raised.
+
+    Raises:
+        ValueError: If ``max_queue_size`` is not positive.
+    """
+    if max_queue_size < 1:
+        raise ValueError("max_queue_size must be positive.")
+
+    queue = asyncio.Queue(max_queue_size)
+    errors = []
+
+    async def produce():
+        try:
+            async for request in _aiter(requests):
+                if isinstance(request, (bytes, bytearray, memoryview)):
+                    request = {audio_field: bytes(request)}
+                await queue.put(request)
+        except Exception as exc:
+            # End the stream, and raise the error once its responses have
+            # been received.
+            errors.append(exc)
+        await queue.put(_END)
+
+    async def request_iterator():
+        yield first_request
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                request = await queue.get()
+                if request is _END:
+                    return
+                yield request
+        finally:
+            producer.cancel()
+
+    stream = await streaming_recognize(request_iterator())
+
+    async def responses():
+        done = False
+        try:
+            async for response in stream:
+                yield response
+            done = True
+        finally:
+            if not done and hasattr(stream, "cancel"):
+                stream.cancel()
+        if errors:
+            raise errors[0]
+
+    return responses()
@@ -80,6 +80,13 @@ from .types.cloud_speech import (
     WordInfo,
 )
 
+from google.cloud.speech_v2.helpers import SpeechAsyncHelpers
+
+
+class SpeechAsyncClient(SpeechAsyncHelpers, SpeechAsyncClient):
+    __doc__ = SpeechAsyncClient.__doc__
+
+
 __all__ = (
     "SpeechAsyncClient",
     "AutoDetectDecodingConfig",
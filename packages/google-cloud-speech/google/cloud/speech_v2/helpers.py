@@ -0,0 +1,114 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import google.api_core.gapic_v1.method
+
+from google.cloud.speech_v1 import streaming
+
+
+class SpeechAsyncHelpers(object):
+    """A set of convenience methods to make the Speech async client easier to use.
+
+    This class should be considered abstract; it is used as a superclass
+    in a multiple-inheritance construction alongside the applicable GAPIC.
+    See the :class:`~google.cloud.speech_v2.SpeechAsyncClient`.
+    """
+
+    async def streaming_recognize_audio(
+        self,
+        recognizer,
+        audio,
+        *,
+        config=None,
+        max_queue_size=streaming.DEFAULT_MAX_QUEUE_SIZE,
+        retry=google.api_core.gapic_v1.method.DEFAULT,
+        timeout=google.api_core.gapic_v1.method.DEFAULT,
+        metadata=(),
+    ):
+        """Perform bi-directional speech recognition of chunks of audio.
+
+        Like :meth:`streaming_recognize`, but the first request, naming the
+        recognizer, is sent for you, and ``audio`` may be an async
+        iterable of raw audio chunks. Only available via gRPC (not REST).
+
+        The requests are read into a queue of at most ``max_queue_size``
+        requests, from which they are sent. While the queue is full,
+        ``audio`` is not read, so that a stream which cannot keep up
+        slows its source rather than buffering audio without bound.
+
+        Example:
+          >>> from google.cloud import speech_v2
+          >>> client = speech_v2.SpeechAsyncClient()
+          >>> async def audio_chunks(reader):
+          ...     while chunk := await reader.read(1600):
+          ...         yield chunk
+          >>> stream = await client.streaming_recognize_audio(
+          ...     'projects/my-project/locations/global/recognizers/_',
+          ...     audio_chunks(reader),
+          ...     config=speech_v2.StreamingRecognitionConfig(
+          ...         config=speech_v2.RecognitionConfig(
+          ...             auto_decoding_config={},
+          ...             language_codes=['en-US'],
+          ...             model='long',
+          ...         ),
+          ...     ),
+          ... )
+          >>> async for response in stream:
+          ...     # process response
+          ...     pass
+
+        Args:
+            recognizer (str): The name of the Recognizer to use.
+            audio (Union[AsyncIterable, Iterable]): The audio, as
+                bytes-like chunks, or
+                :class:`~.types.StreamingRecognizeRequest` objects.
+            config (Optional[:class:`~.types.StreamingRecognitionConfig`]):
+                The configuration to use for the stream, overriding that of
+                the Recognizer.
+            max_queue_size (int): The maximum number of requests read ahead
+                of the stream.
+            retry (Optional[google.api_core.retry.Retry]):  A retry object used
+                to retry requests. If ``None`` is specified, requests will not
+                be retried.
+            timeout (Optional[float]): The amount of time, in seconds, to wait
+                for the request to complete. Note that if ``retry`` is
+                specified, the timeout applies to each individual attempt.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+          AsyncIterator[:class:`~.types.StreamingRecognizeResponse`]: The
+            responses. Once they end, any error raised while reading
+            ``audio`` is raised.
+
+        Raises:
+          :exc:`ValueError` if the parameters are invalid.
+        """
+
+        def streaming_recognize(requests):
+            return super(SpeechAsyncHelpers, self).streaming_recognize(
+                requests=requests,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+
+        first_request = {"recognizer": recognizer}
+        if config is not None:
+            first_request["streaming_config"] = config
+        return await streaming._streaming_recognize_async(
+            streaming_recognize, first_request, "audio", audio, max_queue_size
+        )
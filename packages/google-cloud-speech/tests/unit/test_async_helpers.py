@@ -0,0 +1,224 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import asyncio
+from unittest import mock
+
+import google.auth.credentials
+import pytest
+
+from google.cloud import speech_v1, speech_v1p1beta1, speech_v2
+
+V1_ASYNC_CLIENT = "google.cloud.speech_v1.services.speech.SpeechAsyncClient"
+V2_ASYNC_CLIENT = "google.cloud.speech_v2.services.speech.SpeechAsyncClient"
+
+
+def make_async_client(module):
+    credentials = mock.Mock(spec=google.auth.credentials.Credentials)
+    return module.SpeechAsyncClient(credentials=credentials)
+
+
+class FakeStream(object):
+    """A stream which responds to each request with the number of requests."""
+
+    def __init__(self, requests, delay=0):
+        self.requests = []
+        self.cancelled = False
+        self._request_iterator = requests
+        self._delay = delay
+
+    def cancel(self):
+        self.cancelled = True
+
+    async def __aiter__(self):
+        async for request in self._request_iterator:
+            self.requests.append(request)
+            await asyncio.sleep(self._delay)
+            yield len(self.requests)
+
+
+def patch_streaming_recognize(target, streams, delay=0):
+    async def streaming_recognize(self, requests, **kwargs):
+        streams.append(FakeStream(requests, delay))
+        return streams[-1]
+
+    return mock.patch(
+        target + ".streaming_recognize",
+        autospec=True,
+        side_effect=streaming_recognize,
+    )
+
+
+async def chunks(*items):
+    for item in items:
+        yield item
+
+
+def test_async_clients_have_helpers():
+    assert issubclass(speech_v1.SpeechAsyncClient, speech_v1.helpers.SpeechAsyncHelpers)
+    assert issubclass(
+        speech_v1p1beta1.SpeechAsyncClient, speech_v1.helpers.SpeechAsyncHelpers
+    )
+    assert issubclass(speech_v2.SpeechAsyncClient, speech_v2.helpers.SpeechAsyncHelpers)
+
+
+@pytest.mark.parametrize("module", [speech_v1, speech_v1p1beta1, speech_v2])
+@pytest.mark.asyncio
+async def test_streaming_recognize_keeps_generated_signature(module):
+    client = make_async_client(module)
+    requests = chunks({"audio": b"abc"})
+    streams = []
+    target = module.__name__ + ".services.speech.SpeechAsyncClient"
+    with patch_streaming_recognize(target, streams):
+        stream = await client.streaming_recognize(requests=requests)
+
+    assert stream is streams[0]
+    assert streams[0]._request_iterator is requests
+
+
+@pytest.mark.asyncio
+async def test_streaming_recognize_audio():
+    client = make_async_client(speech_v1)
+    config = speech_v1.StreamingRecognitionConfig()
+    request = speech_v1.StreamingRecognizeRequest(audio_content=b"jkl")
+    streams = []
+
+    with patch_streaming_recognize(V1_ASYNC_CLIENT, streams) as patched:
+        stream = await client.streaming_recognize_audio(
+            config, chunks(b"abc", memoryview(b"def"), bytearray(b"ghi"), request)
+        )
+        responses = [response async for response in stream]
+
+    assert responses == [1, 2, 3, 4, 5]
+    assert streams[0].requests == [
+        {"streaming_config": config},
+        {"audio_content": b"abc"},
+        {"audio_content": b"def"},
+        {"audio_content": b"ghi"},
+        request,
+    ]
+    _, kwargs = patched.call_args
+    assert "retry" in kwargs
+    assert "timeout" in kwargs
+    assert "metadata" in kwargs
+
+
+@pytest.mark.asyncio
+async def test_streaming_recognize_audio_plain_iterable():
+    client = make_async_client(speech_v1)
+    config = speech_v1.StreamingRecognitionConfig()
+    streams = []
+
+    with patch_streaming_recognize(V1_ASYNC_CLIENT, streams):
+        stream = await client.streaming_recognize_audio(config, [b"abc"])
+        responses = [response async for response in stream]
+
+    assert responses == [1, 2]
+    assert streams[0].requests[1] == {"audio_content": b"abc"}
+
+
+@pytest.mark.asyncio
+async def test_streaming_recognize_audio_v2():
+    client = make_async_client(speech_v2)
+    recognizer = "projects/my-project/locations/global/recognizers/_"
+    config = speech_v2.StreamingRecognitionConfig()
+    streams = []
+
+    with patch_streaming_recognize(V2_ASYNC_CLIENT, streams):
+        stream = await client.streaming_recognize_audio(
+            recognizer, [b"abc"], config=config
+        )
+        [response async for response in stream]
+        stream = await client.streaming_recognize_audio(recognizer, [b"abc"])
+        [response async for response in stream]
+
+    assert streams[0].requests == [
+        {"recognizer": recognizer, "streaming_config": config},
+        {"audio": b"abc"},
+    ]
+    assert streams[1].requests[0] == {"recognizer": recognizer}
+
+
+@pytest.mark.asyncio
+async def test_streaming_recognize_audio_backpressure():
+    client = make_async_client(speech_v1)
+    config = speech_v1.StreamingRecognitionConfig()
+    streams = []
+    read = []
+
+    async def audio():
+        for index in range(20):
+            read.append(index)
+            yield b"x"
+
+    with patch_streaming_recognize(V1_ASYNC_CLIENT, streams, delay=0.001):
+        stream = await client.streaming_recognize_audio(
+            config, audio(), max_queue_size=2
+        )
+        async for response in stream:
+            # The source is read no further ahead of the stream than the
+            # queue and the request being put into it.
+            assert len(read) <= len(streams[0].requests) - 1 + 3
+        assert len(read) == 20
+
+
+@pytest.mark.asyncio
+async def test_streaming_recognize_audio_source_error():
+    client = make_async_client(speech_v1)
+    config = speech_v1.StreamingRecognitionConfig()
+    streams = []
+
+    async def audio():
+        yield b"abc"
+        raise IOError("connection reset")
+
+    with patch_streaming_recognize(V1_ASYNC_CLIENT, streams):
+        stream = await client.streaming_recognize_audio(config, audio())
+        responses = []
+        with pytest.raises(IOError):
+            async for response in stream:
+                responses.append(response)
+
+    # The responses to the audio read before the error are received.
+    assert responses == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_streaming_recognize_audio_closed_early():
+    client = make_async_client(speech_v1)
+    config = speech_v1.StreamingRecognitionConfig()
+    streams = []
+
+    async def audio():
+        while True:
+            yield b"x"
+
+    with patch_streaming_recognize(V1_ASYNC_CLIENT, streams):
+        stream = await client.streaming_recognize_audio(config, audio())
+        async for response in stream:
+            break
+        await stream.aclose()
+
+    assert streams[0].cancelled
+
+
+@pytest.mark.asyncio
+async def test_streaming_recognize_audio_invalid_queue_size():
+    client = make_async_client(speech_v1)
+    config = speech_v1.StreamingRecognitionConfig()
+
+    with pytest.raises(ValueError):
+        await client.streaming_recognize_audio(config, [], max_queue_size=0)
@@ -0,0 +1,233 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import io
+from unittest import mock
+
+import google.auth.credentials
+import pytest
+
+from google.cloud.speech_v1 import SpeechClient, streaming, types
+
+AUDIO = bytes(range(256)) * 100
+
+LINEAR16 = types.RecognitionConfig(
+    encoding=types.RecognitionConfig.AudioEncoding.LINEAR16,
+    sample_rate_hertz=8000,
+    audio_channel_count=2,
+)
+
+
+class FakeSocket(object):
+    def __init__(self, data, sizes):
+        self._data = data
+        self._sizes = sizes
+
+    def recv(self, size):
+        size = min(size, next(self._sizes, size))
+        data, self._data = self._data[:size], self._data[size:]
+        return data
+
+
+def test_audio_source_buffer():
+    source = streaming.AudioSource(memoryview(AUDIO), LINEAR16)
+
+    # 100 milliseconds of 16-bit, 8 kHz, stereo audio.
+    assert source.bytes_per_second == 32000
+    assert source.block_size == 4
+    assert source.frame_size == 3200
+    frames = list(source)
+    assert all(isinstance(frame, bytes) for frame in frames)
+    assert [len(frame) for frame in frames] == [3200] * 8
+    assert b"".join(frames) == AUDIO
+
+
+def test_audio_source_max_frame_size():
+    config = types.RecognitionConfig(
+        encoding=types.RecognitionConfig.AudioEncoding.LINEAR16,
+        sample_rate_hertz=48000,
+        audio_channel_count=2,
+    )
+    source = streaming.AudioSource(AUDIO * 2, config, frame_duration=1.0)
+
+    assert source.frame_size == 25000
+    assert all(len(frame) <= 25000 for frame in source)
+
+
+def test_audio_source_unknown_rate():
+    config = types.RecognitionConfig(
+        encoding=types.RecognitionConfig.AudioEncoding.FLAC,
+        sample_rate_hertz=16000,
+    )
+    source = streaming.AudioSource(io.BytesIO(AUDIO), config)
+
+    assert source.bytes_per_second is None
+    assert source.frame_size == streaming.DEFAULT_FRAME_SIZE
+    assert b"".join(source) == AUDIO
+
+    with pytest.raises(ValueError):
+        streaming.AudioSource(AUDIO, config, speed=1.0)
+
+
+def test_audio_source_socket_keeps_samples_whole():
+    sizes = iter([3, 1001, 2, 7])
+    source = streaming.AudioSource(FakeSocket(AUDIO, sizes), LINEAR16)
+
+    frames = list(source)
+    assert all(len(frame) % 4 == 0 for frame in frames)
+    assert all(len(frame) <= 3200 for frame in frames)
+    assert b"".join(frames) == AUDIO
+
+
+def test_audio_source_chunks():
+    chunks = [AUDIO[:5], AUDIO[5:10001], AUDIO[10001:]]
+    source = streaming.AudioSource(iter(chunks), LINEAR16)
+
+    frames = list(source)
+    assert all(len(frame) % 4 == 0 for frame in frames)
+    assert all(len(frame) <= 3200 for frame in frames)
+    assert b"".join(frames) == AUDIO
+
+
+def test_audio_source_partial_samples():
+    chunks = [bytearray(AUDIO[i : i + 3]) for i in range(0, 6000, 3)]
+    source = streaming.AudioSource(iter(chunks), LINEAR16)
+
+    frames = list(source)
+    assert all(isinstance(frame, bytes) for frame in frames)
+    assert all(len(frame) == 4 for frame in frames)
+    assert b"".join(frames) == AUDIO[:6000]
+
+
+def test_audio_source_whole_reads_not_copied():
+    chunks = [AUDIO[:3200], AUDIO[3200:6400]]
+    frames = list(streaming.AudioSource(iter(chunks), LINEAR16))
+
+    assert frames[0] is chunks[0]
+    assert frames[1] is chunks[1]
+
+
+def test_audio_source_invalid_arguments():
+    with pytest.raises(ValueError):
+        streaming.AudioSource(AUDIO, LINEAR16, frame_duration=0)
+    with pytest.raises(ValueError):
+        streaming.AudioSource(AUDIO, LINEAR16, speed=0)
+
+
+def test_audio_source_pacing():
+    source = streaming.AudioSource(AUDIO[:9600], LINEAR16, speed=2.0)
+    clock = mock.Mock(return_value=100.0)
+    with mock.patch("time.monotonic", clock), mock.patch("time.sleep") as sleep:
+        frames = list(source)
+
+    assert len(frames) == 3
+    # Each 100 millisecond frame is due 50 milliseconds after the last.
+    assert [call[0][0] for call in sleep.call_args_list] == [
+        pytest.approx(0.05),
+        pytest.approx(0.1),
+    ]
+
+
+def make_speech_client():
+    credentials = mock.Mock(spec=google.auth.credentials.Credentials)
+    return SpeechClient(credentials=credentials)
+
+
+def final_response(end_seconds, word_seconds):
+    return types.StreamingRecognizeResponse(
+        results=[
+            types.StreamingRecognitionResult(
+                is_final=True,
+                result_end_time={"seconds": end_seconds},
+                alternatives=[
+                    types.SpeechRecognitionAlternative(
+                        words=[
+                            types.WordInfo(
+                                start_time={"seconds": word_seconds},
+                                end_time={"seconds": end_seconds},
+                            )
+                        ]
+                    )
+                ],
+            )
+        ]
+    )
+
+
+def test_streaming_recognize_audio_restarts():
+    client = make_speech_client()
+    config = types.StreamingRecognitionConfig(config=LINEAR16)
+    # Ten seconds of audio, streamed four seconds at a time.
+    audio = bytes(320000)
+    streams = []
+
+    def streaming_recognize(self, requests, **kwargs):
+        streams.append(list(requests))
+        # A final result ending three seconds into the stream.
+        return [final_response(3, 1)]
+
+    super_patch = mock.patch(
+        "google.cloud.speech_v1.services.speech.SpeechClient.streaming_recognize",
+        autospec=True,
+        side_effect=streaming_recognize,
+    )
+    with super_patch as patched:
+        responses = list(
+            client.streaming_recognize_audio(config, audio, restart_interval=4.0)
+        )
+
+    for stream in streams:
+        assert stream[0] == {"streaming_config": config}
+    sent = [
+        sum(len(request["audio_content"]) for request in stream[1:])
+        for stream in streams
+    ]
+    # Each stream resends the audio after the three seconds recognized in
+    # the last, so the streams start at 0, 3, 6 and 9 seconds.
+    assert sent == [128000, 128000, 128000, 32000]
+    assert [
+        response.results[0].result_end_time.total_seconds() for response in responses
+    ] == [3, 6, 9, 12]
+    assert [
+        response.results[0].alternatives[0].words[0].start_time.total_seconds()
+        for response in responses
+    ] == [1, 4, 7, 10]
+    _, kwargs = patched.call_args
+    assert "metadata" in kwargs
+
+
+def test_streaming_recognize_audio_without_restarts():
+    client = make_speech_client()
+    config = types.StreamingRecognitionConfig(config=LINEAR16)
+    streams = []
+
+    def streaming_recognize(self, requests, **kwargs):
+        streams.append(list(requests))
+        return [final_response(3, 1)]
+
+    super_patch = mock.patch(
+        "google.cloud.speech_v1.services.speech.SpeechClient.streaming_recognize",
+        autospec=True,
+        side_effect=streaming_recognize,
+    )
+    with super_patch:
+        responses = list(
+            client.streaming_recognize_audio(config, AUDIO, restart_interval=None)
+        )
+
+    assert len(streams) == 1
+    assert b"".join(request["audio_content"] for request in streams[0][1:]) == AUDIO
+    assert responses[0].results[0].result_end_time.total_seconds() == 3
@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Buffered, batching exporter of spans.
+
+:class:`BatchSpanExporter` queues spans in memory and writes them with
+``batch_write_spans`` from a background thread, so that recording a span
+costs an append to a queue rather than a request.
+
+.. code-block:: python
+
+    from google.cloud import trace_v2
+    from google.cloud.trace_v2.span_exporter import BatchSpanExporter
+
+    client = trace_v2.TraceServiceClient()
+    with BatchSpanExporter(client, "my-project") as exporter:
+        exporter.export(span)
+"""
+
+import collections
+import logging
+import threading
+import time
+from typing import NamedTuple, Optional, Union
+
+from google.cloud.trace_v2.types import trace, tracing
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 2048
+DEFAULT_MAX_BATCH_SIZE = 512
+# Requests are limited to 10 MB; leave room for the rest of the request.
+DEFAULT_MAX_BATCH_BYTES = 8 * 1024 * 1024
+DEFAULT_SCHEDULE_DELAY = 5.0
+
+# The metadata with which gRPC compresses a request, as set by its
+# ``compression`` option. The generated client does not pass that option on
+# to the channel, so it is set directly, and only for the gRPC transport.
+_GZIP_METADATA = ("grpc-internal-encoding-request", "gzip")
+
+
+class ExportStats(NamedTuple):
+    """Counts of the spans passed to a :class:`BatchSpanExporter`."""
+
+    exported: int
+    """Spans written successfully."""
+    dropped: int
+    """Spans dropped because the queue was full or the exporter shut down."""
+    failed: int
+    """Spans whose request failed."""
+
+
+class BatchSpanExporter:
+    """Writes spans in batches from a background thread.
+
+    Spans are queued by :meth:`export` and written in requests of up to
+    ``max_batch_size`` spans and ``max_batch_bytes`` bytes. A request is
+    sent once enough spans are queued to fill it, or ``schedule_delay``
+    seconds after the previous request.
+
+    :meth:`export` never blocks: once ``max_queue_size`` spans are queued,
+    further spans are dropped and counted in :attr:`stats`. Spans which do
+    not fit in a request are queued again, ahead of the others, and if the
+    queue has filled up meanwhile the oldest spans are dropped. Failed
+    requests are logged and counted, and are not retried beyond the
+    client's retry policy, so that a slow backend cannot make the queue
+    grow.
+
+    Args:
+        client (google.cloud.trace_v2.TraceServiceClient): The client used to
+            write spans.
+        project (str): The ID of the project to write spans to.
+        max_queue_size (int): The maximum number of queued spans.
+        max_batch_size (int): The maximum number of spans in a request.
+        max_batch_bytes (int): The maximum encoded size of the spans in a
+            request.
+        schedule_delay (float): The maximum number of seconds between
+            requests while spans are queued.
+        compression (bool): Whether to compress requests with gzip. Only
+            applies to the gRPC transport.
+        timeout (Optional[float]): The timeout of each request.
+
+    Raises:
+        ValueError: If an option is out of range.
+    """
+
+    def __init__(
+        self,
+        client,
+        project: str,
+        *,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        schedule_delay: float = DEFAULT_SCHEDULE_DELAY,
+        compression: bool = True,
+        timeout: Optional[float] = None,
+    ):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be positive.")
+        if not 1 <= max_batch_size <= max_queue_size:
+            raise ValueError("max_batch_size must be between 1 and max_queue_size.")
+        if max_batch_bytes < 1:
+            raise ValueError("max_batch_bytes must be positive.")
+        if schedule_delay < 0:
+            raise ValueError("schedule_delay must not be negative.")
+
+        self._client = client
+        self._name = f"projects/{project}"
+        self._max_queue_size = max_queue_size
+        self._max_batch_size = max_batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._schedule_delay = schedule_delay
+        if compression and client.transport.kind == "grpc":
+            self._metadata = (_GZIP_METADATA,)
+        else:
+            self._metadata = ()
+        self._timeout = timeout
+
+        self._condition = threading.Condition()
+        self._queue = collections.deque()
+        # The number of spans taken from the queue but not yet written.
+        self._writing = 0
+        self._flush_requests = 0
+        self._shutdown = False
+        self._exported = 0
+        self._dropped = 0
+        self._failed = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="trace-span-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    @property
+    def stats(self) -> ExportStats:
+        """ExportStats: The number of spans exported, dropped and failed."""
+        with self._condition:
+            return ExportStats(self._exported, self._dropped, self._failed)
+
+    def export(self, span: Union[trace.Span, dict]) -> bool:
+        """Queue a span to be written.
+
+        Args:
+            span (Union[google.cloud.trace_v2.types.Span, dict]): The span.
+
+        Returns:
+            bool: Whether the span was queued, rather than dropped.
+        """
+        with self._condition:
+            if self._shutdown or len(self._queue) >= self._max_queue_size:
+                self._dropped += 1
+                return False
+            self._queue.append(span)
+            if len(self._queue) == self._max_batch_size:
+                self._condition.notify_all()
+            return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write the queued spans now, and wait until they are written.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to wait.
+
+        Returns:
+            bool: Whether every span queued before the call was written (or
+            failed) before the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flush_requests += 1
+            self._condition.notify_all()
+            try:
+                while self._queue or self._writing:
+                    remaining = None
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                    if not self._thread.is_alive():
+                        return False
+                    self._condition.wait(remaining)
+                return True
+            finally:
+                self._flush_requests -= 1
+
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        """Write the queued spans and stop the exporter.
+
+        Spans exported afterwards are dropped. Calling :meth:`shutdown`
+        more than once is allowed.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to wait
+                for the queued spans to be written.
+
+        Returns:
+            bool: Whether every queued span was written before the timeout.
+        """
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def _run(self):
+        """Write batches of spans until the exporter is shut down."""
+        # Whether spans which did not fit in the last request are queued.
+        requeued = False
+        while True:
+            with self._condition:
+                deadline = time.monotonic() + self._schedule_delay
+                while not (
+                    requeued
+                    or self._shutdown
+                    or self._flush_requests
+                    or len(self._queue) >= self._max_batch_size
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._shutdown and not self._queue:
+                    return
+                count = min(len(self._queue), self._max_batch_size)
+                spans = [self._queue.popleft() for _ in range(count)]
+                self._writing = count
+            batch, requeued = self._fit_batch(spans)
+            self._write(batch)
+
+    def _fit_batch(self, spans):
+        """Return the spans which fit in a request, and requeue the rest.
+
+        Returns:
+            Tuple[List[google.cloud.trace_v2.types.Span], bool]: The spans of
+            the request, and whether any spans were requeued.
+        """
+        batch = []
+        size = 0
+        for index, span in enumerate(spans):
+            try:
+                if not isinstance(span, trace.Span):
+                    span = trace.Span(span)
+                span_size = trace.Span.pb(span).ByteSize()
+            except Exception:
+                _LOGGER.exception("Cannot write an invalid span.")
+                with self._condition:
+                    self._failed += 1
+                    self._writing -= 1
+                continue
+            if batch and size + span_size > self._max_batch_bytes:
+                rest = spans[index:]
+                with self._condition:
+                    self._queue.extendleft(reversed(rest))
+                    self._writing -= len(rest)
+                    # Spans exported meanwhile may have filled the queue.
+                    overflow = len(self._queue) - self._max_queue_size
+                    for _ in range(overflow):
+                        self._queue.popleft()
+                    if overflow > 0:
+                        self._dropped += overflow
+                return batch, True
+            batch.append(span)
+            size += span_size
+        return batch, False
+
+    def _write(self, batch):
+        if not batch:
+            return
+        request = tracing.BatchWriteSpansRequest(name=self._name, spans=batch)
+        kwargs = {"request": request, "metadata": self._metadata}
+        if self._timeout is not None:
+            kwargs["timeout"] = self._timeout
+        try:
+            self._client.batch_write_spans(**kwargs)
+        except Exception:
+            _LOGGER.exception("Failed to write %d spans.", len(batch))
+            succeeded = False
+        else:
+            succeeded = True
+        with self._condition:
+            if succeeded:
+                self._exported += len(batch)
+            else:
+                self._failed += len(batch)
+            self._writing -= len(batch)
+            self._condition.notify_all()
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+import pytest
+
+from google.cloud import trace_v2
+from google.cloud.trace_v2.span_exporter import BatchSpanExporter, ExportStats
+
+PROJECT = "my-project"
+
+
+def make_span(index, display_name=""):
+    span_id = "{:016x}".format(index + 1)
+    return trace_v2.Span(
+        name=f"projects/{PROJECT}/traces/{'0' * 32}/spans/{span_id}",
+        span_id=span_id,
+        display_name={"value": display_name},
+    )
+
+
+def make_client(transport="grpc"):
+    client = mock.Mock(spec=["batch_write_spans", "transport"])
+    client.transport.kind = transport
+    client.requests = []
+    client.batch_write_spans.side_effect = (
+        lambda request, **kwargs: client.requests.append(request)
+    )
+    return client
+
+
+def written(client):
+    return [[span.span_id for span in request.spans] for request in client.requests]
+
+
+@pytest.fixture
+def exporters():
+    exporters = []
+    yield exporters
+    for exporter in exporters:
+        exporter.shutdown()
+
+
+def make_exporter(exporters, client, **kwargs):
+    exporter = BatchSpanExporter(client, PROJECT, **kwargs)
+    exporters.append(exporter)
+    return exporter
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"max_queue_size": 0},
+        {"max_batch_size": 0},
+        {"max_queue_size": 10, "max_batch_size": 11},
+        {"max_batch_bytes": 0},
+        {"schedule_delay": -1},
+    ],
+)
+def test_invalid_options(options):
+    with pytest.raises(ValueError):
+        BatchSpanExporter(make_client(), PROJECT, **options)
+
+
+def test_flush(exporters):
+    client = make_client()
+    exporter = make_exporter(exporters, client, max_batch_size=2, schedule_delay=60)
+    spans = [make_span(index) for index in range(5)]
+    for span in spans:
+        assert exporter.export(span)
+
+    assert exporter.flush(timeout=5)
+    assert [span_id for request in written(client) for span_id in request] == [
+        span.span_id for span in spans
+    ]
+    assert all(len(request) <= 2 for request in written(client))
+    assert client.requests[0].name == f"projects/{PROJECT}"
+    assert exporter.stats == ExportStats(exported=5, dropped=0, failed=0)
+
+
+def test_full_batch_written_without_flush(exporters):
+    client = make_client()
+    exporter = make_exporter(exporters, client, max_batch_size=2, schedule_delay=60)
+    exporter.export(make_span(0))
+    exporter.export(make_span(1))
+
+    deadline = time.monotonic() + 5
+    while not client.requests and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert written(client) == [[make_span(0).span_id, make_span(1).span_id]]
+
+
+def test_schedule_delay(exporters):
+    client = make_client()
+    exporter = make_exporter(exporters, client, schedule_delay=0.01)
+    exporter.export({"span_id": "0000000000000001"})
+
+    deadline = time.monotonic() + 5
+    while not client.requests and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert written(client) == [["0000000000000001"]]
+
+
+def test_max_batch_bytes(exporters):
+    client = make_client()
+    spans = [make_span(index, "x" * 1000) for index in range(3)]
+    size = trace_v2.Span.pb(spans[0]).ByteSize()
+    exporter = make_exporter(
+        exporters, client, max_batch_bytes=2 * size, schedule_delay=60
+    )
+    for span in spans:
+        exporter.export(span)
+    exporter.flush(timeout=5)
+
+    assert [len(request) for request in written(client)] == [2, 1]
+
+
+def test_compression_and_timeout(exporters):
+    client = make_client()
+    exporter = make_exporter(exporters, client, timeout=7.5)
+    exporter.export(make_span(0))
+    exporter.flush(timeout=5)
+
+    _, kwargs = client.batch_write_spans.call_args
+    assert kwargs["metadata"] == (("grpc-internal-encoding-request", "gzip"),)
+    assert kwargs["timeout"] == 7.5
+
+    client = make_client()
+    exporter = make_exporter(exporters, client, compression=False)
+    exporter.export(make_span(0))
+    exporter.flush(timeout=5)
+
+    _, kwargs = client.batch_write_spans.call_args
+    assert kwargs["metadata"] == ()
+    assert "timeout" not in kwargs
+
+
+def test_no_compression_metadata_over_rest(exporters):
+    client = make_client(transport="rest")
+    exporter = make_exporter(exporters, client)
+    exporter.export(make_span(0))
+    exporter.flush(timeout=5)
+
+    _, kwargs = client.batch_write_spans.call_args
+    assert kwargs["metadata"] == ()
+
+
+def test_drops_when_full(exporters):
+    client = make_client()
+    release = threading.Event()
+    client.batch_write_spans.side_effect = lambda request, **kwargs: release.wait()
+    exporter = make_exporter(
+        exporters, client, max_queue_size=2, max_batch_size=1, schedule_delay=0
+    )
+    # The first span is being written, and the next two fill the queue.
+    exporter.export(make_span(0))
+    deadline = time.monotonic() + 5
+    while exporter._queue and time.monotonic() < deadline:
+        time.sleep(0.01)
+    accepted = [exporter.export(make_span(index)) for index in range(1, 5)]
+    release.set()
+    exporter.flush(timeout=5)
+
+    assert accepted == [True, True, False, False]
+    assert exporter.stats == ExportStats(exported=3, dropped=2, failed=0)
+
+
+def test_requeue_drops_oldest_when_full(exporters):
+    client = make_client()
+    size = trace_v2.Span.pb(make_span(0)).ByteSize()
+    exporter = make_exporter(
+        exporters,
+        client,
+        max_queue_size=3,
+        max_batch_size=3,
+        max_batch_bytes=size,
+        schedule_delay=60,
+    )
+    taken = [make_span(index) for index in range(3)]
+    # Spans exported while the taken spans are being written.
+    for index in range(3, 5):
+        assert exporter.export(make_span(index))
+    with exporter._condition:
+        exporter._writing = len(taken)
+
+    batch, requeued = exporter._fit_batch(taken)
+
+    assert [span.span_id for span in batch] == [taken[0].span_id]
+    assert requeued
+    assert [span.span_id for span in exporter._queue] == [
+        make_span(index).span_id for index in (2, 3, 4)
+    ]
+    assert exporter.stats == ExportStats(exported=0, dropped=1, failed=0)
+    with exporter._condition:
+        exporter._writing = 0
+
+
+def test_failed_request(exporters):
+    client = make_client()
+    client.batch_write_spans.side_effect = core_exceptions.ServiceUnavailable("down")
+    exporter = make_exporter(exporters, client)
+    exporter.export(make_span(0))
+    exporter.export({"span_id": 5})
+    exporter.flush(timeout=5)
+
+    # The invalid span fails by itself.
+    assert exporter.stats == ExportStats(exported=0, dropped=0, failed=2)
+
+
+def test_shutdown(exporters):
+    client = make_client()
+    exporter = make_exporter(exporters, client, schedule_delay=60)
+    with exporter:
+        exporter.export(make_span(0))
+
+    assert written(client) == [[make_span(0).span_id]]
+    assert not exporter.export(make_span(1))
+    assert exporter.stats.dropped == 1
+    assert exporter.shutdown()
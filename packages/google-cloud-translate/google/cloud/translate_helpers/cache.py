@@ -0,0 +1,311 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Caches of translation results.
+
+A cache maps a key, made by :func:`make_key` from a text and the options
+which affect its translation, to a string holding the result. Only texts
+missing from the cache are sent to the API.
+
+Caches are passed to :class:`google.cloud.translate_v2.Client`, or to
+:func:`translate_text` with a
+:class:`~google.cloud.translate_v3.TranslationServiceClient`::
+
+    from google.cloud import translate_v2
+    from google.cloud.translate_helpers import cache
+
+    client = translate_v2.Client(cache=cache.SQLiteCache('translations.db'))
+"""
+
+import collections
+import hashlib
+import json
+import sqlite3
+import threading
+
+from google.api_core import gapic_v1
+
+DEFAULT_MAX_ENTRIES = 100000
+
+# The most keys looked up in one query. SQLite limits the number of
+# parameters of a statement to 999 in older versions.
+_MAX_QUERY_KEYS = 500
+
+
+def make_key(text, **options):
+    """Make the cache key of the translation of a text.
+
+    :type text: str
+    :param text: The text to translate.
+
+    :type options: dict
+    :param options: The options which affect the translation, such as the
+        source and target languages, model, format and glossary. Options
+        which are ``None`` or empty are ignored.
+
+    :rtype: str
+    :returns: A hex digest identifying the text and options.
+    """
+    options = {name: value for name, value in options.items() if value}
+    digest = hashlib.sha256(text.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class LRUCache(object):
+    """An in-memory cache which evicts the least recently used entries.
+
+    It may be shared between threads.
+
+    :type max_entries: int
+    :param max_entries: (Optional) The maximum number of entries.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive.")
+        self._max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_many(self, keys):
+        """Look up entries.
+
+        :type keys: iterable of str
+        :param keys: The keys to look up.
+
+        :rtype: dict
+        :returns: The values of the keys which are in the cache.
+        """
+        found = {}
+        with self._lock:
+            for key in keys:
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = value
+        return found
+
+    def set_many(self, entries):
+        """Add entries, evicting the least recently used if full.
+
+        :type entries: dict
+        :param entries: The values of the keys to add.
+        """
+        with self._lock:
+            for key, value in entries.items():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteCache(object):
+    """A cache stored in an SQLite database, which persists between runs.
+
+    It may be shared between threads.
+
+    :type path: str
+    :param path: The path of the database file, which is created if it
+        does not exist.
+    """
+
+    def __init__(self, path):
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM translations"
+            ).fetchone()
+        return count
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def get_many(self, keys):
+        """Look up entries.
+
+        :type keys: iterable of str
+        :param keys: The keys to look up.
+
+        :rtype: dict
+        :returns: The values of the keys which are in the cache.
+        """
+        keys = list(keys)
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _MAX_QUERY_KEYS):
+                batch = keys[start : start + _MAX_QUERY_KEYS]
+                rows = self._connection.execute(
+                    "SELECT key, value FROM translations WHERE key IN ({})".format(
+                        ", ".join("?" * len(batch))
+                    ),
+                    batch,
+                )
+                found.update(rows)
+        return found
+
+    def set_many(self, entries):
+        """Add entries, replacing any with the same keys.
+
+        :type entries: dict
+        :param entries: The values of the keys to add.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO translations (key, value) VALUES (?, ?)",
+                entries.items(),
+            )
+
+
+def lookup(cache, values, translate, **options):
+    """Translate values, sending only those missing from a cache.
+
+    :type cache: :class:`LRUCache` or :class:`SQLiteCache`
+    :param cache: The cache.
+
+    :type values: list of str
+    :param values: The texts to translate.
+
+    :type translate: callable
+    :param translate: Called with the list of the values missing from the
+        cache, returns a list of their results as strings.
+
+    :type options: dict
+    :param options: The options of the translation, passed to
+        :func:`make_key`.
+
+    :rtype: list
+    :returns: The result of each value, in order.
+    """
+    keys = [make_key(value, **options) for value in values]
+    results = cache.get_many(set(keys))
+    missing = {}
+    for value, key in zip(values, keys):
+        if key not in results:
+            missing.setdefault(key, value)
+    if missing:
+        translated = translate(list(missing.values()))
+        if len(translated) != len(missing):
+            raise ValueError(
+                "Expected one result per value", list(missing.values()), translated
+            )
+        fresh = dict(zip(missing, translated))
+        cache.set_many(fresh)
+        results.update(fresh)
+    return [results[key] for key in keys]
+
+
+def translate_text(
+    client,
+    request=None,
+    *,
+    cache,
+    retry=gapic_v1.method.DEFAULT,
+    timeout=gapic_v1.method.DEFAULT,
+    metadata=(),
+):
+    """Translate text with a v3 client, sending only the uncached contents.
+
+    Contents are cached by their source and target languages, MIME type,
+    model and glossary. The contents missing from the cache are sent in
+    one ``translate_text`` request, and the response holds a translation
+    of every content, in order.
+
+    :type client: :class:`~google.cloud.translate_v3.TranslationServiceClient`
+    :param client: The client.
+
+    :type request: :class:`~google.cloud.translate_v3.TranslateTextRequest`
+        or dict
+    :param request: The request.
+
+    :type cache: :class:`LRUCache` or :class:`SQLiteCache`
+    :param cache: The cache.
+
+    :type retry: :class:`google.api_core.retry.Retry`
+    :param retry: (Optional) Designation of what errors, if any, should be
+        retried.
+
+    :type timeout: float
+    :param timeout: (Optional) The timeout of the request.
+
+    :type metadata: sequence of tuple of str
+    :param metadata: (Optional) Strings which should be sent along with the
+        request as metadata.
+
+    :rtype: :class:`~google.cloud.translate_v3.TranslateTextResponse`
+    :returns: The translations.
+    """
+    # Imported here so that users of translate_v2 do not load the v3 client.
+    from google.cloud import translate_v3
+
+    request = translate_v3.TranslateTextRequest(request)
+    glossary = request.glossary_config.glossary
+    options = {
+        "source": request.source_language_code,
+        "target": request.target_language_code,
+        "format": request.mime_type,
+        "model": request.model,
+        "glossary": glossary,
+        "ignore_case": glossary and request.glossary_config.ignore_case,
+    }
+
+    def translate(contents):
+        missing = translate_v3.TranslateTextRequest(request)
+        missing.contents = contents
+        response = client.translate_text(
+            request=missing, retry=retry, timeout=timeout, metadata=metadata
+        )
+        glossary_translations = list(response.glossary_translations)
+        results = []
+        for index, translation in enumerate(response.translations):
+            result = {"translation": translate_v3.Translation.to_dict(translation)}
+            if index < len(glossary_translations):
+                result["glossary_translation"] = translate_v3.Translation.to_dict(
+                    glossary_translations[index]
+                )
+            results.append(json.dumps(result))
+        return results
+
+    results = [
+        json.loads(result)
+        for result in lookup(cache, list(request.contents), translate, **options)
+    ]
+    response = translate_v3.TranslateTextResponse(
+        translations=[result["translation"] for result in results]
+    )
+    if glossary:
+        response.glossary_translations = [
+            result.get("glossary_translation", {}) for result in results
+        ]
+    return response
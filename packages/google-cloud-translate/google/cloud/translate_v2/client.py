@@ -14,10 +14,13 @@
 
 """Client for interacting with the Google Cloud Translation API."""
 
+from concurrent import futures
+import json
 
 import google.api_core.client_options
 from google.cloud.client import Client as BaseClient
 
+from google.cloud.translate_helpers import cache as translation_cache
 from google.cloud.translate_v2._http import Connection
 
 ENGLISH_ISO_639 = "en"
@@ -29,6 +32,9 @@ BASE = "base"
 NMT = "nmt"
 """Neural Machine Translation model."""
 
+DEFAULT_MAX_WORKERS = 8
+"""Default number of requests sent concurrently for a large list of values."""
+
 
 class Client(BaseClient):
     """Client to bundle configuration needed for API requests.
@@ -62,11 +68,33 @@ class Client(BaseClient):
     :type client_options: :class:`~google.api_core.client_options.ClientOptions` or :class:`dict`
     :param client_options: (Optional) Client options used to set user options on the client.
         API Endpoint should be set through client_options.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The maximum number of requests sent
+                        concurrently when the values passed to
+                        :meth:`translate` or :meth:`detect_language` are
+                        split across requests. Defaults to
+                        :data:`DEFAULT_MAX_WORKERS`.
+
+    :type cache: :class:`~google.cloud.translate_helpers.cache.LRUCache` or
+                 :class:`~google.cloud.translate_helpers.cache.SQLiteCache`
+    :param cache: (Optional) A cache of translations. Values whose
+                  translation with the same options is cached are not sent
+                  by :meth:`translate`.
     """
 
     SCOPE = ("https://www.googleapis.com/auth/cloud-platform",)
     """The scopes required for authenticating."""
 
+    MAX_SEGMENTS = 128
+    """The maximum number of values sent in a single request."""
+
+    MAX_CHARACTERS = 5000
+    """The maximum number of characters sent in a single request.
+
+    A value longer than this is sent in a request by itself.
+    """
+
     def __init__(
         self,
         target_language=ENGLISH_ISO_639,
@@ -74,8 +102,14 @@ class Client(BaseClient):
         _http=None,
         client_info=None,
         client_options=None,
+        max_workers=DEFAULT_MAX_WORKERS,
+        cache=None,
     ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive.")
         self.target_language = target_language
+        self.max_workers = max_workers
+        self.cache = cache
         super(Client, self).__init__(credentials=credentials, _http=_http)
 
         kw_args = {"client_info": client_info}
@@ -148,19 +182,17 @@ class Client(BaseClient):
                  :class:`ValueError <exceptions.ValueError>` if a value
                  produces a list of detections with 0 or multiple results
                  in it.
+
+        Lists of more than :attr:`MAX_SEGMENTS` values or
+        :attr:`MAX_CHARACTERS` characters are split across requests, which
+        are sent concurrently.
         """
         single_value = False
         if isinstance(values, str):
             single_value = True
             values = [values]
 
-        data = {"q": values}
-
-        response = self._connection.api_request(
-            method="POST", path="/detect", data=data
-        )
-
-        detections = response.get("data", {}).get("detections", ())
+        detections = self._post_values("/detect", {}, values, "detections")
 
         if len(values) != len(detections):
             raise ValueError(
@@ -242,6 +274,10 @@ class Client(BaseClient):
                   dictionary will be returned.
         :raises: :class:`~exceptions.ValueError` if the number of
                  values and translations differ.
+
+        Lists of more than :attr:`MAX_SEGMENTS` values or
+        :attr:`MAX_CHARACTERS` characters are split across requests, which
+        are sent concurrently.
         """
         single_value = False
         if isinstance(values, str):
@@ -255,16 +291,31 @@ class Client(BaseClient):
 
         data = {
             "target": target_language,
-            "q": values,
             "cid": customization_ids,
             "format": format_,
             "source": source_language,
             "model": model,
         }
 
-        response = self._connection.api_request(method="POST", path="", data=data)
+        if self.cache is None:
+            translations = self._post_values("", data, values, "translations")
+        else:
 
-        translations = response.get("data", {}).get("translations", ())
+            def translate(missing):
+                translations = self._post_values("", data, missing, "translations")
+                return [json.dumps(translation) for translation in translations]
+
+            cached = translation_cache.lookup(
+                self.cache,
+                values,
+                translate,
+                source=source_language,
+                target=target_language,
+                format=format_,
+                model=model,
+                customization_ids=customization_ids,
+            )
+            translations = [json.loads(translation) for translation in cached]
         if len(values) != len(translations):
             raise ValueError(
                 "Expected iterations to have same length", values, translations
@@ -276,3 +327,72 @@ class Client(BaseClient):
             return translations[0]
         else:
             return translations
+
+    def _split_values(self, values):
+        """Split values into lists within the limits of a single request.
+
+        :type values: list
+        :param values: The strings to split.
+
+        :rtype: list
+        :returns: Lists of consecutive values. There is always at least one
+                  list, which may be empty.
+        """
+        chunks = [[]]
+        characters = 0
+        for value in values:
+            chunk = chunks[-1]
+            if chunk and (
+                len(chunk) >= self.MAX_SEGMENTS
+                or characters + len(value) > self.MAX_CHARACTERS
+            ):
+                chunk = []
+                chunks.append(chunk)
+                characters = 0
+            chunk.append(value)
+            characters += len(value)
+        return chunks
+
+    def _post_values(self, path, data, values, key):
+        """Post values in as many requests as needed, and combine the results.
+
+        :type path: str
+        :param path: The path of the requests.
+
+        :type data: dict
+        :param data: The body of each request, other than the values.
+
+        :type values: list
+        :param values: The values to send, as the ``q`` field.
+
+        :type key: str
+        :param key: The field of the ``data`` of each response which holds
+                    the results.
+
+        :rtype: list
+        :returns: The results of every request, in the order of ``values``.
+        """
+
+        def post(chunk):
+            response = self._connection.api_request(
+                method="POST", path=path, data=dict(data, q=chunk)
+            )
+            return response.get("data", {}).get(key, ())
+
+        chunks = self._split_values(values)
+        if len(chunks) == 1:
+            return post(chunks[0])
+
+        with futures.ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(chunks))
+        ) as executor:
+            pending = [executor.submit(post, chunk) for chunk in chunks]
+            try:
+                results = []
+                for future in pending:
+                    results.extend(future.result())
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        return results
@@ -0,0 +1,213 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import mock
+
+
+class Test_make_key(unittest.TestCase):
+    def _call_fut(self, text, **options):
+        from google.cloud.translate_helpers.cache import make_key
+
+        return make_key(text, **options)
+
+    def test_options(self):
+        key = self._call_fut("hello", target="es")
+        self.assertEqual(key, self._call_fut("hello", target="es", model=None))
+        self.assertNotEqual(key, self._call_fut("hello", target="fr"))
+        self.assertNotEqual(key, self._call_fut("hello", target="es", model="nmt"))
+        self.assertNotEqual(key, self._call_fut("hello!", target="es"))
+
+    def test_text_and_options_are_separate(self):
+        self.assertNotEqual(
+            self._call_fut("a", target="b"), self._call_fut("a\0", target="b")
+        )
+
+
+class TestLRUCache(unittest.TestCase):
+    @staticmethod
+    def _make_one(*args, **kwargs):
+        from google.cloud.translate_helpers.cache import LRUCache
+
+        return LRUCache(*args, **kwargs)
+
+    def test_invalid_max_entries(self):
+        with self.assertRaises(ValueError):
+            self._make_one(max_entries=0)
+
+    def test_get_and_set(self):
+        cache = self._make_one()
+        cache.set_many({"a": "1", "b": "2"})
+
+        self.assertEqual(cache.get_many(["a", "c"]), {"a": "1"})
+        self.assertEqual(len(cache), 2)
+
+    def test_eviction(self):
+        cache = self._make_one(max_entries=2)
+        cache.set_many({"a": "1", "b": "2"})
+        cache.get_many(["a"])
+        cache.set_many({"c": "3"})
+
+        self.assertEqual(cache.get_many(["a", "b", "c"]), {"a": "1", "c": "3"})
+
+
+class TestSQLiteCache(unittest.TestCase):
+    def _make_one(self):
+        from google.cloud.translate_helpers.cache import SQLiteCache
+
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "translations.db")
+        self.addCleanup(os.rmdir, directory)
+        self.addCleanup(os.remove, path)
+        return path, SQLiteCache(path)
+
+    def test_persists(self):
+        from google.cloud.translate_helpers.cache import SQLiteCache
+
+        path, cache = self._make_one()
+        with cache:
+            cache.set_many({"a": "1", "b": "2"})
+            cache.set_many({"b": "3"})
+
+        with SQLiteCache(path) as reopened:
+            self.assertEqual(reopened.get_many(["a", "b", "c"]), {"a": "1", "b": "3"})
+            self.assertEqual(len(reopened), 2)
+
+    def test_many_keys(self):
+        _, cache = self._make_one()
+        with cache:
+            entries = {str(index): str(index) for index in range(1200)}
+            cache.set_many(entries)
+
+            self.assertEqual(cache.get_many(list(entries)), entries)
+
+
+class Test_lookup(unittest.TestCase):
+    def _call_fut(self, *args, **kwargs):
+        from google.cloud.translate_helpers.cache import lookup
+
+        return lookup(*args, **kwargs)
+
+    def test_only_misses_translated(self):
+        from google.cloud.translate_helpers.cache import LRUCache
+
+        cache = LRUCache()
+        translate = mock.Mock(side_effect=lambda values: [v.upper() for v in values])
+
+        first = self._call_fut(cache, ["a", "b", "a"], translate, target="es")
+        second = self._call_fut(cache, ["c", "b", "a"], translate, target="es")
+        third = self._call_fut(cache, ["a"], translate, target="fr")
+
+        self.assertEqual(first, ["A", "B", "A"])
+        self.assertEqual(second, ["C", "B", "A"])
+        self.assertEqual(third, ["A"])
+        self.assertEqual(
+            [call[0][0] for call in translate.call_args_list],
+            [["a", "b"], ["c"], ["a"]],
+        )
+
+    def test_all_cached(self):
+        from google.cloud.translate_helpers.cache import LRUCache
+
+        cache = LRUCache()
+        translate = mock.Mock(side_effect=lambda values: values)
+        self._call_fut(cache, ["a"], translate)
+        self._call_fut(cache, ["a"], translate)
+
+        translate.assert_called_once()
+
+    def test_wrong_number_of_results(self):
+        from google.cloud.translate_helpers.cache import LRUCache
+
+        with self.assertRaises(ValueError):
+            self._call_fut(LRUCache(), ["a", "b"], lambda values: ["A"])
+
+
+class Test_translate_text(unittest.TestCase):
+    def _call_fut(self, *args, **kwargs):
+        from google.cloud.translate_helpers.cache import translate_text
+
+        return translate_text(*args, **kwargs)
+
+    @staticmethod
+    def _make_client():
+        from google.cloud import translate_v3
+
+        client = mock.Mock(spec=["translate_text"])
+
+        def translate_text(request, **kwargs):
+            response = translate_v3.TranslateTextResponse(
+                translations=[
+                    {"translated_text": content.upper(), "model": "nmt"}
+                    for content in request.contents
+                ]
+            )
+            if request.glossary_config.glossary:
+                response.glossary_translations = [
+                    {"translated_text": content.title()} for content in request.contents
+                ]
+            return response
+
+        client.translate_text.side_effect = translate_text
+        return client
+
+    def test_only_misses_sent(self):
+        from google.cloud.translate_helpers.cache import LRUCache
+
+        client = self._make_client()
+        cache = LRUCache()
+        request = {
+            "parent": "projects/my-project",
+            "target_language_code": "es",
+            "contents": ["hello", "world"],
+        }
+
+        self._call_fut(client, request, cache=cache)
+        request["contents"] = ["world", "again"]
+        response = self._call_fut(client, request, cache=cache, timeout=5)
+
+        self.assertEqual(
+            [translation.translated_text for translation in response.translations],
+            ["WORLD", "AGAIN"],
+        )
+        self.assertEqual(response.translations[0].model, "nmt")
+        _, kwargs = client.translate_text.call_args
+        self.assertEqual(list(kwargs["request"].contents), ["again"])
+        self.assertEqual(kwargs["request"].parent, "projects/my-project")
+        self.assertEqual(kwargs["timeout"], 5)
+
+    def test_glossary(self):
+        from google.cloud.translate_helpers.cache import LRUCache
+
+        client = self._make_client()
+        cache = LRUCache()
+        request = {
+            "target_language_code": "es",
+            "contents": ["hello world"],
+        }
+        self._call_fut(client, request, cache=cache)
+        request["glossary_config"] = {"glossary": "projects/p/glossaries/g"}
+
+        response = self._call_fut(client, request, cache=cache)
+        cached = self._call_fut(client, request, cache=cache)
+
+        # Translations with a glossary are cached separately.
+        self.assertEqual(client.translate_text.call_count, 2)
+        for result in (response, cached):
+            self.assertEqual(
+                result.glossary_translations[0].translated_text, "Hello World"
+            )
@@ -377,6 +377,122 @@ class TestClient(unittest.TestCase):
         }
         self.assertEqual(req["data"], expected_data)
 
+    def test_constructor_invalid_max_workers(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_http=object(), max_workers=0)
+
+    def test_split_values(self):
+        client = self._make_one(_http=object())
+        client.MAX_SEGMENTS = 3
+        client.MAX_CHARACTERS = 10
+
+        self.assertEqual(client._split_values([]), [[]])
+        self.assertEqual(
+            client._split_values(["a", "b", "c", "d"]), [["a", "b", "c"], ["d"]]
+        )
+        self.assertEqual(
+            client._split_values(["aaaa", "bbbb", "cc", "d"]),
+            [["aaaa", "bbbb", "cc"], ["d"]],
+        )
+        # A value longer than the limit is sent by itself.
+        self.assertEqual(
+            client._split_values(["a", "b" * 20, "c"]), [["a"], ["b" * 20], ["c"]]
+        )
+
+    def test_translate_split(self):
+        client = self._make_one(_http=object(), max_workers=4)
+        client.MAX_SEGMENTS = 2
+        values = ["value-{}".format(index) for index in range(7)]
+        conn = client._connection = _TranslatingConnection()
+
+        result = client.translate(values, target_language="eo")
+
+        self.assertEqual(
+            result,
+            [{"translatedText": value.upper(), "input": value} for value in values],
+        )
+        self.assertEqual(
+            sorted(req["data"]["q"] for req in conn._requested),
+            [values[0:2], values[2:4], values[4:6], values[6:]],
+        )
+        for req in conn._requested:
+            self.assertEqual(req["data"]["target"], "eo")
+
+    def test_translate_split_error(self):
+        from google.cloud.exceptions import BadRequest
+
+        client = self._make_one(_http=object())
+        client.MAX_SEGMENTS = 1
+        client._connection = _TranslatingConnection(fail="b")
+
+        with self.assertRaises(BadRequest):
+            client.translate(["a", "b", "c"])
+
+    def test_detect_language_split(self):
+        client = self._make_one(_http=object())
+        client.MAX_CHARACTERS = 4
+        values = ["abc", "de", "fgh"]
+        conn = client._connection = _TranslatingConnection()
+
+        result = client.detect_language(values)
+
+        self.assertEqual(
+            result,
+            [
+                {"language": value, "confidence": 1.0, "input": value}
+                for value in values
+            ],
+        )
+        self.assertEqual(len(conn._requested), 3)
+        for req in conn._requested:
+            self.assertEqual(req["path"], "/detect")
+
+    def test_translate_cached(self):
+        from google.cloud.translate_helpers.cache import LRUCache
+
+        client = self._make_one(_http=object(), cache=LRUCache())
+        conn = client._connection = _TranslatingConnection()
+
+        client.translate(["a", "b"], target_language="eo")
+        result = client.translate(["b", "c", "a"], target_language="eo")
+        client.translate("a", target_language="es")
+
+        self.assertEqual(
+            result,
+            [
+                {"translatedText": "B", "input": "b"},
+                {"translatedText": "C", "input": "c"},
+                {"translatedText": "A", "input": "a"},
+            ],
+        )
+        self.assertEqual(
+            [req["data"]["q"] for req in conn._requested], [["a", "b"], ["c"], ["a"]]
+        )
+
+
+class _TranslatingConnection(object):
+    """Responds to translation and detection requests from their values."""
+
+    def __init__(self, fail=None):
+        self._fail = fail
+        self._requested = []
+
+    def api_request(self, **kw):
+        from google.cloud.exceptions import BadRequest
+
+        self._requested.append(kw)
+        values = kw["data"]["q"]
+        if self._fail in values:
+            raise BadRequest("Cannot translate " + self._fail)
+        if kw["path"] == "/detect":
+            detections = [
+                [{"language": value, "confidence": 1.0, "isReliable": False}]
+                for value in values
+            ]
+            return {"data": {"detections": detections}}
+        translations = [{"translatedText": value.upper()} for value in values]
+        return {"data": {"translations": translations}}
+
 
 class _Connection(object):
     def __init__(self, *responses):
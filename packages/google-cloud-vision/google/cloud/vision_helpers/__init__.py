@@ -17,6 +17,8 @@ from __future__ import absolute_import
 from google.api_core import protobuf_helpers as protobuf
 import proto
 
+from google.cloud.vision_helpers import batching, images
+
 
 class VisionHelpers(object):
     """A set of convenience methods to make the Vision GAPIC easier to use.
@@ -50,22 +52,79 @@ class VisionHelpers(object):
         Returns:
             :class:`~.vision_v1.AnnotateImageResponse` The API response.
         """
+        request = self._prepare_request(request)
+        r = self.batch_annotate_images(
+            requests=[request], retry=retry, timeout=timeout, metadata=metadata
+        )
+        return r.responses[0]
+
+    def batching_annotator(self, **kwargs):
+        """Return an annotator which sends images in batches.
+
+        Example:
+            >>> from google.cloud.vision_v1 import ImageAnnotatorClient
+            >>> client = ImageAnnotatorClient()
+            >>> with client.batching_annotator() as annotator:
+            ...     futures = [
+            ...         annotator.label_detection({'source': {'image_uri': uri}})
+            ...         for uri in uris
+            ...     ]
+            >>> responses = [future.result() for future in futures]
+
+        Args:
+            kwargs (dict): Options of the
+                :class:`~google.cloud.vision_helpers.batching.BatchingImageAnnotator`.
+
+        Returns:
+            :class:`~google.cloud.vision_helpers.batching.BatchingImageAnnotator`:
+                The annotator.
+        """
+        return batching.BatchingImageAnnotator(self, **kwargs)
+
+    def _prepare_request(
+        self, request, *, max_image_bytes=None, max_image_dimension=None
+    ):
+        """Read the image content of a request, and default to all features.
+
+        The request is copied rather than changed, so that the image
+        content is not held by the caller's request after it is sent.
+
+        Args:
+            request (:class:`~.vision_v1.AnnotateImageRequest`)
+            max_image_bytes (int): Downscale image content larger than this.
+            max_image_dimension (int): Downscale images wider or taller
+                than this, in pixels.
+
+        Returns:
+            The request, ready to be sent.
+        """
         if not isinstance(request, proto.Message):
-            # If the image is a file handler, set the content.
+            request = dict(request)
             image = protobuf.get(request, "image")
             if not isinstance(image, proto.Message):
-                if hasattr(image, "read"):
-                    img_bytes = image.read()
-                    protobuf.set(request, "image", {})
-                    protobuf.set(request, "image.content", img_bytes)
-                    image = protobuf.get(request, "image")
-
-                # If a filename is provided, read the file.
-                filename = protobuf.get(image, "source.filename", default=None)
-                if filename:
-                    with open(filename, "rb") as img_file:
-                        protobuf.set(request, "image.content", img_file.read())
-                        protobuf.set(request, "image.source", None)
+                # If the image is a file handler or a buffer, set the content.
+                if hasattr(image, "read") or images._is_bytes_like(image):
+                    image = {"content": images.read_content(image)}
+                else:
+                    image = dict(image)
+                    content = image.get("content")
+                    # If a filename is provided, read the file.
+                    filename = protobuf.get(image, "source.filename", default=None)
+                    if filename:
+                        content = images.read_content(filename)
+                        image["source"] = None
+                    elif images._is_bytes_like(content):
+                        content = images.read_content(content)
+                    if content is not None:
+                        image["content"] = content
+                if max_image_bytes is not None or max_image_dimension is not None:
+                    if image.get("content"):
+                        image["content"] = images.downscale(
+                            image["content"],
+                            max_bytes=max_image_bytes,
+                            max_dimension=max_image_dimension,
+                        )
+                request["image"] = image
 
         # This method allows features not to be specified, and you get all
         # of them.
@@ -73,10 +132,7 @@ class VisionHelpers(object):
             protobuf.setdefault(request, "features", self._get_all_features())
         elif len(request.features) == 0:
             request.features = self._get_all_features()
-        r = self.batch_annotate_images(
-            requests=[request], retry=retry, timeout=timeout, metadata=metadata
-        )
-        return r.responses[0]
+        return request
 
     def _get_all_features(self):
         """Return a list of all features.
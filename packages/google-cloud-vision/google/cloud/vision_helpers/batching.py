@@ -0,0 +1,328 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batching front end for image annotation.
+
+``batch_annotate_images`` accepts up to 16 images per request, but
+:meth:`~google.cloud.vision_helpers.VisionHelpers.annotate_image` sends one.
+:class:`BatchingImageAnnotator` collects images annotated from any number
+of threads into shared requests, and resolves a future for each image.
+"""
+
+from __future__ import absolute_import
+
+from concurrent import futures
+import functools
+import os
+import threading
+import time
+
+import proto
+
+from google.cloud.vision_helpers import decorators
+
+# The maximum number of images in a batch_annotate_images request.
+MAX_BATCH_SIZE = 16
+
+# The default maximum size of the images in a request. The API rejects
+# requests larger than about 10 MB.
+DEFAULT_MAX_BATCH_BYTES = 8 * 1024 * 1024
+
+DEFAULT_MAX_LATENCY = 0.05
+
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# An allowance for the fields of a request other than the image.
+_REQUEST_OVERHEAD = 1024
+
+
+def _request_size(request):
+    """Estimate the encoded size of an image annotation request."""
+    if isinstance(request, proto.Message):
+        return type(request).pb(request).ByteSize()
+    image = request.get("image") or {}
+    if isinstance(image, proto.Message):
+        return type(image).pb(image).ByteSize() + _REQUEST_OVERHEAD
+    content = image.get("content") or b""
+    source = image.get("source") or {}
+    if isinstance(source, proto.Message):
+        source_size = type(source).pb(source).ByteSize()
+    else:
+        source_size = len(str(source))
+        filename = source.get("filename")
+        if filename:
+            try:
+                source_size += os.path.getsize(filename)
+            except OSError:
+                # The error is raised when the file is read.
+                pass
+    return memoryview(content).nbytes + source_size + _REQUEST_OVERHEAD
+
+
+def _has_file_object(request):
+    """Return whether the image of a request is an open file."""
+    return isinstance(request, dict) and hasattr(request.get("image"), "read")
+
+
+class _Batch(object):
+    """The requests waiting to be sent with the same call options."""
+
+    __slots__ = ("requests", "futures", "size", "deadline")
+
+    def __init__(self, deadline):
+        self.requests = []
+        self.futures = []
+        self.size = 0
+        self.deadline = deadline
+
+
+class BatchingImageAnnotator(object):
+    """Annotates images in batches.
+
+    :meth:`annotate_image` returns a :class:`concurrent.futures.Future`
+    instead of the response. Images annotated with the same ``retry``,
+    ``timeout`` and ``metadata`` are collected into one
+    ``batch_annotate_images`` request, which is sent once it holds
+    ``max_batch_size`` images or ``max_batch_bytes`` of requests, or
+    ``max_latency`` seconds after its first image was added. Up to
+    ``max_in_flight`` requests are sent concurrently.
+
+    Images named by a filename are read only when their batch is sent, so
+    the content of at most ``max_in_flight`` batches is held in memory at
+    a time, however many images are waiting.
+
+    The single-feature methods of the client, such as ``label_detection``,
+    are also available, and likewise return futures. Coroutines may wait
+    for a future with :func:`asyncio.wrap_future`.
+
+    Example:
+        >>> from google.cloud.vision_v1 import ImageAnnotatorClient
+        >>> from google.cloud.vision_helpers.batching import BatchingImageAnnotator
+        >>> client = ImageAnnotatorClient()
+        >>> with BatchingImageAnnotator(client) as annotator:
+        ...     future = annotator.annotate_image({
+        ...         'image': {'source': {'image_uri': 'https://foo.com/image.jpg'}},
+        ...     })
+        >>> response = future.result()
+
+    Args:
+        client (:class:`~.vision_v1.ImageAnnotatorClient`): The client used
+            to send the requests.
+        max_batch_size (int): The maximum number of images in a request.
+            Defaults to, and cannot exceed, 16.
+        max_batch_bytes (int): The maximum estimated size of a request. An
+            image larger than this is sent by itself.
+        max_latency (float): The number of seconds an image may wait for
+            the rest of its batch.
+        max_in_flight (int): The maximum number of concurrent requests.
+        max_image_bytes (int): Downscale image content larger than this,
+            with :func:`~google.cloud.vision_helpers.images.downscale`.
+        max_image_dimension (int): Downscale images wider or taller than
+            this, in pixels.
+
+    Raises:
+        ValueError: If an option is out of range.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        max_batch_size=MAX_BATCH_SIZE,
+        max_batch_bytes=DEFAULT_MAX_BATCH_BYTES,
+        max_latency=DEFAULT_MAX_LATENCY,
+        max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+        max_image_bytes=None,
+        max_image_dimension=None,
+    ):
+        if not 1 <= max_batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(
+                "max_batch_size must be between 1 and {}.".format(MAX_BATCH_SIZE)
+            )
+        if max_batch_bytes < 1:
+            raise ValueError("max_batch_bytes must be positive.")
+        if max_latency < 0:
+            raise ValueError("max_latency must not be negative.")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be positive.")
+
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._max_latency = max_latency
+        self._max_image_bytes = max_image_bytes
+        self._max_image_dimension = max_image_dimension
+
+        self._lock = threading.Condition()
+        # The batch being collected for each set of call options.
+        self._batches = {}
+        self._sent = set()
+        self._closed = False
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="vision-batching"
+        )
+        self._timer = threading.Thread(
+            target=self._send_expired, name="vision-batching-timer", daemon=True
+        )
+        self._timer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getattr__(self, name):
+        # Provide the single-feature methods of the client, such as
+        # label_detection, built on annotate_image.
+        feature = None
+        if name.islower() and not name.startswith("_"):
+            feature = getattr(self._client.Feature.Type, name.upper(), None)
+        if not feature:
+            raise AttributeError(name)
+        detect = decorators._create_single_feature_method(feature)
+        return functools.partial(detect, self)
+
+    def annotate_image(self, request, *, retry=None, timeout=None, metadata=()):
+        """Add an image to the next batch.
+
+        Args:
+            request (:class:`~.vision_v1.AnnotateImageRequest`): The
+                request, as accepted by
+                :meth:`~google.cloud.vision_helpers.VisionHelpers.annotate_image`.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for the request of the batch.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the
+            :class:`~.vision_v1.AnnotateImageResponse` of the image, or the
+            exception raised by its request.
+
+        Raises:
+            RuntimeError: If the annotator is closed.
+        """
+        if _has_file_object(request):
+            # The caller may close the file once this returns.
+            request = self._prepare_request(request)
+        size = _request_size(request)
+        future = futures.Future()
+        key = (retry, timeout, tuple(metadata))
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot annotate images after close().")
+            batch = self._batches.get(key)
+            if batch is not None and batch.size + size > self._max_batch_bytes:
+                self._send(key)
+                batch = None
+            if batch is None:
+                batch = _Batch(time.monotonic() + self._max_latency)
+                self._batches[key] = batch
+                self._lock.notify()
+            batch.requests.append(request)
+            batch.futures.append(future)
+            batch.size += size
+            if (
+                len(batch.requests) >= self._max_batch_size
+                or batch.size >= self._max_batch_bytes
+            ):
+                self._send(key)
+        return future
+
+    def flush(self):
+        """Send the pending images, and wait for their responses."""
+        with self._lock:
+            for key in list(self._batches):
+                self._send(key)
+            sent = list(self._sent)
+        futures.wait(sent)
+
+    def close(self):
+        """Send the pending images and stop the annotator.
+
+        Waits for the responses of every image. Calling
+        :meth:`annotate_image` afterwards raises an error.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._lock.notify()
+        self.flush()
+        self._timer.join()
+        self._executor.shutdown(wait=True)
+
+    def _send(self, key):
+        """Send the batch for a set of call options.
+
+        Must be called with the lock held.
+        """
+        batch = self._batches.pop(key)
+        retry, timeout, metadata = key
+        sent = self._executor.submit(
+            self._annotate_batch, batch, retry, timeout, metadata
+        )
+        self._sent.add(sent)
+        sent.add_done_callback(self._sent_done)
+
+    def _sent_done(self, sent):
+        with self._lock:
+            self._sent.discard(sent)
+
+    def _prepare_request(self, request):
+        return self._client._prepare_request(
+            request,
+            max_image_bytes=self._max_image_bytes,
+            max_image_dimension=self._max_image_dimension,
+        )
+
+    def _annotate_batch(self, batch, retry, timeout, metadata):
+        requests = []
+        pending = []
+        for request, future in zip(batch.requests, batch.futures):
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                requests.append(self._prepare_request(request))
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                pending.append(future)
+        # Release the unprepared requests, which may hold image content.
+        del batch.requests[:]
+        if not requests:
+            return
+        try:
+            response = self._client.batch_annotate_images(
+                requests=requests, retry=retry, timeout=timeout, metadata=metadata
+            )
+        except Exception as exc:
+            for future in pending:
+                future.set_exception(exc)
+        else:
+            for future, image_response in zip(pending, response.responses):
+                future.set_result(image_response)
+
+    def _send_expired(self):
+        """Send each batch once its first image has waited max_latency."""
+        with self._lock:
+            while not self._closed:
+                now = time.monotonic()
+                for key, batch in list(self._batches.items()):
+                    if batch.deadline <= now:
+                        self._send(key)
+                deadlines = [batch.deadline for batch in self._batches.values()]
+                self._lock.wait(min(deadlines) - now if deadlines else None)
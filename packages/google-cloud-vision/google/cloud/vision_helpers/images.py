@@ -0,0 +1,127 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Loading and downscaling of image content.
+
+The content of an image is sent in a ``bytes`` field, so it must be held in
+memory as a :class:`bytes` object. :func:`read_content` makes that object
+with a single copy of the image, whatever its source, and :func:`downscale`
+shrinks images which exceed the API's limits before they are sent.
+"""
+
+from __future__ import absolute_import
+
+import io
+import os
+
+try:
+    import PIL.Image
+except ImportError:  # pragma: NO COVER
+    PIL = None
+
+# The JPEG quality of downscaled images.
+DEFAULT_QUALITY = 85
+
+# The factor by which each attempt to fit an image into max_bytes scales it.
+_SHRINK_FACTOR = 0.75
+
+
+def read_content(image):
+    """Return the content of an image as bytes.
+
+    Args:
+        image (Union[bytes, bytearray, memoryview, mmap.mmap, BinaryIO, str, os.PathLike]):
+            The image: a bytes-like object, a file opened in binary mode,
+            or the name of a file.
+
+    Returns:
+        bytes: The content. :class:`bytes` are returned as is; other
+        sources are copied once.
+    """
+    if isinstance(image, bytes):
+        return image
+    if isinstance(image, (str, os.PathLike)):
+        with open(image, "rb") as image_file:
+            # A single read allocates the content at the size of the file.
+            return image_file.read()
+    if hasattr(image, "read"):
+        return image.read()
+    return memoryview(image).cast("B").tobytes()
+
+
+def _is_bytes_like(value):
+    """Return whether a value is a buffer other than :class:`bytes`."""
+    if isinstance(value, (bytes, str)):
+        return False
+    try:
+        memoryview(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _check_pillow():
+    if PIL is None:
+        raise RuntimeError("Downscaling images requires `Pillow` to be installed.")
+
+
+def downscale(content, *, max_bytes=None, max_dimension=None, quality=DEFAULT_QUALITY):
+    """Shrink an image to fit within a size and a dimension.
+
+    Images within both limits are returned unchanged. Others are resized
+    so that neither side exceeds ``max_dimension``, and re-encoded as JPEG,
+    at smaller and smaller sizes until they fit in ``max_bytes``.
+
+    Args:
+        content (bytes): The content of the image.
+        max_bytes (Optional[int]): The maximum size of the content.
+        max_dimension (Optional[int]): The maximum width and height of the
+            image, in pixels.
+        quality (int): The JPEG quality of a re-encoded image.
+
+    Returns:
+        bytes: The content of the image, or of the downscaled image.
+
+    Raises:
+        RuntimeError: If the image must be downscaled but `Pillow` is not
+            installed.
+        ValueError: If the image cannot be made to fit in ``max_bytes``.
+    """
+    small_enough = max_bytes is None or len(content) <= max_bytes
+    if small_enough and max_dimension is None:
+        return content
+
+    _check_pillow()
+    # BytesIO shares the buffer of bytes until it is written to.
+    with PIL.Image.open(io.BytesIO(content)) as image:
+        width, height = image.size
+        scale = 1.0
+        if max_dimension is not None:
+            scale = min(scale, max_dimension / max(width, height))
+        if small_enough and scale >= 1.0:
+            return content
+
+        image = image.convert("RGB")
+        while True:
+            size = (max(int(width * scale), 1), max(int(height * scale), 1))
+            resized = image if size == image.size else image.resize(size)
+            output = io.BytesIO()
+            resized.save(output, format="JPEG", quality=quality)
+            if max_bytes is None or output.tell() <= max_bytes:
+                return output.getvalue()
+            if size == (1, 1):
+                raise ValueError(
+                    "The image cannot be downscaled to {} bytes.".format(max_bytes)
+                )
+            scale *= _SHRINK_FACTOR
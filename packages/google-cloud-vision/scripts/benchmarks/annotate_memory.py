@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measure the peak memory of annotating many image files concurrently.
+
+Images named by filename are annotated with a
+:class:`~google.cloud.vision_helpers.batching.BatchingImageAnnotator`,
+whose requests are serialized (as the transport would) by a fake client.
+Compares reading each file when its batch is sent with reading every file
+when it is queued, and reports the peak memory traced by
+:mod:`tracemalloc`.
+
+Usage::
+
+    python scripts/benchmarks/annotate_memory.py [--images N] [--size MB]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from google.auth.credentials import AnonymousCredentials
+
+from google.cloud import vision_v1
+from google.cloud.vision_helpers.batching import BatchingImageAnnotator
+
+
+def _make_client(latency):
+    client = vision_v1.ImageAnnotatorClient(credentials=AnonymousCredentials())
+
+    def batch_annotate_images(requests, **kwargs):
+        request = vision_v1.BatchAnnotateImagesRequest(requests=requests)
+        vision_v1.BatchAnnotateImagesRequest.serialize(request)
+        time.sleep(latency)
+        return vision_v1.BatchAnnotateImagesResponse(responses=[{} for _ in requests])
+
+    client.batch_annotate_images = batch_annotate_images
+    return client
+
+
+def _annotate(client, filenames, eager, max_in_flight):
+    with BatchingImageAnnotator(
+        client, max_batch_size=4, max_in_flight=max_in_flight
+    ) as annotator:
+        for filename in filenames:
+            request = {"image": {"source": {"filename": filename}}}
+            if eager:
+                # As when every image was read when it was queued.
+                request = client._prepare_request(request)
+            annotator.annotate_image(request)
+
+
+def _measure(function, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--images", type=int, default=64)
+    parser.add_argument("--size", type=float, default=2.0, help="MB per image")
+    parser.add_argument("--max-in-flight", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    size = int(args.size * 1024 * 1024)
+    client = _make_client(args.latency)
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = []
+        for index in range(args.images):
+            filename = os.path.join(directory, "{}.jpg".format(index))
+            with open(filename, "wb") as image_file:
+                image_file.write(os.urandom(size))
+            filenames.append(filename)
+
+        print(
+            "{} images of {:.1f} MiB, {} requests in flight".format(
+                args.images, size / 2**20, args.max_in_flight
+            )
+        )
+        for name, eager in (("read when queued", True), ("read when sent", False)):
+            elapsed, peak = _measure(
+                _annotate, client, filenames, eager, args.max_in_flight
+            )
+            print(
+                "{:>18}: {:8.1f} MiB peak, {:6.2f}s".format(
+                    name, peak / 2**20, elapsed
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
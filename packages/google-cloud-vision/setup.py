@@ -44,6 +44,8 @@ dependencies = [
     "proto-plus >= 1.22.3, <2.0.0dev",
     "protobuf>=3.19.5,<5.0.0dev,!=3.20.0,!=3.20.1,!=4.21.0,!=4.21.1,!=4.21.2,!=4.21.3,!=4.21.4,!=4.21.5",
 ]
+extras = {"pillow": "Pillow >= 9.0.0"}
+
 url = "https://github.com/googleapis/google-cloud-python/tree/main/packages/google-cloud-vision"
 
 package_root = os.path.abspath(os.path.dirname(__file__))
@@ -86,6 +88,7 @@ setuptools.setup(
     packages=packages,
     python_requires=">=3.7",
     install_requires=dependencies,
+    extras_require=extras,
     include_package_data=True,
     zip_safe=False,
 )
@@ -0,0 +1,232 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import threading
+import unittest
+
+from google.api_core import exceptions
+from google.auth.credentials import Credentials
+import mock
+
+import google.cloud.vision_v1 as vision_v1
+from google.cloud.vision_helpers.batching import BatchingImageAnnotator
+from google.cloud.vision_v1 import ImageAnnotatorClient
+
+
+def batch_annotate_images(requests, **kwargs):
+    # Respond to each request with a label naming its image.
+    return vision_v1.BatchAnnotateImagesResponse(
+        responses=[
+            {"label_annotations": [{"description": _image_uri(request)}]}
+            for request in requests
+        ]
+    )
+
+
+def _image_uri(request):
+    if isinstance(request, dict):
+        return request["image"]["source"]["image_uri"]
+    return request.image.source.image_uri
+
+
+def make_request(name, **kwargs):
+    return {"image": {"source": {"image_uri": name}}, **kwargs}
+
+
+class TestBatchingImageAnnotator(unittest.TestCase):
+    def setUp(self):
+        credentials = mock.Mock(spec=Credentials)
+        self.client = ImageAnnotatorClient(credentials=credentials)
+        patch = mock.patch.object(
+            ImageAnnotatorClient,
+            "batch_annotate_images",
+            side_effect=batch_annotate_images,
+        )
+        self.batch_annotate = patch.start()
+        self.addCleanup(patch.stop)
+
+    def _make_one(self, **kwargs):
+        annotator = BatchingImageAnnotator(self.client, **kwargs)
+        self.addCleanup(annotator.close)
+        return annotator
+
+    def _batches(self):
+        return [
+            [_image_uri(request) for request in call[1]["requests"]]
+            for call in self.batch_annotate.call_args_list
+        ]
+
+    def test_invalid_options(self):
+        for options in (
+            {"max_batch_size": 0},
+            {"max_batch_size": 17},
+            {"max_batch_bytes": 0},
+            {"max_latency": -1},
+            {"max_in_flight": 0},
+        ):
+            with self.assertRaises(ValueError):
+                BatchingImageAnnotator(self.client, **options)
+
+    def test_full_batches(self):
+        annotator = self._make_one(max_latency=60)
+        names = ["image-{}".format(index) for index in range(32)]
+        results = [annotator.annotate_image(make_request(name)) for name in names]
+
+        responses = [future.result(timeout=5) for future in results]
+        self.assertEqual(
+            [response.label_annotations[0].description for response in responses],
+            names,
+        )
+        self.assertEqual(self._batches(), [names[:16], names[16:]])
+        # Images without features are annotated with all of them.
+        _, kwargs = self.batch_annotate.call_args
+        self.assertEqual(
+            len(kwargs["requests"][0]["features"]),
+            len(self.client._get_all_features()),
+        )
+
+    def test_max_latency(self):
+        annotator = self._make_one(max_latency=0.01)
+        future = annotator.annotate_image(make_request("a"))
+
+        response = future.result(timeout=5)
+        self.assertEqual(response.label_annotations[0].description, "a")
+        self.assertEqual(self._batches(), [["a"]])
+
+    def test_max_batch_bytes(self):
+        annotator = self._make_one(max_batch_bytes=5000, max_latency=60)
+        for name in "abc":
+            request = make_request(name)
+            request["image"]["content"] = b"x" * 2000
+            annotator.annotate_image(request)
+        annotator.flush()
+
+        self.assertEqual(self._batches(), [["a"], ["b"], ["c"]])
+
+    def test_call_options(self):
+        annotator = self._make_one(max_latency=60)
+        first = annotator.annotate_image(make_request("a"), timeout=5)
+        second = annotator.annotate_image(make_request("b"), metadata=[("k", "v")])
+        third = annotator.annotate_image(make_request("c"), timeout=5)
+        annotator.flush()
+
+        for future in (first, second, third):
+            self.assertTrue(future.done())
+        calls = {
+            tuple(_image_uri(request) for request in kwargs["requests"]): kwargs
+            for _, kwargs in self.batch_annotate.call_args_list
+        }
+        self.assertEqual(calls[("a", "c")]["timeout"], 5)
+        self.assertEqual(calls[("b",)]["metadata"], (("k", "v"),))
+
+    def test_single_feature_methods(self):
+        annotator = self._make_one(max_latency=60)
+        future = annotator.label_detection(
+            {"source": {"image_uri": "a"}}, max_results=3
+        )
+        annotator.flush()
+
+        self.assertEqual(future.result().label_annotations[0].description, "a")
+        _, kwargs = self.batch_annotate.call_args
+        self.assertEqual(
+            kwargs["requests"][0]["features"],
+            [{"type_": vision_v1.Feature.Type.LABEL_DETECTION, "max_results": 3}],
+        )
+        with self.assertRaises(AttributeError):
+            annotator.no_such_detection
+
+    def test_error(self):
+        error = exceptions.InvalidArgument("bad image")
+        self.batch_annotate.side_effect = error
+        annotator = self._make_one(max_latency=60)
+        futures = [annotator.annotate_image(make_request(name)) for name in "ab"]
+        annotator.flush()
+
+        for future in futures:
+            self.assertIs(future.exception(), error)
+
+    def test_cancelled(self):
+        annotator = self._make_one(max_latency=60)
+        cancelled = annotator.annotate_image(make_request("a"))
+        future = annotator.annotate_image(make_request("b"))
+        cancelled.cancel()
+        annotator.flush()
+
+        self.assertEqual(future.result().label_annotations[0].description, "b")
+        self.assertEqual(self._batches(), [["b"]])
+
+    def test_many_threads(self):
+        annotator = self._make_one(max_latency=60)
+        results = {}
+
+        def annotate(name):
+            results[name] = annotator.annotate_image(make_request(name))
+
+        threads = [
+            threading.Thread(target=annotate, args=(str(index),)) for index in range(64)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        annotator.flush()
+
+        self.assertEqual(self.batch_annotate.call_count, 4)
+        for name, future in results.items():
+            self.assertEqual(future.result().label_annotations[0].description, name)
+
+    def test_close(self):
+        annotator = self._make_one(max_latency=60)
+        with annotator:
+            future = annotator.annotate_image(make_request("a"))
+
+        self.assertTrue(future.done())
+        with self.assertRaises(RuntimeError):
+            annotator.annotate_image(make_request("b"))
+
+    def test_filenames_read_when_sent(self):
+        annotator = self._make_one(max_latency=60)
+        with mock.patch(
+            "builtins.open", mock.mock_open(read_data=b"image==")
+        ) as io_open:
+            found = annotator.annotate_image(
+                {"image": {"source": {"filename": "found.jpg"}}}
+            )
+            io_open.assert_not_called()
+            annotator.flush()
+
+        self.assertTrue(found.done())
+        io_open.assert_called_once_with("found.jpg", "rb")
+        _, kwargs = self.batch_annotate.call_args
+        self.assertEqual(kwargs["requests"][0]["image"]["content"], b"image==")
+
+    def test_unreadable_file(self):
+        annotator = self._make_one(max_latency=60)
+        missing = annotator.annotate_image(
+            {"image": {"source": {"filename": "/no/such/image.jpg"}}}
+        )
+        found = annotator.annotate_image(make_request("a"))
+        annotator.flush()
+
+        self.assertIsInstance(missing.exception(), OSError)
+        self.assertEqual(found.result().label_annotations[0].description, "a")
+
+    def test_client_batching_annotator(self):
+        annotator = self.client.batching_annotator(max_batch_size=2)
+        self.addCleanup(annotator.close)
+
+        self.assertIsInstance(annotator, BatchingImageAnnotator)
+        self.assertEqual(annotator._max_batch_size, 2)
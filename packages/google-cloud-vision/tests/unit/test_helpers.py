@@ -128,3 +128,36 @@ class TestSingleImageHelper(unittest.TestCase):
         # Evalute the request object to ensure it looks correct.
         request_sent = kwargs["requests"][0]
         assert request_sent["image"]["content"] == b"imagefile=="
+
+    @mock.patch.object(ImageAnnotatorClient, "batch_annotate_images")
+    def test_image_buffer(self, batch_annotate):
+        self.client.annotate_image({"image": memoryview(b"bogus==")})
+        self.client.annotate_image({"image": {"content": bytearray(b"bogus==")}})
+
+        for args, kwargs in batch_annotate.call_args_list:
+            request_sent = kwargs["requests"][0]
+            assert request_sent["image"]["content"] == b"bogus=="
+            assert type(request_sent["image"]["content"]) is bytes
+
+    @mock.patch.object(ImageAnnotatorClient, "batch_annotate_images")
+    def test_request_not_changed(self, batch_annotate):
+        file_ = io.BytesIO(b"bogus==")
+        request = {"image": file_}
+
+        self.client.annotate_image(request)
+
+        # The caller's request does not keep the content of the image.
+        assert request == {"image": file_}
+        _, args, kwargs = batch_annotate.mock_calls[0]
+        assert kwargs["requests"][0]["image"] == {"content": b"bogus=="}
+
+    @mock.patch("google.cloud.vision_helpers.images.downscale")
+    def test_prepare_request_downscale(self, downscale):
+        downscale.return_value = b"small"
+
+        request = self.client._prepare_request(
+            {"image": {"content": b"large"}}, max_image_dimension=100
+        )
+
+        downscale.assert_called_once_with(b"large", max_bytes=None, max_dimension=100)
+        assert request["image"]["content"] == b"small"
@@ -0,0 +1,110 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import io
+import mmap
+import os
+import random
+import tempfile
+import unittest
+
+import mock
+
+from google.cloud.vision_helpers import images
+
+try:
+    import PIL.Image
+except ImportError:  # pragma: NO COVER
+    PIL = None
+
+
+def _make_png(width, height):
+    rng = random.Random(0)
+    image = PIL.Image.frombytes(
+        "RGB",
+        (width, height),
+        bytes(rng.getrandbits(8) for _ in range(width * height * 3)),
+    )
+    output = io.BytesIO()
+    image.save(output, format="PNG")
+    return output.getvalue()
+
+
+class TestReadContent(unittest.TestCase):
+    def test_bytes(self):
+        content = b"image"
+        self.assertIs(images.read_content(content), content)
+
+    def test_buffers(self):
+        for buffer in (bytearray(b"image"), memoryview(b"image")):
+            self.assertEqual(images.read_content(buffer), b"image")
+        self.assertEqual(images.read_content(memoryview(b"xximage")[2:]), b"image")
+
+    def test_file_object(self):
+        self.assertEqual(images.read_content(io.BytesIO(b"image")), b"image")
+
+    def test_filename_and_mmap(self):
+        with tempfile.NamedTemporaryFile(delete=False) as image_file:
+            image_file.write(b"image")
+        self.addCleanup(os.remove, image_file.name)
+
+        self.assertEqual(images.read_content(image_file.name), b"image")
+        with open(image_file.name, "rb") as image_file:
+            with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(images.read_content(mapped), b"image")
+
+    def test_is_bytes_like(self):
+        self.assertTrue(images._is_bytes_like(bytearray(b"x")))
+        self.assertTrue(images._is_bytes_like(memoryview(b"x")))
+        self.assertFalse(images._is_bytes_like(b"x"))
+        self.assertFalse(images._is_bytes_like("x"))
+        self.assertFalse(images._is_bytes_like({"content": b"x"}))
+
+
+@unittest.skipIf(PIL is None, "Requires Pillow")
+class TestDownscale(unittest.TestCase):
+    def test_within_limits(self):
+        content = _make_png(64, 32)
+        self.assertIs(images.downscale(content), content)
+        self.assertIs(images.downscale(content, max_bytes=len(content)), content)
+        self.assertIs(images.downscale(content, max_dimension=64), content)
+
+    def test_max_dimension(self):
+        content = _make_png(64, 32)
+        downscaled = images.downscale(content, max_dimension=16)
+
+        with PIL.Image.open(io.BytesIO(downscaled)) as image:
+            self.assertEqual(image.format, "JPEG")
+            self.assertEqual(image.size, (16, 8))
+
+    def test_max_bytes(self):
+        content = _make_png(256, 256)
+        downscaled = images.downscale(content, max_bytes=4000)
+
+        self.assertLessEqual(len(downscaled), 4000)
+        with PIL.Image.open(io.BytesIO(downscaled)) as image:
+            self.assertLess(image.size[0], 256)
+
+    def test_max_bytes_too_small(self):
+        with self.assertRaises(ValueError):
+            images.downscale(_make_png(8, 8), max_bytes=10)
+
+    def test_without_pillow(self):
+        content = _make_png(8, 8)
+        with mock.patch.object(images, "PIL", None):
+            self.assertIs(images.downscale(content, max_bytes=len(content)), content)
+            with self.assertRaises(RuntimeError):
+                images.downscale(content, max_dimension=4)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Decoding of Rice-Golomb delta encoded integers.
+
+The integers of a :class:`~google.cloud.webrisk_v1.types.RiceDeltaEncoding`
+are sorted, and each after the first is encoded as its difference from the
+previous one: a quotient in unary (``q`` one bits and a zero bit) followed
+by a remainder of ``rice_parameter`` bits. Bits are read from the least
+significant bit of each byte of ``encoded_data`` first.
+"""
+
+import array
+
+# Bits are read through a 64-bit window, which holds at least 57 unread bits
+# whatever the offset of the first bit within its byte.
+_WINDOW_BYTES = 8
+_WINDOW_BITS = 57
+
+
+def decode_integers(encoding):
+    """Decode Rice-Golomb delta encoded integers.
+
+    Args:
+        encoding (google.cloud.webrisk_v1.types.RiceDeltaEncoding): The
+            encoded integers.
+
+    Returns:
+        array.array: The decoded unsigned 32-bit integers, in order.
+
+    Raises:
+        ValueError: If the encoding is invalid or truncated.
+    """
+    first_value = encoding.first_value
+    count = encoding.entry_count
+    rice_parameter = encoding.rice_parameter
+    values = array.array("I")
+    try:
+        values.append(first_value)
+    except OverflowError:
+        raise ValueError("The first value must fit in 32 bits.")
+    if not count:
+        return values
+    if not 2 <= rice_parameter <= 28:
+        raise ValueError("The Rice parameter must be between 2 and 28.")
+
+    # Pad the data so that every window is a full 8 bytes.
+    data = memoryview(bytes(encoding.encoded_data) + bytes(_WINDOW_BYTES))
+    total_bits = len(encoding.encoded_data) * 8
+    remainder_mask = (1 << rice_parameter) - 1
+    from_bytes = int.from_bytes
+    append = values.append
+    value = first_value
+    position = 0
+    for _ in range(count):
+        byte, offset = divmod(position, 8)
+        window = from_bytes(data[byte : byte + _WINDOW_BYTES], "little") >> offset
+        # The quotient is the number of trailing one bits of the window.
+        zeros = ~window
+        quotient = (zeros & -zeros).bit_length() - 1
+        if quotient + 1 + rice_parameter > _WINDOW_BITS:
+            quotient, window = _read_long_quotient(data, position, total_bits)
+        remainder = (window >> (quotient + 1)) & remainder_mask
+        position += quotient + 1 + rice_parameter
+        if position > total_bits:
+            raise ValueError("The encoded data is truncated.")
+        value += (quotient << rice_parameter) | remainder
+        try:
+            append(value)
+        except OverflowError:
+            raise ValueError("The decoded values must fit in 32 bits.")
+    return values
+
+
+def _read_long_quotient(data, position, total_bits):
+    """Read a quotient which does not fit in a single window.
+
+    Returns:
+        Tuple[int, int]: The quotient, and a window starting at the
+        zero bit which ends it.
+    """
+    quotient = 0
+    while True:
+        if position >= total_bits:
+            raise ValueError("The encoded data is truncated.")
+        byte, offset = divmod(position, 8)
+        if not (data[byte] >> offset) & 1:
+            window = int.from_bytes(data[byte : byte + _WINDOW_BYTES], "little")
+            # Shift the window so that the remainder follows `quotient + 1`
+            # bits, as for a short quotient.
+            return quotient, (window >> offset) << quotient
+        quotient += 1
+        position += 1
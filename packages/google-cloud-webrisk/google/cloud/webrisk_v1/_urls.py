@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Canonicalization of URLs and the expressions hashed to look them up.
+
+The rules are those of the Web Risk Update API: a URL is canonicalized,
+and then looked up as up to 30 combinations of a suffix of its host and
+a prefix of its path, each hashed with SHA256.
+"""
+
+import hashlib
+import re
+from urllib.parse import unquote_to_bytes
+
+# Characters removed from anywhere in a URL.
+_REMOVED_CHARACTERS = str.maketrans("", "", "\t\r\n")
+
+_CONSECUTIVE_DOTS = re.compile(r"\.{2,}")
+
+# The number of components, at most, of the host suffixes looked up.
+_MAX_HOST_COMPONENTS = 5
+# The number of path prefixes looked up, besides the exact path.
+_MAX_PATH_PREFIXES = 4
+
+
+def _unescape(text):
+    """Percent-unescape text until it has no more escapes.
+
+    The text holds a character for each byte, of the same code point, so
+    that escapes of bytes which are not UTF-8 survive unchanged.
+    """
+    while True:
+        unescaped = unquote_to_bytes(text.encode("latin-1")).decode("latin-1")
+        if unescaped == text:
+            return text
+        text = unescaped
+
+
+def _escape(text):
+    """Percent-escape control, space, non-ASCII, "#" and "%" characters."""
+    return "".join(
+        character
+        if " " < character < "\x7f" and character not in "#%"
+        else "%{:02X}".format(ord(character))
+        for character in text
+    )
+
+
+def _parse_ipv4(host):
+    """Parse a host in any of the forms of ``inet_aton``.
+
+    Returns:
+        Optional[str]: The address in dotted-decimal form, or None if the
+        host is not an IPv4 address.
+    """
+    parts = host.split(".")
+    if len(parts) > 4:
+        return None
+    numbers = []
+    for part in parts:
+        try:
+            if part[:2] in ("0x", "0X"):
+                numbers.append(int(part[2:], 16))
+            elif len(part) > 1 and part[0] == "0":
+                numbers.append(int(part, 8))
+            else:
+                numbers.append(int(part, 10))
+        except ValueError:
+            return None
+    # The last number fills the bytes left by the others.
+    last_bytes = 5 - len(numbers)
+    if any(number > 255 for number in numbers[:-1]) or numbers[-1] >= 1 << (
+        8 * last_bytes
+    ):
+        return None
+    address = numbers[:-1] + list(numbers[-1].to_bytes(last_bytes, "big"))
+    return ".".join(str(number) for number in address)
+
+
+def _normalize_path(path):
+    """Resolve "." and ".." segments and collapse consecutive slashes."""
+    segments = []
+    directory = path.endswith("/")
+    for segment in path.split("/"):
+        if segment in ("", "."):
+            directory = True
+            continue
+        if segment == "..":
+            if segments:
+                segments.pop()
+            directory = True
+            continue
+        segments.append(segment)
+        directory = False
+    if path.endswith("/"):
+        directory = True
+    return "/" + "/".join(segments) + ("/" if directory and segments else "")
+
+
+def _split(uri):
+    """Canonicalize a URL and split it into its parts.
+
+    Returns:
+        Tuple[str, str, bool, str, Optional[str]]: The scheme, the host,
+        whether the host is an IP address, the path and the query, which
+        is None if the URL has none.
+    """
+    uri = uri.strip().translate(_REMOVED_CHARACTERS)
+    # Work on the UTF-8 bytes of the URL, a character for each byte.
+    uri = uri.encode("utf-8").decode("latin-1")
+    uri = uri.split("#", 1)[0]
+    uri = _unescape(uri)
+    scheme, separator, rest = uri.partition("://")
+    if not separator:
+        scheme, rest = "http", uri
+
+    end = len(rest)
+    for delimiter in "/?":
+        index = rest.find(delimiter)
+        if index >= 0:
+            end = min(end, index)
+    authority, rest = rest[:end], rest[end:]
+    rest, separator, query = rest.partition("?")
+    if not separator:
+        query = None
+
+    host = authority.rpartition("@")[2]
+    if not host.startswith("["):
+        host = host.rpartition(":")[0] or host
+    host = _CONSECUTIVE_DOTS.sub(".", host.strip("."))
+    # Lowercase ASCII letters only; other characters stand for bytes.
+    host = host.encode("latin-1").lower().decode("latin-1")
+    address = _parse_ipv4(host)
+    if address is not None:
+        host = address
+    return (
+        scheme.lower(),
+        _escape(host),
+        address is not None,
+        _escape(_normalize_path(rest)),
+        None if query is None else _escape(query),
+    )
+
+
+def canonicalize(uri):
+    """Canonicalize a URL.
+
+    Args:
+        uri (str): The URL.
+
+    Returns:
+        str: The canonical URL.
+    """
+    scheme, host, _, path, query = _split(uri)
+    canonical = "{}://{}{}".format(scheme, host, path)
+    if query is not None:
+        canonical += "?" + query
+    return canonical
+
+
+def expressions(uri):
+    """List the host suffix and path prefix expressions of a URL.
+
+    Args:
+        uri (str): The URL.
+
+    Returns:
+        List[str]: The expressions, most specific first and without
+        duplicates.
+    """
+    _, host, is_address, path, query = _split(uri)
+
+    hosts = [host]
+    if not is_address:
+        components = host.split(".")
+        start = max(1, len(components) - _MAX_HOST_COMPONENTS)
+        # The top-level domain alone is not looked up.
+        for index in range(start, len(components) - 1):
+            hosts.append(".".join(components[index:]))
+
+    paths = []
+    if query is not None:
+        paths.append(path + "?" + query)
+    paths.append(path)
+    prefix = "/"
+    directories = path.split("/")[1:-1]
+    for directory in [None] + directories[: _MAX_PATH_PREFIXES - 1]:
+        if directory is not None:
+            prefix += directory + "/"
+        if prefix not in paths:
+            paths.append(prefix)
+
+    return [host + path for host in hosts for path in paths]
+
+
+def full_hashes(uri):
+    """Compute the SHA256 hashes of the expressions of a URL.
+
+    Args:
+        uri (str): The URL.
+
+    Returns:
+        List[bytes]: The hashes, in the order of :func:`expressions`.
+    """
+    return [
+        hashlib.sha256(expression.encode("ascii")).digest()
+        for expression in expressions(uri)
+    ]
@@ -0,0 +1,676 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A local database of threat lists, kept up to date with the Update API.
+
+:class:`LocalThreatDatabase` holds the hash prefixes of threat lists,
+updated with ``compute_threat_list_diff``, and checks URLs against them
+without a request. Only a URL with an expression whose hash has a prefix
+in a list is looked up with ``search_hashes``, and the full hashes found
+are cached until they expire.
+
+.. code-block:: python
+
+    from google.cloud import webrisk_v1
+    from google.cloud.webrisk_v1.local_database import LocalThreatDatabase
+
+    client = webrisk_v1.WebRiskServiceClient()
+    threat_types = [
+        webrisk_v1.ThreatType.MALWARE,
+        webrisk_v1.ThreatType.SOCIAL_ENGINEERING,
+    ]
+    with LocalThreatDatabase(client, threat_types, path="webrisk.db") as database:
+        threats = database.lookup_uri("http://example.com/")
+"""
+
+import array
+import base64
+import bisect
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from google.cloud.webrisk_v1 import _rice, _urls
+from google.cloud.webrisk_v1.types import webrisk
+
+_LOGGER = logging.getLogger(__name__)
+
+# The number of seconds between updates of a threat list when the server
+# does not recommend a time.
+DEFAULT_UPDATE_INTERVAL = 30 * 60.0
+# The number of seconds before retrying an update which failed.
+DEFAULT_RETRY_INTERVAL = 5 * 60.0
+# The maximum number of seconds between fetches of a list whose checksum
+# keeps failing to match. The interval doubles from DEFAULT_RETRY_INTERVAL
+# with each mismatch.
+_MAX_MISMATCH_RETRY_INTERVAL = 24 * 60 * 60.0
+
+# The size of nearly every hash prefix.
+_PREFIX_SIZE = 4
+_FULL_HASH_SIZE = 32
+# An array of unsigned 32-bit integers.
+_TYPECODE = "I"
+
+_FILE_MAGIC = b"WEBRISK1"
+_FILE_HEADER = struct.Struct("<8sI")
+
+
+def _big_endian_bytes(values):
+    """Concatenate 32-bit integers as big-endian bytes."""
+    values = array.array(_TYPECODE, bytes(values))
+    if sys.byteorder == "little":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_big_endian_bytes(data):
+    """Split bytes into big-endian 32-bit integers."""
+    values = array.array(_TYPECODE)
+    values.frombytes(data)
+    if sys.byteorder == "little":
+        values.byteswap()
+    return values
+
+
+class HashPrefixList(object):
+    """A sorted list of the hash prefixes of a threat list.
+
+    Prefixes of 4 bytes, nearly all of them, are held as the big-endian
+    unsigned 32-bit integers they encode, in a compact array which is
+    searched by bisection. Their order is thus the lexicographic order of
+    the prefixes. Longer prefixes are held in a set.
+
+    Lists are not modified: :meth:`apply` returns a new list.
+
+    Args:
+        short_prefixes (Sequence[int]): The sorted integers of the 4-byte
+            prefixes: an :class:`array.array` or a :class:`memoryview`
+            of unsigned 32-bit integers.
+        long_prefixes (Iterable[bytes]): The prefixes longer than 4 bytes.
+    """
+
+    def __init__(
+        self,
+        short_prefixes: Optional[Sequence[int]] = None,
+        long_prefixes: Iterable[bytes] = (),
+    ):
+        if short_prefixes is None:
+            short_prefixes = array.array(_TYPECODE)
+        self._short = short_prefixes
+        self._long = sorted(long_prefixes)
+        self._long_set = frozenset(self._long)
+        self._long_sizes = sorted({len(prefix) for prefix in self._long})
+
+    @classmethod
+    def from_prefixes(cls, prefixes: Iterable[bytes]) -> "HashPrefixList":
+        """Build a list out of hash prefixes, in any order.
+
+        Raises:
+            ValueError: If a prefix is shorter than 4 or longer than 32 bytes.
+        """
+        short = array.array(_TYPECODE)
+        long = []
+        for prefix in prefixes:
+            prefix = bytes(prefix)
+            if not _PREFIX_SIZE <= len(prefix) <= _FULL_HASH_SIZE:
+                raise ValueError("Hash prefixes must have 4 to 32 bytes.")
+            if len(prefix) == _PREFIX_SIZE:
+                short.append(int.from_bytes(prefix, "big"))
+            else:
+                long.append(prefix)
+        return cls(array.array(_TYPECODE, sorted(short)), long)
+
+    def __len__(self):
+        return len(self._short) + len(self._long)
+
+    def __iter__(self):
+        short = (value.to_bytes(_PREFIX_SIZE, "big") for value in self._short)
+        if not self._long:
+            return short
+        return heapq.merge(short, self._long)
+
+    def match(self, full_hash: bytes) -> Optional[bytes]:
+        """Find the prefix of a full hash in the list.
+
+        Returns:
+            Optional[bytes]: The prefix, or None if the list has none.
+        """
+        short = self._short
+        value = int.from_bytes(full_hash[:_PREFIX_SIZE], "big")
+        index = bisect.bisect_left(short, value)
+        if index < len(short) and short[index] == value:
+            return full_hash[:_PREFIX_SIZE]
+        for size in self._long_sizes:
+            if full_hash[:size] in self._long_set:
+                return full_hash[:size]
+        return None
+
+    def sha256(self) -> bytes:
+        """Compute the SHA256 hash of the prefixes, concatenated in order."""
+        digest = hashlib.sha256()
+        if self._long:
+            for prefix in self:
+                digest.update(prefix)
+        else:
+            digest.update(_big_endian_bytes(self._short))
+        return digest.digest()
+
+    def apply(
+        self,
+        removals: Iterable[int] = (),
+        short_additions: Iterable[int] = (),
+        long_additions: Iterable[bytes] = (),
+    ) -> "HashPrefixList":
+        """Remove prefixes, then add others.
+
+        Args:
+            removals (Iterable[int]): The indices in this list of the
+                prefixes to remove.
+            short_additions (Iterable[int]): The integers of the 4-byte
+                prefixes to add.
+            long_additions (Iterable[bytes]): The longer prefixes to add.
+
+        Returns:
+            HashPrefixList: The new list.
+
+        Raises:
+            ValueError: If an index is out of range.
+        """
+        removals = sorted(set(removals))
+        if removals and (removals[0] < 0 or removals[-1] >= len(self)):
+            raise ValueError("A removal index is out of range.")
+
+        if self._long:
+            # The indices count prefixes of every size, so work on them all.
+            removed = set(removals)
+            kept = [prefix for index, prefix in enumerate(self) if index not in removed]
+            short = array.array(
+                _TYPECODE,
+                (
+                    int.from_bytes(prefix, "big")
+                    for prefix in kept
+                    if len(prefix) == _PREFIX_SIZE
+                ),
+            )
+            long = [prefix for prefix in kept if len(prefix) > _PREFIX_SIZE]
+        else:
+            short = array.array(_TYPECODE)
+            start = 0
+            for index in removals:
+                short.extend(self._short[start:index])
+                start = index + 1
+            short.extend(self._short[start:])
+            long = []
+
+        short_additions = array.array(_TYPECODE, short_additions)
+        if short_additions:
+            short = array.array(
+                _TYPECODE, sorted(itertools.chain(short, short_additions))
+            )
+        long.extend(long_additions)
+        return HashPrefixList(short, long)
+
+
+def _removal_indices(removals):
+    """Decode the indices of a ``ThreatEntryRemovals``."""
+    indices = array.array(_TYPECODE, removals.raw_indices.indices)
+    if removals.HasField("rice_indices"):
+        indices.extend(_rice.decode_integers(removals.rice_indices))
+    return indices
+
+
+def _additions(additions):
+    """Decode the prefixes of a ``ThreatEntryAdditions``.
+
+    Returns:
+        Tuple[array.array, List[bytes]]: The integers of the 4-byte
+        prefixes, and the longer prefixes.
+    """
+    short = array.array(_TYPECODE)
+    long = []
+    for raw_hashes in additions.raw_hashes:
+        size = raw_hashes.prefix_size
+        data = raw_hashes.raw_hashes
+        if not _PREFIX_SIZE <= size <= _FULL_HASH_SIZE or len(data) % size:
+            raise ValueError("Invalid raw hashes of size {}.".format(size))
+        if size == _PREFIX_SIZE:
+            short.extend(_from_big_endian_bytes(data))
+        else:
+            long.extend(
+                data[start : start + size] for start in range(0, len(data), size)
+            )
+    if additions.HasField("rice_hashes"):
+        # The integers are the prefixes read as little-endian integers.
+        values = _rice.decode_integers(additions.rice_hashes)
+        values.byteswap()
+        short.extend(values)
+    return short, long
+
+
+def _timestamp_seconds(timestamp):
+    return timestamp.seconds + timestamp.nanos / 1e9
+
+
+def _write_file(path, lists):
+    """Save the prefixes and version tokens of threat lists to a file.
+
+    The file is written next to ``path`` and then renamed, so that a file
+    mapped by :func:`_read_file` is never modified.
+    """
+    header = {"byteorder": sys.byteorder, "lists": []}
+    blocks = []
+    offset = 0
+    for name, (version_token, prefixes) in lists.items():
+        block = bytes(prefixes._short)
+        header["lists"].append(
+            {
+                "threat_type": name,
+                "version_token": base64.b64encode(version_token).decode("ascii"),
+                "offset": offset,
+                "count": len(prefixes._short),
+                "long_prefixes": [
+                    base64.b64encode(prefix).decode("ascii")
+                    for prefix in prefixes._long
+                ],
+            }
+        )
+        blocks.append(block)
+        offset += len(block)
+    header = json.dumps(header).encode("utf-8")
+    # Align the prefixes, so that the mapped file can be read as integers.
+    padding = -(_FILE_HEADER.size + len(header)) % array.array(_TYPECODE).itemsize
+    header += b" " * padding
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(_FILE_HEADER.pack(_FILE_MAGIC, len(header)))
+        file.write(header)
+        for block in blocks:
+            file.write(block)
+    os.replace(temporary_path, path)
+
+
+def _read_file(path):
+    """Load the prefixes and version tokens of threat lists from a file.
+
+    The file is mapped into memory, and the 4-byte prefixes of each list
+    are read from the mapping as needed rather than copied, until a diff
+    is applied to the list.
+
+    Returns:
+        Dict[str, Tuple[bytes, HashPrefixList]]: The version token and the
+        prefixes of each threat list, by the name of its threat type.
+
+    Raises:
+        ValueError: If the file is not a database file.
+    """
+    with open(path, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapping)
+    magic, header_size = _FILE_HEADER.unpack_from(view)
+    if magic != _FILE_MAGIC:
+        raise ValueError("{} is not a threat list database.".format(path))
+    start = _FILE_HEADER.size + header_size
+    header = json.loads(bytes(view[_FILE_HEADER.size : start]).decode("utf-8"))
+    itemsize = array.array(_TYPECODE).itemsize
+
+    lists = {}
+    for entry in header["lists"]:
+        offset = start + entry["offset"]
+        block = view[offset : offset + entry["count"] * itemsize]
+        if header["byteorder"] == sys.byteorder:
+            short = block.cast(_TYPECODE)
+        else:
+            short = array.array(_TYPECODE, bytes(block))
+            short.byteswap()
+        long = [base64.b64decode(prefix) for prefix in entry["long_prefixes"]]
+        lists[entry["threat_type"]] = (
+            base64.b64decode(entry["version_token"]),
+            HashPrefixList(short, long),
+        )
+    return lists
+
+
+class _ThreatList(object):
+    """The state of one threat list."""
+
+    __slots__ = (
+        "threat_type",
+        "prefixes",
+        "version_token",
+        "next_update",
+        "mismatches",
+    )
+
+    def __init__(self, threat_type):
+        self.threat_type = threat_type
+        self.prefixes = HashPrefixList()
+        # An empty token requests the whole list.
+        self.version_token = b""
+        # The time.time() at which to update the list.
+        self.next_update = 0.0
+        # The number of consecutive updates whose checksum did not match.
+        self.mismatches = 0
+
+
+class LocalThreatDatabase(object):
+    """A local copy of threat lists, for checking URLs.
+
+    :meth:`update` fetches the changes to each threat list since the last
+    update with ``compute_threat_list_diff`` and applies them, checking
+    the result against the SHA256 checksum sent by the server. A list
+    which does not match is fetched whole on its next update, which is
+    scheduled with exponential backoff while mismatches persist. Once
+    :meth:`start` is called, a background thread updates each list when
+    the server recommends.
+
+    :meth:`lookup_uri` hashes the expressions of a URL and searches for
+    their prefixes in the lists. A URL with no prefix in any list is safe.
+    Otherwise, the full hashes with the prefix are fetched with
+    ``search_hashes`` and cached: the threats found until their
+    ``expire_time``, and the absence of others until the response's
+    ``negative_expire_time``.
+
+    Args:
+        client (google.cloud.webrisk_v1.WebRiskServiceClient): The client
+            to use.
+        threat_types (Sequence[google.cloud.webrisk_v1.types.ThreatType]):
+            The threat lists to keep.
+        path (str): (Optional) A file in which to keep the lists, so that
+            they are not fetched whole each time the database is created.
+            The file is loaded if it exists, and saved after each update.
+        max_diff_entries (int): (Optional) The maximum number of entries in
+            each diff.
+        max_database_entries (int): (Optional) The maximum number of entries
+            to keep in each list.
+        timeout (float): (Optional) The timeout of each request.
+    """
+
+    def __init__(
+        self,
+        client,
+        threat_types: Sequence[webrisk.ThreatType],
+        *,
+        path: Optional[str] = None,
+        max_diff_entries: Optional[int] = None,
+        max_database_entries: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        if not threat_types:
+            raise ValueError("At least one threat type is required.")
+        self._client = client
+        self._path = path
+        self._constraints = webrisk.ComputeThreatListDiffRequest.Constraints(
+            supported_compressions=[
+                webrisk.CompressionType.RAW,
+                webrisk.CompressionType.RICE,
+            ],
+            max_diff_entries=max_diff_entries or 0,
+            max_database_entries=max_database_entries or 0,
+        )
+        self._timeout = timeout
+
+        self._lists = {}
+        for threat_type in threat_types:
+            threat_type = webrisk.ThreatType(threat_type)
+            self._lists[threat_type] = _ThreatList(threat_type)
+        if path is not None and os.path.exists(path):
+            for name, (version_token, prefixes) in _read_file(path).items():
+                threat_list = self._lists.get(webrisk.ThreatType[name])
+                if threat_list is not None:
+                    threat_list.version_token = version_token
+                    threat_list.prefixes = prefixes
+
+        self._condition = threading.Condition()
+        # The time.time() at which each (full hash, threat type) and each
+        # (hash prefix, threat type) expire from the caches.
+        self._positive_cache: Dict[Tuple[bytes, webrisk.ThreatType], float] = {}
+        self._negative_cache: Dict[Tuple[bytes, webrisk.ThreatType], float] = {}
+        self._thread = None
+        self._stopped = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def update(self, *, only_due: bool = False):
+        """Apply the changes to each threat list since its last update.
+
+        Args:
+            only_due (bool): (Optional) Whether to update only the lists
+                whose recommended update time has passed.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If a request
+                fails.
+            ValueError: If a response is invalid.
+        """
+        now = time.time()
+        for threat_list in self._lists.values():
+            if not only_due or threat_list.next_update <= now:
+                self._update_list(threat_list)
+        self._prune_caches(time.time())
+        if self._path is not None:
+            self._save()
+
+    def start(self):
+        """Start updating the threat lists in a background thread.
+
+        The lists are updated when the server recommends, or every 30
+        minutes. A failed update is logged and retried after 5 minutes.
+        """
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="webrisk-local-database", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop updating the threat lists in the background."""
+        with self._condition:
+            thread, self._thread = self._thread, None
+            self._stopped = True
+            self._condition.notify_all()
+        if thread is not None:
+            thread.join()
+
+    def lookup_uri(self, uri: str) -> List[webrisk.ThreatType]:
+        """Find the threats of a URL.
+
+        Args:
+            uri (str): The URL.
+
+        Returns:
+            List[google.cloud.webrisk_v1.types.ThreatType]: The threat types
+            of the lists which have the URL, if any.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If the request for
+                the full hashes of a matching prefix fails.
+        """
+        return self.lookup_hashes(_urls.full_hashes(uri))
+
+    def lookup_hashes(self, full_hashes: Iterable[bytes]) -> List[webrisk.ThreatType]:
+        """Find the threats of the full hashes of URL expressions.
+
+        Args:
+            full_hashes (Iterable[bytes]): The SHA256 hashes of the
+                expressions.
+
+        Returns:
+            List[google.cloud.webrisk_v1.types.ThreatType]: The threat types
+            of the lists which have any of the hashes.
+        """
+        # The threat types and the full hashes of each matching prefix.
+        matches = {}
+        for full_hash in full_hashes:
+            for threat_type, threat_list in self._lists.items():
+                prefix = threat_list.prefixes.match(full_hash)
+                if prefix is not None:
+                    threat_types, hashes = matches.setdefault(prefix, (set(), set()))
+                    threat_types.add(threat_type)
+                    hashes.add(full_hash)
+
+        threats = set()
+        for prefix, (threat_types, hashes) in matches.items():
+            threats.update(self._lookup_prefix(prefix, threat_types, hashes))
+        return sorted(threats)
+
+    def _lookup_prefix(self, prefix, threat_types, full_hashes):
+        """Find the threats of full hashes with a prefix in the lists."""
+        threats = set()
+        unresolved = set()
+        now = time.time()
+        with self._condition:
+            for threat_type in threat_types:
+                safe = self._negative_cache.get((prefix, threat_type), 0) > now
+                for full_hash in full_hashes:
+                    if self._positive_cache.get((full_hash, threat_type), 0) > now:
+                        threats.add(threat_type)
+                    elif not safe:
+                        unresolved.add(threat_type)
+        unresolved -= threats
+        if not unresolved:
+            return threats
+
+        request = webrisk.SearchHashesRequest(
+            hash_prefix=prefix, threat_types=sorted(unresolved)
+        )
+        response = self._client.search_hashes(request=request, timeout=self._timeout)
+        response = webrisk.SearchHashesResponse.pb(response)
+
+        negative_expire_time = _timestamp_seconds(response.negative_expire_time)
+        with self._condition:
+            for threat_type in unresolved:
+                self._negative_cache[(prefix, threat_type)] = negative_expire_time
+            for threat in response.threats:
+                expire_time = _timestamp_seconds(threat.expire_time)
+                for threat_type in threat.threat_types:
+                    threat_type = webrisk.ThreatType(threat_type)
+                    self._positive_cache[(threat.hash_, threat_type)] = expire_time
+                    if threat_type in unresolved and threat.hash_ in full_hashes:
+                        threats.add(threat_type)
+        return threats
+
+    def _update_list(self, threat_list):
+        request = webrisk.ComputeThreatListDiffRequest(
+            threat_type=threat_list.threat_type,
+            version_token=threat_list.version_token,
+            constraints=self._constraints,
+        )
+        response = self._client.compute_threat_list_diff(
+            request=request, timeout=self._timeout
+        )
+        response = webrisk.ComputeThreatListDiffResponse.pb(response)
+
+        response_types = webrisk.ComputeThreatListDiffResponse.ResponseType
+        if response.response_type == response_types.RESET:
+            prefixes = HashPrefixList()
+            removals = ()
+        elif response.response_type == response_types.DIFF:
+            prefixes = threat_list.prefixes
+            removals = _removal_indices(response.removals)
+        else:
+            raise ValueError("The response has no type.")
+        short, long = _additions(response.additions)
+        prefixes = prefixes.apply(removals, short, long)
+
+        if response.HasField("recommended_next_diff"):
+            next_update = _timestamp_seconds(response.recommended_next_diff)
+        else:
+            next_update = time.time() + DEFAULT_UPDATE_INTERVAL
+
+        if prefixes.sha256() != response.checksum.sha256:
+            # Keep the old prefixes until the list is fetched again, backing
+            # off so that a mismatch which persists does not refetch the
+            # whole list continually.
+            with self._condition:
+                threat_list.mismatches += 1
+                retry_interval = min(
+                    DEFAULT_RETRY_INTERVAL * 2 ** min(threat_list.mismatches - 1, 16),
+                    _MAX_MISMATCH_RETRY_INTERVAL,
+                )
+                threat_list.version_token = b""
+                threat_list.next_update = time.time() + retry_interval
+            _LOGGER.warning(
+                "The checksum of the %s list does not match; fetching it whole "
+                "in %d seconds.",
+                threat_list.threat_type.name,
+                retry_interval,
+            )
+            return
+
+        with self._condition:
+            threat_list.prefixes = prefixes
+            threat_list.version_token = response.new_version_token
+            threat_list.next_update = next_update
+            threat_list.mismatches = 0
+
+    def _prune_caches(self, now):
+        with self._condition:
+            for cache in (self._positive_cache, self._negative_cache):
+                for key in [key for key, expire in cache.items() if expire <= now]:
+                    del cache[key]
+
+    def _save(self):
+        with self._condition:
+            lists = {
+                threat_list.threat_type.name: (
+                    threat_list.version_token,
+                    threat_list.prefixes,
+                )
+                for threat_list in self._lists.values()
+            }
+        _write_file(self._path, lists)
+
+    def _run(self):
+        """Update the threat lists when due, until stopped."""
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    next_update = min(
+                        threat_list.next_update for threat_list in self._lists.values()
+                    )
+                    timeout = next_update - time.time()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                if self._stopped:
+                    return
+            try:
+                self.update(only_due=True)
+            except Exception:
+                _LOGGER.exception("Failed to update the threat lists.")
+                retry_time = time.time() + DEFAULT_RETRY_INTERVAL
+                with self._condition:
+                    for threat_list in self._lists.values():
+                        threat_list.next_update = max(
+                            threat_list.next_update, retry_time
+                        )
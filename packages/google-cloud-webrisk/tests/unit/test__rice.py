@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import random
+
+import pytest
+
+from google.cloud.webrisk_v1 import types
+from google.cloud.webrisk_v1._rice import decode_integers
+
+
+def rice_encode(values, rice_parameter):
+    encoded = 0
+    position = 0
+    for previous, value in zip(values, values[1:]):
+        quotient, remainder = divmod(value - previous, 1 << rice_parameter)
+        encoded |= ((1 << quotient) - 1) << position
+        position += quotient + 1
+        encoded |= remainder << position
+        position += rice_parameter
+    return types.RiceDeltaEncoding(
+        first_value=values[0],
+        rice_parameter=rice_parameter,
+        entry_count=len(values) - 1,
+        encoded_data=encoded.to_bytes((position + 7) // 8, "little"),
+    )
+
+
+def test_decode_integers():
+    # Deltas of 2 (quotient 0, remainder 2) and 15 (quotient 3, remainder 3),
+    # read from the least significant bit of each byte first.
+    encoding = types.RiceDeltaEncoding(
+        first_value=5, rice_parameter=2, entry_count=2, encoded_data=b"\xbc\x01"
+    )
+    assert list(decode_integers(encoding)) == [5, 7, 22]
+
+
+def test_decode_integers_single_value():
+    encoding = types.RiceDeltaEncoding(first_value=12345)
+    assert list(decode_integers(encoding)) == [12345]
+
+
+@pytest.mark.parametrize(
+    "size,limit,rice_parameter",
+    [(1000, 2**32, 18), (1000, 2**32, 28), (100, 2**12, 2), (10, 2**16, 2)],
+)
+def test_decode_integers_round_trip(size, limit, rice_parameter):
+    # Small Rice parameters make quotients longer than a 64-bit window.
+    values = sorted(random.Random(size).sample(range(limit), size))
+    encoding = rice_encode(values, rice_parameter)
+    assert list(decode_integers(encoding)) == values
+
+
+def test_decode_integers_truncated():
+    encoding = rice_encode([1, 100, 10000], 4)
+    encoding.encoded_data = encoding.encoded_data[:-1]
+    with pytest.raises(ValueError):
+        decode_integers(encoding)
+
+
+def test_decode_integers_invalid_rice_parameter():
+    encoding = rice_encode([1, 100], 4)
+    encoding.rice_parameter = 1
+    with pytest.raises(ValueError):
+        decode_integers(encoding)
+
+
+def test_decode_integers_overflow():
+    encoding = rice_encode([2**32 - 1, 2**32 + 1], 4)
+    with pytest.raises(ValueError):
+        decode_integers(encoding)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import hashlib
+
+import pytest
+
+from google.cloud.webrisk_v1 import _urls
+
+
+@pytest.mark.parametrize(
+    "uri,expected",
+    [
+        ("http://host/%25%32%35", "http://host/%25"),
+        ("http://host/%25%32%35%25%32%35", "http://host/%25%25"),
+        ("http://host/%2525252525252525", "http://host/%25"),
+        ("http://host/asdf%25%32%35asd", "http://host/asdf%25asd"),
+        ("http://host/%%%25%32%35asd%%", "http://host/%25%25%25asd%25%25"),
+        (
+            "http://%31%36%38%2e%31%38%38%2e%39%39%2e%32%36/%2E%73%65%63%75%72%65/",
+            "http://168.188.99.26/.secure/",
+        ),
+        (
+            "http://host%23.com/%257Ea%2521b%2540c%2523d%2524e%25f%255E00%252611",
+            "http://host%23.com/~a!b@c%23d$e%25f^00&11",
+        ),
+        ("http://3279880203/blah", "http://195.127.0.11/blah"),
+        ("http://0xc3.0177.11/", "http://195.127.0.11/"),
+        ("http://www.google.com/blah/..", "http://www.google.com/"),
+        ("www.google.com/", "http://www.google.com/"),
+        ("www.google.com", "http://www.google.com/"),
+        ("http://www.evil.com/blah#frag", "http://www.evil.com/blah"),
+        ("http://www.GOOgle.com/", "http://www.google.com/"),
+        ("http://www.google.com.../", "http://www.google.com/"),
+        ("http://www.google.com/foo\tbar\rbaz\n2", "http://www.google.com/foobarbaz2"),
+        ("http://www.google.com/q?", "http://www.google.com/q?"),
+        ("http://www.google.com/q?r?s", "http://www.google.com/q?r?s"),
+        ("http://evil.com/foo#bar#baz", "http://evil.com/foo"),
+        ("http://evil.com/foo?bar;", "http://evil.com/foo?bar;"),
+        ("http://\x01\x80.com/", "http://%01%C2%80.com/"),
+        ("http://notrailingslash.com", "http://notrailingslash.com/"),
+        ("http://user@www.gotaport.com:1234/", "http://www.gotaport.com/"),
+        ("  http://www.google.com/  ", "http://www.google.com/"),
+        ("http:// leadingspace.com/", "http://%20leadingspace.com/"),
+        ("%20leadingspace.com/", "http://%20leadingspace.com/"),
+        ("https://www.securesite.com/", "https://www.securesite.com/"),
+        ("http://host.com/ab%23cd", "http://host.com/ab%23cd"),
+        (
+            "http://host.com//twoslashes?more//slashes",
+            "http://host.com/twoslashes?more//slashes",
+        ),
+    ],
+)
+def test_canonicalize(uri, expected):
+    assert _urls.canonicalize(uri) == expected
+
+
+def test_expressions():
+    assert _urls.expressions("http://a.b.c/1/2.html?param=1") == [
+        "a.b.c/1/2.html?param=1",
+        "a.b.c/1/2.html",
+        "a.b.c/",
+        "a.b.c/1/",
+        "b.c/1/2.html?param=1",
+        "b.c/1/2.html",
+        "b.c/",
+        "b.c/1/",
+    ]
+
+
+def test_expressions_limits():
+    expressions = _urls.expressions("http://a.b.c.d.e.f.g/1/2/3/4/5/6.html")
+    hosts = sorted({expression.split("/", 1)[0] for expression in expressions})
+    paths = sorted({"/" + expression.split("/", 1)[1] for expression in expressions})
+    # The exact host, and four suffixes of at most five components.
+    assert hosts == ["a.b.c.d.e.f.g", "c.d.e.f.g", "d.e.f.g", "e.f.g", "f.g"]
+    # The exact path, and four prefixes.
+    assert paths == ["/", "/1/", "/1/2/", "/1/2/3/", "/1/2/3/4/5/6.html"]
+    assert len(expressions) == 25
+
+
+def test_expressions_ip_address():
+    assert _urls.expressions("http://1.2.3.4/1/") == ["1.2.3.4/1/", "1.2.3.4/"]
+
+
+def test_full_hashes():
+    assert _urls.full_hashes("http://a.b/") == [hashlib.sha256(b"a.b/").digest()]
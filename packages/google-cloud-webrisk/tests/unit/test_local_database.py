@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import hashlib
+import time
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import pytest
+
+from google.cloud.webrisk_v1 import _urls, local_database, types
+from google.cloud.webrisk_v1.local_database import HashPrefixList, LocalThreatDatabase
+
+MALWARE = types.ThreatType.MALWARE
+SOCIAL_ENGINEERING = types.ThreatType.SOCIAL_ENGINEERING
+
+EVIL_URI = "http://evil.example.com/download.exe"
+EVIL_HASH = _urls.full_hashes(EVIL_URI)[0]
+OTHER_PREFIXES = [b"\x00\x00\x00\x01", b"\x7f\x00\x00\x00", b"\xff\xff\xff\xfe"]
+
+
+def checksum(prefixes):
+    return hashlib.sha256(b"".join(sorted(prefixes))).digest()
+
+
+def rice_hashes(prefixes):
+    """Rice-encode 4-byte prefixes, as little-endian integers."""
+    values = sorted(int.from_bytes(prefix, "little") for prefix in prefixes)
+    encoded = 0
+    position = 0
+    for previous, value in zip(values, values[1:]):
+        quotient, remainder = divmod(value - previous, 1 << 28)
+        encoded |= ((1 << quotient) - 1) << position
+        position += quotient + 1
+        encoded |= remainder << position
+        position += 28
+    return types.RiceDeltaEncoding(
+        first_value=values[0],
+        rice_parameter=28,
+        entry_count=len(values) - 1,
+        encoded_data=encoded.to_bytes((position + 7) // 8, "little"),
+    )
+
+
+def diff_response(response_type, prefixes, additions=None, removals=None, token=b"2"):
+    return types.ComputeThreatListDiffResponse(
+        response_type=response_type,
+        additions=additions or {},
+        removals=removals or {},
+        new_version_token=token,
+        checksum={"sha256": checksum(prefixes)},
+        recommended_next_diff={"seconds": int(time.time()) + 3600},
+    )
+
+
+def reset_response(prefixes, token=b"1"):
+    return diff_response(
+        types.ComputeThreatListDiffResponse.ResponseType.RESET,
+        prefixes,
+        additions={
+            "raw_hashes": [{"prefix_size": 4, "raw_hashes": b"".join(prefixes)}]
+        },
+        token=token,
+    )
+
+
+def make_client(responses=()):
+    client = mock.Mock(spec=["compute_threat_list_diff", "search_hashes"])
+    client.compute_threat_list_diff.side_effect = list(responses)
+    return client
+
+
+def test_hash_prefix_list():
+    prefixes = HashPrefixList.from_prefixes(
+        OTHER_PREFIXES[::-1] + [b"\x7f\x00\x00\x00\x01"]
+    )
+
+    assert len(prefixes) == 4
+    assert list(prefixes) == [
+        b"\x00\x00\x00\x01",
+        b"\x7f\x00\x00\x00",
+        b"\x7f\x00\x00\x00\x01",
+        b"\xff\xff\xff\xfe",
+    ]
+    assert prefixes.sha256() == checksum(list(prefixes))
+    assert prefixes.match(b"\x7f\x00\x00\x00" + bytes(28)) == b"\x7f\x00\x00\x00"
+    assert prefixes.match(b"\x7f\x00\x00\x01" + bytes(28)) is None
+    assert prefixes.match(b"\xff\xff\xff\xff" + bytes(28)) is None
+
+    with pytest.raises(ValueError):
+        HashPrefixList.from_prefixes([b"\x00"])
+
+
+def test_hash_prefix_list_long_prefix_match():
+    prefixes = HashPrefixList.from_prefixes([b"\x01\x02\x03\x04\x05"])
+    assert (
+        prefixes.match(b"\x01\x02\x03\x04\x05" + bytes(27)) == b"\x01\x02\x03\x04\x05"
+    )
+    assert prefixes.match(b"\x01\x02\x03\x04\x06" + bytes(27)) is None
+
+
+@pytest.mark.parametrize("long_prefix", [False, True])
+def test_hash_prefix_list_apply(long_prefix):
+    initial = list(OTHER_PREFIXES)
+    if long_prefix:
+        initial.append(b"\x7f\x00\x00\x00\x01")
+    prefixes = HashPrefixList.from_prefixes(initial)
+
+    updated = prefixes.apply(
+        removals=[0, 1],
+        short_additions=[int.from_bytes(b"\x10\x00\x00\x00", "big")],
+        long_additions=[b"\x20\x00\x00\x00\x00"],
+    )
+
+    expected = sorted(initial)[2:] + [b"\x10\x00\x00\x00", b"\x20\x00\x00\x00\x00"]
+    assert list(updated) == sorted(expected)
+    assert updated.sha256() == checksum(expected)
+    # The original list is unchanged.
+    assert list(prefixes) == sorted(initial)
+
+    with pytest.raises(ValueError):
+        prefixes.apply(removals=[len(initial)])
+
+
+def test_update_reset_and_diff():
+    initial = OTHER_PREFIXES + [EVIL_HASH[:4]]
+    added = [b"\x01\x02\x03\x04", b"\xa0\xb0\xc0\xd0"]
+    # The first two prefixes are removed.
+    removed = sorted(initial)[:2]
+    final = sorted(initial)[2:] + added
+    client = make_client(
+        [
+            reset_response(initial),
+            diff_response(
+                types.ComputeThreatListDiffResponse.ResponseType.DIFF,
+                final,
+                additions={"rice_hashes": rice_hashes(added)},
+                removals={
+                    "raw_indices": {"indices": [1]},
+                    "rice_indices": {"first_value": 0},
+                },
+            ),
+        ]
+    )
+    database = LocalThreatDatabase(client, [MALWARE], max_diff_entries=1024)
+
+    database.update()
+    request = client.compute_threat_list_diff.call_args[1]["request"]
+    assert request.threat_type == MALWARE
+    assert request.version_token == b""
+    assert request.constraints.max_diff_entries == 1024
+    assert list(database._lists[MALWARE].prefixes) == sorted(initial)
+
+    database.update()
+    request = client.compute_threat_list_diff.call_args[1]["request"]
+    assert request.version_token == b"1"
+    assert list(database._lists[MALWARE].prefixes) == sorted(final)
+    assert database._lists[MALWARE].version_token == b"2"
+    assert not set(removed) & set(database._lists[MALWARE].prefixes)
+
+
+def test_update_checksum_mismatch():
+    response = reset_response(OTHER_PREFIXES)
+    response.checksum.sha256 = b"wrong"
+    client = make_client([reset_response(OTHER_PREFIXES[:1]), response])
+    database = LocalThreatDatabase(client, [MALWARE])
+    database.update()
+
+    database.update()
+
+    threat_list = database._lists[MALWARE]
+    # The old prefixes are kept until the list is fetched whole again.
+    assert list(threat_list.prefixes) == OTHER_PREFIXES[:1]
+    assert threat_list.version_token == b""
+    assert threat_list.next_update > time.time()
+
+
+def test_update_repeated_checksum_mismatch_backs_off():
+    response = reset_response(OTHER_PREFIXES)
+    response.checksum.sha256 = b"wrong"
+    client = make_client([response] * 12 + [reset_response(OTHER_PREFIXES)])
+    database = LocalThreatDatabase(client, [MALWARE])
+    threat_list = database._lists[MALWARE]
+
+    intervals = []
+    now = 1000.0
+    with mock.patch("time.time", side_effect=lambda: now):
+        for _ in range(12):
+            database.update(only_due=True)
+            intervals.append(threat_list.next_update - now)
+            # Updates which are not due do not send a request.
+            database.update(only_due=True)
+            now = threat_list.next_update
+        assert client.compute_threat_list_diff.call_count == 12
+
+        database.update(only_due=True)
+
+    assert intervals[:3] == [
+        local_database.DEFAULT_RETRY_INTERVAL,
+        2 * local_database.DEFAULT_RETRY_INTERVAL,
+        4 * local_database.DEFAULT_RETRY_INTERVAL,
+    ]
+    assert intervals[-1] == local_database._MAX_MISMATCH_RETRY_INTERVAL
+    assert list(threat_list.prefixes) == OTHER_PREFIXES
+    assert threat_list.mismatches == 0
+
+
+def test_update_only_due():
+    client = make_client([reset_response(OTHER_PREFIXES)])
+    database = LocalThreatDatabase(client, [MALWARE])
+    database.update()
+
+    database.update(only_due=True)
+
+    assert client.compute_threat_list_diff.call_count == 1
+
+
+def test_lookup_uri():
+    client = make_client(
+        [
+            reset_response(OTHER_PREFIXES + [EVIL_HASH[:4]]),
+            reset_response(OTHER_PREFIXES),
+        ]
+    )
+    client.search_hashes.return_value = types.SearchHashesResponse(
+        threats=[
+            {
+                "threat_types": [MALWARE],
+                "hash_": EVIL_HASH,
+                "expire_time": {"seconds": int(time.time()) + 300},
+            }
+        ],
+        negative_expire_time={"seconds": int(time.time()) + 300},
+    )
+    database = LocalThreatDatabase(client, [MALWARE, SOCIAL_ENGINEERING])
+    database.update()
+
+    assert database.lookup_uri("http://example.com/") == []
+    client.search_hashes.assert_not_called()
+
+    assert database.lookup_uri(EVIL_URI) == [MALWARE]
+    request = client.search_hashes.call_args[1]["request"]
+    assert request.hash_prefix == EVIL_HASH[:4]
+    assert list(request.threat_types) == [MALWARE]
+
+    # The full hash is cached until it expires.
+    assert database.lookup_uri(EVIL_URI) == [MALWARE]
+    assert client.search_hashes.call_count == 1
+
+
+def test_lookup_uri_negative_cache():
+    other_uri = "http://evil.example.com/other"
+    other_hash = _urls.full_hashes(other_uri)[0]
+    client = make_client([reset_response([EVIL_HASH[:4]])])
+    client.search_hashes.return_value = types.SearchHashesResponse(
+        negative_expire_time={"seconds": int(time.time()) + 300},
+    )
+    database = LocalThreatDatabase(client, [MALWARE])
+    database.update()
+
+    assert database.lookup_hashes([EVIL_HASH]) == []
+    assert database.lookup_hashes([EVIL_HASH[:4] + other_hash[4:]]) == []
+    assert client.search_hashes.call_count == 1
+
+
+def test_lookup_uri_expired():
+    client = make_client([reset_response([EVIL_HASH[:4]])])
+    client.search_hashes.return_value = types.SearchHashesResponse(
+        threats=[
+            {
+                "threat_types": [MALWARE],
+                "hash_": EVIL_HASH,
+                "expire_time": {"seconds": int(time.time()) - 1},
+            }
+        ],
+        negative_expire_time={"seconds": int(time.time()) - 1},
+    )
+    database = LocalThreatDatabase(client, [MALWARE])
+    database.update()
+
+    assert database.lookup_uri(EVIL_URI) == [MALWARE]
+    assert database.lookup_uri(EVIL_URI) == [MALWARE]
+    assert client.search_hashes.call_count == 2
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "webrisk.db")
+    prefixes = OTHER_PREFIXES + [EVIL_HASH[:4]]
+    long_prefix = b"\x7f\x00\x00\x00\x01"
+    response = reset_response(prefixes)
+    response.additions.raw_hashes.append({"prefix_size": 5, "raw_hashes": long_prefix})
+    response.checksum.sha256 = checksum(prefixes + [long_prefix])
+    client = make_client([response])
+    database = LocalThreatDatabase(client, [MALWARE], path=path)
+    database.update()
+
+    loaded = LocalThreatDatabase(
+        make_client(), [MALWARE, SOCIAL_ENGINEERING], path=path
+    )
+
+    threat_list = loaded._lists[MALWARE]
+    assert isinstance(threat_list.prefixes._short, memoryview)
+    assert list(threat_list.prefixes) == sorted(prefixes + [long_prefix])
+    assert threat_list.version_token == b"1"
+    assert threat_list.prefixes.match(EVIL_HASH) == EVIL_HASH[:4]
+    assert len(loaded._lists[SOCIAL_ENGINEERING].prefixes) == 0
+
+
+def test_start_and_stop():
+    client = make_client([reset_response(OTHER_PREFIXES)])
+    database = LocalThreatDatabase(client, [MALWARE])
+
+    with database:
+        deadline = time.monotonic() + 5
+        while not len(database._lists[MALWARE].prefixes):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    assert list(database._lists[MALWARE].prefixes) == OTHER_PREFIXES
+    client.compute_threat_list_diff.assert_called_once()